@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Union, List, Tuple, Dict, Type, TYPE_CHECKING
+from typing import Union, List, Tuple, Dict, Type, Iterable, TYPE_CHECKING
 
 import os
 import sys
@@ -12,8 +12,20 @@ from _balder.plugin_manager import PluginManager
 from _balder.executor.executor_tree import ExecutorTree
 from _balder.collector import Collector
 from _balder.solver import Solver
+from _balder.session_registry import SessionRegistry
 from _balder.exceptions import DuplicateBalderSettingError
 from _balder.balder_settings import BalderSettings
+from _balder.session_options import SessionOptions
+from _balder.fixture_execution_level import FixtureExecutionLevel
+from _balder.execution_order_optimizer import ExecutionOrderOptimizer
+from _balder.execution_plan import ExecutionPlan
+from _balder.utils.duration_store import DurationStore
+from _balder.utils.fixture_result_store import FixtureResultStore
+from _balder.utils.sample_rotation_store import SampleRotationStore
+from _balder.sampling import Sampling
+from _balder.distributed import Coordinator, Worker
+from _balder.distributed.protocol import parse_address
+from _balder.utils.functions import get_argument_names, get_method_type
 
 if TYPE_CHECKING:
     from _balder.setup import Setup
@@ -32,8 +44,11 @@ class BalderSession:
     """
     # this is the default value (will be overwritten in this constructor if necessary)
     baldersettings: BalderSettings = BalderSettings()
+    # the session whose registry is currently active (it is reset automatically as soon as a new session is created)
+    _active_session: Union[BalderSession, None] = None
 
-    def __init__(self, cmd_args: Union[List[str], None] = None, working_dir: Union[pathlib.Path, None] = None):
+    def __init__(self, cmd_args: Union[List[str], None] = None, working_dir: Union[pathlib.Path, None] = None,
+                 worker_mode: bool = False):
         """
 
         :param cmd_args: optional the command line list of strings that should be parsed instead of parsing the real
@@ -41,7 +56,21 @@ class BalderSession:
 
         :param working_dir: the working directory that should be used instead of the given value in `cmd_arg_str` or
                             the current directory (determined by `os.getcwd()`)
+
+        :param worker_mode: True if this session is a worker session (`balder worker`) that executes the variations
+                            a coordinator assigns to it
         """
+        if BalderSession._active_session is not None:
+            # only one session can be active at a time - the previous session can not be used anymore
+            BalderSession._active_session.reset()
+        #: the registry all controllers and all elements the decorators register are saved in while this session is
+        #: active (it contains everything that was registered before the session was created)
+        self.registry = SessionRegistry.create_from_base()
+        self.registry.activate()
+        BalderSession._active_session = self
+
+        #: True if this session is executed as worker of a coordinator
+        self.worker_mode = worker_mode
         #: contains the alternative command line arguments as a string list (has to be given, if the object should
         #: not use the console params of this call)
         self._alt_cmd_args = cmd_args
@@ -56,19 +85,14 @@ class BalderSession:
 
         #: the working directory for this balder session (default: current directory from `os.getcwd()`)
         self.working_dir: Union[pathlib.Path, None] = pathlib.Path(os.getcwd())
-        #: specifies that the tests should only be collected but not be resolved and executed
-        self.collect_only: Union[bool, None] = None
-        #: specifies that the tests should only be collected and resolved but not executed
-        self.resolve_only: Union[bool, None] = None
-        #: specifies that all discarded variations should be printed (with information why they were discarded)
-        self.show_discarded: Union[bool, None] = None
-        #: contains a number of :class:`Setup` class strings that should only be considered for the execution
-        self.only_with_setup: Union[List[str], None] = None
-        #: contains a number of :class:`Scenario` class strings that should only be considered for the execution
-        self.only_with_scenario: Union[List[str], None] = None
-        #: if this is true, the test run should include duplicated tests that are declared as covered_by another test
-        #: method
-        self.force_covered_by_duplicates: Union[bool, None] = None
+        #: all other settings that can be modified by command line arguments
+        self.options = SessionOptions()
+        #: the sampling that selects the executed variations and parametrizations (None if everything is executed)
+        self.sampling: Union[Sampling, None] = None
+        #: the loaded execution plan (only set if the session executes a plan that was loaded with `--load-plan`)
+        self.execution_plan: Union[ExecutionPlan, None] = None
+        #: True if the collecting process was already executed (the daemon collects the session before it is run)
+        self.is_collected = False
 
         self.preparse_args()
 
@@ -96,7 +120,7 @@ class BalderSession:
         if BalderSession.baldersettings.force_covered_by_duplicates:
             # overwrite console argument only if the value in BalderSettings is true (because cmd line can only
             # overwrite the value False)
-            self.force_covered_by_duplicates = True
+            self.options.force_covered_by_duplicates = True
 
         for cur_plugin_cls in self.get_balderplugins_from_balderglob():
             self.plugin_manager.register(cur_plugin_cls, self)
@@ -116,6 +140,8 @@ class BalderSession:
         #: contains the reference to the used :class:`ExecutorTree` class (or none, if there was no solving executed
         #: till now)
         self.executor_tree: Union[ExecutorTree, None] = None
+        #: contains the durations of earlier runs (or none, if the execution order should not be optimized)
+        self.duration_store: Union[DurationStore, None] = None
 
     # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
 
@@ -134,6 +160,60 @@ class BalderSession:
 
     # ---------------------------------- PROPERTIES --------------------------------------------------------------------
 
+    @property
+    def collect_only(self) -> Union[bool, None]:
+        """specifies that the tests are only collected (see :attr:`SessionOptions.collect_only`)"""
+        return self.options.collect_only
+
+    @collect_only.setter
+    def collect_only(self, value: Union[bool, None]):
+        self.options.collect_only = value
+
+    @property
+    def resolve_only(self) -> Union[bool, None]:
+        """specifies that the tests are only collected and resolved (see :attr:`SessionOptions.resolve_only`)"""
+        return self.options.resolve_only
+
+    @resolve_only.setter
+    def resolve_only(self, value: Union[bool, None]):
+        self.options.resolve_only = value
+
+    @property
+    def show_discarded(self) -> Union[bool, None]:
+        """specifies that all discarded variations should be printed (see :attr:`SessionOptions.show_discarded`)"""
+        return self.options.show_discarded
+
+    @show_discarded.setter
+    def show_discarded(self, value: Union[bool, None]):
+        self.options.show_discarded = value
+
+    @property
+    def only_with_setup(self) -> Union[List[str], None]:
+        """the :class:`Setup` class strings to consider (see :attr:`SessionOptions.only_with_setup`)"""
+        return self.options.only_with_setup
+
+    @only_with_setup.setter
+    def only_with_setup(self, value: Union[List[str], None]):
+        self.options.only_with_setup = value
+
+    @property
+    def only_with_scenario(self) -> Union[List[str], None]:
+        """the :class:`Scenario` class strings to consider (see :attr:`SessionOptions.only_with_scenario`)"""
+        return self.options.only_with_scenario
+
+    @only_with_scenario.setter
+    def only_with_scenario(self, value: Union[List[str], None]):
+        self.options.only_with_scenario = value
+
+    @property
+    def force_covered_by_duplicates(self) -> Union[bool, None]:
+        """specifies that covered_by duplicates are executed (see :attr:`SessionOptions.force_covered_by_duplicates`)"""
+        return self.options.force_covered_by_duplicates
+
+    @force_covered_by_duplicates.setter
+    def force_covered_by_duplicates(self, value: Union[bool, None]):
+        self.options.force_covered_by_duplicates = value
+
     @property
     def all_collected_pyfiles(self) -> List[pathlib.Path]:
         """returns all collected pyfiles"""
@@ -177,6 +257,282 @@ class BalderSession:
 
     # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
 
+    def _add_general_args(self):
+        """
+        This method adds the general command line arguments, that define which tests are collected, resolved and
+        executed, to the argument parser.
+        """
+        self.cmd_arg_parser.add_argument(
+            '--working-dir', nargs="?", default=os.getcwd(),
+            help="a explicit working directory on which the testsystem is to be executed with")
+
+        self.cmd_arg_parser.add_argument(
+            '--collect-only', action='store_true',
+            help="specifies that the tests are only collected but not resolved and executed")
+
+        self.cmd_arg_parser.add_argument(
+            '--resolve-only', action='store_true',
+            help="specifies that the tests are only collected and resolved but not executed")
+
+        self.cmd_arg_parser.add_argument(
+            '--show-discarded', action='store_true',
+            help="specifies that all discarded variations should be printed (with information why they were discarded)")
+
+        self.cmd_arg_parser.add_argument(
+            '--only-with-setup', nargs="*",
+            help="defines a number of Setup classes which should only be considered for the execution")
+
+        self.cmd_arg_parser.add_argument(
+            '--only-with-scenario', nargs="*",
+            help="defines a number of Scenario classes which should only be considered for the execution")
+        self.cmd_arg_parser.add_argument(
+            '--force-covered-by-duplicates', action='store_true',
+            help="specifies that the test run should include duplicated tests that are declared as covered_by another "
+                 "test method (also true if it was already set in baldersetting object)")
+
+    def _add_concurrency_args(self):
+        """
+        This method adds the command line arguments, that define how many testcases and fixtures are executed at the
+        same time, to the argument parser.
+        """
+        self.cmd_arg_parser.add_argument(
+            '--parallel-testcases', type=int, default=1,
+            help="the maximum number of testcases of one variation that are executed at the same time in worker "
+                 "threads - only testcases that are marked with `@balder.parallel_safe` are executed in parallel "
+                 "(default: 1)")
+
+        self.cmd_arg_parser.add_argument(
+            '--concurrent-async-testcases', type=int, default=1,
+            help="the maximum number of async testcases of one variation that are executed concurrently on the event "
+                 "loop of the session (default: 1)")
+
+        self.cmd_arg_parser.add_argument(
+            '--concurrent-fixtures', type=int, default=1,
+            help="the maximum number of fixtures that are constructed and torn down at the same time in worker threads "
+                 "- only fixtures of the same execution level and definition scope that do not reference each other "
+                 "are executed concurrently (default: 1)")
+
+    def _validate_concurrency_args(self):
+        """
+        This method validates the parsed concurrency arguments and saves them in the session options.
+        """
+        self.options.concurrency.parallel_testcases = self.parsed_args.parallel_testcases
+        self.options.concurrency.concurrent_async_testcases = self.parsed_args.concurrent_async_testcases
+        self.options.concurrency.concurrent_fixtures = self.parsed_args.concurrent_fixtures
+        options = self.options.concurrency
+        for cur_arg_name, cur_value in (('--parallel-testcases', options.parallel_testcases),
+                                        ('--concurrent-async-testcases', options.concurrent_async_testcases),
+                                        ('--concurrent-fixtures', options.concurrent_fixtures)):
+            if cur_value < 1:
+                self.cmd_arg_parser.error(f"argument {cur_arg_name}: the value has to be 1 or higher")
+
+    def _add_sampling_args(self):
+        """
+        This method adds the command line arguments, that select a subset of the variations and parametrized
+        testcases, to the argument parser.
+        """
+        self.cmd_arg_parser.add_argument(
+            '--parametrize-nwise', type=int, default=None, metavar='STRENGTH',
+            help="reduces the parametrization of all parametrized tests to a n-wise covering array with the given "
+                 "strength (2 for pairwise) - tests with `@balder.parametrize_nwise` use their own strength")
+        self.cmd_arg_parser.add_argument(
+            '--parametrize-seed', type=int, default=None,
+            help="the seed the n-wise covering arrays are determined with - the same seed always results in the same "
+                 "testcases (default: the value of `--seed`)")
+        self.cmd_arg_parser.add_argument(
+            '--sample', type=int, default=None, metavar='N',
+            help="only executes a sample of N variations of every scenario (with every setup) and N parametrized "
+                 "testcases of every parametrized test - every run selects another sample")
+        self.cmd_arg_parser.add_argument(
+            '--sample-ratio', type=float, default=None, metavar='R',
+            help="only executes the given ratio (greater than 0 and not greater than 1) of the variations of every "
+                 "scenario (with every setup) and of the parametrized testcases of every parametrized test")
+        self.cmd_arg_parser.add_argument(
+            '--sample-run', type=int, default=None,
+            help="the index of the sampled run, that determines which sample is selected (default: the index after "
+                 "the one of the last sampled run, that is saved in the `.balder_cache` directory)")
+        self.cmd_arg_parser.add_argument(
+            '--seed', type=int, default=0,
+            help="the seed of the session - the same seed (and sample run) always selects the same sample (default: 0)")
+        self.cmd_arg_parser.add_argument(
+            '--minimal-variations', action='store_true',
+            help="only executes a small set of variations of every scenario (with every setup), that covers every "
+                 "scenario device with every kind of setup device, every feature implementation and every routed "
+                 "connection type at least once")
+        self.cmd_arg_parser.add_argument(
+            '--first-variation-only', action='store_true',
+            help="only determines and executes the first applicable variation of every scenario (with every setup) - "
+                 "the remaining device mappings are never determined")
+
+    def _validate_sampling_args(self):
+        """
+        This method validates the parsed sampling arguments and saves them in the session options.
+        """
+        options = self.options.sampling
+        options.parametrize_nwise = self.parsed_args.parametrize_nwise
+        if options.parametrize_nwise is not None and options.parametrize_nwise < 1:
+            self.cmd_arg_parser.error("argument --parametrize-nwise: the value has to be 1 or higher")
+        options.seed = self.parsed_args.seed
+        options.parametrize_seed = self.parsed_args.parametrize_seed
+        if options.parametrize_seed is None:
+            options.parametrize_seed = options.seed
+        options.sample_size = self.parsed_args.sample
+        options.sample_ratio = self.parsed_args.sample_ratio
+        options.sample_run = self.parsed_args.sample_run
+        if options.sample_size is not None and options.sample_ratio is not None:
+            self.cmd_arg_parser.error("argument --sample-ratio: not allowed with argument --sample")
+        if options.sample_size is not None and options.sample_size < 1:
+            self.cmd_arg_parser.error("argument --sample: the value has to be 1 or higher")
+        if options.sample_ratio is not None and not 0 < options.sample_ratio <= 1:
+            self.cmd_arg_parser.error("argument --sample-ratio: the value has to be greater than 0 and not greater "
+                                      "than 1")
+        if options.sample_run is not None and not options.is_sampled:
+            self.cmd_arg_parser.error("argument --sample-run: only allowed with argument --sample or --sample-ratio")
+        if options.sample_run is not None and options.sample_run < 0:
+            self.cmd_arg_parser.error("argument --sample-run: the value has to be 0 or higher")
+        options.minimal_variations = self.parsed_args.minimal_variations
+        if options.minimal_variations and options.is_sampled:
+            self.cmd_arg_parser.error("argument --minimal-variations: not allowed with argument --sample or "
+                                      "--sample-ratio")
+        options.first_variation_only = self.parsed_args.first_variation_only
+        if options.first_variation_only and (options.minimal_variations or options.is_sampled):
+            self.cmd_arg_parser.error("argument --first-variation-only: not allowed with argument "
+                                      "--minimal-variations, --sample or --sample-ratio")
+
+    def _add_failure_limit_args(self):
+        """
+        This method adds the command line arguments, that stop the execution after a number of failures, to the
+        argument parser.
+        """
+        self.cmd_arg_parser.add_argument(
+            '-x', '--exitfirst', action='store_true',
+            help="stops the execution after the first failed testcase or fixture (the same as `--maxfail 1`)")
+        self.cmd_arg_parser.add_argument(
+            '--maxfail', type=int, default=None,
+            help="stops the execution after the given number of failed testcases or fixtures - the remaining testcases "
+                 "are marked as not run")
+        self.cmd_arg_parser.add_argument(
+            '--maxfail-per-setup', type=int, default=None,
+            help="stops the execution of a setup after the given number of failed testcases or fixtures within it")
+        self.cmd_arg_parser.add_argument(
+            '--maxfail-per-variation', type=int, default=None,
+            help="stops the execution of a variation after the given number of failed testcases or fixtures within it")
+
+    def _validate_failure_limit_args(self):
+        """
+        This method validates the parsed failure limit arguments and saves them in the session options.
+        """
+        self.options.failure_limits.max_failures = 1 if self.parsed_args.exitfirst else self.parsed_args.maxfail
+        self.options.failure_limits.max_failures_per_setup = self.parsed_args.maxfail_per_setup
+        self.options.failure_limits.max_failures_per_variation = self.parsed_args.maxfail_per_variation
+        options = self.options.failure_limits
+        for cur_arg_name, cur_value in (('--maxfail', options.max_failures),
+                                        ('--maxfail-per-setup', options.max_failures_per_setup),
+                                        ('--maxfail-per-variation', options.max_failures_per_variation)):
+            if cur_value is not None and cur_value < 1:
+                self.cmd_arg_parser.error(f"argument {cur_arg_name}: the value has to be 1 or higher")
+
+    def _add_execution_plan_args(self):
+        """
+        This method adds the command line arguments, that optimize, save or load the execution plan, to the argument
+        parser.
+        """
+        self.cmd_arg_parser.add_argument(
+            '--optimize-execution-order', action='store_true',
+            help="reorders the setups, scenarios and variations to reduce the fixture work - the durations of every "
+                 "run are recorded in the `.balder_cache` directory and are used to optimize the order of the next run")
+        self.cmd_arg_parser.add_argument(
+            '--save-plan', default=None, metavar='FILE',
+            help="saves the resolved execution plan (the variations with their device mappings, testcases and "
+                 "discard reasons) in the given JSON file - it can be executed later with `--load-plan`")
+        self.cmd_arg_parser.add_argument(
+            '--load-plan', default=None, metavar='FILE',
+            help="executes the execution plan of the given JSON file - only the files of the planned setups and "
+                 "scenarios are imported and the setups and scenarios are not resolved again")
+
+    def _validate_execution_plan_args(self):
+        """
+        This method validates the parsed execution plan arguments and saves them in the session options. It has to be
+        called after all other arguments were validated, because a loaded plan can not be combined with the arguments
+        the plan was resolved with.
+        """
+        plan_options = self.options.plan
+        sampling_options = self.options.sampling
+        plan_options.optimize_execution_order = self.parsed_args.optimize_execution_order
+        save_plan, load_plan = self.parsed_args.save_plan, self.parsed_args.load_plan
+        plan_options.save_plan = None if save_plan is None else pathlib.Path(save_plan)
+        plan_options.load_plan = None if load_plan is None else pathlib.Path(load_plan)
+        if plan_options.load_plan is None:
+            return
+        for cur_arg_name, cur_value in (('--save-plan', plan_options.save_plan),
+                                        ('--only-with-setup', self.options.only_with_setup),
+                                        ('--only-with-scenario', self.options.only_with_scenario),
+                                        ('--sample', sampling_options.sample_size),
+                                        ('--sample-ratio', sampling_options.sample_ratio),
+                                        ('--parametrize-nwise', sampling_options.parametrize_nwise),
+                                        ('--parametrize-seed', self.parsed_args.parametrize_seed),
+                                        ('--minimal-variations', sampling_options.minimal_variations),
+                                        ('--first-variation-only', sampling_options.first_variation_only)):
+            if cur_value:
+                self.cmd_arg_parser.error(f"argument --load-plan: not allowed with argument {cur_arg_name} "
+                                          f"(the plan was already resolved with these options)")
+
+    def _add_distribution_args(self):
+        """
+        This method adds the command line arguments of the distributed execution with a coordinator and workers to
+        the argument parser.
+        """
+        self.cmd_arg_parser.add_argument(
+            '--coordinator', metavar='HOST:PORT',
+            help="runs this session as coordinator that distributes the variations to workers connecting to the given "
+                 "address (for `balder worker` the address of the coordinator to connect to)")
+        self.cmd_arg_parser.add_argument(
+            '--expected-workers', type=int, default=1,
+            help="the number of workers the coordinator waits for - the session is finished as soon as all of them "
+                 "have disconnected again (default: 1)")
+
+    def _validate_distribution_args(self):
+        """
+        This method validates the parsed arguments of the distributed execution and saves them in the session options.
+        """
+        if self.parsed_args.coordinator is not None:
+            try:
+                self.options.distribution.coordinator_address = parse_address(self.parsed_args.coordinator)
+            except ValueError as exc:
+                self.cmd_arg_parser.error(f"argument --coordinator: {exc}")
+        elif self.worker_mode:
+            self.cmd_arg_parser.error("the argument --coordinator is required for `balder worker`")
+        self.options.distribution.expected_workers = self.parsed_args.expected_workers
+        if self.options.distribution.expected_workers < 1:
+            self.cmd_arg_parser.error("argument --expected-workers: the value has to be 1 or higher")
+
+    def _add_daemon_and_watch_args(self):
+        """
+        This method adds the command line arguments of the daemon and the watch mode to the argument parser. These
+        arguments are handled by the console script before a session is created.
+        """
+        self.cmd_arg_parser.add_argument(
+            '--daemon', action='store_true',
+            help="starts a daemon that keeps the collected environment in memory and executes the runs that are "
+                 "requested with `--use-daemon` (only available on POSIX systems)")
+        self.cmd_arg_parser.add_argument(
+            '--use-daemon', action='store_true',
+            help="executes this run within the running daemon (the environment is only imported and collected again "
+                 "if a python file of the working directory was changed)")
+        self.cmd_arg_parser.add_argument(
+            '--stop-daemon', action='store_true',
+            help="stops the running daemon")
+        self.cmd_arg_parser.add_argument(
+            '--daemon-socket', default=None, metavar='PATH',
+            help="the unix socket the daemon listens on (default: `daemon.sock` in the `.balder_cache` directory)")
+        self.cmd_arg_parser.add_argument(
+            '--watch', action='store_true',
+            help="executes the session and waits for changes of the python files in the working directory afterwards "
+                 "- only the setup/scenario pairs that are affected by a change are executed again")
+        self.cmd_arg_parser.add_argument(
+            '--watch-interval', type=float, default=0.5, metavar='SECONDS',
+            help="the time between two checks for changed files in watch mode (default: 0.5)")
+
     # ---------------------------------- METHODS -----------------------------------------------------------------------
 
     def get_baldersettings_from_balderglob(self) -> Union[BalderSettings, None]:
@@ -236,54 +592,103 @@ class BalderSession:
             description='Balder is a simple scenario-based test system that allows you to run your tests on various '
                         'devices without rewriting them')
 
-        self.cmd_arg_parser.add_argument(
-            '--working-dir', nargs="?", default=os.getcwd(),
-            help="a explicit working directory on which the testsystem is to be executed with")
-
-        self.cmd_arg_parser.add_argument(
-            '--collect-only', action='store_true',
-            help="specifies that the tests are only collected but not resolved and executed")
-
-        self.cmd_arg_parser.add_argument(
-            '--resolve-only', action='store_true',
-            help="specifies that the tests are only collected and resolved but not executed")
-
-        self.cmd_arg_parser.add_argument(
-            '--show-discarded', action='store_true',
-            help="specifies that all discarded variations should be printed (with information why they were discarded)")
-
-        self.cmd_arg_parser.add_argument(
-            '--only-with-setup', nargs="*",
-            help="defines a number of Setup classes which should only be considered for the execution")
-
-        self.cmd_arg_parser.add_argument(
-            '--only-with-scenario', nargs="*",
-            help="defines a number of Scenario classes which should only be considered for the execution")
-        self.cmd_arg_parser.add_argument(
-            '--force-covered-by-duplicates', action='store_true',
-            help="specifies that the test run should include duplicated tests that are declared as covered_by another "
-                 "test method (also true if it was already set in baldersetting object)")
-
+        self._add_general_args()
+        self._add_concurrency_args()
+        self._add_sampling_args()
+        self._add_failure_limit_args()
+        self._add_execution_plan_args()
+        self._add_distribution_args()
+        self._add_daemon_and_watch_args()
         self.plugin_manager.execute_addoption(self.cmd_arg_parser)
 
         self.parsed_args = self.cmd_arg_parser.parse_args(self._alt_cmd_args)
 
         self.working_dir = self.parsed_args.working_dir
-        self.collect_only = self.parsed_args.collect_only
-        self.resolve_only = self.parsed_args.resolve_only
-        self.show_discarded = self.parsed_args.show_discarded
-        self.only_with_setup = self.parsed_args.only_with_setup
-        self.only_with_scenario = self.parsed_args.only_with_scenario
-        self.force_covered_by_duplicates = self.parsed_args.force_covered_by_duplicates
+        self.options.collect_only = self.parsed_args.collect_only
+        self.options.resolve_only = self.parsed_args.resolve_only
+        self.options.show_discarded = self.parsed_args.show_discarded
+        self.options.only_with_setup = self.parsed_args.only_with_setup
+        self.options.only_with_scenario = self.parsed_args.only_with_scenario
+        self.options.force_covered_by_duplicates = self.parsed_args.force_covered_by_duplicates
+        self._validate_concurrency_args()
+        self._validate_sampling_args()
+        self._validate_failure_limit_args()
+        self._validate_distribution_args()
+        self._validate_execution_plan_args()
+
+    def update_cmd_args(self, cmd_args: List[str]):
+        """
+        This method parses the given command line arguments instead of the current ones. It allows to run an already
+        collected session (see the daemon mode) with other arguments. The arguments that influence the collecting
+        process have to be the same.
+
+        :param cmd_args: the new command line arguments
+        """
+        working_dir = self.working_dir
+        collect_filters = (self.options.only_with_setup, self.options.only_with_scenario)
+        self._alt_cmd_args = cmd_args
+        self.parse_args()
+        self.working_dir = working_dir
+        if self.is_collected and (self.options.only_with_setup, self.options.only_with_scenario) != collect_filters:
+            raise ValueError('the arguments `--only-with-setup` and `--only-with-scenario` can not be changed after '
+                             'the session was collected')
+
+    def reset(self, modules: Union[Iterable[str], None] = None):
+        """
+        This method resets the session, so that a new session can be created and executed in the same process. It
+        removes the modules of the working directory from `sys.modules` (the next session imports them again),
+        discards the registry of this session and activates the base registry again. The controllers and the elements
+        that were registered by modules that are still imported (for example installed balderhub packages or the
+        modules the watch mode keeps) are kept in the base registry, because these modules will not be imported again.
+        The data the collector has determined is always discarded.
+
+        The session itself can not be executed again after it was reset - create a new :class:`BalderSession` instead.
+        Creating a new session resets the previous one automatically, so this method only has to be called directly,
+        if not all modules of the working directory should be removed. It does nothing if the session was already reset.
+
+        :param modules: the names of the modules that should be removed from `sys.modules` (default: all modules of the
+                        working directory)
+        """
+        if BalderSession._active_session is not self:
+            return
+        BalderSession._active_session = None
+        if modules is None:
+            module_prefix = f"{self.working_dir.stem}."
+            modules = [cur_name for cur_name in sys.modules.keys()
+                       if cur_name == self.working_dir.stem or cur_name.startswith(module_prefix)]
+        for cur_module_name in modules:
+            cur_module = sys.modules.pop(cur_module_name, None)
+            parent_name, _, attr_name = cur_module_name.rpartition('.')
+            parent_module = sys.modules.get(parent_name)
+            if cur_module is not None and getattr(parent_module, attr_name, None) is cur_module:
+                # otherwise `from <parent> import <module>` would still return the removed module
+                delattr(parent_module, attr_name)
+        loaded_modules = set(sys.modules.keys())
+        base_registry = SessionRegistry.get_base()
+        base_registry.merge(self.registry, modules=loaded_modules, with_collected_data=False)
+        base_registry.remove_all_except(loaded_modules)
+        self.registry.clear()
+        SessionRegistry.get_base().activate()
+        get_argument_names.cache_clear()
+        get_method_type.cache_clear()
+
+        BalderSession.baldersettings = BalderSettings()
 
     def collect(self):
         """
-        This method collects all data.
+        This method collects all data. If an execution plan should be loaded, only the files the plan references are
+        collected.
         """
+        py_files = None
+        if self.options.plan.load_plan is not None:
+            self.execution_plan = ExecutionPlan.load(self.options.plan.load_plan)
+            py_files = [pathlib.Path(self.working_dir).joinpath(cur_file) for cur_file in self.execution_plan.files]
         self.collector.collect(
             plugin_manager=self.plugin_manager,
-            scenario_filter_patterns=self.only_with_scenario,
-            setup_filter_patterns=self.only_with_setup)
+            scenario_filter_patterns=self.options.only_with_scenario,
+            setup_filter_patterns=self.options.only_with_setup,
+            py_files=py_files)
+        self.is_collected = True
 
     def solve(self):
         """
@@ -292,8 +697,13 @@ class BalderSession:
         self.solver = Solver(setups=self.all_collected_setups,
                              scenarios=self.all_collected_scenarios,
                              connections=self.all_collected_connections,
-                             fixture_manager=self.collector.get_fixture_manager())
-        self.solver.resolve(plugin_manager=self.plugin_manager)
+                             fixture_manager=self.collector.get_fixture_manager(),
+                             only_pairs_with=self.options.only_pairs_with)
+        if self.execution_plan is not None:
+            self.solver.resolve_from_plan(self.execution_plan, with_discarded=self.options.show_discarded)
+        else:
+            self.solver.resolve(plugin_manager=self.plugin_manager,
+                                first_variation_only=self.options.sampling.first_variation_only)
 
     def create_executor_tree(self):
         """
@@ -302,9 +712,52 @@ class BalderSession:
         .. note::
             Note that the method creates an :class:`ExecutorTree`, that hasn't to be completely resolved yet.
         """
-        self.executor_tree = self.solver.get_executor_tree(plugin_manager=self.plugin_manager,
-                                                           add_discarded=self.show_discarded)
+        sampling_options = self.options.sampling
+        if sampling_options.is_sampled:
+            sample_run = sampling_options.sample_run
+            if sample_run is None:
+                # rotate the sample, so that consecutive runs execute other variations and parametrizations
+                rotation_store = SampleRotationStore(self.working_dir)
+                sample_run = rotation_store.get_next_run()
+                rotation_store.save_next_run(sample_run + 1)
+            self.sampling = Sampling(size=sampling_options.sample_size, ratio=sampling_options.sample_ratio,
+                                     seed=sampling_options.seed, run=sample_run)
+        self.executor_tree = self.solver.get_executor_tree(
+            plugin_manager=self.plugin_manager,
+            add_discarded=self.options.show_discarded,
+            sampling=self.sampling,
+            minimal_variations=sampling_options.minimal_variations)
+        if self.execution_plan is not None:
+            # the variations were already selected - the plan only selects the parametrized testcases the same way
+            self.sampling = self.execution_plan.sampling
+            self.executor_tree.sampling = self.sampling
+            sampling_options.parametrize_nwise = self.execution_plan.parametrize_nwise
+            sampling_options.parametrize_seed = self.execution_plan.parametrize_seed
+        self.executor_tree.max_parallel_testcases = self.options.concurrency.parallel_testcases
+        self.executor_tree.max_concurrent_async_testcases = self.options.concurrency.concurrent_async_testcases
+        self.executor_tree.max_concurrent_fixtures = self.options.concurrency.concurrent_fixtures
+        self.executor_tree.parametrize_nwise = sampling_options.parametrize_nwise
+        self.executor_tree.parametrize_seed = sampling_options.parametrize_seed
+        self.executor_tree.fixture_result_store = FixtureResultStore(self.working_dir)
+        failure_limits = self.options.failure_limits
+        for cur_level, cur_max_failures in (
+                (FixtureExecutionLevel.SESSION, failure_limits.max_failures),
+                (FixtureExecutionLevel.SETUP, failure_limits.max_failures_per_setup),
+                (FixtureExecutionLevel.VARIATION, failure_limits.max_failures_per_variation)):
+            if cur_max_failures is not None:
+                self.executor_tree.max_failures[cur_level] = cur_max_failures
         self.plugin_manager.execute_filter_executor_tree(executor_tree=self.executor_tree)
+        if self.options.plan.optimize_execution_order:
+            self.duration_store = DurationStore(self.working_dir)
+            self.duration_store.load()
+            ExecutionOrderOptimizer(self.executor_tree, self.duration_store).optimize()
+        if self.options.plan.save_plan is not None:
+            # the discarded variations are part of the tree (they are only skipped if `show_discarded` is not set), so
+            # the plan contains them without adding the discarded branches to the executed tree
+            connection_files = [cur_file for cur_file in self.all_collected_pyfiles
+                                if Collector.is_connection_py_file(cur_file)]
+            ExecutionPlan.create_for(self.executor_tree, self.working_dir, connection_files)\
+                .save(self.options.plan.save_plan)
 
     def run(self):
         """
@@ -312,7 +765,8 @@ class BalderSession:
         """
         line_length = 120
 
-        self.collect()
+        if not self.is_collected:
+            self.collect()
 
         def print_rect_row(text):
             line = "| " + text
@@ -325,17 +779,36 @@ class BalderSession:
         print_rect_row(f" python version {sys_version} | balder version {balder.__version__}")
         print("+" + "-" * (line_length - 2) + "+")
         print(f"Collect {len(self.all_collected_setups)} Setups and {len(self.all_collected_scenarios)} Scenarios")
-        if not self.collect_only:
+        if not self.options.collect_only:
             self.solve()
             self.create_executor_tree()
             count_valid = len(self.executor_tree.get_all_variation_executors())
             count_discarded = len(self.executor_tree.get_all_variation_executors(return_discarded=True)) - count_valid
-            addon_text = f" ({count_discarded} discarded)" if self.show_discarded else ""
-            print(f"  resolve them to {count_valid} valid variations{addon_text}")
+            addon_text = f" ({count_discarded} discarded)" if self.options.show_discarded else ""
+            if self.execution_plan is not None:
+                print(f"  load {count_valid} valid variations{addon_text} from the execution plan "
+                      f"`{self.options.plan.load_plan}`")
+            else:
+                print(f"  resolve them to {count_valid} valid variations{addon_text}")
+            if self.sampling is not None:
+                print(f"  sample them with seed {self.sampling.seed} (sample run {self.sampling.run})")
             print("")
-            if not self.resolve_only:
-                self.executor_tree.execute(show_discarded=self.show_discarded)
+            if self.options.resolve_only:
+                self.executor_tree.print_tree(show_discarded=self.options.show_discarded)
+            elif self.worker_mode:
+                Worker(self.executor_tree, self.options.distribution.coordinator_address)\
+                    .run(show_discarded=self.options.show_discarded)
+            elif self.options.distribution.coordinator_address is not None:
+                self.executor_tree.print_session_line(ExecutorTree.SESSION_START_TEXT)
+                Coordinator(self.executor_tree, self.options.distribution.coordinator_address,
+                            expected_workers=self.options.distribution.expected_workers)\
+                    .run(show_discarded=self.options.show_discarded)
+                self.executor_tree.print_session_line(ExecutorTree.SESSION_END_TEXT)
+                self.executor_tree.print_summary()
             else:
-                self.executor_tree.print_tree(show_discarded=self.show_discarded)
+                self.executor_tree.execute(show_discarded=self.options.show_discarded)
+            if self.duration_store is not None and not self.options.resolve_only:
+                self.duration_store.record(self.executor_tree)
+                self.duration_store.save()
 
         self.plugin_manager.execute_session_finished(self.executor_tree)
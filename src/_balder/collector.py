@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List, Type, Union, Dict, Callable, Tuple, Iterable, Any, TYPE_CHECKING
+from typing import List, Type, Union, Callable, Tuple, Iterable, Any, TYPE_CHECKING
 
 import os
 import sys
@@ -20,6 +20,8 @@ from _balder.connection import Connection
 from _balder.parametrization import FeatureAccessSelector, Parameter
 from _balder.fixture_manager import FixtureManager
 from _balder.fixture_execution_level import FixtureExecutionLevel
+from _balder.feature_method_cache import FeatureMethodCache
+from _balder.session_registry import SessionRegistry
 from _balder.controllers import ScenarioController, SetupController, DeviceController, VDeviceController, \
     FeatureController, NormalScenarioSetupController
 from _balder.exceptions import DuplicateForVDeviceError, UnknownVDeviceException
@@ -36,26 +38,11 @@ class Collector:
     """
     The Collector class manages the loading and importing of all relevant balder objects. It does not resolve something,
     but secures that all relevant data is being collected.
-    """
-    # metadata object that contains all raw fixtures (classes that were not be resolved yet)
-    _raw_fixtures = {}
-
-    # this static attribute will be managed by the decorator `@for_vdevice(..)`. It holds all functions/methods that
-    # were decorated with `@for_vdevice(..)` (without checking their correctness). The collector will check them later
-    # with the method `rework_method_variation_decorators()`
-    _possible_method_variations: Dict[
-        Callable,
-        List[Tuple[Union[Type[VDevice], str], Connection]]
-    ] = {}
-
-    # this static attribute will be managed by the decorator `@parametrize(..)`. It holds all functions/methods that
-    # were decorated with `@parametrize(..)` (without checking their correctness). The collector will check it later
-    # with the method `rework_static_parametrization_decorators()`
-    _possible_parametrization: Dict[
-        Callable,
-        Dict[str, Union[Iterable[Any], FeatureAccessSelector]]
-    ] = {}
 
+    All elements the decorators register (for example with `@fixture(..)`, `@for_vdevice(..)` or `@parametrize(..)`)
+    are saved in the active :class:`SessionRegistry` without checking their correctness. The collector checks them
+    later with the `rework_*` methods.
+    """
     def __init__(self, working_dir: pathlib.Path):
         self.working_dir = pathlib.Path(working_dir)
 
@@ -75,16 +62,19 @@ class Collector:
         self.balderglob_was_loaded = False
 
     @staticmethod
-    def register_raw_fixture(fixture: Callable, level: str):
+    def register_raw_fixture(fixture: Callable, level: str, **options):
         """
         allows to register a new fixture - used by decorator `@balder.fixture()`
 
         :param level: the fixture level
         :param fixture: the fixture callable itself
+        :param options: the additional options of the fixture (for example `lazy`)
         """
-        if level not in Collector._raw_fixtures.keys():
-            Collector._raw_fixtures[level] = []
-        Collector._raw_fixtures[level].append(fixture)
+        registry = SessionRegistry.get_active()
+        if level not in registry.raw_fixtures.keys():
+            registry.raw_fixtures[level] = []
+        registry.raw_fixtures[level].append(fixture)
+        registry.raw_fixture_options[fixture] = options
 
     @staticmethod
     def register_possible_method_variation(
@@ -98,9 +88,10 @@ class Collector:
         :param vdevice: the vdevice the method is for
         :param with_connections: the connections the method is for
         """
-        if meth not in Collector._possible_method_variations.keys():
-            Collector._possible_method_variations[meth] = []
-        Collector._possible_method_variations[meth].append((vdevice, with_connections))
+        possible_method_variations = SessionRegistry.get_active().possible_method_variations
+        if meth not in possible_method_variations.keys():
+            possible_method_variations[meth] = []
+        possible_method_variations[meth].append((vdevice, with_connections))
 
     @staticmethod
     def register_possible_parametrization(
@@ -116,11 +107,38 @@ class Collector:
         :param field_name: the name of the method argument, the parametrized value should be added
         :param values: an Iterable of all values that should be parametrized or the FeatureAccessSelector object
         """
-        if meth not in Collector._possible_parametrization.keys():
-            Collector._possible_parametrization[meth] = {}
-        if field_name in Collector._possible_parametrization[meth].keys():
+        possible_parametrization = SessionRegistry.get_active().possible_parametrization
+        if meth not in possible_parametrization.keys():
+            possible_parametrization[meth] = {}
+        if field_name in possible_parametrization[meth].keys():
             raise ValueError(f'field `{field_name}` already registered for method `{meth.__qualname__}`')
-        Collector._possible_parametrization[meth][field_name] = values
+        possible_parametrization[meth][field_name] = values
+
+    @staticmethod
+    def register_possible_parallel_safe_test(meth: Callable):
+        """
+        allows to register a test method that can be executed in parallel - used by decorator `@balder.parallel_safe`
+
+        :param meth: the method that should be registered
+        """
+        possible_parallel_safe_tests = SessionRegistry.get_active().possible_parallel_safe_tests
+        if meth not in possible_parallel_safe_tests:
+            possible_parallel_safe_tests.append(meth)
+
+    @staticmethod
+    def register_possible_nwise_parametrization(meth: Callable, strength: int, seed: Union[int, None]):
+        """
+        allows to register a test method whose parametrization should be reduced to a n-wise covering array - used by
+        decorator `@balder.parametrize_nwise()`
+
+        :param meth: the method that should be registered
+        :param strength: the number of parameters every covered combination consists of
+        :param seed: the seed the covering array should be determined with (None if the session seed should be used)
+        """
+        possible_nwise_parametrization = SessionRegistry.get_active().possible_nwise_parametrization
+        if meth in possible_nwise_parametrization.keys():
+            raise ValueError(f'the method `{meth.__qualname__}` has more than one `@parametrize_nwise` decorator')
+        possible_nwise_parametrization[meth] = (strength, seed)
 
     @property
     def all_pyfiles(self) -> List[pathlib.Path]:
@@ -224,7 +242,7 @@ class Collector:
         :return: the fixture manager that is valid for this session
         """
         resolved_dict = {}
-        for cur_level_as_str, all_fixture_callable_of_that_level in self._raw_fixtures.items():
+        for cur_level_as_str, all_fixture_callable_of_that_level in SessionRegistry.get_active().raw_fixtures.items():
             cur_level = FixtureExecutionLevel(cur_level_as_str)
             resolved_dict[cur_level] = {}
             for cur_callable in all_fixture_callable_of_that_level:
@@ -235,7 +253,7 @@ class Collector:
                     if cls not in resolved_dict[cur_level].keys():
                         resolved_dict[cur_level][cls] = []
                     resolved_dict[cur_level][cls].append((func_type, cur_callable))
-        return FixtureManager(resolved_dict)
+        return FixtureManager(resolved_dict, fixture_options=SessionRegistry.get_active().raw_fixture_options)
 
     def load_balderglob_py_file(self) -> Union[types.ModuleType, None]:
         """
@@ -250,14 +268,32 @@ class Collector:
 
         if filepath.is_file():
             self.balderglob_was_loaded = True
-
-            spec = importlib.util.spec_from_file_location(module_name, filepath)
-            cur_module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = cur_module
-            spec.loader.exec_module(cur_module)
-            return cur_module
+            return self._import_module(module_name, filepath)
         return None
 
+    @staticmethod
+    def is_connection_py_file(path: pathlib.Path) -> bool:
+        """
+        returns True if the given python file is a connection module (it is directly located in a submodule
+        `connections`)
+        """
+        return 'connections' in path.parts[-2] or 'connections.py' == path.parts[-1]
+
+    @staticmethod
+    def _import_module(module_name: str, filepath: pathlib.Path) -> types.ModuleType:
+        """
+        This method imports the given python file with the given module name and returns the module. If the module was
+        already imported (for example by another module or by an earlier session in watch mode), the already imported
+        module is returned, so that every class exists only once.
+        """
+        if module_name in sys.modules.keys():
+            return sys.modules[module_name]
+        spec = importlib.util.spec_from_file_location(module_name, filepath)
+        cur_module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = cur_module
+        spec.loader.exec_module(cur_module)
+        return cur_module
+
     def get_all_py_files(self) -> List[pathlib.Path]:
         """
         This method returns all python modules that the system can find in the current set WORKING_DIR. It doesn't
@@ -296,14 +332,7 @@ class Collector:
                 f"{self.working_dir.stem}.{'.'.join(cur_path.parent.relative_to(self.working_dir).parts)}." \
                 f"{ cur_path.stem}"
 
-            if module_name in sys.modules.keys():
-                # ignore all already imported items
-                continue
-
-            spec = importlib.util.spec_from_file_location(module_name, cur_path)
-            cur_module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = cur_module
-            spec.loader.exec_module(cur_module)
+            cur_module = self._import_module(module_name, cur_path)
             class_members = inspect.getmembers(cur_module, inspect.isclass)
             for cur_class_name, cur_class in class_members:
                 if cur_class_name.startswith('Scenario') and issubclass(cur_class, Scenario) \
@@ -328,15 +357,12 @@ class Collector:
         """
         for cur_path in py_file_paths:
             #: only use files that match the filter
-            if 'connections' in cur_path.parts[-2] or 'connections.py' == cur_path.parts[-1]:
+            if self.is_connection_py_file(cur_path):
                 module_name = \
                     f"{self.working_dir.stem}.{'.'.join(cur_path.parent.relative_to(self.working_dir).parts)}." \
                     f"{cur_path.stem}"
 
-                spec = importlib.util.spec_from_file_location(module_name, cur_path)
-                cur_module = importlib.util.module_from_spec(spec)
-                sys.modules[module_name] = cur_module
-                spec.loader.exec_module(cur_module)
+                self._import_module(module_name, cur_path)
 
     def get_all_connection_classes(self) -> List[Type[Connection]]:
         """
@@ -381,14 +407,7 @@ class Collector:
                 f"{self.working_dir.stem}.{'.'.join(cur_path.parent.relative_to(self.working_dir).parts)}." \
                 f"{cur_path.stem}"
 
-            # ignore all already imported items
-            if module_name in sys.modules.keys():
-                continue
-
-            spec = importlib.util.spec_from_file_location(module_name, cur_path)
-            cur_module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = cur_module
-            spec.loader.exec_module(cur_module)
+            cur_module = self._import_module(module_name, cur_path)
             class_members = inspect.getmembers(cur_module, inspect.isclass)
             for cur_class_name, cur_class in class_members:
                 if cur_class_name.startswith('Setup') and issubclass(cur_class, Setup) and cur_class != Setup:
@@ -475,15 +494,31 @@ class Collector:
                                              f"IGNORE in a higher parent class - not possible to add it now to "
                                              f"SKIP")
 
+    @staticmethod
+    def _reset_method_variations_of(decorated_functions: Iterable[Callable]):
+        """
+        This method resets the method variations of all features that define one of the given decorated functions. The
+        controllers of features that were not imported again (see watch mode) still contain the method variations of an
+        earlier collection - these are determined again.
+
+        :param decorated_functions: the functions that were decorated with `@for_vdevice(..)`
+        """
+        for cur_owner in set(get_class_that_defines_method(cur_fn) for cur_fn in decorated_functions):
+            if cur_owner is not None and issubclass(cur_owner, Feature):
+                FeatureController.get_for(cur_owner).set_method_based_for_vdevice(None)
+
     @staticmethod
     def rework_method_variation_decorators():
         """
-        This method iterates over the static attribute `Collector._possible_method_variations` and checks if these
+        This method iterates over the registered method variations of the active session registry and checks if these
         decorated functions are valid (if they are methods of a :meth:`Feature` class). All valid decorated data will
         then be set for the related feature classes.
         """
 
-        for cur_fn, cur_decorator_data_list in Collector._possible_method_variations.items():
+        possible_method_variations = SessionRegistry.get_active().possible_method_variations
+        Collector._reset_method_variations_of(possible_method_variations.keys())
+
+        for cur_fn, cur_decorator_data_list in possible_method_variations.items():
             owner = get_class_that_defines_method(cur_fn)
             owner_feature_controller = FeatureController.get_for(owner)
             name = cur_fn.__name__
@@ -550,17 +585,23 @@ class Collector:
                 return method_variation_multiplexer
 
             new_callback = owner_wrapper(owner, name, cur_fn)
+            # the statistics of cached method variations are provided together by the multiplexer
+            all_variation_caches = [FeatureMethodCache.get_for(cur_variation)
+                                    for cur_variation in owner_for_vdevice[name].keys()]
+            all_variation_caches = [cur_cache for cur_cache in all_variation_caches if cur_cache is not None]
+            if all_variation_caches:
+                FeatureMethodCache.attach_statistic_methods(new_callback, all_variation_caches)
             setattr(owner, name, new_callback)
             owner_feature_controller.set_method_based_for_vdevice(owner_for_vdevice)
 
     @staticmethod
     def rework_parametrization_decorators():
         """
-        This method iterates over the static attribute `Collector._possible_static_parametrization` and checks if these
+        This method iterates over the registered parametrization of the active session registry and checks if these
         decorated functions are valid (if they are test methods and part of a :meth:`Scenario` class).
         """
 
-        for cur_fn, cur_decorator_data_dict in Collector._possible_parametrization.items():
+        for cur_fn, cur_decorator_data_dict in SessionRegistry.get_active().possible_parametrization.items():
             owner = get_class_that_defines_method(cur_fn)
             if not issubclass(owner, Scenario):
                 raise TypeError(f'the related class of `{cur_fn.__qualname__}` is not a `Scenario` class')
@@ -585,6 +626,39 @@ class Collector:
 
             owner_scenario_controller.check_for_parameter_loop_in_dynamic_parametrization(cur_fn)
 
+    @staticmethod
+    def rework_parallel_safe_decorators():
+        """
+        This method iterates over the registered parallel-safe tests of the active session registry and checks if
+        these decorated functions are valid (if they are test methods and part of a :meth:`Scenario` class).
+        """
+        for cur_fn in SessionRegistry.get_active().possible_parallel_safe_tests:
+            owner = get_class_that_defines_method(cur_fn)
+            if owner is None or not issubclass(owner, Scenario):
+                raise TypeError(f'the related class of `{cur_fn.__qualname__}` is not a `Scenario` class')
+            owner_scenario_controller = ScenarioController.get_for(owner)
+            if cur_fn not in owner_scenario_controller.get_all_test_methods():
+                raise TypeError(f'the method {cur_fn.__qualname__} is not a test method')
+            owner_scenario_controller.register_parallel_safe_test_method(cur_fn)
+
+    @staticmethod
+    def rework_parametrize_nwise_decorators():
+        """
+        This method iterates over the registered n-wise parametrization of the active session registry and checks if
+        these decorated functions are valid (if they are parametrized test methods and part of a :meth:`Scenario`
+        class).
+        """
+        for cur_fn, (cur_strength, cur_seed) in SessionRegistry.get_active().possible_nwise_parametrization.items():
+            owner = get_class_that_defines_method(cur_fn)
+            if owner is None or not issubclass(owner, Scenario):
+                raise TypeError(f'the related class of `{cur_fn.__qualname__}` is not a `Scenario` class')
+            owner_scenario_controller = ScenarioController.get_for(owner)
+            if cur_fn not in owner_scenario_controller.get_all_test_methods():
+                raise TypeError(f'the method {cur_fn.__qualname__} is not a test method')
+            if not owner_scenario_controller.get_parametrization_for(cur_fn):
+                raise TypeError(f'the method {cur_fn.__qualname__} uses `@parametrize_nwise` but is not parametrized')
+            owner_scenario_controller.register_nwise_parametrization(cur_fn, cur_strength, cur_seed)
+
     def get_all_scenario_feature_classes(self) -> List[Type[Feature]]:
         """
         This method returns a list with all :class:`Feature` classes that are being instantiated in one or more
@@ -813,17 +887,19 @@ class Collector:
         return list(set(remaining))
 
     def collect(self, plugin_manager: PluginManager, scenario_filter_patterns: Union[List[str], None],
-                setup_filter_patterns: Union[List[str], None]):
+                setup_filter_patterns: Union[List[str], None], py_files: Union[List[pathlib.Path], None] = None):
         """
         This method manages the entire collection process.
 
         :param plugin_manager: contains the reference to the used plugin manager
         :param scenario_filter_patterns: a list with filter patterns for scenarios
         :param setup_filter_patterns: a list with filter patterns for setups
+        :param py_files: the python files that should be collected (default: all python files of the working
+                         directory) - used to import only the files an execution plan references
         """
         # load all py files
         self.load_balderglob_py_file()
-        self._all_py_files = self.get_all_py_files()
+        self._all_py_files = self.get_all_py_files() if py_files is None else py_files
         self._all_py_files = plugin_manager.execute_modify_collected_pyfiles(self._all_py_files)
 
         if scenario_filter_patterns:
@@ -858,6 +934,8 @@ class Collector:
 
         Collector.rework_method_variation_decorators()
         Collector.rework_parametrization_decorators()
+        Collector.rework_parallel_safe_decorators()
+        Collector.rework_parametrize_nwise_decorators()
 
         # do some further stuff after everything was read
         self._set_original_vdevice_in_features()
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import os
+import socket
 import pathlib
 import sys
+import argparse
 import traceback
-from typing import Callable, Optional, Union, List
+from typing import Callable, Optional, Union, List, Tuple, TYPE_CHECKING
 from _balder.exit_code import ExitCode
-from _balder.testresult import ResultState
-from _balder.exceptions import BalderException
-from _balder.balder_session import BalderSession
+
+if TYPE_CHECKING:
+    from _balder.balder_session import BalderSession
+
+# pylint: disable=import-outside-toplevel
+# the modules of the session are imported within the functions that need them, so that the commands that only talk to
+# a running daemon start fast
 
 
 def console_balder(cmd_args: Optional[List[str]] = None, working_dir: Union[str, pathlib.Path, None] = None):
@@ -15,13 +22,162 @@ def console_balder(cmd_args: Optional[List[str]] = None, working_dir: Union[str,
     _console_balder_debug(cmd_args=cmd_args, working_dir=working_dir)
 
 
+def _console_daemon(cmd_args: List[str], working_dir: Union[str, pathlib.Path, None] = None) -> int:
+    """
+    helper that handles the daemon arguments `--daemon`, `--use-daemon` and `--stop-daemon`
+
+    :return: the exit code
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--daemon', action='store_true')
+    parser.add_argument('--use-daemon', action='store_true')
+    parser.add_argument('--stop-daemon', action='store_true')
+    parser.add_argument('--daemon-socket', default=None)
+    parser.add_argument('--working-dir', nargs="?", default=None)
+    daemon_args, remaining_args = parser.parse_known_args(cmd_args)
+    if not hasattr(os, 'fork') or not hasattr(socket, 'AF_UNIX'):
+        print("the balder daemon is only available on POSIX systems", file=sys.stderr)
+        return ExitCode.BALDER_USAGE_ERROR.value
+    if working_dir is None:
+        working_dir = daemon_args.working_dir if daemon_args.working_dir is not None else os.getcwd()
+
+    if daemon_args.daemon:
+        from _balder.daemon.server import DaemonServer
+        DaemonServer(working_dir, daemon_args.daemon_socket).run()
+        return ExitCode.SUCCESS.value
+    from _balder.daemon.client import DaemonClient
+    client = DaemonClient(working_dir, daemon_args.daemon_socket)
+    try:
+        if daemon_args.stop_daemon:
+            client.stop()
+            return ExitCode.SUCCESS.value
+        return client.run(remaining_args)
+    except ConnectionError as exc:
+        print(str(exc), file=sys.stderr)
+        return ExitCode.BALDER_USAGE_ERROR.value
+
+
+def _console_watch(cmd_args: List[str], working_dir: Union[str, pathlib.Path, None] = None) -> int:
+    """
+    helper that handles the argument `--watch` - executes the session and all following sessions after changes
+
+    :return: the exit code
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--watch', action='store_true')
+    parser.add_argument('--watch-interval', type=float, default=0.5)
+    parser.add_argument('--working-dir', nargs="?", default=None)
+    watch_args, remaining_args = parser.parse_known_args(cmd_args)
+    if any(cur_arg in remaining_args for cur_arg in ('--daemon', '--use-daemon', '--stop-daemon', '--coordinator')) \
+            or (remaining_args and remaining_args[0] == 'worker'):
+        print("the watch mode can not be combined with the daemon or the distributed execution", file=sys.stderr)
+        return ExitCode.BALDER_USAGE_ERROR.value
+    if watch_args.watch_interval <= 0:
+        print("argument --watch-interval: the value has to be greater than 0", file=sys.stderr)
+        return ExitCode.BALDER_USAGE_ERROR.value
+    if working_dir is None:
+        working_dir = watch_args.working_dir if watch_args.working_dir is not None else os.getcwd()
+    from _balder.watcher import Watcher
+    try:
+        Watcher(remaining_args, working_dir, interval=watch_args.watch_interval).run()
+    except KeyboardInterrupt:
+        pass
+    return ExitCode.SUCCESS.value
+
+
+def _console_plan_diff(cmd_args: List[str]) -> int:
+    """
+    helper that handles the command `balder plan-diff OLD NEW` - prints the variations (and testcases) that were added
+    or removed between two execution plans
+
+    :return: the exit code
+    """
+    from _balder.execution_plan import ExecutionPlan
+    from _balder.exceptions import ExecutionPlanError
+    parser = argparse.ArgumentParser(
+        prog='balder plan-diff',
+        description='shows the variations that were added or removed between two execution plans (see `--save-plan`)')
+    parser.add_argument('old_plan', help="the older execution plan")
+    parser.add_argument('new_plan', help="the newer execution plan")
+    diff_args = parser.parse_args(cmd_args)
+    try:
+        old_plan = ExecutionPlan.load(diff_args.old_plan)
+        new_plan = ExecutionPlan.load(diff_args.new_plan)
+    except ExecutionPlanError as exc:
+        print(str(exc), file=sys.stderr)
+        return ExitCode.BALDER_USAGE_ERROR.value
+    added, removed, changed = old_plan.diff(new_plan)
+    print(f"{len(added)} variation(s) added, {len(removed)} variation(s) removed, {len(changed)} variation(s) with "
+          f"changed testcases")
+    for cur_variation_id in added:
+        print(f"+ {cur_variation_id}")
+    for cur_variation_id in removed:
+        print(f"- {cur_variation_id}")
+    for cur_variation_id, (added_testcases, removed_testcases) in changed.items():
+        print(f"~ {cur_variation_id}")
+        for cur_testcase_id in added_testcases:
+            print(f"    + {cur_testcase_id.rpartition('::')[2]}")
+        for cur_testcase_id in removed_testcases:
+            print(f"    - {cur_testcase_id.rpartition('::')[2]}")
+    return ExitCode.SUCCESS.value
+
+
+#: the handlers of the sub-commands, that are executed instead of a balder session - every entry consists of a function
+#: that checks if the command line arguments request the sub-command and the handler that returns the exit code
+_SUB_COMMAND_HANDLERS: List[Tuple[Callable[[List[str]], bool],
+                                  Callable[[List[str], Union[str, pathlib.Path, None]], int]]] = [
+    (lambda cmd_args: any(cur_arg in cmd_args for cur_arg in ('--daemon', '--use-daemon', '--stop-daemon')),
+     _console_daemon),
+    (lambda cmd_args: '--watch' in cmd_args, _console_watch),
+    (lambda cmd_args: cmd_args[:1] == ['plan-diff'], lambda cmd_args, _: _console_plan_diff(cmd_args[1:])),
+]
+
+
+def _get_exit_code_of(balder_session: BalderSession) -> int:
+    """
+    helper that returns the exit code for the given executed session
+    """
+    from _balder.testresult import ResultState
+    from _balder.exceptions import BalderException
+    if balder_session.executor_tree is None:
+        return ExitCode.SUCCESS.value
+    if balder_session.executor_tree.executor_result in [ResultState.ERROR, ResultState.FAILURE]:
+        # check if a BalderException was thrown too -> would be a balder environment error -> special exit code
+        balder_exceptions = [cur_exc for cur_exc in balder_session.executor_tree.get_all_recognized_exception()
+                             if isinstance(cur_exc, BalderException)]
+        if len(balder_exceptions) > 0:
+            return ExitCode.BALDER_USAGE_ERROR.value
+        return ExitCode.TESTS_FAILED.value
+    return ExitCode.SUCCESS.value
+
+
 # pylint: disable-next=too-many-arguments
 def _console_balder_debug(cmd_args: Optional[List[str]] = None, working_dir: Union[str, pathlib.Path, None] = None,
                           cb_session_created: Optional[Callable] = None, cb_run_finished: Optional[Callable] = None,
-                          cb_balder_exc: Optional[Callable] = None, cb_unexpected_exc: Optional[Callable] = None):
-    """helper balder execution that allows more debug access"""
+                          cb_balder_exc: Optional[Callable] = None, cb_unexpected_exc: Optional[Callable] = None,
+                          *, balder_session: Optional[BalderSession] = None):
+    """
+    helper balder execution that allows more debug access
+
+    If `balder_session` is given, this already collected session is executed with the given command line arguments
+    (used by the daemon). The sub-commands (see `_SUB_COMMAND_HANDLERS`) are only available without a given session.
+    """
+    from _balder.exceptions import BalderException
+    from _balder.balder_session import BalderSession
     try:
-        balder_session = BalderSession(cmd_args=cmd_args, working_dir=working_dir)
+        if cmd_args is None:
+            cmd_args = sys.argv[1:]
+        if balder_session is None:
+            for cur_is_requested, cur_handler in _SUB_COMMAND_HANDLERS:
+                if cur_is_requested(cmd_args):
+                    sys.exit(cur_handler(cmd_args, working_dir))
+        # `balder worker ...` starts a worker session that executes the variations a coordinator assigns to it
+        worker_mode = cmd_args[:1] == ['worker']
+        cmd_args = cmd_args[1:] if worker_mode else cmd_args
+        if balder_session is None:
+            balder_session = BalderSession(cmd_args=cmd_args, working_dir=working_dir, worker_mode=worker_mode)
+        else:
+            balder_session.update_cmd_args(cmd_args)
 
         if cb_session_created:
             cb_session_created(balder_session)
@@ -31,18 +187,7 @@ def _console_balder_debug(cmd_args: Optional[List[str]] = None, working_dir: Uni
         if cb_run_finished:
             cb_run_finished(balder_session)
 
-        if balder_session.executor_tree is None:
-            sys.exit(ExitCode.SUCCESS.value)
-        elif balder_session.executor_tree.executor_result == ResultState.SUCCESS:
-            sys.exit(ExitCode.SUCCESS.value)
-        elif balder_session.executor_tree.executor_result in [ResultState.ERROR, ResultState.FAILURE]:
-            # check if a BalderException was thrown too -> would be a balder environment error -> special exit code
-            balder_exceptions = [cur_exc for cur_exc in balder_session.executor_tree.get_all_recognized_exception()
-                                 if isinstance(cur_exc, BalderException)]
-            if len(balder_exceptions) > 0:
-                sys.exit(ExitCode.BALDER_USAGE_ERROR.value)
-            else:
-                sys.exit(ExitCode.TESTS_FAILED.value)
+        sys.exit(_get_exit_code_of(balder_session))
 
     except BalderException as exc:
         # a balder usage error occurs
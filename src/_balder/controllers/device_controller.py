@@ -10,6 +10,7 @@ from _balder.setup import Setup
 from _balder.device import Device
 from _balder.vdevice import VDevice
 from _balder.scenario import Scenario
+from _balder.session_registry import SessionRegistry
 from _balder.controllers.base_device_controller import BaseDeviceController
 from _balder.controllers.feature_controller import FeatureController
 from _balder.exceptions import DeviceResolvingException, InnerFeatureResolvingError, \
@@ -29,9 +30,6 @@ class DeviceController(BaseDeviceController, ABC):
     # helper property to disable manual constructor creation
     __priv_instantiate_key = object()
 
-    #: contains all existing setup devices and its corresponding controller object
-    _items: Dict[Type[Device], DeviceController] = {}
-
     def __init__(self, related_cls, _priv_instantiate_key):
         super().__init__()
 
@@ -73,12 +71,13 @@ class DeviceController(BaseDeviceController, ABC):
         This class returns the current existing controller instance for the given item. If the instance does not exist
         yet, it will automatically create it and saves the instance in an internal dictionary.
         """
-        if DeviceController._items.get(related_cls) is None:
+        items = SessionRegistry.get_active().device_controllers
+        if items.get(related_cls) is None:
             item = DeviceController(
                 related_cls, _priv_instantiate_key=DeviceController.__priv_instantiate_key)
-            DeviceController._items[related_cls] = item
+            items[related_cls] = item
 
-        return DeviceController._items.get(related_cls)
+        return items.get(related_cls)
 
     # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
 
@@ -10,6 +10,7 @@ from _balder.device import Device
 from _balder.vdevice import VDevice
 from _balder.feature import Feature
 from _balder.controllers import Controller
+from _balder.session_registry import SessionRegistry
 from _balder.controllers.vdevice_controller import VDeviceController
 from _balder.connection import Connection
 from _balder.exceptions import UnclearMethodVariationError, MultiInheritanceError, VDeviceOverwritingError, \
@@ -25,9 +26,6 @@ class FeatureController(Controller):
     # helper property to disable manual constructor creation
     __priv_instantiate_key = object()
 
-    #: contains all existing feature and its corresponding controller object
-    _items: Dict[Type[Feature], FeatureController] = {}
-
     def __init__(self, related_cls, _priv_instantiate_key):
 
         # this helps to make this constructor only possible inside the controller object
@@ -73,11 +71,12 @@ class FeatureController(Controller):
         This class returns the current existing controller instance for the given item. If the instance does not exist
         yet, it will automatically create it and saves the instance in an internal dictionary.
         """
-        if FeatureController._items.get(related_cls) is None:
+        items = SessionRegistry.get_active().feature_controllers
+        if items.get(related_cls) is None:
             item = FeatureController(related_cls, _priv_instantiate_key=FeatureController.__priv_instantiate_key)
-            FeatureController._items[related_cls] = item
+            items[related_cls] = item
 
-        return FeatureController._items.get(related_cls)
+        return items.get(related_cls)
 
     # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
 
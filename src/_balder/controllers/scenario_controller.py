@@ -3,18 +3,20 @@ from typing import Type, Dict, List, Tuple, Union, Callable, Iterable, Any
 
 import logging
 import inspect
+from graphlib import TopologicalSorter
 from collections import OrderedDict
 from _balder.cnnrelations import OrConnectionRelation
 from _balder.device import Device
 from _balder.scenario import Scenario
 from _balder.connection import Connection
+from _balder.session_registry import SessionRegistry
 from _balder.controllers.feature_controller import FeatureController
 from _balder.controllers.device_controller import DeviceController
 from _balder.controllers.normal_scenario_setup_controller import NormalScenarioSetupController
 from _balder.parametrization import FeatureAccessSelector, Parameter
 from _balder.exceptions import UnclearAssignableFeatureConnectionError, ConnectionIntersectionError, \
     MultiInheritanceError
-from _balder.utils.functions import get_scenario_inheritance_list_of
+from _balder.utils.functions import get_scenario_inheritance_list_of, get_argument_names
 
 logger = logging.getLogger(__file__)
 
@@ -27,11 +29,6 @@ class ScenarioController(NormalScenarioSetupController):
     # helper property to disable manual constructor creation
     __priv_instantiate_key = object()
 
-    #: contains all existing scenarios and its corresponding controller object
-    _items: Dict[Type[Scenario], ScenarioController] = {}
-
-    _parametrization: Dict[Callable, Dict[str, Union[Iterable[Any], FeatureAccessSelector]]] = {}
-
     def __init__(self, related_cls, _priv_instantiate_key):
 
         # describes if the current controller is for setups or for scenarios (has to be set in child controller)
@@ -63,16 +60,43 @@ class ScenarioController(NormalScenarioSetupController):
         This class returns the current existing controller instance for the given item. If the instance does not exist
         yet, it will automatically create it and saves the instance in an internal dictionary.
         """
-        if ScenarioController._items.get(related_cls) is None:
+        items = SessionRegistry.get_active().scenario_controllers
+        if items.get(related_cls) is None:
             item = ScenarioController(related_cls, _priv_instantiate_key=ScenarioController.__priv_instantiate_key)
-            ScenarioController._items[related_cls] = item
+            items[related_cls] = item
 
-        return ScenarioController._items.get(related_cls)
+        return items.get(related_cls)
 
     # ---------------------------------- CLASS METHODS ----------------------------------------------------------------
 
     # ---------------------------------- PROPERTIES --------------------------------------------------------------------
 
+    @property
+    def _parametrization(self) -> Dict[Callable, Dict[str, Union[Iterable[Any], FeatureAccessSelector]]]:
+        """returns the registered parametrization of all test methods (of the active session)"""
+        return SessionRegistry.get_active().parametrization
+
+    @property
+    def _parallel_safe_test_methods(self) -> List[Callable]:
+        """returns all test methods that were marked with `@parallel_safe` (of the active session)"""
+        return SessionRegistry.get_active().parallel_safe_test_methods
+
+    @property
+    def _dynamic_parametrization_order(self) -> Dict[Callable, Tuple[str, ...]]:
+        """
+        returns the order the dynamic parametrization attributes of a test method have to be resolved in (it is
+        determined on first request)
+        """
+        return SessionRegistry.get_active().dynamic_parametrization_order
+
+    @property
+    def _nwise_parametrization(self) -> Dict[Callable, Tuple[int, Union[int, None]]]:
+        """
+        returns the strength and the seed (None for the session seed) of all test methods that were decorated with
+        `@parametrize_nwise` (of the active session)
+        """
+        return SessionRegistry.get_active().nwise_parametrization
+
     @property
     def related_cls(self) -> Type[Scenario]:
         return self._related_cls
@@ -119,7 +143,7 @@ class ScenarioController(NormalScenarioSetupController):
         params = self._parametrization[test_method]
 
         # get arguments in defined order
-        arguments = [name for name in inspect.getfullargspec(test_method).args if name in params.keys()]
+        arguments = [name for name in get_argument_names(test_method) if name in params.keys()]
         ordered_dict = OrderedDict()
         for cur_arg in arguments:
             cur_value = params[cur_arg]
@@ -130,6 +154,62 @@ class ScenarioController(NormalScenarioSetupController):
             ordered_dict[cur_arg] = params[cur_arg]
         return ordered_dict
 
+    def get_dynamic_parametrization_order_for(self, test_method: Callable) -> Tuple[str, ...]:
+        """
+        This method returns the names of all dynamic parametrization attributes of a test method of this Scenario in the
+        order they can be resolved in (attributes that use a :class:`Parameter` of another attribute come after it).
+        The order is only determined once for every test method.
+
+        :param test_method: the test method of the Scenario
+        """
+        if test_method not in self._dynamic_parametrization_order:
+            dynamic_parametrization = self.get_parametrization_for(test_method, static=False) or {}
+            # sort attributes according their Parameter - using TopologicalSorter
+            graph = {attr: [param.name for param in config.get_parameters(of_type=Parameter).values()]
+                     for attr, config in dynamic_parametrization.items()}
+            # also add all elements from static parameters
+            graph.update({param: [] for param in self.get_parametrization_for(test_method, dynamic=False) or {}})
+            self._dynamic_parametrization_order[test_method] = tuple(
+                attr for attr in TopologicalSorter(graph).static_order() if attr in dynamic_parametrization.keys())
+        return self._dynamic_parametrization_order[test_method]
+
+    def register_parallel_safe_test_method(self, test_method: Callable) -> None:
+        """
+        This method registers a test method of this Scenario as parallel-safe test method
+        """
+        if test_method not in self.get_all_test_methods():
+            raise ValueError(f'got test method `{test_method.__qualname__}` which is no part of the '
+                             f'scenario `{self.related_cls}`')
+        if test_method not in self._parallel_safe_test_methods:
+            self._parallel_safe_test_methods.append(test_method)
+
+    def is_parallel_safe(self, test_method: Callable) -> bool:
+        """
+        returns True if the given test method of this Scenario was marked as parallel-safe
+
+        :param test_method: the test method of the Scenario
+        """
+        return test_method in self._parallel_safe_test_methods
+
+    def register_nwise_parametrization(self, test_method: Callable, strength: int, seed: Union[int, None]) -> None:
+        """
+        This method registers that the parametrization of a test method of this Scenario should be reduced to a n-wise
+        covering array
+        """
+        if test_method not in self.get_all_test_methods():
+            raise ValueError(f'got test method `{test_method.__qualname__}` which is no part of the '
+                             f'scenario `{self.related_cls}`')
+        self._nwise_parametrization[test_method] = (strength, seed)
+
+    def get_nwise_parametrization_for(self, test_method: Callable) -> Tuple[int, Union[int, None]] | None:
+        """
+        returns the strength and the seed (None if the session seed should be used) of the n-wise reduction of the
+        given test method of this Scenario (None if the test method has no `@parametrize_nwise` decorator)
+
+        :param test_method: the test method of the Scenario
+        """
+        return self._nwise_parametrization.get(test_method)
+
     def register_covered_by_for(self, meth: Union[str, None], covered_by: Union[Scenario, Callable, None]) -> None:
         """
         This method registers a covered-by statement for this Scenario. If `meth` is provided, the statement is for the
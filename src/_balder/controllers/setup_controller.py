@@ -1,9 +1,10 @@
 from __future__ import annotations
-from typing import Type, Dict, Union, TYPE_CHECKING
+from typing import Type, Union, TYPE_CHECKING
 
 import logging
 from _balder.setup import Setup
 from _balder.exceptions import IllegalVDeviceMappingError, MultiInheritanceError
+from _balder.session_registry import SessionRegistry
 from _balder.controllers.feature_controller import FeatureController
 from _balder.controllers.device_controller import DeviceController
 from _balder.controllers.normal_scenario_setup_controller import NormalScenarioSetupController
@@ -22,9 +23,6 @@ class SetupController(NormalScenarioSetupController):
     # helper property to disable manual constructor creation
     __priv_instantiate_key = object()
 
-    #: contains all existing setups and its corresponding controller object
-    _items: Dict[Type[Setup], SetupController] = {}
-
     def __init__(self, related_cls, _priv_instantiate_key):
 
         # describes if the current controller is for setups or for scenarios (has to be set in child controller)
@@ -53,11 +51,12 @@ class SetupController(NormalScenarioSetupController):
         This class returns the current existing controller instance for the given item. If the instance does not exist
         yet, it will automatically create it and saves the instance in an internal dictionary.
         """
-        if SetupController._items.get(related_cls) is None:
+        items = SessionRegistry.get_active().setup_controllers
+        if items.get(related_cls) is None:
             item = SetupController(related_cls, _priv_instantiate_key=SetupController.__priv_instantiate_key)
-            SetupController._items[related_cls] = item
+            items[related_cls] = item
 
-        return SetupController._items.get(related_cls)
+        return items.get(related_cls)
 
     # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
 
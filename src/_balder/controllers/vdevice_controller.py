@@ -1,9 +1,10 @@
 from __future__ import annotations
-from typing import Type, Dict, Union
+from typing import Type, Union
 
 import logging
 from _balder.vdevice import VDevice
 from _balder.feature import Feature
+from _balder.session_registry import SessionRegistry
 from _balder.controllers.base_device_controller import BaseDeviceController
 from _balder.exceptions import VDeviceResolvingError
 
@@ -17,9 +18,6 @@ class VDeviceController(BaseDeviceController):
     # helper property to disable manual constructor creation
     __priv_instantiate_key = object()
 
-    #: contains all existing VDevices and its corresponding controller object
-    _items: Dict[Type[VDevice], VDeviceController] = {}
-
     def __init__(self, related_cls, _priv_instantiate_key):
         super().__init__()
 
@@ -46,11 +44,12 @@ class VDeviceController(BaseDeviceController):
         This class returns the current existing controller instance for the given item. If the instance does not exist
         yet, it will automatically create it and saves the instance in an internal dictionary.
         """
-        if VDeviceController._items.get(related_cls) is None:
+        items = SessionRegistry.get_active().vdevice_controllers
+        if items.get(related_cls) is None:
             item = VDeviceController(related_cls, _priv_instantiate_key=VDeviceController.__priv_instantiate_key)
-            VDeviceController._items[related_cls] = item
+            items[related_cls] = item
 
-        return VDeviceController._items.get(related_cls)
+        return items.get(related_cls)
 
     # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
 
@@ -0,0 +1,18 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from _balder.utils.lazy_loader import make_lazy_getattr
+
+if TYPE_CHECKING:
+    from _balder.daemon.server import DaemonServer
+    from _balder.daemon.client import DaemonClient
+
+# the server imports the whole balder session - it is imported on first access (see `__getattr__`), so that the client
+# starts fast
+_LAZY_OBJECTS = {
+    'DaemonServer': '_balder.daemon.server',
+    'DaemonClient': '_balder.daemon.client',
+}
+
+
+__getattr__ = make_lazy_getattr(__name__, _LAZY_OBJECTS)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+from typing import List, Union
+
+import os
+import sys
+import signal
+import socket
+import pathlib
+from _balder.exit_code import ExitCode
+from _balder.daemon.protocol import DaemonConnection, get_default_socket_path, MSG_RUN, MSG_STOP, MSG_STARTED, \
+    MSG_EXIT, MSG_ERROR
+
+
+class DaemonClient:
+    """
+    The client sends a requested run to a running :class:`DaemonServer`. It sends its stdin, stdout and stderr
+    together with the request, so that the run writes its output directly into the streams of the client.
+    """
+
+    def __init__(self, working_dir: Union[str, pathlib.Path], socket_path: Union[str, pathlib.Path, None] = None):
+        """
+        :param working_dir: the working directory of the environment
+
+        :param socket_path: the path of the unix socket the daemon listens on (default: `daemon.sock` in the
+                            `.balder_cache` directory of the working directory)
+        """
+        self._working_dir = pathlib.Path(working_dir).absolute()
+        self._socket_path = pathlib.Path(socket_path).absolute() if socket_path is not None else \
+            get_default_socket_path(self._working_dir)
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def socket_path(self) -> pathlib.Path:
+        """returns the path of the unix socket the daemon listens on"""
+        return self._socket_path
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _connect(self) -> DaemonConnection:
+        """connects to the daemon and returns the connection"""
+        client_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client_socket.connect(str(self._socket_path))
+        except OSError as exc:
+            client_socket.close()
+            raise ConnectionError(f"can not connect to a balder daemon on `{self._socket_path}` - start it with "
+                                  f"`balder --daemon`") from exc
+        return DaemonConnection(client_socket)
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def run(self, cmd_args: List[str]) -> int:
+        """
+        requests a run with the given command line arguments and waits till it is finished
+
+        :param cmd_args: the command line arguments of the run
+        :return: the exit code of the run
+        """
+        connection = self._connect()
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            connection.send(MSG_RUN, fds=[0, 1, 2], args=cmd_args, working_dir=str(self._working_dir),
+                            cwd=os.getcwd())
+            run_pid = None
+            while True:
+                try:
+                    message, _ = connection.receive(MSG_STARTED, MSG_EXIT, MSG_ERROR)
+                except KeyboardInterrupt:
+                    # the run is not part of the process group of the client - forward the interrupt to it
+                    if run_pid is None:
+                        raise
+                    os.kill(run_pid, signal.SIGINT)
+                    continue
+                if message is None:
+                    print("the connection to the balder daemon was closed unexpectedly", file=sys.stderr)
+                    return ExitCode.UNEXPECTED_ERROR.value
+                if message['type'] == MSG_STARTED:
+                    run_pid = message['pid']
+                elif message['type'] == MSG_ERROR:
+                    print(message['text'], file=sys.stderr)
+                    return message['exit_code']
+                else:
+                    return message['exit_code']
+        finally:
+            connection.close()
+
+    def stop(self) -> None:
+        """stops the daemon"""
+        connection = self._connect()
+        try:
+            connection.send(MSG_STOP)
+            connection.receive(MSG_EXIT)
+        finally:
+            connection.close()
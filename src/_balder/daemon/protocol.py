@@ -0,0 +1,111 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+import json
+import socket
+import pathlib
+from _balder.exceptions import DaemonProtocolError
+
+# all message types that can be sent between the daemon, its zygote and its clients (every message is a JSON object in
+# one line)
+
+#: sent by the client - contains the command line arguments that should be executed (the file descriptors of stdin,
+#: stdout and stderr of the client are sent together with this message)
+MSG_RUN = 'run'
+#: sent by the client if the daemon should terminate
+MSG_STOP = 'stop'
+#: sent by the zygote after it has collected the environment - contains the modules it has imported
+MSG_READY = 'ready'
+#: sent to the client by the process that executes the session - contains its process id
+MSG_STARTED = 'started'
+#: sent to the client after the session was executed - contains the exit code
+MSG_EXIT = 'exit'
+#: sent to the client if the session could not be executed - contains the error text and the exit code
+MSG_ERROR = 'error'
+
+#: the name of the socket file within the balder cache directory, if no other socket path is given
+SOCKET_FILE_NAME = 'daemon.sock'
+#: the maximum number of bytes that are received at once
+RECEIVE_SIZE = 65536
+
+
+def get_default_socket_path(working_dir: Union[str, pathlib.Path]) -> pathlib.Path:
+    """
+    returns the path of the socket the daemon of the given working directory listens on by default
+
+    :param working_dir: the working directory of the daemon
+    """
+    # the duration store imports all executors - it is not needed for the fast start of the client
+    from _balder.utils.duration_store import DurationStore  # pylint: disable=import-outside-toplevel
+    return pathlib.Path(working_dir) / DurationStore.CACHE_DIR_NAME / SOCKET_FILE_NAME
+
+
+class DaemonConnection:
+    """
+    wraps a connected unix socket and allows to send and receive messages (newline-delimited JSON objects) together
+    with file descriptors
+    """
+
+    def __init__(self, sock: socket.socket):
+        self._socket = sock
+        self._buffer = b''
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def socket(self) -> socket.socket:
+        """returns the wrapped socket"""
+        return self._socket
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def send(self, msg_type: str, fds: Iterable[int] = (), **data) -> None:
+        """
+        sends a new message
+
+        :param msg_type: the type of the message (one of the `MSG_*` constants)
+        :param fds: the file descriptors that should be sent together with the message
+        :param data: the data of the message (has to be JSON serializable)
+        """
+        payload = (json.dumps({'type': msg_type, **data}) + '\n').encode('utf-8')
+        fds = list(fds)
+        if fds:
+            sent = socket.send_fds(self._socket, [payload], fds)
+            payload = payload[sent:]
+        if payload:
+            self._socket.sendall(payload)
+
+    def receive(self, *expected_types: str, max_fds: int = 0) -> Tuple[Union[Dict[str, Any], None], List[int]]:
+        """
+        receives the next message
+
+        :param expected_types: the message types that are allowed (all types are allowed if this is empty)
+        :param max_fds: the maximum number of file descriptors that are expected together with the message
+        :return: the message (None if the connection was closed by the partner) and the received file descriptors
+        """
+        fds = []
+        while b'\n' not in self._buffer:
+            if max_fds:
+                data, new_fds, _, _ = socket.recv_fds(self._socket, RECEIVE_SIZE, max_fds)
+                fds.extend(new_fds)
+            else:
+                data = self._socket.recv(RECEIVE_SIZE)
+            if not data:
+                return None, fds
+            self._buffer += data
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        message = json.loads(line.decode('utf-8'))
+        if expected_types and message.get('type') not in expected_types:
+            raise DaemonProtocolError(f"received unexpected message of type `{message.get('type')}` (expected one "
+                                      f"of {', '.join(expected_types)})")
+        return message, fds
+
+    def close(self) -> None:
+        """closes the connection"""
+        self._socket.close()
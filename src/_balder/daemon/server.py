@@ -0,0 +1,332 @@
+from __future__ import annotations
+from typing import Dict, List, Union
+
+import os
+import sys
+import signal
+import socket
+import pathlib
+import argparse
+import importlib
+import traceback
+from _balder.exit_code import ExitCode
+from _balder.exceptions import BalderException
+from _balder.balder_session import BalderSession
+from _balder.utils.functions import get_py_file_snapshot
+from _balder.daemon.protocol import DaemonConnection, get_default_socket_path, MSG_RUN, MSG_STOP, MSG_READY, \
+    MSG_EXIT, MSG_ERROR, MSG_STARTED
+
+
+class DaemonZygote:
+    """
+    The zygote is a process of the :class:`DaemonServer` that has imported and collected the environment. It forks a
+    new process for every requested run - this process executes the session with the command line arguments of the
+    client, without importing or collecting the environment again. The zygote itself is never changed by a run.
+    """
+
+    def __init__(self, working_dir: pathlib.Path, connection: DaemonConnection):
+        """
+        :param working_dir: the working directory of the environment
+
+        :param connection: the connection to the :class:`DaemonServer`
+        """
+        self._working_dir = working_dir
+        self._connection = connection
+        #: the collected session (all runs are forked from it)
+        self._session: Union[BalderSession, None] = None
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _get_imported_external_modules(self) -> List[str]:
+        """returns the names of all imported modules that are not part of the working directory"""
+        result = []
+        for cur_name, cur_module in list(sys.modules.items()):
+            cur_file = getattr(cur_module, '__file__', None)
+            if cur_file is None or cur_name == '__main__':
+                continue
+            if not pathlib.Path(cur_file).absolute().is_relative_to(self._working_dir):
+                result.append(cur_name)
+        return sorted(result)
+
+    def _execute(self, message: dict, fds: List[int]) -> None:
+        """
+        executes the requested run within the forked process and sends the exit code to the client - the file
+        descriptors are the client socket and the stdin, stdout and stderr of the client
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from _balder.console.balder import _console_balder_debug  # the console module imports the daemon itself
+
+        client_connection = DaemonConnection(socket.socket(fileno=fds[0]))
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for cur_target_fd, cur_fd in enumerate(fds[1:4]):
+            os.dup2(cur_fd, cur_target_fd)
+            os.close(cur_fd)
+        try:
+            os.chdir(message['cwd'])
+        except OSError:
+            pass
+        client_connection.send(MSG_STARTED, pid=os.getpid())
+
+        exit_code = ExitCode.SUCCESS.value
+        try:
+            _console_balder_debug(cmd_args=message['args'], working_dir=self._working_dir,
+                                  balder_session=self._session)
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else ExitCode.SUCCESS.value if exc.code is None else \
+                ExitCode.UNEXPECTED_ERROR.value
+        sys.stdout.flush()
+        sys.stderr.flush()
+        client_connection.send(MSG_EXIT, exit_code=exit_code)
+        client_connection.close()
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def run(self, collection_args: List[str]) -> None:
+        """
+        collects the environment and forks a process for every requested run, till the connection to the server is
+        closed
+
+        :param collection_args: the command line arguments that influence the collecting process
+        """
+        try:
+            self._session = BalderSession(cmd_args=collection_args, working_dir=self._working_dir)
+            self._session.collect()
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else ExitCode.UNEXPECTED_ERROR.value
+            self._connection.send(MSG_ERROR, text=traceback.format_exc(), exit_code=exit_code)
+            return
+        except BalderException:
+            self._connection.send(MSG_ERROR, text=traceback.format_exc(), exit_code=ExitCode.BALDER_USAGE_ERROR.value)
+            return
+        except Exception:  # pylint: disable=broad-exception-caught
+            self._connection.send(MSG_ERROR, text=traceback.format_exc(), exit_code=ExitCode.UNEXPECTED_ERROR.value)
+            return
+        self._connection.send(MSG_READY, modules=self._get_imported_external_modules())
+
+        # the forked runs are reaped automatically
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+        while True:
+            message, fds = self._connection.receive(MSG_RUN, max_fds=4)
+            if message is None:
+                return
+            pid = os.fork()
+            if pid == 0:
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                self._connection.close()
+                try:
+                    self._execute(message, fds)
+                finally:
+                    os._exit(0)  # pylint: disable=protected-access
+            for cur_fd in fds:
+                os.close(cur_fd)
+
+
+class DaemonServer:
+    """
+    The daemon keeps a warm process for one working directory and executes the runs clients request over a local unix
+    socket.
+
+    The daemon itself only imports balder and all modules outside the working directory the environment needs. It
+    forks a :class:`DaemonZygote`, that imports and collects the environment, and forwards every requested run to it.
+    Before every run, the daemon compares the modification times of all python files of the working directory with the
+    ones the zygote was started with - if a file was changed, added or removed, a new zygote is forked, that imports
+    the files of the working directory again (all other modules are still imported).
+    """
+
+    def __init__(self, working_dir: Union[str, pathlib.Path], socket_path: Union[str, pathlib.Path, None] = None):
+        """
+        :param working_dir: the working directory of the environment
+
+        :param socket_path: the path of the unix socket the daemon listens on (default: `daemon.sock` in the
+                            `.balder_cache` directory of the working directory)
+        """
+        self._working_dir = pathlib.Path(working_dir).absolute()
+        self._socket_path = pathlib.Path(socket_path).absolute() if socket_path is not None else \
+            get_default_socket_path(self._working_dir)
+
+        #: the listening socket (None if the daemon is not running)
+        self._server_socket: Union[socket.socket, None] = None
+        #: the process id of the current zygote (None if there is no zygote)
+        self._zygote_pid: Union[int, None] = None
+        #: the connection to the current zygote
+        self._zygote_connection: Union[DaemonConnection, None] = None
+        #: the command line arguments the current zygote has collected the environment with
+        self._zygote_collection_args: Union[List[str], None] = None
+        #: the modification times of all python files of the working directory, the current zygote was started with
+        self._zygote_snapshot: Dict[str, int] = {}
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    @staticmethod
+    def get_collection_args(cmd_args: List[str]) -> List[str]:
+        """
+        returns the command line arguments of the given ones, that influence the collecting process (a run with other
+        collection arguments needs a new zygote)
+
+        :param cmd_args: all command line arguments of a run
+        """
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument('--only-with-setup', nargs="*")
+        parser.add_argument('--only-with-scenario', nargs="*")
+        known_args, _ = parser.parse_known_args(cmd_args)
+        result = []
+        if known_args.only_with_setup is not None:
+            result += ['--only-with-setup', *known_args.only_with_setup]
+        if known_args.only_with_scenario is not None:
+            result += ['--only-with-scenario', *known_args.only_with_scenario]
+        return result
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def working_dir(self) -> pathlib.Path:
+        """returns the working directory of the environment"""
+        return self._working_dir
+
+    @property
+    def socket_path(self) -> pathlib.Path:
+        """returns the path of the unix socket the daemon listens on"""
+        return self._socket_path
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _get_snapshot(self) -> Dict[str, int]:
+        """returns the modification times of all python files of the working directory"""
+        return get_py_file_snapshot(self._working_dir)
+
+    def _start_zygote(self, collection_args: List[str], client_fds: List[int]) -> Union[dict, None]:
+        """
+        forks a new zygote that collects the environment with the given arguments
+
+        :param collection_args: the command line arguments that influence the collecting process
+        :param client_fds: the file descriptors of the current client (the zygote closes its inherited copies, because
+                           the client waits till all of them are closed)
+
+        :return: None if the zygote is ready, otherwise the error message of the zygote
+        """
+        self._zygote_snapshot = self._get_snapshot()
+        server_side, zygote_side = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        pid = os.fork()
+        if pid == 0:
+            server_side.close()
+            self._server_socket.close()
+            for cur_fd in client_fds:
+                os.close(cur_fd)
+            try:
+                DaemonZygote(self._working_dir, DaemonConnection(zygote_side)).run(
+                    ['--working-dir', str(self._working_dir), *collection_args])
+            finally:
+                os._exit(0)  # pylint: disable=protected-access
+        zygote_side.close()
+        self._zygote_pid = pid
+        self._zygote_connection = DaemonConnection(server_side)
+        self._zygote_collection_args = collection_args
+
+        message, _ = self._zygote_connection.receive(MSG_READY, MSG_ERROR)
+        if message is None or message['type'] == MSG_ERROR:
+            self._stop_zygote()
+            return message if message is not None else {
+                'type': MSG_ERROR, 'text': 'the zygote of the balder daemon terminated unexpectedly',
+                'exit_code': ExitCode.UNEXPECTED_ERROR.value}
+        # import all external modules, so that the next zygotes do not need to import them again
+        for cur_module_name in message['modules']:
+            if cur_module_name not in sys.modules:
+                try:
+                    importlib.import_module(cur_module_name)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # the module will be imported by the zygote itself
+                    pass
+        return None
+
+    def _stop_zygote(self) -> None:
+        """stops the current zygote (the runs that were forked by it are not affected)"""
+        if self._zygote_connection is not None:
+            self._zygote_connection.close()
+            self._zygote_connection = None
+        if self._zygote_pid is not None:
+            os.waitpid(self._zygote_pid, 0)
+            self._zygote_pid = None
+        self._zygote_collection_args = None
+
+    def _handle_client(self, connection: DaemonConnection) -> bool:
+        """
+        handles the request of a connected client
+
+        :return: False if the daemon should terminate, otherwise True
+        """
+        message, fds = connection.receive(MSG_RUN, MSG_STOP, max_fds=3)
+        try:
+            if message is None:
+                return True
+            if message['type'] == MSG_STOP:
+                connection.send(MSG_EXIT, exit_code=ExitCode.SUCCESS.value)
+                return False
+            if pathlib.Path(message['working_dir']).absolute() != self._working_dir:
+                connection.send(MSG_ERROR, text=f"the balder daemon serves the working directory "
+                                                f"`{self._working_dir}` and not `{message['working_dir']}`",
+                                exit_code=ExitCode.BALDER_USAGE_ERROR.value)
+                return True
+
+            collection_args = self.get_collection_args(message['args'])
+            if self._zygote_pid is not None and (collection_args != self._zygote_collection_args
+                                                 or self._get_snapshot() != self._zygote_snapshot):
+                self._stop_zygote()
+            # the second attempt is only used if the zygote has terminated unexpectedly
+            for _ in range(2):
+                if self._zygote_pid is None:
+                    error = self._start_zygote(collection_args, [connection.socket.fileno(), *fds])
+                    if error is not None:
+                        connection.send(MSG_ERROR, text=error['text'], exit_code=error['exit_code'])
+                        return True
+                try:
+                    self._zygote_connection.send(MSG_RUN, fds=[connection.socket.fileno(), *fds],
+                                                 args=message['args'], cwd=message['cwd'])
+                    return True
+                except OSError:
+                    self._stop_zygote()
+            connection.send(MSG_ERROR, text='the zygote of the balder daemon terminated unexpectedly',
+                            exit_code=ExitCode.UNEXPECTED_ERROR.value)
+            return True
+        finally:
+            for cur_fd in fds:
+                os.close(cur_fd)
+            connection.close()
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def run(self) -> None:
+        """starts the daemon and handles the requests of the clients till a client stops the daemon"""
+        if self._socket_path.exists():
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as test_socket:
+                try:
+                    test_socket.connect(str(self._socket_path))
+                except OSError:
+                    # the socket of a terminated daemon
+                    self._socket_path.unlink()
+                else:
+                    raise RuntimeError(f"there is already a balder daemon that listens on `{self._socket_path}`")
+        self._socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._server_socket.bind(str(self._socket_path))
+            self._server_socket.listen()
+            print(f"balder daemon serves `{self._working_dir}` on `{self._socket_path}`", flush=True)
+            running = True
+            while running:
+                client_socket, _ = self._server_socket.accept()
+                running = self._handle_client(DaemonConnection(client_socket))
+        finally:
+            self._stop_zygote()
+            self._server_socket.close()
+            self._server_socket = None
+            self._socket_path.unlink(missing_ok=True)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+from typing import Literal, Union
+
+import inspect
+from _balder.feature_method_cache import FeatureMethodCache
+from _balder.fixture_execution_level import FixtureExecutionLevel
+
+
+def cached(level: Union[Literal['session', 'setup', 'scenario', 'variation', 'testcase'], FixtureExecutionLevel]):
+    """
+    This decorator memoizes the results of the decorated feature method. The results are saved per feature instance and
+    per arguments and they are removed automatically as soon as the executor leaves a branch with the given execution
+    level. The decorated method provides the methods ``cache_info()`` and ``cache_clear()``.
+
+    .. note::
+        If you use this decorator together with ``@balder.for_vdevice(..)``, it has to be the inner decorator (placed
+        below the ``@balder.for_vdevice(..)`` decorator). Every method variation has its own cache then.
+
+    :param level: the execution level after which the memoized results are invalidated
+    """
+    allowed_levels = [level.value for level in FixtureExecutionLevel]
+
+    if isinstance(level, FixtureExecutionLevel):
+        level = level.value
+    if level not in allowed_levels:
+        raise ValueError(f"the value of `level` must be a `FixtureExecutionLevel` or a `str` with one of the values "
+                         f"`{'`, `'.join(allowed_levels)}`")
+
+    def decorator_cached(func):
+        if not inspect.isfunction(func):
+            raise TypeError('the decorator `@cached` can only be used for feature methods - if you use it together '
+                            'with `@for_vdevice`, it has to be placed below it')
+        return FeatureMethodCache(func, FixtureExecutionLevel(level)).wrap()
+    return decorator_cached
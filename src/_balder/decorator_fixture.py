@@ -1,25 +1,40 @@
 from __future__ import annotations
-from typing import Literal
+from typing import Literal, Union
 
 import functools
 from _balder.collector import Collector
+from _balder.fixture_cache import FixtureCache
 from _balder.fixture_execution_level import FixtureExecutionLevel
 
 
-def fixture(level: Literal['session', 'setup', 'scenario', 'variation', 'testcase']):
+def fixture(level: Literal['session', 'setup', 'scenario', 'variation', 'testcase'], lazy: bool = False,
+            cache: Union[FixtureCache, None] = None):
     """
     This decorator declares the decorated function/method as a fixture function/method.
 
     :param level: the execution level the fixture should have
+
+    :param lazy: if this is True, the fixture is not constructed when its execution level is entered, but the first
+                 time a testcase or another fixture requests its value (it is torn down at its normal level anyway)
+
+    :param cache: optional :class:`FixtureCache` object, that defines how the value of the fixture is cached between
+                  multiple test sessions (only allowed for fixtures with the execution level `session`)
     """
     allowed_levels = [level.value for level in FixtureExecutionLevel]
 
     if level not in allowed_levels:
         raise ValueError(f"the value of `level` must be a `str` with one of the values `{'`, `'.join(allowed_levels)}`")
+    if not isinstance(lazy, bool):
+        raise TypeError("the value of `lazy` must be a `bool`")
+    if cache is not None:
+        if not isinstance(cache, FixtureCache):
+            raise TypeError("the value of `cache` must be a `FixtureCache` object")
+        if level != FixtureExecutionLevel.SESSION.value:
+            raise ValueError("the value of `cache` is only allowed for fixtures with the level `session`")
 
     def decorator_fixture(func):
         # always register the raw fixture in Collector - class determination will be done later by :meth:`Collector`
-        Collector.register_raw_fixture(func, level)
+        Collector.register_raw_fixture(func, level, lazy=lazy, cache=cache)
 
         @functools.wraps(func)
         def wrapper_fixture(*args, **kwargs):
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import inspect
+from _balder.collector import Collector
+
+
+def parallel_safe(func):
+    """
+    Marks a test method as parallel-safe. Balder is allowed to execute parallel-safe test methods of the same variation
+    concurrently in worker threads, if the session was started with ``--parallel-testcases`` and a value greater than
+    one. All other test methods are still executed sequentially.
+
+    .. note::
+        A parallel-safe test method must not share mutable state with other test methods of the same variation. Only
+        fixtures of the execution level ``testcase`` are created separately for every test, all fixtures with a higher
+        execution level are shared.
+
+    :param func: the test method that should be marked
+    """
+    if not inspect.isfunction(func):
+        raise TypeError('the decorated object needs to be a test method')
+
+    Collector.register_possible_parallel_safe_test(func)
+    return func
@@ -0,0 +1,47 @@
+from __future__ import annotations
+from typing import List, Literal, Union
+
+import inspect
+import pathlib
+from _balder.collector import Collector
+from _balder.parametrization_file import ParametrizationFile
+
+
+def parametrize_from_file(
+        path: Union[str, pathlib.Path],
+        fields: Union[List[str], None] = None,
+        file_format: Union[Literal['csv', 'jsonl'], None] = None,
+        encoding: str = 'utf-8'
+):
+    """
+    Allows to parametrize a test function with the records of a CSV or JSONL file. Every record of the file is one
+    parametrization element that provides the values of all ``fields`` (the test function needs an argument for every
+    field). The file is read lazily while the parametrized testcases are executed - it is never loaded completely into
+    memory.
+
+    :param path: the path of the file (relative paths are relative to the directory of the module the test function is
+                 defined in)
+
+    :param fields: the fields of the records that should be used as arguments (all fields of the CSV header or of the
+                   first JSON object if it is not given)
+
+    :param file_format: the format of the file (``csv`` or ``jsonl``) - determined by the file suffix if it is not given
+
+    :param encoding: the encoding of the file
+    """
+    if not isinstance(path, (str, pathlib.Path)):
+        raise ValueError('the given path must be a string or a `pathlib.Path`')
+
+    def decorator(func):
+        if not inspect.isfunction(func):
+            raise TypeError('the decorated object needs to be a test method')
+
+        file_path = pathlib.Path(path)
+        if not file_path.is_absolute():
+            file_path = pathlib.Path(inspect.getfile(func)).parent / file_path
+        parametrization_file = ParametrizationFile(file_path, fields=fields, file_format=file_format,
+                                                   encoding=encoding)
+        for cur_field in parametrization_file.fields:
+            Collector.register_possible_parametrization(func, cur_field, parametrization_file)
+        return func
+    return decorator
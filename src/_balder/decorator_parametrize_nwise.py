@@ -0,0 +1,31 @@
+from __future__ import annotations
+from typing import Union
+
+import inspect
+from _balder.collector import Collector
+
+
+def parametrize_nwise(strength: int = 2, seed: Union[int, None] = None):
+    """
+    Reduces the parametrization of a test function to a n-wise covering array. Instead of executing the test for all
+    combinations of the parametrization values, Balder only executes a subset of them, that still contains every
+    combination of values of any ``strength`` parameters (pairwise for ``strength=2``). This works for static and
+    dynamic parametrization.
+
+    :param strength: the number of parameters every covered combination consists of (2 for pairwise)
+
+    :param seed: the seed that is used to determine the covering array (the session seed ``--parametrize-seed`` is used
+                 if it is not given)
+    """
+    if not isinstance(strength, int) or strength < 1:
+        raise ValueError('the value of `strength` has to be an integer that is 1 or higher')
+    if seed is not None and not isinstance(seed, int):
+        raise ValueError('the value of `seed` has to be an integer or None')
+
+    def decorator(func):
+        if not inspect.isfunction(func):
+            raise TypeError('the decorated object needs to be a test method')
+
+        Collector.register_possible_nwise_parametrization(func, strength, seed)
+        return func
+    return decorator
@@ -0,0 +1,2 @@
+from _balder.distributed.coordinator import Coordinator
+from _balder.distributed.worker import Worker
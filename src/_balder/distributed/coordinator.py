@@ -0,0 +1,222 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Set, Tuple, Union, TYPE_CHECKING
+
+import sys
+import time
+import socket
+import threading
+import traceback
+from _balder.testresult import ResultState
+from _balder.previous_executor_mark import PreviousExecutorMark
+from _balder.executor.testcase_executor import TestcaseExecutor
+from _balder.distributed.protocol import MessageConnection, MSG_REGISTER, MSG_PULL, MSG_WORK, MSG_WAIT, MSG_DONE, \
+    MSG_RESULT, MSG_FINISHED, apply_fixture_results, apply_variation_results
+
+if TYPE_CHECKING:
+    from _balder.executor.executor_tree import ExecutorTree
+    from _balder.executor.variation_executor import VariationExecutor
+    from _balder.executor.basic_executable_executor import BasicExecutableExecutor
+
+
+class Coordinator:
+    """
+    The coordinator distributes the variations of a resolved executor tree to all connected :class:`Worker`. Every
+    worker registers the :class:`Setup` classes it can serve and pulls the variations one after another. The results
+    the workers send back are written into the executor tree of the coordinator.
+
+    If a worker disconnects while it executes a variation, the variation is handed over to the next worker that can
+    serve its setup.
+    """
+    #: the time in seconds the coordinator waits for new connections before it checks if the session is finished
+    ACCEPT_TIMEOUT_SEC = 0.2
+
+    def __init__(self, executor_tree: ExecutorTree, address: Tuple[str, int], expected_workers: int = 1):
+        """
+        :param executor_tree: the resolved executor tree that should be executed by the workers
+
+        :param address: a tuple with the host and the port the coordinator should listen on
+
+        :param expected_workers: the number of workers that have to register before the coordinator finishes the
+                                 session (the session is finished as soon as all of them have disconnected again)
+        """
+        self._executor_tree = executor_tree
+        self._address = address
+        self._expected_workers = expected_workers
+
+        self._lock = threading.Lock()
+        #: all work items that were not assigned to a worker yet
+        self._pending_variations: List[VariationExecutor] = []
+        #: all work items that are currently executed by a worker (with the name of the worker as value)
+        self._assigned_variations: Dict[VariationExecutor, str] = {}
+        #: all variation executors of the tree with their executor id as key
+        self._variation_executors: Dict[str, VariationExecutor] = {}
+        self._registered_workers = 0
+        self._connected_workers = 0
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    @staticmethod
+    def _is_executed(executor: BasicExecutableExecutor, show_discarded: bool) -> bool:
+        """
+        returns True if the executor would be executed by its parent in a local session, otherwise it sets the
+        result for the whole branch (the same way the parent executor does it) and returns False
+        """
+        if executor.has_runnable_tests(consider_discarded_too=show_discarded) or executor.has_skipped_tests():
+            return True
+        if executor.prev_mark == PreviousExecutorMark.SKIP:
+            executor.set_result_for_whole_branch(ResultState.SKIP)
+        elif executor.prev_mark == PreviousExecutorMark.COVERED_BY:
+            executor.set_result_for_whole_branch(ResultState.COVERED_BY)
+        else:
+            executor.set_result_for_whole_branch(ResultState.NOT_RUN)
+        return False
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def executor_tree(self) -> ExecutorTree:
+        """returns the executor tree this coordinator distributes"""
+        return self._executor_tree
+
+    @property
+    def is_finished(self) -> bool:
+        """returns True if all expected workers have registered and disconnected again"""
+        with self._lock:
+            return self._registered_workers >= self._expected_workers and self._connected_workers == 0
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _prepare_work_items(self, show_discarded: bool) -> None:
+        """determines all variations that have to be executed by the workers"""
+        for cur_setup_executor in self.executor_tree.get_setup_executors(return_discarded=show_discarded):
+            if not self._is_executed(cur_setup_executor, show_discarded):
+                continue
+            for cur_scenario_executor in cur_setup_executor.get_scenario_executors(return_discarded=show_discarded):
+                if not self._is_executed(cur_scenario_executor, show_discarded):
+                    continue
+                for cur_variation_executor in cur_scenario_executor.get_variation_executors(
+                        return_discarded=show_discarded):
+                    if self._is_executed(cur_variation_executor, show_discarded):
+                        self._pending_variations.append(cur_variation_executor)
+        self._variation_executors = {
+            cur_variation_executor.executor_id: cur_variation_executor
+            for cur_variation_executor in self._pending_variations
+        }
+
+    def _get_next_work_item_for(self, setups: Set[str], worker_name: str) -> Tuple[str, Union[VariationExecutor, None]]:
+        """
+        returns the message type and the work item the worker should execute next
+
+        :param setups: the setup ids the worker can serve
+        :param worker_name: the name of the worker
+        """
+        def can_serve(variation_executor: VariationExecutor):
+            return variation_executor.parent_executor.parent_executor.executor_id in setups
+
+        with self._lock:
+            for cur_variation_executor in self._pending_variations:
+                if can_serve(cur_variation_executor):
+                    self._pending_variations.remove(cur_variation_executor)
+                    self._assigned_variations[cur_variation_executor] = worker_name
+                    return MSG_WORK, cur_variation_executor
+            if any(can_serve(cur_variation_executor) for cur_variation_executor in self._assigned_variations):
+                # another worker executes a variation this worker could take over if the other one disconnects
+                return MSG_WAIT, None
+        return MSG_DONE, None
+
+    def _apply_work_item_result(self, message: Dict[str, Any], worker_name: str) -> None:
+        """writes the received results into the executor tree and prints them"""
+        variation_executor = self._variation_executors[message['executor_id']]
+        with self._lock:
+            self._assigned_variations.pop(variation_executor, None)
+            apply_variation_results(variation_executor, message)
+
+            scenario_executor = variation_executor.parent_executor
+            print(f"SETUP {scenario_executor.parent_executor.base_setup_class.__class__.__name__}")
+            print(f"  SCENARIO {scenario_executor.base_scenario_class.__class__.__name__}")
+            device_map_str = [f"{scenario_device.__qualname__}:{setup_device.__qualname__}"
+                              for scenario_device, setup_device in variation_executor.base_device_mapping.items()]
+            print(f"    VARIATION {' | '.join(device_map_str)} (executed by worker {worker_name})")
+            for cur_testcase_executor in variation_executor.get_testcase_executors():
+                if isinstance(cur_testcase_executor, TestcaseExecutor):
+                    print(f"      TEST {cur_testcase_executor.full_test_name_str} "
+                          f"[{cur_testcase_executor.body_result.get_result_as_char()}]")
+            sys.stdout.flush()
+
+    def _handle_worker(self, sock: socket.socket, address: Tuple[str, int]) -> None:
+        """communicates with one connected worker (executed in its own thread)"""
+        connection = MessageConnection(sock)
+        worker_name = f"{address[0]}:{address[1]}"
+        registered = False
+        assigned_variation = None
+        try:
+            message = connection.receive(MSG_REGISTER)
+            if message is None:
+                return
+            setups = set(message['setups'])
+            with self._lock:
+                self._registered_workers += 1
+                self._connected_workers += 1
+            registered = True
+
+            while True:
+                message = connection.receive(MSG_PULL, MSG_RESULT, MSG_FINISHED)
+                if message is None:
+                    break
+                if message['type'] == MSG_PULL:
+                    msg_type, assigned_variation = self._get_next_work_item_for(setups, worker_name)
+                    if assigned_variation is None:
+                        connection.send(msg_type)
+                    else:
+                        connection.send(msg_type, executor_id=assigned_variation.executor_id)
+                elif message['type'] == MSG_RESULT:
+                    self._apply_work_item_result(message, worker_name)
+                    assigned_variation = None
+                else:
+                    with self._lock:
+                        apply_fixture_results(self.executor_tree, message['session'], merge=True)
+                    break
+        except Exception:  # pylint: disable=broad-exception-caught
+            traceback.print_exception(*sys.exc_info())
+        finally:
+            with self._lock:
+                if assigned_variation is not None:
+                    # the worker has not finished its work item -> hand it over to another worker
+                    self._assigned_variations.pop(assigned_variation, None)
+                    self._pending_variations.insert(0, assigned_variation)
+                    print(f"worker {worker_name} disconnected while executing variation "
+                          f"`{assigned_variation.executor_id}` - the variation will be executed again")
+                if registered:
+                    self._connected_workers -= 1
+            connection.close()
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def run(self, show_discarded=False) -> None:
+        """
+        This method distributes the whole executor tree and waits till all workers have finished their work.
+
+        :param show_discarded: True if discarded variations are part of the session
+        """
+        start_time = time.perf_counter()
+        self._prepare_work_items(show_discarded=show_discarded)
+
+        print(f"coordinator waits for {self._expected_workers} worker(s) on {self._address[0]}:{self._address[1]}")
+        sys.stdout.flush()
+        worker_threads = []
+        with socket.create_server(self._address) as server:
+            server.settimeout(self.ACCEPT_TIMEOUT_SEC)
+            while not self.is_finished:
+                try:
+                    sock, address = server.accept()
+                except socket.timeout:
+                    continue
+                sock.settimeout(None)
+                cur_thread = threading.Thread(target=self._handle_worker, args=(sock, address), daemon=True)
+                cur_thread.start()
+                worker_threads.append(cur_thread)
+        for cur_thread in worker_threads:
+            cur_thread.join()
+        self.executor_tree.execution_time_sec = time.perf_counter() - start_time
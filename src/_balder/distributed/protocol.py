@@ -0,0 +1,326 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Tuple, Union, TYPE_CHECKING
+
+import json
+import socket
+from collections import OrderedDict
+from _balder.executor.parametrized_testcase_executor import ParametrizedTestcaseExecutor
+from _balder.executor.unresolved_parametrized_testcase_executor import UnresolvedParametrizedTestcaseExecutor
+from _balder.exceptions import BalderException, RemoteExecutionError, RemoteBalderException, \
+    DistributedProtocolError
+from _balder.testresult import ResultState
+
+if TYPE_CHECKING:
+    from _balder.testresult import _Result
+    from _balder.executor.variation_executor import VariationExecutor
+
+# all message types that can be sent between a coordinator and its workers (every message is a JSON object in one line)
+
+#: sent by the worker directly after it has connected - contains the setups the worker can serve
+MSG_REGISTER = 'register'
+#: sent by the worker to request a new work item
+MSG_PULL = 'pull'
+#: sent by the coordinator - contains the executor id of the variation the worker should execute
+MSG_WORK = 'work'
+#: sent by the coordinator if there is currently no work for the worker, but maybe later (the worker should pull again)
+MSG_WAIT = 'wait'
+#: sent by the coordinator if there is no remaining work for the worker
+MSG_DONE = 'done'
+#: sent by the worker after it has executed a work item - contains all results of the variation
+MSG_RESULT = 'result'
+#: sent by the worker before it disconnects - contains the results of the session fixtures
+MSG_FINISHED = 'finished'
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """
+    parses a `HOST:PORT` string
+
+    :param address: the address string
+    :return: a tuple with the host and the port
+    """
+    host, sep, port = address.rpartition(':')
+    if not sep or not host or not port.isdigit():
+        raise ValueError(f'the address `{address}` has to be in the format `HOST:PORT`')
+    return host, int(port)
+
+
+class MessageConnection:
+    """
+    wraps a connected socket and allows to send and receive messages (newline-delimited JSON objects)
+    """
+
+    def __init__(self, sock: socket.socket):
+        self._socket = sock
+        self._reader = sock.makefile('r', encoding='utf-8', newline='\n')
+        self._writer = sock.makefile('w', encoding='utf-8', newline='\n')
+
+    def send(self, msg_type: str, **data) -> None:
+        """
+        sends a new message
+
+        :param msg_type: the type of the message (one of the `MSG_*` constants)
+        :param data: the data of the message (has to be JSON serializable)
+        """
+        self._writer.write(json.dumps({'type': msg_type, **data}) + '\n')
+        self._writer.flush()
+
+    def receive(self, *expected_types: str) -> Union[Dict[str, Any], None]:
+        """
+        receives the next message
+
+        :param expected_types: the message types that are allowed (all types are allowed if this is empty)
+        :return: the message or None if the connection was closed by the partner
+        """
+        line = self._reader.readline()
+        if not line:
+            return None
+        message = json.loads(line)
+        if expected_types and message.get('type') not in expected_types:
+            raise DistributedProtocolError(f"received unexpected message of type `{message.get('type')}` (expected "
+                                           f"one of {', '.join(expected_types)})")
+        return message
+
+    def close(self) -> None:
+        """closes the connection"""
+        for cur_file in (self._reader, self._writer):
+            try:
+                cur_file.close()
+            except OSError:
+                pass
+        self._socket.close()
+
+
+def serialize_result(result: _Result) -> Dict[str, Any]:
+    """
+    converts a result object into a JSON serializable dictionary
+
+    :param result: the result object (for example the `construct_result` of an executor)
+    """
+    exception = None
+    if result.exception is not None:
+        exception = {
+            'type': result.exception.__class__.__qualname__,
+            'message': str(result.exception),
+            'balder_exception': isinstance(result.exception, BalderException)
+        }
+    return {'state': result.result.value, 'exception': exception}
+
+
+def deserialize_exception(data: Union[Dict[str, Any], None]) -> Union[RemoteExecutionError, None]:
+    """
+    converts the serialized exception back into an exception object
+
+    :param data: the exception part of a serialized result
+    """
+    if data is None:
+        return None
+    exception_cls = RemoteBalderException if data['balder_exception'] else RemoteExecutionError
+    return exception_cls(f"{data['type']}: {data['message']}")
+
+
+def apply_result(result: _Result, data: Dict[str, Any], merge=False) -> None:
+    """
+    sets the serialized result data in the given result object
+
+    :param result: the result object that should be updated
+    :param data: the serialized result data
+    :param merge: if True the state will only be set if it has a higher priority than the current state of the result
+                  (used for results of executors that are executed by different workers)
+    """
+    state = ResultState(data['state'])
+    priority_order = ResultState.priority_order()
+    if merge and priority_order.index(state) >= priority_order.index(result.result):
+        return
+    result.set_result(state, deserialize_exception(data['exception']))
+
+
+def serialize_fixture_results(executor) -> Dict[str, Any]:
+    """returns the serialized construct and teardown results of the given executor"""
+    return {'construct': serialize_result(executor.construct_result),
+            'teardown': serialize_result(executor.teardown_result)}
+
+
+def apply_fixture_results(executor, data: Dict[str, Any], merge=False) -> None:
+    """sets the serialized construct and teardown results (see :meth:`serialize_fixture_results`) in the executor"""
+    apply_result(executor.construct_result, data['construct'], merge=merge)
+    apply_result(executor.teardown_result, data['teardown'], merge=merge)
+
+
+def _get_parametrized_groups_of(variation_executor: VariationExecutor) -> List[UnresolvedParametrizedTestcaseExecutor]:
+    """
+    returns the groups of all parametrized testcases of the given variation in their order (also the groups that were
+    not executed completely and are still part of the variation)
+    """
+    result = []
+    for cur_testcase_executor in variation_executor.get_testcase_executors():
+        group = cur_testcase_executor
+        if isinstance(cur_testcase_executor, ParametrizedTestcaseExecutor):
+            group = cur_testcase_executor.unresolved_group_obj
+        if isinstance(group, UnresolvedParametrizedTestcaseExecutor) and group not in result:
+            result.append(group)
+    return result
+
+
+def _serialize_testcase_result(testcase_executor, group_name: Union[str, None], row: Union[int, None]) \
+        -> Dict[str, Any]:
+    """
+    returns the serialized results of one testcase executor
+
+    :param testcase_executor: the executed testcase executor
+    :param group_name: the qualified name of the test method, if the testcase belongs to a parametrized group
+    :param row: the row of the testcase within its group
+    """
+    return {
+        'name': testcase_executor.full_test_name_str,
+        'group': group_name,
+        'row': row,
+        'body': serialize_result(testcase_executor.body_result),
+        **serialize_fixture_results(testcase_executor)
+    }
+
+
+def serialize_parametrization_value(value: Any) -> Any:
+    """
+    returns the given parametrization value as it is, if it is JSON serializable, otherwise its string representation
+
+    :param value: the value of a dynamic parametrization
+    """
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return str(value)
+    return value
+
+
+def serialize_dynamic_parametrization(variation_executor: VariationExecutor) -> List[Dict[str, Any]]:
+    """
+    returns the resolved parametrization of all dynamically parametrized testcases of an executed variation - the
+    coordinator can not resolve them on its own, because the setup features are only active on the worker
+
+    :param variation_executor: the executed variation executor
+    """
+    result = []
+    for cur_group in _get_parametrized_groups_of(variation_executor):
+        if cur_group.has_dynamic_parametrization and cur_group.get_testcase_count() is not None:
+            result.append({
+                'group': cur_group.base_testcase_callable.__qualname__,
+                'parametrization': [
+                    {cur_name: serialize_parametrization_value(cur_value) for cur_name, cur_value in cur_row.items()}
+                    for cur_row in cur_group.resolve_parametrization()]
+            })
+    return result
+
+
+def serialize_testcase_results(variation_executor: VariationExecutor) -> List[Dict[str, Any]]:
+    """
+    returns the serialized results of all testcase executors of the given (already executed) variation - the
+    parametrized testcases are identified by their test method and their row within its parametrization, so that the
+    receiver can look up the parametrization values in its own tree
+
+    :param variation_executor: the executed variation executor
+    """
+    result = []
+    # holds the row of the next testcase executor of every group
+    next_rows = {}
+    for cur_testcase_executor in variation_executor.get_testcase_executors():
+        if isinstance(cur_testcase_executor, UnresolvedParametrizedTestcaseExecutor):
+            # the group was not executed completely - only send the testcases that were created
+            group_name = cur_testcase_executor.base_testcase_callable.__qualname__
+            result.extend(_serialize_testcase_result(cur_executor, group_name, cur_row)
+                          for cur_row, cur_executor in enumerate(cur_testcase_executor.materialized_executors))
+            continue
+        group_name = None
+        row = None
+        if isinstance(cur_testcase_executor, ParametrizedTestcaseExecutor) \
+                and cur_testcase_executor.unresolved_group_obj is not None:
+            group_name = cur_testcase_executor.base_testcase_callable.__qualname__
+            row = next_rows.get(group_name, 0)
+            next_rows[group_name] = row + 1
+        result.append(_serialize_testcase_result(cur_testcase_executor, group_name, row))
+    return result
+
+
+def serialize_unmaterialized_results(variation_executor: VariationExecutor) -> List[Dict[str, Any]]:
+    """
+    returns the results of the testcases that are not executed and whose executors were never created (they are
+    stored in their group, see :meth:`UnresolvedParametrizedTestcaseExecutor.set_result_for_unmaterialized_testcases`)
+
+    :param variation_executor: the executed variation executor
+    """
+    return [{'group': cur_child.base_testcase_callable.__qualname__, 'state': cur_child.unmaterialized_result.value}
+            for cur_child in variation_executor.get_testcase_executors()
+            if isinstance(cur_child, UnresolvedParametrizedTestcaseExecutor)
+            and cur_child.unmaterialized_result is not None]
+
+
+def serialize_variation_results(variation_executor: VariationExecutor) -> Dict[str, Any]:
+    """
+    returns the serialized results of the given (already executed) variation and of its parent executors
+
+    :param variation_executor: the executed variation executor
+    """
+    scenario_executor = variation_executor.parent_executor
+    return {
+        'setup': serialize_fixture_results(scenario_executor.parent_executor),
+        'scenario': serialize_fixture_results(scenario_executor),
+        'variation': serialize_fixture_results(variation_executor),
+        'dynamic_parametrization': serialize_dynamic_parametrization(variation_executor),
+        'testcases': serialize_testcase_results(variation_executor),
+        'unmaterialized': serialize_unmaterialized_results(variation_executor)
+    }
+
+
+def apply_variation_results(variation_executor: VariationExecutor, data: Dict[str, Any]) -> None:
+    """
+    sets the serialized results (see :meth:`serialize_variation_results`) in the given variation and its parent
+    executors - the executors of parametrized testcases that are still unresolved in this tree are created by their
+    group (with the parametrization values of this tree) and replace the group as soon as all of them were created.
+    The result of the testcases the worker has never created an executor for is only stored in their group.
+
+    :param variation_executor: the variation executor the results belong to
+    :param data: the serialized results
+    """
+    scenario_executor = variation_executor.parent_executor
+    # the setup and scenario executor can be executed by different workers -> keep the worst result
+    apply_fixture_results(scenario_executor.parent_executor, data['setup'], merge=True)
+    apply_fixture_results(scenario_executor, data['scenario'], merge=True)
+    apply_fixture_results(variation_executor, data['variation'])
+
+    children = variation_executor.get_testcase_executors()
+    executors_by_name = {cur_child.full_test_name_str: cur_child for cur_child in children
+                         if not isinstance(cur_child, UnresolvedParametrizedTestcaseExecutor)}
+    # the groups that are still unresolved in this tree with the qualified name of their test method as key
+    groups_by_name = {cur_child.base_testcase_callable.__qualname__: cur_child for cur_child in children
+                      if isinstance(cur_child, UnresolvedParametrizedTestcaseExecutor)}
+    for cur_group_data in data['dynamic_parametrization']:
+        if cur_group_data['group'] in groups_by_name:
+            groups_by_name[cur_group_data['group']].set_resolved_parametrization(
+                [OrderedDict(cur_row) for cur_row in cur_group_data['parametrization']])
+    resolved_groups = []
+    for cur_testcase_data in data['testcases']:
+        if cur_testcase_data['group'] in groups_by_name:
+            group_executor = groups_by_name[cur_testcase_data['group']]
+            testcase_count = group_executor.get_testcase_count()
+            if testcase_count is None or cur_testcase_data['row'] >= testcase_count:
+                raise DistributedProtocolError(f"can not find row {cur_testcase_data['row']} of testcase "
+                                               f"`{cur_testcase_data['name']}` in variation "
+                                               f"`{variation_executor.executor_id}`")
+            testcase_executor = group_executor.get_parametrized_testcase_executor(cur_testcase_data['row'])
+            if group_executor not in resolved_groups:
+                resolved_groups.append(group_executor)
+        elif cur_testcase_data['name'] in executors_by_name:
+            testcase_executor = executors_by_name[cur_testcase_data['name']]
+        else:
+            raise DistributedProtocolError(f"can not find testcase `{cur_testcase_data['name']}` in variation "
+                                           f"`{variation_executor.executor_id}`")
+        apply_fixture_results(testcase_executor, cur_testcase_data)
+        apply_result(testcase_executor.body_result, cur_testcase_data['body'])
+    for cur_group_data in data['unmaterialized']:
+        if cur_group_data['group'] in groups_by_name:
+            groups_by_name[cur_group_data['group']].set_result_for_unmaterialized_testcases(
+                ResultState(cur_group_data['state']))
+    completed_groups = {cur_group: cur_group.materialized_executors for cur_group in resolved_groups
+                        if len(cur_group.materialized_executors) == cur_group.get_testcase_count()}
+    if completed_groups:
+        variation_executor.exchange_unresolved_parametrization(completed_groups)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+from typing import Any, Dict, Tuple, Union, TYPE_CHECKING
+
+import time
+import socket
+from _balder.previous_executor_mark import PreviousExecutorMark
+from _balder.exceptions import DistributedProtocolError
+from _balder.executor.variation_executor import VariationExecutor
+from _balder.distributed.protocol import MessageConnection, MSG_REGISTER, MSG_PULL, MSG_WORK, MSG_WAIT, MSG_DONE, \
+    MSG_RESULT, MSG_FINISHED, serialize_fixture_results, serialize_variation_results, apply_variation_results
+
+if TYPE_CHECKING:
+    from _balder.executor.executor_tree import ExecutorTree
+
+
+class Worker:
+    """
+    A worker connects to a :class:`Coordinator`, registers all :class:`Setup` classes of its executor tree and executes
+    the variations the coordinator assigns to it. The results of every executed variation are sent back to the
+    coordinator.
+
+    The session fixtures are executed once for the whole worker session. All other fixtures are executed for every
+    work item.
+    """
+    #: the time in seconds the worker waits before it pulls again, if the coordinator has currently no work for it
+    WAIT_INTERVAL_SEC = 0.2
+    #: the time in seconds the worker tries to connect to a coordinator that is not listening yet
+    CONNECT_TIMEOUT_SEC = 30
+
+    def __init__(self, executor_tree: ExecutorTree, coordinator_address: Tuple[str, int]):
+        """
+        :param executor_tree: the resolved executor tree of this worker
+
+        :param coordinator_address: a tuple with the host and the port of the coordinator
+        """
+        self._executor_tree = executor_tree
+        self._coordinator_address = coordinator_address
+        self._connection: Union[MessageConnection, None] = None
+
+        #: contains the sent results of all executed variations with their executor id as key
+        self.executed_results: Dict[str, Dict[str, Any]] = {}
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def executor_tree(self) -> ExecutorTree:
+        """returns the executor tree this worker executes the variations of"""
+        return self._executor_tree
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _connect(self) -> socket.socket:
+        """connects to the coordinator - retries till the coordinator listens or the connect timeout is reached"""
+        end_time = time.perf_counter() + self.CONNECT_TIMEOUT_SEC
+        while True:
+            try:
+                return socket.create_connection(self._coordinator_address)
+            except ConnectionRefusedError:
+                if time.perf_counter() > end_time:
+                    raise
+                time.sleep(self.WAIT_INTERVAL_SEC)
+
+    def _execute_variation(self, executor_id: str, show_discarded: bool) -> Dict[str, Any]:
+        """
+        executes the variation with the given executor id (with its setup and scenario fixtures) and returns its
+        serialized results
+
+        :param executor_id: the executor id of the variation that should be executed
+        :param show_discarded: True if discarded variations are part of the session
+        """
+        variation_executor = self.executor_tree.get_executor_by_id(executor_id)
+        if not isinstance(variation_executor, VariationExecutor):
+            raise DistributedProtocolError(f'the coordinator requests the unknown variation `{executor_id}`')
+        # ignore all other variations while the related setup executor is executed
+        all_variation_executors = self.executor_tree.get_all_variation_executors(return_discarded=show_discarded)
+        previous_marks = {cur_executor: cur_executor.prev_mark for cur_executor in all_variation_executors}
+        for cur_executor in all_variation_executors:
+            if cur_executor is not variation_executor:
+                cur_executor.prev_mark = PreviousExecutorMark.IGNORE
+        try:
+            variation_executor.parent_executor.parent_executor.execute(show_discarded=show_discarded)
+        finally:
+            for cur_executor, cur_mark in previous_marks.items():
+                cur_executor.prev_mark = cur_mark
+        return serialize_variation_results(variation_executor)
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def execute_work_items(self, show_discarded=False) -> None:
+        """
+        This method pulls work items from the coordinator and executes them, till the coordinator has no remaining
+        work for this worker. It is called by the :class:`ExecutorTree` after the session fixtures were entered.
+
+        :param show_discarded: True if discarded variations are part of the session
+        """
+        while True:
+            self._connection.send(MSG_PULL)
+            message = self._connection.receive(MSG_WORK, MSG_WAIT, MSG_DONE)
+            if message is None:
+                raise ConnectionError('the coordinator has closed the connection unexpectedly')
+            if message['type'] == MSG_DONE:
+                break
+            if message['type'] == MSG_WAIT:
+                time.sleep(self.WAIT_INTERVAL_SEC)
+                continue
+            executor_id = message['executor_id']
+            results = self._execute_variation(executor_id, show_discarded=show_discarded)
+            self.executed_results[executor_id] = results
+            self._connection.send(MSG_RESULT, executor_id=executor_id, **results)
+
+        # the execution of a variation resets the results of all other variations - restore them
+        for cur_executor_id, cur_results in self.executed_results.items():
+            apply_variation_results(self.executor_tree.get_executor_by_id(cur_executor_id), cur_results)
+
+    def run(self, show_discarded=False) -> None:
+        """
+        connects to the coordinator and executes the whole worker session
+
+        :param show_discarded: True if discarded variations are part of the session
+        """
+        self._connection = MessageConnection(self._connect())
+        try:
+            self._connection.send(
+                MSG_REGISTER,
+                setups=[cur_setup_executor.executor_id
+                        for cur_setup_executor in self.executor_tree.get_setup_executors(return_discarded=True)]
+            )
+            self.executor_tree.remote_worker = self
+            try:
+                self.executor_tree.execute(show_discarded=show_discarded)
+            finally:
+                self.executor_tree.remote_worker = None
+            self._connection.send(MSG_FINISHED, session=serialize_fixture_results(self.executor_tree))
+        finally:
+            self._connection.close()
+            self._connection = None
@@ -180,3 +180,33 @@ class UnexpectedPluginMethodReturnValue(BalderException):
     """
     is thrown if a user plugin doesn't return something or returns wrong values in its plugin method
     """
+
+
+class RemoteExecutionError(Exception):
+    """
+    is used to represent an exception that was raised on a remote worker while it executed a part of the test session
+    """
+
+
+class RemoteBalderException(RemoteExecutionError, BalderException):
+    """
+    is used to represent a :class:`BalderException` that was raised on a remote worker
+    """
+
+
+class DistributedProtocolError(BalderException):
+    """
+    is thrown if a coordinator or a worker receives an unexpected message
+    """
+
+
+class DaemonProtocolError(BalderException):
+    """
+    is thrown if the balder daemon or one of its clients receives an unexpected message
+    """
+
+
+class ExecutionPlanError(BalderException):
+    """
+    is thrown if an execution plan can not be read or does not match the environment it should be executed in
+    """
@@ -0,0 +1,124 @@
+from __future__ import annotations
+from typing import Callable, List, Set, Type, TYPE_CHECKING
+
+from _balder.executor.scenario_executor import ScenarioExecutor
+from _balder.executor.variation_executor import VariationExecutor
+from _balder.executor.testcase_executor import TestcaseExecutor
+
+if TYPE_CHECKING:
+    from _balder.device import Device
+    from _balder.executor.executor_tree import ExecutorTree
+    from _balder.executor.basic_executable_executor import BasicExecutableExecutor
+    from _balder.utils.duration_store import DurationStore
+
+
+class ExecutionOrderOptimizer:
+    """
+    This class reorders the sibling branches of an :class:`ExecutorTree` to reduce the fixture work of a test session:
+
+    * setups are ordered by their duration from earlier runs (the longest first)
+    * scenarios and variations are chained in a way that consecutive branches share as many setup devices as possible,
+      so devices that were provisioned for one branch are used again by the next one - if there are multiple
+      candidates, the branch with the more expensive fixtures (recorded in earlier runs) is executed first
+    * testcases get their durations of earlier runs, so long testcases are started first if they are executed in
+      parallel
+
+    The order of testcases within a variation is never changed. Branches without recorded durations and without shared
+    devices keep their original order.
+    """
+
+    def __init__(self, executor_tree: ExecutorTree, duration_store: DurationStore):
+        """
+        :param executor_tree: the executor tree that should be reordered
+
+        :param duration_store: the durations that were recorded in earlier runs
+        """
+        self._executor_tree = executor_tree
+        self._duration_store = duration_store
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    @staticmethod
+    def _get_setup_devices_of(executor: BasicExecutableExecutor) -> Set[Type[Device]]:
+        """returns all setup devices that are used by the given scenario or variation executor"""
+        if isinstance(executor, VariationExecutor):
+            return set(executor.base_device_mapping.values())
+        if isinstance(executor, ScenarioExecutor):
+            result = set()
+            for cur_variation_executor in executor.all_child_executors:
+                result.update(cur_variation_executor.base_device_mapping.values())
+            return result
+        raise TypeError(f"can not determine setup devices for executor of type `{executor.__class__.__name__}`")
+
+    @staticmethod
+    def _chain_by_shared_devices(
+            executors: List[BasicExecutableExecutor],
+            get_cost: Callable[[BasicExecutableExecutor], float]
+    ) -> List[BasicExecutableExecutor]:
+        """
+        This method returns the given executors in an order where consecutive executors share as many setup devices as
+        possible. It starts with the most expensive executor and always continues with the executor that shares the
+        most setup devices with the previous one (the more expensive one, if there are multiple candidates).
+
+        :param executors: the sibling executors that should be ordered
+        :param get_cost: callable that returns the cost of an executor
+        """
+        remaining = list(executors)
+        if not remaining:
+            return []
+        # `max()` returns the first element of multiple equal ones -> the original order is kept for equal candidates
+        cur_executor = max(remaining, key=get_cost)
+        result = [cur_executor]
+        remaining.remove(cur_executor)
+        while remaining:
+            cur_devices = ExecutionOrderOptimizer._get_setup_devices_of(cur_executor)
+            cur_executor = max(
+                remaining,
+                key=lambda cur_elem, cur_devices=cur_devices: (
+                    len(ExecutionOrderOptimizer._get_setup_devices_of(cur_elem) & cur_devices), get_cost(cur_elem)))
+            result.append(cur_executor)
+            remaining.remove(cur_executor)
+        return result
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def executor_tree(self) -> ExecutorTree:
+        """returns the executor tree this optimizer reorders"""
+        return self._executor_tree
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _get_total_cost(self, executor: BasicExecutableExecutor) -> float:
+        """returns the recorded duration of the whole branch (0 if it is unknown)"""
+        return self._duration_store.get_total_duration(executor) or 0
+
+    def _get_fixture_cost(self, executor: BasicExecutableExecutor) -> float:
+        """returns the recorded duration of all fixtures within the branch (0 if it is unknown)"""
+        cost = self._duration_store.get_fixture_duration(executor) or 0
+        if isinstance(executor, ScenarioExecutor):
+            cost += sum(self._get_fixture_cost(cur_child) for cur_child in executor.all_child_executors)
+        return cost
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def optimize(self) -> None:
+        """reorders the whole executor tree"""
+        self.executor_tree.reorder_child_executors(
+            sorted(self.executor_tree.all_child_executors, key=self._get_total_cost, reverse=True))
+
+        for cur_setup_executor in self.executor_tree.all_child_executors:
+            cur_setup_executor.reorder_child_executors(
+                self._chain_by_shared_devices(cur_setup_executor.all_child_executors, self._get_fixture_cost))
+
+            for cur_scenario_executor in cur_setup_executor.all_child_executors:
+                cur_scenario_executor.reorder_child_executors(
+                    self._chain_by_shared_devices(cur_scenario_executor.all_child_executors, self._get_fixture_cost))
+
+                for cur_variation_executor in cur_scenario_executor.all_child_executors:
+                    for cur_testcase_executor in cur_variation_executor.all_child_executors:
+                        if isinstance(cur_testcase_executor, TestcaseExecutor):
+                            cur_testcase_executor.expected_duration_sec = \
+                                self._duration_store.get_total_duration(cur_testcase_executor)
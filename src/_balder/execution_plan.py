@@ -0,0 +1,226 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Tuple, Union, TYPE_CHECKING
+
+import sys
+import json
+import pathlib
+from _balder import __version__
+from _balder.sampling import Sampling
+from _balder.exceptions import ExecutionPlanError
+from _balder.parametrization_file import ParametrizationFile
+from _balder.executor.unresolved_parametrized_testcase_executor import UnresolvedParametrizedTestcaseExecutor
+from _balder.utils.functions import get_class_id
+
+if TYPE_CHECKING:
+    from _balder.executor.executor_tree import ExecutorTree
+    from _balder.executor.variation_executor import VariationExecutor
+
+
+class ExecutionPlan:
+    """
+    This class describes a resolved executor tree, that can be saved in a JSON file (``--save-plan``) and executed
+    later without resolving it again (``--load-plan``).
+
+    The plan holds the stable ids of every variation and testcase (see :meth:`BasicExecutor.executor_id`) and of their
+    setups and scenarios (see :func:`get_class_id`), the device mapping of every variation, the testcases with their
+    static parametrization and the reasons why variations were discarded. It also holds the python files the setups and
+    scenarios are defined in (relative to the working directory), so that only these files have to be imported again.
+    """
+    #: the version of the file format
+    VERSION = 1
+
+    def __init__(self, files: List[str], variations: List[Dict[str, Any]], options: Dict[str, Any]):
+        """
+        :param files: the python files (relative to the working directory) that have to be imported for the plan
+
+        :param variations: the data of all planned variations in the order they should be executed
+
+        :param options: the session options the variations and parametrizations were selected with
+        """
+        self._files = files
+        self._variations = variations
+        self._options = options
+        # the data of all planned variations with their id as key
+        self._variations_by_id = {cur_variation['id']: cur_variation for cur_variation in variations}
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    @staticmethod
+    def _get_testcase_data_for(variation_executor: VariationExecutor) -> List[Dict[str, Any]]:
+        """returns the data of all testcases of the given variation"""
+        result = []
+        for cur_testcase_executor in variation_executor.get_testcase_executors():
+            testcase = cur_testcase_executor.base_testcase_callable
+            data = {
+                'id': cur_testcase_executor.executor_id,
+                'name': testcase.__name__,
+                'parametrization': None
+            }
+            if isinstance(cur_testcase_executor, UnresolvedParametrizedTestcaseExecutor):
+                data['parametrization'] = {
+                    'static': {
+                        cur_name: (f"file:{cur_values.path.name}" if isinstance(cur_values, ParametrizationFile)
+                                   else [repr(cur_value) for cur_value in cur_values])
+                        for cur_name, cur_values in cur_testcase_executor.static_parametrization.items()},
+                    'dynamic': list(variation_executor.parent_executor.base_scenario_controller
+                                    .get_parametrization_for(testcase, static=False, dynamic=True) or {}),
+                }
+            result.append(data)
+        return result
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    @classmethod
+    def create_for(cls, executor_tree: ExecutorTree, working_dir: Union[str, pathlib.Path],
+                   connection_files: List[pathlib.Path]) -> ExecutionPlan:
+        """
+        creates the plan for the given executor tree
+
+        :param executor_tree: the resolved executor tree (with its discarded variations, if they should be part of
+                              the plan)
+
+        :param working_dir: the working directory of the session
+
+        :param connection_files: the python files of the working directory that define connections (they are imported
+                                 together with the files of the setups and scenarios)
+        """
+        working_dir = pathlib.Path(working_dir).absolute()
+        files = {cur_file.absolute().relative_to(working_dir).as_posix() for cur_file in connection_files}
+        variations = []
+        for cur_variation_executor in executor_tree.get_all_variation_executors(return_discarded=True):
+            setup_class = cur_variation_executor.cur_setup_class.__class__
+            scenario_class = cur_variation_executor.cur_scenario_class.__class__
+            for cur_class in (setup_class, scenario_class):
+                module_file = pathlib.Path(sys.modules[cur_class.__module__].__file__).absolute()
+                if module_file.is_relative_to(working_dir):
+                    files.add(module_file.relative_to(working_dir).as_posix())
+            discard_exc = cur_variation_executor.not_applicable_variation_exc
+            variations.append({
+                'id': cur_variation_executor.executor_id,
+                'setup': get_class_id(setup_class),
+                'scenario': get_class_id(scenario_class),
+                'device_mapping': {
+                    get_class_id(cur_scenario_device): get_class_id(cur_setup_device)
+                    for cur_scenario_device, cur_setup_device in cur_variation_executor.base_device_mapping.items()},
+                'applicable': cur_variation_executor.can_be_applied(),
+                'discard_reason': None if discard_exc is None else str(discard_exc.args[0]),
+                'testcases': cls._get_testcase_data_for(cur_variation_executor),
+            })
+        sampling = executor_tree.sampling
+        options = {
+            'parametrize_nwise': executor_tree.parametrize_nwise,
+            'parametrize_seed': executor_tree.parametrize_seed,
+            'sampling': None if sampling is None else {
+                'size': sampling.size, 'ratio': sampling.ratio, 'seed': sampling.seed, 'run': sampling.run},
+        }
+        return cls(sorted(files), variations, options)
+
+    @classmethod
+    def load(cls, filepath: Union[str, pathlib.Path]) -> ExecutionPlan:
+        """
+        loads the plan from the given JSON file
+
+        :param filepath: the path to the file
+        """
+        try:
+            with open(filepath, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError) as exc:
+            raise ExecutionPlanError(f'can not read the execution plan `{filepath}`: {exc}') from exc
+        if not isinstance(data, dict) or data.get('version') != cls.VERSION:
+            raise ExecutionPlanError(f'the execution plan `{filepath}` is no execution plan of version {cls.VERSION}')
+        try:
+            return cls(data['files'], data['variations'], data['options'])
+        except KeyError as exc:
+            raise ExecutionPlanError(f'the execution plan `{filepath}` does not contain the key {exc}') from exc
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def files(self) -> List[str]:
+        """returns the python files (relative to the working directory) that have to be imported for the plan"""
+        return self._files.copy()
+
+    @property
+    def variations(self) -> List[Dict[str, Any]]:
+        """returns the data of all planned variations in the order they should be executed"""
+        return self._variations.copy()
+
+    @property
+    def applicable_variation_ids(self) -> List[str]:
+        """returns the ids of all planned variations that can be applied"""
+        return [cur_variation['id'] for cur_variation in self._variations if cur_variation['applicable']]
+
+    @property
+    def parametrize_nwise(self) -> Union[int, None]:
+        """returns the strength of the n-wise covering arrays the parametrization was reduced to"""
+        return self._options['parametrize_nwise']
+
+    @property
+    def parametrize_seed(self) -> int:
+        """returns the seed the n-wise covering arrays were determined with"""
+        return self._options['parametrize_seed']
+
+    @property
+    def sampling(self) -> Union[Sampling, None]:
+        """returns the sampling the parametrized testcases were selected with (None if they were not sampled)"""
+        if self._options['sampling'] is None:
+            return None
+        return Sampling(**self._options['sampling'])
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def save(self, filepath: Union[str, pathlib.Path]) -> None:
+        """
+        saves the plan in the given JSON file
+
+        :param filepath: the path to the file
+        """
+        filepath = pathlib.Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as file:
+            json.dump({'version': self.VERSION, 'balder_version': __version__, 'files': self._files,
+                       'options': self._options, 'variations': self._variations}, file, indent=2)
+
+    def get_testcase_names_of(self, variation_id: str) -> List[str]:
+        """
+        returns the names of all planned test methods of the given variation
+
+        :param variation_id: the id of the variation
+        """
+        if variation_id not in self._variations_by_id:
+            raise KeyError(f'the variation `{variation_id}` is not part of the plan')
+        return [cur_testcase['name'] for cur_testcase in self._variations_by_id[variation_id]['testcases']]
+
+    def diff(self, other: ExecutionPlan) -> Tuple[List[str], List[str], Dict[str, Tuple[List[str], List[str]]]]:
+        """
+        compares this plan with a newer one
+
+        :param other: the newer plan
+
+        :return: a tuple with the ids of the applicable variations that were added, the ids of the applicable
+                 variations that were removed and the testcase ids that were added and removed for every variation that
+                 is applicable in both plans (only variations with changed testcases are part of the dictionary)
+        """
+        own_ids = self.applicable_variation_ids
+        other_ids = other.applicable_variation_ids
+        own_id_set, other_id_set = set(own_ids), set(other_ids)
+        added = [cur_id for cur_id in other_ids if cur_id not in own_id_set]
+        removed = [cur_id for cur_id in own_ids if cur_id not in other_id_set]
+
+        def get_testcase_ids(plan: ExecutionPlan) -> Dict[str, List[str]]:
+            return {cur_variation['id']: [cur_testcase['id'] for cur_testcase in cur_variation['testcases']]
+                    for cur_variation in plan.variations if cur_variation['applicable']}
+        own_testcases = get_testcase_ids(self)
+        other_testcases = get_testcase_ids(other)
+        changed = {}
+        for cur_id in own_ids:
+            if cur_id not in other_testcases:
+                continue
+            added_testcases = [cur_tc for cur_tc in other_testcases[cur_id] if cur_tc not in own_testcases[cur_id]]
+            removed_testcases = [cur_tc for cur_tc in own_testcases[cur_id] if cur_tc not in other_testcases[cur_id]]
+            if added_testcases or removed_testcases:
+                changed[cur_id] = (added_testcases, removed_testcases)
+        return added, removed, changed
@@ -10,6 +10,7 @@ from abc import ABC, abstractmethod
 
 from _balder.executor.basic_executor import BasicExecutor
 from _balder.testresult import ResultState
+from _balder.feature_method_cache import FeatureMethodCache
 
 if TYPE_CHECKING:
     from _balder.fixture_execution_level import FixtureExecutionLevel
@@ -29,6 +30,8 @@ class BasicExecutableExecutor(BasicExecutor, ABC):
 
         # holds the execution time of this branch (with branch fixtures)
         self.execution_time_sec = None
+        # holds the time the construction and teardown code of the fixtures of this branch took
+        self.fixture_execution_time_sec = None
 
     # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
 
@@ -101,12 +104,17 @@ class BasicExecutableExecutor(BasicExecutor, ABC):
         Executes the whole branch
         """
         start_time = time.perf_counter()
+        self.fixture_execution_time_sec = 0
         self._prepare_execution(show_discarded=show_discarded)
 
         try:
             try:
                 if self.has_runnable_tests():
-                    self.fixture_manager.enter(self)
+                    fixture_start_time = time.perf_counter()
+                    try:
+                        self.fixture_manager.enter(self)
+                    finally:
+                        self.fixture_execution_time_sec += time.perf_counter() - fixture_start_time
                     self.construct_result.set_result(ResultState.SUCCESS)
                 else:
                     self.construct_result.set_result(ResultState.NOT_RUN)
@@ -119,7 +127,11 @@ class BasicExecutableExecutor(BasicExecutor, ABC):
             finally:
                 if self.has_runnable_tests():
                     if self.fixture_manager.is_allowed_to_leave(self):
-                        self.fixture_manager.leave(self)
+                        fixture_start_time = time.perf_counter()
+                        try:
+                            self.fixture_manager.leave(self)
+                        finally:
+                            self.fixture_execution_time_sec += time.perf_counter() - fixture_start_time
                         self.teardown_result.set_result(ResultState.SUCCESS)
                 else:
                     self.teardown_result.set_result(ResultState.NOT_RUN)
@@ -127,7 +139,14 @@ class BasicExecutableExecutor(BasicExecutor, ABC):
             # this has to be a teardown fixture error
             traceback.print_exception(*sys.exc_info())
             self.teardown_result.set_result(ResultState.ERROR, exc)
+        finally:
+            # the results of cached feature methods are only valid within the branch of their execution level
+            FeatureMethodCache.invalidate_level(self.fixture_execution_level)
 
         self._cleanup_execution(show_discarded=show_discarded)
 
+        if ResultState.ERROR in (self.construct_result.result, self.teardown_result.result) \
+                or (self.all_child_executors is None and self.body_result.result == ResultState.FAILURE):
+            self.executor_tree.record_failure(self)
+
         self.execution_time_sec = time.perf_counter() - start_time
@@ -10,6 +10,7 @@ from _balder.testresult import FixturePartResult, ResultState, ResultSummary, Te
 if TYPE_CHECKING:
     from _balder.setup import Setup
     from _balder.scenario import Scenario
+    from _balder.executor.executor_tree import ExecutorTree
 
 
 class BasicExecutor(ABC):
@@ -54,6 +55,23 @@ class BasicExecutor(ABC):
         """returns the base class instance to which this executor instance belongs or None if this element is a
         ExecutorTree"""
 
+    @property
+    @abstractmethod
+    def executor_id(self) -> str | None:
+        """
+        returns the id of this executor or None if this element is a ExecutorTree - the id is derived from the
+        qualified names of the setup and scenario classes, the device mapping and the test method (with its
+        parametrization values), so it is the same in every process that resolves the same tree
+        """
+
+    @property
+    def executor_tree(self) -> ExecutorTree:
+        """returns the root :class:`ExecutorTree` this executor belongs to"""
+        cur_executor = self
+        while cur_executor.parent_executor is not None:
+            cur_executor = cur_executor.parent_executor
+        return cur_executor
+
     @property
     def executor_result(self) -> ResultState:
         """
@@ -172,6 +190,20 @@ class BasicExecutor(ABC):
         # remove duplicate items
         return list(set(result))
 
+    def reorder_child_executors(self, ordered_executors: List[BasicExecutor]) -> None:
+        """
+        This method changes the execution order of the child executors of this branch.
+
+        :param ordered_executors: a list with exactly the same child executors of this branch in their new order
+        """
+        if self.all_child_executors is None:
+            raise TypeError(f"the executor `{self.__class__.__name__}` has no child executors")
+        if len(ordered_executors) != len(self.all_child_executors) \
+                or set(map(id, ordered_executors)) != set(map(id, self.all_child_executors)):
+            raise ValueError("the given list has to contain exactly the same executors as the current child list")
+        self.all_child_executors[:] = ordered_executors
+        self.executor_tree.invalidate_cached_views()
+
     @abstractmethod
     def cleanup_empty_executor_branches(self, consider_discarded=False):
         """
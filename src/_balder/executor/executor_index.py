@@ -0,0 +1,159 @@
+from __future__ import annotations
+from typing import List, Dict, Tuple, Callable, Hashable, Iterable, Iterator, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from _balder.executor.basic_executor import BasicExecutor
+
+
+class ChildExecutorIndex:
+    """
+    This class holds the child executors of an executor in their order together with an index, that returns the first
+    child executor for a key (f.e. the setup class of a :class:`SetupExecutor`)
+    """
+
+    def __init__(self, get_key_of: Callable[[BasicExecutor], Hashable]):
+        """
+        :param get_key_of: the callable that returns the key of a child executor
+        """
+        self._get_key_of = get_key_of
+        self._executors: List[BasicExecutor] = []
+        # contains the first child executor of every key
+        self._first_executor_by_key: Dict[Hashable, BasicExecutor] = {}
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def executors(self) -> List[BasicExecutor]:
+        """returns the ordered list of the child executors"""
+        return self._executors
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def add(self, executor: BasicExecutor) -> None:
+        """
+        This method appends the given executor to the child executors
+
+        :param executor: the child executor that should be added
+        """
+        self._executors.append(executor)
+        self._first_executor_by_key.setdefault(self._get_key_of(executor), executor)
+
+    def remove(self, executor: BasicExecutor) -> None:
+        """
+        This method removes the given executor from the child executors
+
+        :param executor: the child executor that should be removed
+        """
+        self._executors.remove(executor)
+        key = self._get_key_of(executor)
+        if self._first_executor_by_key.get(key) is executor:
+            del self._first_executor_by_key[key]
+            next_executor = next((cur_executor for cur_executor in self._executors
+                                  if self._get_key_of(cur_executor) == key), None)
+            if next_executor is not None:
+                self._first_executor_by_key[key] = next_executor
+
+    def replace_all(self, executors: Iterable[BasicExecutor]) -> None:
+        """
+        This method replaces all child executors with the given ones
+
+        :param executors: the new ordered child executors
+        """
+        self._executors = []
+        self._first_executor_by_key = {}
+        for cur_executor in executors:
+            self.add(cur_executor)
+
+    def get_by_key(self, key: Hashable) -> Union[BasicExecutor, None]:
+        """
+        This method returns the first child executor with the given key
+
+        :param key: the key of the child executor
+
+        :return: returns the first child executor with this key or None if there is no child executor with this key
+        """
+        return self._first_executor_by_key.get(key)
+
+
+class ExecutorTreeIndex(ChildExecutorIndex):
+    """
+    This class holds the setup executors of an :class:`ExecutorTree` together with the indexes and the cached views
+    of the whole tree
+    """
+
+    def __init__(self):
+        super().__init__(get_key_of=lambda setup_executor: setup_executor.base_setup_class.__class__)
+        # contains all executors of the tree with their executor id as key
+        self._executors_by_id: Dict[str, BasicExecutor] = {}
+        # contains the flattened lists of the `get_all_*_executors()` methods that were determined since the tree was
+        # changed the last time
+        self._cached_views: Dict[Tuple[str, bool], list] = {}
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def register(self, executor: BasicExecutor) -> None:
+        """
+        This method adds the given executor and all of its child executors to the id index (an already registered
+        executor with the same id is kept) and drops the cached views
+
+        :param executor: the executor that was added to the tree
+        """
+        self.clear_cached_views()
+        self._executors_by_id.setdefault(executor.executor_id, executor)
+        for cur_child_executor in executor.all_child_executors or []:
+            self.register(cur_child_executor)
+
+    def unregister(self, executor: BasicExecutor) -> None:
+        """
+        This method removes the given executor and all of its child executors from the id index and drops the cached
+        views
+
+        :param executor: the executor that was removed from the tree
+        """
+        self.clear_cached_views()
+        if self._executors_by_id.get(executor.executor_id) is executor:
+            del self._executors_by_id[executor.executor_id]
+        for cur_child_executor in executor.all_child_executors or []:
+            self.unregister(cur_child_executor)
+
+    def get_by_id(self, executor_id: str) -> Union[BasicExecutor, None]:
+        """
+        This method returns the registered executor with the given id (or None if there is none)
+
+        :param executor_id: the id of the executor
+        """
+        return self._executors_by_id.get(executor_id)
+
+    def get_cached_view(self, name: str, return_discarded: bool, iterator: Iterator[BasicExecutor]) -> list:
+        """
+        returns a copy of the cached flattened list with the given name - the list is created from the given iterator,
+        if it is not cached yet
+
+        :param name: the name of the view
+        :param return_discarded: True if the view contains discarded elements too
+        :param iterator: the generator that returns the elements of the view
+        """
+        key = (name, return_discarded)
+        if key not in self._cached_views:
+            self._cached_views[key] = list(iterator)
+        return self._cached_views[key].copy()
+
+    def clear_cached_views(self) -> None:
+        """
+        This method drops all cached views
+        """
+        self._cached_views.clear()
@@ -1,12 +1,17 @@
 from __future__ import annotations
-from typing import Union, List, Type, TYPE_CHECKING
+from typing import Union, List, Dict, Iterator, Type, TYPE_CHECKING
 
+import threading
 from dataclasses import fields
 from _balder.executor.setup_executor import SetupExecutor
+from _balder.executor.basic_executor import BasicExecutor
 from _balder.executor.basic_executable_executor import BasicExecutableExecutor
+from _balder.executor.executor_index import ExecutorTreeIndex
+from _balder.executor.unresolved_parametrized_testcase_executor import UnresolvedParametrizedTestcaseExecutor
 from _balder.fixture_execution_level import FixtureExecutionLevel
 from _balder.testresult import ResultState, BranchBodyResult, ResultSummary
 from _balder.previous_executor_mark import PreviousExecutorMark
+from _balder.utils.session_event_loop import SessionEventLoop
 
 if TYPE_CHECKING:
     from _balder.setup import Setup
@@ -14,6 +19,9 @@ if TYPE_CHECKING:
     from _balder.executor.scenario_executor import ScenarioExecutor
     from _balder.executor.variation_executor import VariationExecutor
     from _balder.executor.testcase_executor import TestcaseExecutor
+    from _balder.distributed.worker import Worker
+    from _balder.utils.fixture_result_store import FixtureResultStore
+    from _balder.sampling import Sampling
 
 
 class ExecutorTree(BasicExecutableExecutor):
@@ -22,12 +30,49 @@ class ExecutorTree(BasicExecutableExecutor):
     """
     fixture_execution_level = FixtureExecutionLevel.SESSION
     LINE_LENGTH = 120
+    SESSION_START_TEXT = "START TESTSESSION"
+    SESSION_END_TEXT = "FINISH TESTSESSION"
 
     def __init__(self, fixture_manager: FixtureManager):
         super().__init__()
-        self._setup_executors: List[SetupExecutor] = []
+        # contains the setup executors, the id index of all executors of this tree (see `register_executor()`) and the
+        # cached views of the `get_all_*_executors()` methods (see `invalidate_cached_views()`)
+        self._index = ExecutorTreeIndex()
         self._fixture_manager = fixture_manager
 
+        #: the maximum number of parallel-safe testcases of one variation that are allowed to be executed at the same
+        #: time (1 means that all testcases are executed sequentially)
+        self.max_parallel_testcases = 1
+        #: the maximum number of async testcases of one variation that are allowed to run concurrently on the session
+        #: event loop (1 means that all testcases are executed sequentially)
+        self.max_concurrent_async_testcases = 1
+        #: the maximum number of fixtures of one execution level that are allowed to be constructed (or torn down) at
+        #: the same time in worker threads (1 means that all fixtures are executed sequentially)
+        self.max_concurrent_fixtures = 1
+        #: the strength of the n-wise covering array the parametrization of all parametrized tests is reduced to (None
+        #: if all combinations are executed) - test methods with ``@balder.parametrize_nwise`` use their own strength
+        self.parametrize_nwise: Union[int, None] = None
+        #: the seed the n-wise covering arrays are determined with (if the test method does not define its own seed)
+        self.parametrize_seed = 0
+        #: the sampling that selects the executed variations and parametrizations (None if all of them are executed)
+        self.sampling: Union[Sampling, None] = None
+
+        #: the event loop all async testcases, fixtures and feature methods of this session are executed on
+        self.event_loop = SessionEventLoop()
+        #: the store the values of cached SESSION fixtures are saved in (None if cached fixtures are always executed)
+        self.fixture_result_store: Union[FixtureResultStore, None] = None
+
+        #: the maximum number of failures per fixture execution level (`SESSION` for the whole session, `SETUP` for
+        #: every setup branch and `VARIATION` for every variation branch) - as soon as a branch reaches its maximum, its
+        #: remaining child branches are not executed anymore
+        self.max_failures: Dict[FixtureExecutionLevel, int] = {}
+        # contains the number of failed testcases and fixtures for every branch that has at least one failure
+        self._failure_counts: Dict[BasicExecutableExecutor, int] = {}
+        self._failure_counts_lock = threading.Lock()
+
+        #: the remote worker that determines the variations this tree executes (only set if balder runs as worker)
+        self.remote_worker: Union[Worker, None] = None
+
         # contains the result object for the BODY part of this branch (will be overwritten in :class:`TestcaseExecutor`)
         self.body_result = BranchBodyResult(self)
 
@@ -39,13 +84,18 @@ class ExecutorTree(BasicExecutableExecutor):
 
     @property
     def all_child_executors(self) -> List[BasicExecutableExecutor] | None:
-        return self._setup_executors
+        return self._index.executors
 
     @property
     def base_instance(self) -> object:
         """returns None because this element is a ExecutorTree"""
         return None
 
+    @property
+    def executor_id(self) -> None:
+        """returns None because this element is a ExecutorTree"""
+        return None
+
     @property
     def fixture_manager(self) -> FixtureManager:
         """returns the fixture manager of this tree"""
@@ -57,14 +107,33 @@ class ExecutorTree(BasicExecutableExecutor):
 
     # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
 
+    @staticmethod
+    def _get_testcase_line_of(
+            testcase_executor: Union[TestcaseExecutor, UnresolvedParametrizedTestcaseExecutor],
+            start_char: str) -> str:
+        """returns the line that describes the given testcase executor in the output of :meth:`print_tree`"""
+        count_str = ""
+        if isinstance(testcase_executor, UnresolvedParametrizedTestcaseExecutor):
+            # do not create the executors of parametrized testcases - only print their number
+            count = testcase_executor.get_testcase_count()
+            count_str = " [dynamically parametrized]" if count is None else f" [{count} parametrized]"
+        return f"{start_char}    -> Testcase<{testcase_executor.base_testcase_callable.__qualname__}>{count_str}"
+
     def _prepare_execution(self, show_discarded):
         if not show_discarded:
             self.update_inner_feature_reference_in_all_setups()
 
     def _body_execution(self, show_discarded):
+        if self.remote_worker is not None:
+            # the coordinator decides which variations are executed
+            self.remote_worker.execute_work_items(show_discarded=show_discarded)
+            return
         for cur_setup_executor in self.get_setup_executors(return_discarded=show_discarded):
             prev_mark = cur_setup_executor.prev_mark
-            if cur_setup_executor.has_runnable_tests(consider_discarded_too=show_discarded) \
+            if self.is_failure_budget_exhausted(self):
+                # do not execute the remaining branches
+                cur_setup_executor.set_result_for_whole_branch(ResultState.NOT_RUN)
+            elif cur_setup_executor.has_runnable_tests(consider_discarded_too=show_discarded) \
                     or cur_setup_executor.has_skipped_tests():
                 cur_setup_executor.execute(show_discarded=show_discarded)
             elif prev_mark == PreviousExecutorMark.SKIP:
@@ -75,10 +144,56 @@ class ExecutorTree(BasicExecutableExecutor):
                 cur_setup_executor.set_result_for_whole_branch(ResultState.NOT_RUN)
 
     def _cleanup_execution(self, show_discarded):
-        pass
+        self.event_loop.close()
 
     # ---------------------------------- METHODS -----------------------------------------------------------------------
 
+    def invalidate_cached_views(self) -> None:
+        """
+        This method drops the cached flattened lists of the ``get_all_*_executors()`` methods. It is called whenever
+        executors are added, removed or reordered and whenever a variation is discarded or its mark changes.
+        """
+        self._index.clear_cached_views()
+
+    def iter_setup_executors(self, return_discarded=False) -> Iterator[SetupExecutor]:
+        """
+        returns a generator over all setup executors of this tree
+
+        :param return_discarded: True if the generator should return discarded variations too
+        """
+        for cur_setup_executor in self._index.executors:
+            if return_discarded \
+                    or next(cur_setup_executor.iter_scenario_executors(return_discarded=False), None) is not None:
+                yield cur_setup_executor
+
+    def iter_all_scenario_executors(self, return_discarded=False) -> Iterator[ScenarioExecutor]:
+        """
+        returns a generator over all scenario executors of this tree
+
+        :param return_discarded: True if the generator should return discarded variations too
+        """
+        for cur_setup_executor in self._index.executors:
+            yield from cur_setup_executor.iter_scenario_executors(return_discarded=return_discarded)
+
+    def iter_all_variation_executors(self, return_discarded=False) -> Iterator[VariationExecutor]:
+        """
+        returns a generator over all variation executors of this tree
+
+        :param return_discarded: True if the generator should return discarded variations too
+        """
+        for cur_setup_executor in self._index.executors:
+            for cur_scenario_executor in cur_setup_executor.all_child_executors:
+                yield from cur_scenario_executor.iter_variation_executors(return_discarded=return_discarded)
+
+    def iter_all_testcase_executors(self) -> Iterator[TestcaseExecutor | UnresolvedParametrizedTestcaseExecutor]:
+        """
+        returns a generator over all testcase executors of the variations that are not discarded (parametrized
+        testcases that were not executed yet are returned as their :class:`UnresolvedParametrizedTestcaseExecutor`
+        group)
+        """
+        for cur_variation_executor in self.iter_all_variation_executors():
+            yield from cur_variation_executor.all_child_executors
+
     def get_setup_executors(self, return_discarded=False) -> List[SetupExecutor]:
         """
         returns all setup executors of this tree
@@ -88,41 +203,29 @@ class ExecutorTree(BasicExecutableExecutor):
         :return: a list of relevant :class:`SetupExecutor`
         """
         if return_discarded:
-            return self._setup_executors
-
-        return [
-            cur_setup_executor
-            for cur_setup_executor in self._setup_executors
-            if len(cur_setup_executor.get_scenario_executors(return_discarded=False)) > 0
-        ]
+            return self._index.executors
+        return list(self.iter_setup_executors())
 
     def get_all_scenario_executors(self, return_discarded=False) -> List[ScenarioExecutor]:
         """
-        returns a list with all scenario executors
+        returns a list with all scenario executors (the list is cached till the tree changes)
         """
-        all_scenario_executor = []
-        for cur_setup_executor in self.get_setup_executors(return_discarded=return_discarded):
-            all_scenario_executor += cur_setup_executor.get_scenario_executors(return_discarded=return_discarded)
-        return all_scenario_executor
+        return self._index.get_cached_view(
+            'scenario', return_discarded, self.iter_all_scenario_executors(return_discarded))
 
     def get_all_variation_executors(self, return_discarded=False) -> List[VariationExecutor]:
         """
-        returns a list with all variation executors
+        returns a list with all variation executors (the list is cached till the tree changes)
         """
-        all_variation_executor = []
-        for cur_scenario_executor in self.get_all_scenario_executors(return_discarded=return_discarded):
-            all_variation_executor += cur_scenario_executor.get_variation_executors(return_discarded=return_discarded)
-        return all_variation_executor
+        return self._index.get_cached_view(
+            'variation', return_discarded, self.iter_all_variation_executors(return_discarded))
 
-    def get_all_testcase_executors(self) -> List[TestcaseExecutor]:
+    def get_all_testcase_executors(self) -> List[TestcaseExecutor | UnresolvedParametrizedTestcaseExecutor]:
         """
-        returns a list with all testcase executors
+        returns a list with all testcase executors (parametrized testcases that were not executed yet are returned as
+        their :class:`UnresolvedParametrizedTestcaseExecutor` group) - the list is cached till the tree changes
         """
-        all_testcase_executor = []
-        for cur_scenario_executor in self.get_all_scenario_executors():
-            for cur_variation_executor in cur_scenario_executor.get_variation_executors():
-                all_testcase_executor += cur_variation_executor.get_testcase_executors()
-        return all_testcase_executor
+        return self._index.get_cached_view('testcase', False, self.iter_all_testcase_executors())
 
     def add_setup_executor(self, setup_executor: SetupExecutor):
         """
@@ -130,23 +233,50 @@ class ExecutorTree(BasicExecutableExecutor):
         """
         if not isinstance(setup_executor, SetupExecutor):
             raise TypeError("the given object `setup_executor` must be of type `SetupExecutor`")
-        if setup_executor in self._setup_executors:
+        if setup_executor in self._index.executors:
             raise ValueError("the given object `setup_executor` already exists in child list")
-        self._setup_executors.append(setup_executor)
+        self._index.add(setup_executor)
+        self.register_executor(setup_executor)
+
+    def register_executor(self, executor: BasicExecutor) -> None:
+        """
+        This method adds the given executor and all of its child executors to the id index of this tree (see
+        :meth:`get_executor_by_id`). It is called by the ``add_*_executor()`` methods of all executors. If another
+        executor with the same id is already registered, the registered one is kept. The cached views of the tree are
+        dropped.
+
+        :param executor: the executor that was added to this tree
+        """
+        self._index.register(executor)
+
+    def unregister_executor(self, executor: BasicExecutor) -> None:
+        """
+        This method removes the given executor and all of its child executors from the id index of this tree (the
+        cached views of the tree are dropped)
+
+        :param executor: the executor that was removed from this tree
+        """
+        self._index.unregister(executor)
+
+    def get_executor_by_id(self, executor_id: str) -> Union[BasicExecutor, None]:
+        """
+        This method returns the executor of this tree with the given id (see :meth:`BasicExecutor.executor_id`)
+
+        :param executor_id: the id of the executor
+
+        :return: returns the associated executor or None if this tree has no executor with the given id
+        """
+        return self._index.get_by_id(executor_id)
 
     def get_executor_for_setup(self, setup: Type[Setup]) -> Union[SetupExecutor, None]:
         """
-        This method searches for a SetupExecutor in the internal list for the given :class:`Setup` type
+        This method searches for a SetupExecutor of this tree for the given :class:`Setup` type
 
         :param setup: the setup class for which the executor is being searched for
 
         :return: returns the associated SetupExecutor or None if there are no matches for the given type
         """
-        for cur_setup_executor in self._setup_executors:
-            if cur_setup_executor.base_setup_class.__class__ == setup:
-                return cur_setup_executor
-        # can not find some
-        return None
+        return self._index.get_by_key(setup)
 
     def cleanup_empty_executor_branches(self, consider_discarded=False):
         to_remove_executor = []
@@ -156,7 +286,8 @@ class ExecutorTree(BasicExecutableExecutor):
                 # remove this whole executor because it has no children anymore
                 to_remove_executor.append(cur_setup_executor)
         for cur_setup_executor in to_remove_executor:
-            self._setup_executors.remove(cur_setup_executor)
+            self._index.remove(cur_setup_executor)
+            self.unregister_executor(cur_setup_executor)
 
     def update_inner_feature_reference_in_all_setups(self):
         """
@@ -168,28 +299,50 @@ class ExecutorTree(BasicExecutableExecutor):
         for cur_setup_executor in self.get_setup_executors():
             cur_setup_executor.update_inner_referenced_feature_instances()
 
-    def execute(self, show_discarded=False) -> None:
+    def record_failure(self, executor: BasicExecutableExecutor) -> None:
         """
-        This method executes this branch of the tree
+        This method records a failed testcase or a failed fixture part of a branch. The failure is counted for the
+        given executor and all of its parent executors.
+
+        :param executor: the executor that has failed
         """
-        start_text = "START TESTSESSION"
-        end_text = "FINISH TESTSESSION"
+        with self._failure_counts_lock:
+            cur_executor = executor
+            while cur_executor is not None:
+                self._failure_counts[cur_executor] = self._failure_counts.get(cur_executor, 0) + 1
+                cur_executor = cur_executor.parent_executor
 
-        def print_line(text):
-            full_text = int((self.LINE_LENGTH - (len(start_text) + 2)) / 2) * "=" + " " + text + " "
-            full_text += "=" * (self.LINE_LENGTH - len(full_text))
-            print(full_text)
+    def get_failure_count(self, executor: BasicExecutableExecutor) -> int:
+        """returns the number of recorded failures within the branch of the given executor"""
+        return self._failure_counts.get(executor, 0)
 
-        print_line(start_text)
-        # check if there exists runnable elements
-        runnables = [cur_exec.has_runnable_tests(consider_discarded_too=show_discarded)
-                     for cur_exec in self.get_setup_executors(return_discarded=show_discarded)]
-        one_or_more_runnable_setups = None if len(runnables) == 0 else max(runnables)
-        if one_or_more_runnable_setups:
-            super().execute(show_discarded=show_discarded)
-        else:
-            print("NO EXECUTABLE SETUPS/SCENARIOS FOUND")
-        print_line(end_text)
+    def is_failure_budget_exhausted(self, executor: BasicExecutableExecutor) -> bool:
+        """
+        This method returns True if the given branch or one of its parent branches has reached its maximum number of
+        failures (see `max_failures`). The remaining children of such a branch should not be executed anymore.
+
+        :param executor: the executor that should be checked
+        """
+        cur_executor = executor
+        while cur_executor is not None:
+            max_failures = self.max_failures.get(cur_executor.fixture_execution_level)
+            if max_failures is not None and self.get_failure_count(cur_executor) >= max_failures:
+                return True
+            cur_executor = cur_executor.parent_executor
+        return False
+
+    def print_session_line(self, text: str) -> None:
+        """
+        prints a line that marks the start or the end of the test session
+
+        :param text: the text that should be printed in the middle of the line
+        """
+        full_text = int((self.LINE_LENGTH - (len(self.SESSION_START_TEXT) + 2)) / 2) * "=" + " " + text + " "
+        full_text += "=" * (self.LINE_LENGTH - len(full_text))
+        print(full_text)
+
+    def print_summary(self) -> None:
+        """prints the summary with the number of all results of this tree"""
         summary = self.testsummary()
         is_first = True
         for cur_field in fields(ResultSummary):
@@ -200,6 +353,24 @@ class ExecutorTree(BasicExecutableExecutor):
             print(f"TOTAL {cur_field.name.upper()}: {getattr(summary, cur_field.name)}", end="")
         print("")
 
+    def execute(self, show_discarded=False) -> None:
+        """
+        This method executes this branch of the tree
+        """
+        self.print_session_line(self.SESSION_START_TEXT)
+        # check if there exists runnable elements
+        runnables = [cur_exec.has_runnable_tests(consider_discarded_too=show_discarded)
+                     for cur_exec in self.get_setup_executors(return_discarded=show_discarded)]
+        one_or_more_runnable_setups = None if len(runnables) == 0 else max(runnables)
+        if one_or_more_runnable_setups:
+            super().execute(show_discarded=show_discarded)
+            if self.is_failure_budget_exhausted(self):
+                print(f"STOPPED THE EXECUTION AFTER {self.get_failure_count(self)} FAILURES")
+        else:
+            print("NO EXECUTABLE SETUPS/SCENARIOS FOUND")
+        self.print_session_line(self.SESSION_END_TEXT)
+        self.print_summary()
+
     def print_tree(self, show_discarded=False) -> None:
         """this method is an auxiliary method which outputs the entire tree"""
         print("RESOLVING OVERVIEW", end="\n\n")
@@ -221,8 +392,7 @@ class ExecutorTree(BasicExecutableExecutor):
                     for cur_key, cur_val in mapping_printings.items():
                         print(("{} {:<" + str(max_len) + "} = {}").format(start_char, cur_key, cur_val))
                     for cur_testcase_excutor in cur_variation_executor.get_testcase_executors():
-                        print(f"{start_char}    -> Testcase<"
-                              f"{cur_testcase_excutor.base_testcase_callable.__qualname__}>")
+                        print(self._get_testcase_line_of(cur_testcase_excutor, start_char))
                     if cur_variation_executor.prev_mark == PreviousExecutorMark.DISCARDED:
                         print(f"{start_char}")
                         print(f"{start_char}    DISCARDED BECAUSE "
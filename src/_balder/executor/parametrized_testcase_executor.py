@@ -26,6 +26,16 @@ class ParametrizedTestcaseExecutor(TestcaseExecutor):
         # holds a reference to the parent unresolved object (if it has dynamic parametrized components
         self._unresolved_group_obj: UnresolvedParametrizedTestcaseExecutor | None = unresolved_group_obj
 
+    @property
+    def parametrization(self) -> OrderedDict[str, Any] | None:
+        """returns the parametrization values of this testcase"""
+        return self._parametrization
+
+    @property
+    def unresolved_group_obj(self) -> UnresolvedParametrizedTestcaseExecutor | None:
+        """returns the unresolved group this executor was resolved from (None if it has no dynamic parametrization)"""
+        return self._unresolved_group_obj
+
     @property
     def full_test_name_str(self) -> str:
         """
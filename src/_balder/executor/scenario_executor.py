@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Type, Union, List, TYPE_CHECKING
+from typing import Type, Union, List, Dict, FrozenSet, Iterator, Tuple, TYPE_CHECKING
 
 from _balder.fixture_execution_level import FixtureExecutionLevel
 from _balder.testresult import ResultState, BranchBodyResult
@@ -7,8 +7,10 @@ from _balder.executor.basic_executable_executor import BasicExecutableExecutor
 from _balder.executor.variation_executor import VariationExecutor
 from _balder.previous_executor_mark import PreviousExecutorMark
 from _balder.controllers.scenario_controller import ScenarioController
+from _balder.utils.functions import get_class_id
 
 if TYPE_CHECKING:
+    from _balder.device import Device
     from _balder.scenario import Scenario
     from _balder.executor.setup_executor import SetupExecutor
     from _balder.fixture_manager import FixtureManager
@@ -23,6 +25,9 @@ class ScenarioExecutor(BasicExecutableExecutor):
     def __init__(self, scenario: Type[Scenario], parent: SetupExecutor):
         super().__init__()
         self._variation_executors: List[VariationExecutor] = []
+        # contains the variation executors with the items of their device mapping as key
+        self._variation_executors_by_mapping: \
+            Dict[FrozenSet[Tuple[Type[Device], Type[Device]]], VariationExecutor] = {}
         # check if instance already exists
         if hasattr(scenario, "_instance") and scenario._instance is not None and \
                 isinstance(scenario._instance, scenario):
@@ -32,6 +37,7 @@ class ScenarioExecutor(BasicExecutableExecutor):
             scenario._instance = self._base_scenario_class
         self._parent_executor = parent
         self._fixture_manager = parent.fixture_manager
+        self._executor_id = self.get_executor_id_for(parent.executor_id, scenario)
 
         # contains the result object for the BODY part of this branch
         self.body_result = BranchBodyResult(self)
@@ -42,6 +48,17 @@ class ScenarioExecutor(BasicExecutableExecutor):
 
     # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
 
+    @staticmethod
+    def get_executor_id_for(setup_executor_id: str, scenario: Type[Scenario]) -> str:
+        """
+        returns the executor id a :class:`ScenarioExecutor` for the given scenario class has
+
+        :param setup_executor_id: the executor id of the parent :class:`SetupExecutor`
+
+        :param scenario: the scenario class
+        """
+        return f"{setup_executor_id}::{get_class_id(scenario)}"
+
     # ---------------------------------- CLASS METHODS ----------------------------------------------------------------
 
     # ---------------------------------- PROPERTIES --------------------------------------------------------------------
@@ -50,6 +67,10 @@ class ScenarioExecutor(BasicExecutableExecutor):
     def all_child_executors(self) -> List[VariationExecutor]:
         return self._variation_executors
 
+    @property
+    def executor_id(self) -> str:
+        return self._executor_id
+
     @property
     def parent_executor(self) -> SetupExecutor:
         return self._parent_executor
@@ -99,7 +120,10 @@ class ScenarioExecutor(BasicExecutableExecutor):
     def _body_execution(self, show_discarded):
         for cur_variation_executor in self.get_variation_executors(return_discarded=show_discarded):
             prev_mark = cur_variation_executor.prev_mark
-            if cur_variation_executor.has_runnable_tests(consider_discarded_too=show_discarded) \
+            if self.executor_tree.is_failure_budget_exhausted(self):
+                # do not execute the remaining branches
+                cur_variation_executor.set_result_for_whole_branch(ResultState.NOT_RUN)
+            elif cur_variation_executor.has_runnable_tests(consider_discarded_too=show_discarded) \
                     or cur_variation_executor.has_skipped_tests():
                 cur_variation_executor.execute(show_discarded=show_discarded)
             elif prev_mark == PreviousExecutorMark.SKIP:
@@ -114,6 +138,16 @@ class ScenarioExecutor(BasicExecutableExecutor):
 
     # ---------------------------------- METHODS -----------------------------------------------------------------------
 
+    def iter_variation_executors(self, return_discarded=False) -> Iterator[VariationExecutor]:
+        """
+        returns a generator over all variation executors that are child executor of this scenario executor
+
+        :param return_discarded: True if the generator should return discarded variations too
+        """
+        for cur_executor in self._variation_executors:
+            if return_discarded or cur_executor.prev_mark != PreviousExecutorMark.DISCARDED:
+                yield cur_executor
+
     def get_variation_executors(self, return_discarded=False) -> List[VariationExecutor]:
         """
         :param return_discarded: True if the method should return discarded variations too
@@ -121,8 +155,7 @@ class ScenarioExecutor(BasicExecutableExecutor):
         :return: returns all variation executors that are child executor of this scenario executor
         """
         if not return_discarded:
-            return [cur_executor for cur_executor in self._variation_executors
-                    if cur_executor.prev_mark != PreviousExecutorMark.DISCARDED]
+            return list(self.iter_variation_executors())
         return self._variation_executors
 
     def cleanup_empty_executor_branches(self, consider_discarded=False):
@@ -136,6 +169,10 @@ class ScenarioExecutor(BasicExecutableExecutor):
                 to_remove_executor.append(cur_variation_executor)
         for cur_variation_executor in to_remove_executor:
             self._variation_executors.remove(cur_variation_executor)
+            mapping_key = frozenset(cur_variation_executor.base_device_mapping.items())
+            if self._variation_executors_by_mapping.get(mapping_key) is cur_variation_executor:
+                del self._variation_executors_by_mapping[mapping_key]
+            self.executor_tree.unregister_executor(cur_variation_executor)
 
     def get_covered_by_element(self) -> List[Union[Scenario, callable]]:
         """
@@ -153,18 +190,17 @@ class ScenarioExecutor(BasicExecutableExecutor):
         if variation_executor in self._variation_executors:
             raise ValueError("the given object `variation_executor` already exists in child list")
         self._variation_executors.append(variation_executor)
+        self._variation_executors_by_mapping.setdefault(
+            frozenset(variation_executor.base_device_mapping.items()), variation_executor)
+        self.executor_tree.register_executor(variation_executor)
 
     def get_executor_for_device_mapping(self, device_mapping: dict) -> Union[VariationExecutor, None]:
         """
-        This method searches for a VariationExecutor in the internal list for which the given device mapping is
+        This method searches for a VariationExecutor of this scenario executor for which the given device mapping is
         contained in
 
         :param device_mapping: the device_mapping dictionary for which the executor should be searched for
 
         :return: returns the associated VariationExecutor or None if no matching could be found
         """
-        for cur_variation_executor in self._variation_executors:
-            if cur_variation_executor.base_device_mapping == device_mapping:
-                return cur_variation_executor
-        # can not find some
-        return None
+        return self._variation_executors_by_mapping.get(frozenset(device_mapping.items()))
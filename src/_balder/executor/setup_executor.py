@@ -1,7 +1,8 @@
 from __future__ import annotations
-from typing import Type, Union, List, TYPE_CHECKING
+from typing import Type, Union, List, Dict, Iterator, TYPE_CHECKING
 
 from _balder.fixture_execution_level import FixtureExecutionLevel
+from _balder.parametrization import ParametrizationValueCache
 from _balder.testresult import ResultState, BranchBodyResult
 from _balder.executor.basic_executable_executor import BasicExecutableExecutor
 from _balder.executor.scenario_executor import ScenarioExecutor
@@ -9,6 +10,7 @@ from _balder.previous_executor_mark import PreviousExecutorMark
 from _balder.controllers.setup_controller import SetupController
 from _balder.controllers.device_controller import DeviceController
 from _balder.controllers.feature_controller import FeatureController
+from _balder.utils.functions import get_class_id
 
 if TYPE_CHECKING:
     from _balder.setup import Setup
@@ -27,6 +29,8 @@ class SetupExecutor(BasicExecutableExecutor):
     def __init__(self, setup: Type[Setup], parent: ExecutorTree):
         super().__init__()
         self._scenario_executors: List[ScenarioExecutor] = []
+        # contains the scenario executors with their scenario class as key
+        self._scenario_executors_by_scenario: Dict[Type[Scenario], ScenarioExecutor] = {}
         # check if instance already exists
         if hasattr(setup, "_instance") and setup._instance is not None and isinstance(setup._instance, setup):
             self._base_setup_class = setup._instance
@@ -35,12 +39,26 @@ class SetupExecutor(BasicExecutableExecutor):
             setup._instance = self._base_setup_class
         self._parent_executor = parent
         self._fixture_manager = parent.fixture_manager
+        self._executor_id = self.get_executor_id_for(setup)
+
+        #: memoizes the values of the feature methods/properties that are used for the dynamic parametrization of the
+        #: variations of this setup
+        self.parametrization_value_cache = ParametrizationValueCache()
 
         # contains the result object for the BODY part of this branch
         self.body_result = BranchBodyResult(self)
 
     # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
 
+    @staticmethod
+    def get_executor_id_for(setup: Type[Setup]) -> str:
+        """
+        returns the executor id a :class:`SetupExecutor` for the given setup class has
+
+        :param setup: the setup class
+        """
+        return get_class_id(setup)
+
     # ---------------------------------- CLASS METHODS ----------------------------------------------------------------
 
     # ---------------------------------- PROPERTIES --------------------------------------------------------------------
@@ -49,6 +67,10 @@ class SetupExecutor(BasicExecutableExecutor):
     def all_child_executors(self) -> List[ScenarioExecutor]:
         return self._scenario_executors
 
+    @property
+    def executor_id(self) -> str:
+        return self._executor_id
+
     @property
     def parent_executor(self) -> ExecutorTree:
         return self._parent_executor
@@ -81,7 +103,10 @@ class SetupExecutor(BasicExecutableExecutor):
     def _body_execution(self, show_discarded):
         for cur_scenario_executor in self.get_scenario_executors(return_discarded=show_discarded):
             prev_mark = cur_scenario_executor.prev_mark
-            if cur_scenario_executor.has_runnable_tests(consider_discarded_too=show_discarded) \
+            if self.executor_tree.is_failure_budget_exhausted(self):
+                # do not execute the remaining branches
+                cur_scenario_executor.set_result_for_whole_branch(ResultState.NOT_RUN)
+            elif cur_scenario_executor.has_runnable_tests(consider_discarded_too=show_discarded) \
                     or cur_scenario_executor.has_skipped_tests():
                 cur_scenario_executor.execute(show_discarded=show_discarded)
             elif prev_mark == PreviousExecutorMark.SKIP:
@@ -124,6 +149,17 @@ class SetupExecutor(BasicExecutableExecutor):
                     # object
                     setattr(cur_feature, cur_ref_feature_name, replacing_candidate)
 
+    def iter_scenario_executors(self, return_discarded=False) -> Iterator[ScenarioExecutor]:
+        """
+        returns a generator over all scenario executors that belongs to this setup executor
+
+        :param return_discarded: True if the generator should return discarded variations too
+        """
+        for cur_scenario_executor in self._scenario_executors:
+            if return_discarded \
+                    or next(cur_scenario_executor.iter_variation_executors(return_discarded=False), None) is not None:
+                yield cur_scenario_executor
+
     def get_scenario_executors(self, return_discarded=False) -> List[ScenarioExecutor]:
         """
         returns a list with all scenario executors that belongs to this setup executor
@@ -134,12 +170,7 @@ class SetupExecutor(BasicExecutableExecutor):
         """
         if return_discarded:
             return self._scenario_executors
-
-        return [
-            cur_scenario_executor
-            for cur_scenario_executor in self._scenario_executors
-            if len(cur_scenario_executor.get_variation_executors(return_discarded=False)) > 0
-        ]
+        return list(self.iter_scenario_executors())
 
     def cleanup_empty_executor_branches(self, consider_discarded=False):
         to_remove_executor = []
@@ -150,6 +181,10 @@ class SetupExecutor(BasicExecutableExecutor):
                 to_remove_executor.append(cur_scenario_executor)
         for cur_scenario_executor in to_remove_executor:
             self._scenario_executors.remove(cur_scenario_executor)
+            scenario = cur_scenario_executor.base_scenario_class.__class__
+            if self._scenario_executors_by_scenario.get(scenario) is cur_scenario_executor:
+                del self._scenario_executors_by_scenario[scenario]
+            self.executor_tree.unregister_executor(cur_scenario_executor)
 
     def add_scenario_executor(self, scenario_executor: ScenarioExecutor):
         """
@@ -160,18 +195,17 @@ class SetupExecutor(BasicExecutableExecutor):
         if scenario_executor in self._scenario_executors:
             raise ValueError("the given object `scenario_executor` already exists in child list")
         self._scenario_executors.append(scenario_executor)
+        self._scenario_executors_by_scenario.setdefault(
+            scenario_executor.base_scenario_class.__class__, scenario_executor)
+        self.executor_tree.register_executor(scenario_executor)
 
     def get_executor_for_scenario(self, scenario: Type[Scenario]) -> Union[ScenarioExecutor, None]:
         """
-        This method searches for a ScenarioExecutor in the internal list for which the given scenario is
+        This method searches for a ScenarioExecutor of this setup executor for which the given scenario is
         contained in
 
         :param scenario: the scenario class for which the executor should be searched for
 
         :return: returns the associated ScenarioExecutor or None if no matching could be found
         """
-        for cur_scenario_executor in self._scenario_executors:
-            if cur_scenario_executor.base_scenario_class.__class__ == scenario:
-                return cur_scenario_executor
-        # can not find some
-        return None
+        return self._scenario_executors_by_scenario.get(scenario)
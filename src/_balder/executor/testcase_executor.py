@@ -3,10 +3,12 @@ from typing import List, Union, TYPE_CHECKING
 
 import sys
 import time
+import inspect
 import traceback
 
 from _balder.executor.basic_executable_executor import BasicExecutableExecutor
 from _balder.fixture_execution_level import FixtureExecutionLevel
+from _balder.feature_method_cache import FeatureMethodCache
 from _balder.previous_executor_mark import PreviousExecutorMark
 from _balder.testresult import ResultState, TestcaseResult
 from _balder.utils.functions import get_method_type
@@ -46,6 +48,10 @@ class TestcaseExecutor(BasicExecutableExecutor, MixinCanBeCoveredByExecutor):
         # holds the raw test execution time in seconds
         self.test_execution_time_sec = 0
 
+        #: the test execution time in seconds that was recorded in an earlier run (None if it is unknown) - it is used
+        #: to start long testcases first, if testcases are executed in parallel
+        self.expected_duration_sec: Union[float, None] = None
+
         # determine prev_mark IGNORE/SKIP for the testcase
         if self.should_be_skipped():
             self.prev_mark = PreviousExecutorMark.SKIP
@@ -67,6 +73,10 @@ class TestcaseExecutor(BasicExecutableExecutor, MixinCanBeCoveredByExecutor):
     def parent_executor(self) -> VariationExecutor:
         return self._parent_executor
 
+    @property
+    def executor_id(self) -> str:
+        return f"{self._parent_executor.executor_id}::{self.full_test_name_str}"
+
     @property
     def scenario_executor(self) -> ScenarioExecutor:
         return self.parent_executor.parent_executor
@@ -104,6 +114,7 @@ class TestcaseExecutor(BasicExecutableExecutor, MixinCanBeCoveredByExecutor):
     # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
 
     def _prepare_execution(self, show_discarded):
+        FeatureMethodCache.set_running_testcase(self)
         print(f"      TEST {self.full_test_name_str} ", end='')
 
     def _body_execution(self, show_discarded):
@@ -125,15 +136,18 @@ class TestcaseExecutor(BasicExecutableExecutor, MixinCanBeCoveredByExecutor):
             all_args = self.get_all_test_method_args()
             if func_type == "staticmethod":
                 # testcase is a staticmethod - no special first attribute
-                self.base_testcase_callable(**all_args)
+                result = self.base_testcase_callable(**all_args)
             elif func_type == "classmethod":
-                self.base_testcase_callable(self=self.base_testcase_obj.__class__, **all_args)
+                result = self.base_testcase_callable(self=self.base_testcase_obj.__class__, **all_args)
             elif func_type == "instancemethod":
-                self.base_testcase_callable(self=self.base_testcase_obj, **all_args)
+                result = self.base_testcase_callable(self=self.base_testcase_obj, **all_args)
             else:
                 # `function` is not allowed here!
                 raise ValueError(f"found illegal value for func_type `{func_type}` for test "
                                  f"`{self.base_testcase_callable.__name__}`")
+            if inspect.isawaitable(result):
+                # this is an async test -> execute it on the event loop of the session
+                self.executor_tree.event_loop.run(result)
 
             self.body_result.set_result(ResultState.SUCCESS)
         except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -143,6 +157,7 @@ class TestcaseExecutor(BasicExecutableExecutor, MixinCanBeCoveredByExecutor):
         self.test_execution_time_sec = time.perf_counter() - start_time
 
     def _cleanup_execution(self, show_discarded):
+        FeatureMethodCache.set_running_testcase(None)
         print(f"[{self.body_result.get_result_as_char()}]")
 
     # ---------------------------------- METHODS -----------------------------------------------------------------------
@@ -165,6 +180,14 @@ class TestcaseExecutor(BasicExecutableExecutor, MixinCanBeCoveredByExecutor):
             return True
         return False
 
+    def is_async(self):
+        """returns true if the testcase is a coroutine function that will be executed on the session event loop"""
+        return inspect.iscoroutinefunction(self.base_testcase_callable)
+
+    def is_parallel_safe(self):
+        """returns true if the testcase is allowed to be executed in parallel with other parallel-safe testcases"""
+        return self.scenario_executor.base_scenario_controller.is_parallel_safe(self.base_testcase_callable)
+
     def is_covered_by(self):
         """returns true if the testcase is covered-by"""
         return self.prev_mark == PreviousExecutorMark.COVERED_BY
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
-import inspect
-from typing import List, Type, Any, Dict, Iterable, TYPE_CHECKING
+from typing import List, Type, Any, Dict, Iterable, Iterator, Sequence, Tuple, TYPE_CHECKING
+import math
 import types
-from graphlib import TopologicalSorter
 from collections import OrderedDict
 
 from _balder.executor.basic_executor import BasicExecutor
 from _balder.executor.parametrized_testcase_executor import ParametrizedTestcaseExecutor
-from _balder.parametrization import Parameter
+from _balder.parametrization_file import ParametrizationFile
 from _balder.previous_executor_mark import PreviousExecutorMark
-from _balder.testresult import BranchBodyResult
+from _balder.testresult import BranchBodyResult, ResultState, ResultSummary
 from _balder.utils.mixin_can_be_covered_by_executor import MixinCanBeCoveredByExecutor
+from _balder.utils.covering_array import get_covering_array, select_covering_rows
+from _balder.utils.functions import get_argument_names
 
 if TYPE_CHECKING:
     from _balder.executor.scenario_executor import ScenarioExecutor
@@ -22,30 +23,90 @@ if TYPE_CHECKING:
 
 class UnresolvedParametrizedTestcaseExecutor(BasicExecutor, MixinCanBeCoveredByExecutor):
     """
-    This executor class represents a group of dynamically parametrized tests.
+    This executor class represents all parametrized tests of one test method within one variation. It only holds the
+    static parametrization values - the :class:`ParametrizedTestcaseExecutor` for every single parametrization is
+    created while the variation is executed (see :meth:`iter_parametrized_testcase_executors`). As soon as all of them
+    were created, this group is replaced with them in its parent :class:`VariationExecutor`.
+
+    If the test method has dynamic parametrization too, the dynamic values are resolved as soon as the setup features
+    are active in the variation (see :meth:`resolve_parametrization`).
+
+    If the parametrization should be reduced to a n-wise covering array (with ``@balder.parametrize_nwise`` or the
+    session option ``--parametrize-nwise``), the group only contains the testcases of the covering array. If the session
+    is sampled (``--sample`` or ``--sample-ratio``), only the sampled testcases are part of the group.
+
+    A result that is set for the whole group (f.e. ``NOT_RUN`` after the failure budget is exhausted) is only stored in
+    the group for the testcases whose executors were not created yet - the executors are never created just to hold
+    this result.
     """
 
     def __init__(
             self,
             testcase: callable,
             parent: VariationExecutor,
-            static_parameters: Dict[str, Any] = None,
+            static_parametrization: Dict[str, Iterable[Any]] = None,
     ) -> None:
         super().__init__()
 
         self._base_testcase_callable = testcase
         self._parent_executor = parent
 
-        # holds the specific static parameters for this unresolved group
-        self._static_parameters = static_parameters if static_parameters is not None else {}
+        # holds all static parametrization values of the test method (the parametrized tests of this group are the
+        # cartesian product of them) - values of a :class:`ParametrizationFile` are not loaded, they are read while
+        # the testcases are created
+        self._static_parametrization = OrderedDict(
+            (cur_name, cur_values if isinstance(cur_values, ParametrizationFile) else list(cur_values))
+            for cur_name, cur_values in (static_parametrization or {}).items())
+        # holds the independent dimensions of the static parametrization - the names of their fields and a sequence
+        # with a tuple of the field values for every element (all fields of one file are one dimension)
+        self._static_dimensions: List[Tuple[Tuple[str, ...], Sequence[Tuple[Any, ...]]]] = []
+        for cur_name, cur_values in self._static_parametrization.items():
+            if isinstance(cur_values, ParametrizationFile):
+                if cur_values not in [cur_sequence for _, cur_sequence in self._static_dimensions]:
+                    self._static_dimensions.append((cur_values.fields, cur_values))
+            else:
+                self._static_dimensions.append(((cur_name, ), [(cur_value, ) for cur_value in cur_values]))
+
+        # holds the full parametrization (static and dynamic) after it was resolved with `resolve_parametrization()`
+        self._resolved_parametrization: List[OrderedDict[str, Any]] | None = None
+        # holds the reduced static parametrization - the n-wise covering array and/or the sampled elements (only if
+        # there is no dynamic parametrization and the parametrization should be reduced)
+        self._reduced_static_parametrization: List[OrderedDict[str, Any]] | None = None
+        # holds all testcase executors of this group that were created till now
+        self._materialized_executors: List[ParametrizedTestcaseExecutor] = []
+        # the iterator that returns the parametrization of the next testcase executor (created on first access)
+        self._parametrization_iterator: Iterator[OrderedDict[str, Any]] | None = None
+        # holds the result of all testcases of this group whose executors were not created yet (None if there was no
+        # result set for them)
+        self._unmaterialized_result: ResultState | None = None
+
+        # if there exist executors that cover this item, they are contained as list in this property
+        self.covered_by_executors = None
 
         # contains the result object for the BODY part of this branch
         self.body_result = BranchBodyResult(self)
 
+        # determine prev_mark IGNORE/SKIP for the whole group
+        if self.base_testcase_callable in self.scenario_executor.all_skip_tests:
+            self.prev_mark = PreviousExecutorMark.SKIP
+        # always overwrite if it should be ignored
+        if self.base_testcase_callable in self.scenario_executor.all_ignore_tests:
+            self.prev_mark = PreviousExecutorMark.IGNORE
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
     @property
     def parent_executor(self) -> VariationExecutor:
         return self._parent_executor
 
+    @property
+    def executor_id(self) -> str:
+        return f"{self._parent_executor.executor_id}::{self._base_testcase_callable.__qualname__}"
+
     @property
     def scenario_executor(self) -> ScenarioExecutor:
         return self.parent_executor.parent_executor
@@ -72,12 +133,206 @@ class UnresolvedParametrizedTestcaseExecutor(BasicExecutor, MixinCanBeCoveredByE
         returns the base class instance to which this executor instance belongs"""
         return self._base_testcase_callable
 
+    @property
+    def static_parametrization(self) -> OrderedDict[str, List[Any] | ParametrizationFile]:
+        """returns all static parametrization values of the test method (or the file that provides them)"""
+        return self._static_parametrization
+
+    @property
+    def has_dynamic_parametrization(self) -> bool:
+        """returns True if the test method has dynamic parametrization that is resolved with the setup features"""
+        return bool(self.scenario_executor.base_scenario_controller.get_parametrization_for(
+            self._base_testcase_callable, static=False))
+
+    @property
+    def nwise_parametrization(self) -> Tuple[int, int | None] | None:
+        """
+        returns the strength and the seed of the n-wise reduction of this group (None if all combinations of the
+        parametrization values should be executed) - the values of ``@balder.parametrize_nwise`` have priority over
+        the session options
+        """
+        executor_tree = self.executor_tree
+        test_config = self.scenario_executor.base_scenario_controller.get_nwise_parametrization_for(
+            self._base_testcase_callable)
+        if test_config is not None:
+            strength, seed = test_config
+            return strength, executor_tree.parametrize_seed if seed is None else seed
+        if executor_tree.parametrize_nwise is None:
+            return None
+        return executor_tree.parametrize_nwise, executor_tree.parametrize_seed
+
+    @property
+    def materialized_executors(self) -> List[ParametrizedTestcaseExecutor]:
+        """returns all testcase executors of this group that were created till now"""
+        return self._materialized_executors.copy()
+
+    @property
+    def unmaterialized_result(self) -> ResultState | None:
+        """
+        returns the result of all testcases of this group whose executors were not created yet (None if there was no
+        result set for them)
+        """
+        return self._unmaterialized_result
+
+    @property
+    def executor_result(self) -> ResultState:
+        """
+        returns the combined state of the testcase executors that were created till now and of the result that was set
+        for the remaining testcases of this group
+        """
+        relative_result = super().executor_result
+        priority_order = ResultState.priority_order()
+        all_results = [cur_executor.executor_result for cur_executor in self._materialized_executors]
+        if self._unmaterialized_result is not None and self.get_unmaterialized_testcase_count():
+            all_results.append(self._unmaterialized_result)
+        for cur_result in all_results:
+            if priority_order.index(cur_result) < priority_order.index(relative_result):
+                relative_result = cur_result
+        return relative_result
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _iter_static_parametrization(self) -> Iterator[OrderedDict[str, Any]]:
+        """returns all combinations of the static parametrization values"""
+        # the dimensions are iterated again for every combination of the previous ones, so that the records of a
+        # parametrization file never need to be held in memory
+        def iter_for(dimension_idx: int, values: Dict[str, Any]) -> Iterator[OrderedDict[str, Any]]:
+            if dimension_idx == len(self._static_dimensions):
+                yield OrderedDict((cur_name, values[cur_name]) for cur_name in self._static_parametrization.keys())
+                return
+            names, sequence = self._static_dimensions[dimension_idx]
+            for cur_element in sequence:
+                yield from iter_for(dimension_idx + 1, {**values, **dict(zip(names, cur_element))})
+
+        yield from iter_for(0, {})
+
+    def _get_static_element_for(self, dimension_indexes: List[int]) -> OrderedDict[str, Any]:
+        """returns the static parametrization element that consists of the given elements of every dimension"""
+        values = {}
+        for (cur_names, cur_sequence), cur_element_idx in zip(self._static_dimensions, dimension_indexes):
+            values.update(zip(cur_names, cur_sequence[cur_element_idx]))
+        return OrderedDict((cur_name, values[cur_name]) for cur_name in self._static_parametrization.keys())
+
+    def _get_sampling_key(self) -> str:
+        """returns the key the sampling of this group is determined with (the same in every run)"""
+        device_mapping_str = ','.join(
+            f"{scenario_device.__qualname__}={setup_device.__qualname__}"
+            for scenario_device, setup_device in self.parent_executor.base_device_mapping.items())
+        return f"{self.parent_executor.cur_setup_class.__class__.__qualname__}::{device_mapping_str}::" \
+               f"{self._base_testcase_callable.__qualname__}"
+
+    def _get_reduced_static_parametrization(self) -> List[OrderedDict[str, Any]]:
+        """
+        returns the static parametrization elements after they were reduced to the n-wise covering array and/or the
+        sampled elements (it is only determined once)
+        """
+        if self._reduced_static_parametrization is None:
+            sampling = self.executor_tree.sampling
+            if self.nwise_parametrization is not None:
+                strength, seed = self.nwise_parametrization
+                # the covering array is determined with the indexes of the dimension elements
+                index_rows = get_covering_array(
+                    OrderedDict((cur_idx, range(len(cur_sequence)))
+                                for cur_idx, (_, cur_sequence) in enumerate(self._static_dimensions)),
+                    strength, seed)
+                result = [self._get_static_element_for(list(cur_index_row.values())) for cur_index_row in index_rows]
+                if sampling is not None:
+                    result = [result[cur_idx]
+                              for cur_idx in sampling.get_sampled_indexes(self._get_sampling_key(), len(result))]
+            else:
+                # decode the sampled indexes of the cartesian product (the first dimension is the outermost one)
+                dimension_sizes = [len(cur_sequence) for _, cur_sequence in self._static_dimensions]
+                result = []
+                for cur_idx in sampling.get_sampled_indexes(self._get_sampling_key(), math.prod(dimension_sizes)):
+                    dimension_indexes = []
+                    for cur_size in reversed(dimension_sizes):
+                        cur_idx, cur_element_idx = divmod(cur_idx, cur_size)
+                        dimension_indexes.insert(0, cur_element_idx)
+                    result.append(self._get_static_element_for(dimension_indexes))
+            self._reduced_static_parametrization = result
+        return self._reduced_static_parametrization
+
+    def _iter_parametrization(self) -> Iterator[OrderedDict[str, Any]]:
+        """returns the parametrization of all testcases of this group"""
+        if self.has_dynamic_parametrization:
+            yield from self.resolve_parametrization()
+        elif self.nwise_parametrization is not None or self.executor_tree.sampling is not None:
+            yield from self._get_reduced_static_parametrization()
+        else:
+            yield from self._iter_static_parametrization()
+
+    def _create_executor_for(self, parametrization: OrderedDict[str, Any]) -> ParametrizedTestcaseExecutor:
+        """creates the testcase executor for the given parametrization"""
+        executor = ParametrizedTestcaseExecutor(
+            self._base_testcase_callable,
+            parent=self.parent_executor,
+            parametrization=parametrization,
+            unresolved_group_obj=self
+        )
+        if self.prev_mark == PreviousExecutorMark.COVERED_BY:
+            executor.prev_mark = PreviousExecutorMark.COVERED_BY
+            executor.covered_by_executors = self.covered_by_executors
+        if self._unmaterialized_result is not None:
+            executor.set_result_for_whole_branch(self._unmaterialized_result)
+        return executor
+
+    def _materialize_next_executor(self) -> ParametrizedTestcaseExecutor | None:
+        """creates the executor of the next testcase of this group (returns None if all executors were created)"""
+        if self._parametrization_iterator is None:
+            self._parametrization_iterator = self._iter_parametrization()
+        next_parametrization = next(self._parametrization_iterator, None)
+        if next_parametrization is None:
+            return None
+        executor = self._create_executor_for(next_parametrization)
+        self._materialized_executors.append(executor)
+        return executor
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
     def has_skipped_tests(self) -> bool:
         return self.prev_mark == PreviousExecutorMark.SKIP
 
     def has_covered_by_tests(self) -> bool:
         return self.prev_mark == PreviousExecutorMark.COVERED_BY
 
+    def set_result_for_whole_branch(self, value: ResultState):
+        """
+        This method sets the result for all testcase executors of this group. The executors that were not created yet
+        are not created for this - their result is stored in this group (see
+        :meth:`set_result_for_unmaterialized_testcases`).
+
+        :param value: the new value that should be set for this branch
+        """
+        for cur_executor in self._materialized_executors:
+            cur_executor.set_result_for_whole_branch(value)
+        self.set_result_for_unmaterialized_testcases(value)
+
+    def set_result_for_unmaterialized_testcases(self, value: ResultState):
+        """
+        This method sets the result for all testcases of this group whose executors were not created yet. It is stored
+        in this group and applied to every executor that is created afterwards.
+
+        :param value: the new value that should be set for these testcases
+        """
+        self._unmaterialized_result = value
+
+    def get_all_recognized_exception(self) -> List[Exception]:
+        all_own = super().get_all_recognized_exception()
+        for cur_executor in self._materialized_executors:
+            all_own += [cur_exception for cur_exception in cur_executor.get_all_recognized_exception()
+                        if cur_exception not in all_own]
+        return all_own
+
+    def testsummary(self) -> ResultSummary:
+        summary = ResultSummary()
+        for cur_executor in self._materialized_executors:
+            summary += cur_executor.testsummary()
+        unmaterialized_count = self.get_unmaterialized_testcase_count()
+        if self._unmaterialized_result is not None and unmaterialized_count:
+            field_name = self._unmaterialized_result.value
+            setattr(summary, field_name, getattr(summary, field_name) + unmaterialized_count)
+        return summary
+
     def get_all_base_instances_of_this_branch(
             self, with_type: Type[Setup] | Type[Scenario] | Type[types.FunctionType],
             only_runnable_elements: bool = True) -> List[Setup | Scenario | object]:
@@ -96,59 +351,113 @@ class UnresolvedParametrizedTestcaseExecutor(BasicExecutor, MixinCanBeCoveredByE
         all_covered_by_data.extend(covered_by_dict.get(None, []))
         return all_covered_by_data
 
-    def get_resolved_parametrized_testcase_executors(self):
+    def get_testcase_count(self) -> int | None:
+        """
+        returns the number of testcases of this group without creating their executors (None if the group has dynamic
+        parametrization that was not resolved yet)
+        """
+        if self.has_dynamic_parametrization:
+            return None if self._resolved_parametrization is None else len(self._resolved_parametrization)
+        if self.nwise_parametrization is not None or self.executor_tree.sampling is not None:
+            return len(self._get_reduced_static_parametrization())
+        return math.prod(len(cur_sequence) for _, cur_sequence in self._static_dimensions)
+
+    def get_unmaterialized_testcase_count(self) -> int:
+        """
+        returns the number of testcases of this group whose executors were not created yet (0 if the group has dynamic
+        parametrization that was not resolved yet)
+        """
+        testcase_count = self.get_testcase_count()
+        if testcase_count is None:
+            return 0
+        return testcase_count - len(self._materialized_executors)
+
+    def iter_parametrized_testcase_executors(self) -> Iterator[ParametrizedTestcaseExecutor]:
+        """
+        returns the testcase executors of this group - every executor is created when it is requested for the first
+        time. As soon as all executors were created, this group is replaced with them in its parent variation.
         """
-        resolves the dynamic parametrization - should be called when setup features are active in the scenario
+        idx = 0
+        while idx < len(self._materialized_executors) or self._materialize_next_executor() is not None:
+            yield self._materialized_executors[idx]
+            idx += 1
+        self.parent_executor.exchange_unresolved_parametrization({self: self._materialized_executors})
+
+    def get_parametrized_testcase_executor(self, row: int) -> ParametrizedTestcaseExecutor:
         """
-        executors = []
+        returns the testcase executor of the given row of this group - the executors are created up to this row if
+        they do not exist yet
 
-        parametrization = self.get_parametrization()
+        :param row: the position of the testcase within this group
+        """
+        while len(self._materialized_executors) <= row:
+            if self._materialize_next_executor() is None:
+                raise IndexError(f'the parametrized testcase `{self.executor_id}` has no row {row}')
+        return self._materialized_executors[row]
+
+    def get_resolved_parametrized_testcase_executors(self) -> List[ParametrizedTestcaseExecutor]:
+        """
+        returns all testcase executors of this group - should be called when setup features are active in the scenario
+        """
+        return list(self.iter_parametrized_testcase_executors())
 
-        if not parametrization:
-            return []
+    def resolve_parametrization(self) -> List[OrderedDict[str, Any]]:
+        """
+        resolves the full parametrization of this group (if it was not resolved before) - should be called when setup
+        features are active in the scenario. If the group should be reduced to a n-wise covering array, only the
+        resolved parametrization elements that are needed to cover all n-wise combinations are returned. If the
+        session is sampled, only the sampled elements are returned.
+        """
+        if self._resolved_parametrization is None:
+            parametrization = self.get_parametrization()
+            if self.nwise_parametrization is not None:
+                strength, seed = self.nwise_parametrization
+                parametrization = select_covering_rows(parametrization, strength, seed)
+            sampling = self.executor_tree.sampling
+            if sampling is not None:
+                parametrization = [
+                    parametrization[cur_idx]
+                    for cur_idx in sampling.get_sampled_indexes(self._get_sampling_key(), len(parametrization))]
+            self._resolved_parametrization = parametrization
+        return self._resolved_parametrization
+
+    def set_resolved_parametrization(self, parametrization: List[OrderedDict[str, Any]]) -> None:
+        """
+        sets the full parametrization of this group that was resolved somewhere else (f.e. by the worker that executed
+        the variation) - the parametrization has to be reduced already (see :meth:`resolve_parametrization`)
 
-        for cur_parametrization in parametrization:
-            executors.append(
-                ParametrizedTestcaseExecutor(
-                    self._base_testcase_callable,
-                    parent=self.parent_executor,
-                    parametrization=cur_parametrization,
-                    unresolved_group_obj=self
-                )
-            )
-        return executors
+        :param parametrization: the resolved parametrization elements of this group
+        """
+        self._resolved_parametrization = parametrization
 
     def get_parametrization(self) -> List[OrderedDict[str, Any]] | None:
         """
-        returns all parametrization elements that belongs to this group executor
+        returns all parametrization elements that belongs to this group executor (the dynamic parametrization is
+        resolved for every combination of the static parametrization values)
+
+        The values of the feature methods/properties are memoized in the :class:`ParametrizationValueCache` of the
+        setup executor, so that identical requests of other variations (or other test methods) of the same setup do
+        not access the feature again.
         """
-        scenario_controller = self.parent_executor.parent_executor.base_scenario_controller
+        scenario_controller = self.scenario_executor.base_scenario_controller
         dynamic_parametrization = scenario_controller.get_parametrization_for(self._base_testcase_callable,
                                                                               static=False)
         if not dynamic_parametrization:
             raise ValueError('can not determine dynamic parametrization, because there are no dynamic parameters')
 
-        # sort attributes according their Parameter - using TopologicalSorter
-        graph = {attr: [param.name for param in config.get_parameters(of_type=Parameter).values()]
-                 for attr, config in dynamic_parametrization.items()}
-        # also add all elements from static parameters
-        graph.update({param: [] for param in self._static_parameters})
-
-        ts = TopologicalSorter(graph)
-        resolvable_order_of_attribues = ts.static_order()
-        resolvable_dynamic_attribues = [attr for attr in resolvable_order_of_attribues
-                                        if attr in dynamic_parametrization.keys()]
+        resolvable_dynamic_attribues = scenario_controller.get_dynamic_parametrization_order_for(
+            self._base_testcase_callable)
+        value_cache = self.scenario_executor.parent_executor.parametrization_value_cache
 
         def get_variations_for(
                 resolved_parameters: Dict[str, Any],
-                remaining_attributes: Iterable[str]
+                remaining_attributes: Tuple[str, ...]
         ) -> List[Dict[str, Any]]:
             result = []
-            remaining_attributes = list(remaining_attributes).copy()
-            attr = remaining_attributes.pop(0)
+            attr = remaining_attributes[0]
             feature_access_selector = dynamic_parametrization[attr]
             # get value for this attribute
-            attr_value_list = feature_access_selector.get_value(resolved_parameters)
+            attr_value_list = feature_access_selector.get_value(resolved_parameters, value_cache)
             if not isinstance(attr_value_list, Iterable):
                 raise TypeError(
                     f'feature parametrizing not possible, because `{feature_access_selector.device.__qualname__}'
@@ -158,27 +467,23 @@ class UnresolvedParametrizedTestcaseExecutor(BasicExecutor, MixinCanBeCoveredByE
             for cur_value in attr_value_list:
                 parameters_with_cur_attr_value = resolved_parameters.copy()
                 parameters_with_cur_attr_value[attr] = cur_value
-                if len(remaining_attributes) > 0:
-                    result.extend(get_variations_for(parameters_with_cur_attr_value, remaining_attributes))
+                if len(remaining_attributes) > 1:
+                    result.extend(get_variations_for(parameters_with_cur_attr_value, remaining_attributes[1:]))
                 else:
                     result.append(parameters_with_cur_attr_value)
 
             return result
 
-        resolved_parameters = self._static_parameters.copy()
-
-        all_full_parametrization = get_variations_for(resolved_parameters, resolvable_dynamic_attribues)
+        all_full_parametrization = []
+        for cur_static_parameters in self._iter_static_parametrization():
+            all_full_parametrization.extend(
+                get_variations_for(dict(cur_static_parameters), resolvable_dynamic_attribues))
 
-        # get combined parametrization
-        result = []
-        for cur_full_parametrization in all_full_parametrization:
-            cur_parameter_set = OrderedDict()
-            for cur_arg in inspect.getfullargspec(self._base_testcase_callable).args:
-                # only if this is a parametrization value
-                if cur_arg in cur_full_parametrization:
-                    cur_parameter_set[cur_arg] = cur_full_parametrization[cur_arg]
-            result.append(cur_parameter_set)
-        return result
+        # get combined parametrization (all elements have the same parametrization arguments)
+        parametrized_arguments = [cur_arg for cur_arg in get_argument_names(self._base_testcase_callable)
+                                  if cur_arg in self._static_parametrization or cur_arg in dynamic_parametrization]
+        return [OrderedDict((cur_arg, cur_full_parametrization[cur_arg]) for cur_arg in parametrized_arguments)
+                for cur_full_parametrization in all_full_parametrization]
 
     def cleanup_empty_executor_branches(self, consider_discarded=False):
         pass
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Type, Union, List, Dict, TYPE_CHECKING
+from typing import Type, Union, List, Dict, Tuple, Iterator, TYPE_CHECKING
 
 import inspect
 import logging
+import concurrent.futures
 from _balder.cnnrelations import OrConnectionRelation
 from _balder.device import Device
 from _balder.connection import Connection
@@ -11,11 +12,13 @@ from _balder.feature_replacement_mapping import FeatureReplacementMapping
 from _balder.fixture_execution_level import FixtureExecutionLevel
 from _balder.testresult import ResultState, BranchBodyResult, ResultSummary
 from _balder.executor.basic_executable_executor import BasicExecutableExecutor
+from _balder.executor.executor_index import ChildExecutorIndex
 from _balder.executor.testcase_executor import TestcaseExecutor
 from _balder.executor.unresolved_parametrized_testcase_executor import UnresolvedParametrizedTestcaseExecutor
 from _balder.previous_executor_mark import PreviousExecutorMark
 from _balder.routing_path import RoutingPath
 from _balder.unmapped_vdevice import UnmappedVDevice
+from _balder.utils.thread_buffered_output import ThreadBufferedOutput
 from _balder.feature_vdevice_mapping import FeatureVDeviceMapping
 from _balder.controllers import DeviceController, VDeviceController, FeatureController, NormalScenarioSetupController
 from _balder.exceptions import NotApplicableVariationException, UnclearAssignableFeatureConnectionError
@@ -27,6 +30,7 @@ if TYPE_CHECKING:
     from _balder.controllers.scenario_controller import ScenarioController
     from _balder.controllers.setup_controller import SetupController
     from _balder.executor.scenario_executor import ScenarioExecutor
+    from _balder.executor.parametrized_testcase_executor import ParametrizedTestcaseExecutor
     from _balder.fixture_manager import FixtureManager
 
 
@@ -41,8 +45,12 @@ class VariationExecutor(BasicExecutableExecutor):
 
     def __init__(self, device_mapping: Dict[Type[Device], Type[Device]], parent: ScenarioExecutor):
         super().__init__()
-        self._testcase_executors = []
+        # contains the testcase executors together with the first testcase executor of every test method
+        self._testcase_executors = ChildExecutorIndex(
+            get_key_of=lambda testcase_executor: testcase_executor.base_testcase_callable)
         self._base_device_mapping = device_mapping
+        # the mark of this variation (see property `prev_mark`)
+        self._prev_mark = PreviousExecutorMark.RUNNABLE
         self._parent_executor = parent
         self._fixture_manager = parent.fixture_manager
 
@@ -78,6 +86,19 @@ class VariationExecutor(BasicExecutableExecutor):
 
     # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
 
+    @staticmethod
+    def get_executor_id_for(scenario_executor_id: str, device_mapping: Dict[Type[Device], Type[Device]]) -> str:
+        """
+        returns the executor id a :class:`VariationExecutor` for the given device mapping has
+
+        :param scenario_executor_id: the executor id of the parent :class:`ScenarioExecutor`
+
+        :param device_mapping: the device mapping with the scenario devices as keys and the setup devices as values
+        """
+        device_mapping_str = ','.join(f"{scenario_device.__qualname__}={setup_device.__qualname__}"
+                                      for scenario_device, setup_device in device_mapping.items())
+        return f"{scenario_executor_id}[{device_mapping_str}]"
+
     # ---------------------------------- CLASS METHODS ----------------------------------------------------------------
 
     # ---------------------------------- PROPERTIES --------------------------------------------------------------------
@@ -89,6 +110,22 @@ class VariationExecutor(BasicExecutableExecutor):
         """
         return None
 
+    @property
+    def executor_id(self) -> str:
+        return self.get_executor_id_for(self._parent_executor.executor_id, self._base_device_mapping)
+
+    @property
+    def prev_mark(self) -> PreviousExecutorMark:
+        """describes the runnable state of this variation before the executor is really used"""
+        return self._prev_mark
+
+    @prev_mark.setter
+    def prev_mark(self, prev_mark: PreviousExecutorMark) -> None:
+        if prev_mark != self._prev_mark:
+            self._prev_mark = prev_mark
+            # the cached views of the tree do not contain discarded variations
+            self.executor_tree.invalidate_cached_views()
+
     @property
     def parent_executor(self) -> ScenarioExecutor:
         return self._parent_executor
@@ -127,7 +164,7 @@ class VariationExecutor(BasicExecutableExecutor):
 
     @property
     def all_child_executors(self) -> List[TestcaseExecutor | UnresolvedParametrizedTestcaseExecutor]:
-        return self._testcase_executors
+        return self._testcase_executors.executors
 
     @property
     def fixture_manager(self) -> FixtureManager:
@@ -144,6 +181,14 @@ class VariationExecutor(BasicExecutableExecutor):
         """
         return self._feature_replacement
 
+    @property
+    def routings(self) -> Dict[Connection, List[RoutingPath]]:
+        """
+        this property is a dictionary with every absolute scenario connection of this variation as key and all valid
+        routings (determined with :meth:`VariationExecutor.create_all_valid_routings`) as value
+        """
+        return self._routings
+
     @property
     def abs_setup_feature_vdevice_mappings(self) -> Dict[Type[Device], FeatureVDeviceMapping]:
         """returns the feature replacement that was determined with
@@ -171,20 +216,34 @@ class VariationExecutor(BasicExecutableExecutor):
             self.exchange_unmapped_vdevice_references()
             self.update_vdevice_referenced_feature_instances()
             self.set_conn_dependent_methods()
-            self.resolve_and_exchange_unresolved_parametrization()
+            self.resolve_dynamic_parametrization()
 
     def _body_execution(self, show_discarded):
         if show_discarded and not self.can_be_applied():
             # do nothing if this variation can not be applied (is discarded)
             return
 
-        for cur_testcase_executor in self.get_testcase_executors():
+        # holds consecutive testcases of the same concurrency group that can be executed together
+        concurrent_batch = []
+        concurrent_group = None
+        for cur_testcase_executor in self._iter_testcase_executors_for_execution():
             if (cur_testcase_executor.has_runnable_tests()
                     or cur_testcase_executor.has_skipped_tests()
                     or cur_testcase_executor.has_covered_by_tests()):
-                cur_testcase_executor.execute()
+                cur_group = self._get_concurrency_group_for(cur_testcase_executor)
+                if cur_group != concurrent_group:
+                    if concurrent_group is not None:
+                        self._execute_testcases_in_parallel(concurrent_batch, max_workers=concurrent_group[1])
+                    concurrent_batch = []
+                    concurrent_group = cur_group
+                if cur_group is None:
+                    self._execute_testcase(cur_testcase_executor)
+                else:
+                    concurrent_batch.append(cur_testcase_executor)
             else:
                 cur_testcase_executor.set_result_for_whole_branch(ResultState.NOT_RUN)
+        if concurrent_group is not None:
+            self._execute_testcases_in_parallel(concurrent_batch, max_workers=concurrent_group[1])
 
     def _cleanup_execution(self, show_discarded):
         if show_discarded and not self.can_be_applied():
@@ -196,6 +255,89 @@ class VariationExecutor(BasicExecutableExecutor):
         self.revert_active_vdevice_device_mappings_in_all_features()
         self.revert_scenario_device_feature_instances()
 
+    def _iter_testcase_executors_for_execution(
+            self) -> Iterator[TestcaseExecutor | UnresolvedParametrizedTestcaseExecutor]:
+        """
+        returns all testcase executors in their execution order - the executors of parametrized testcases are created
+        one after another while they are requested (groups that can not be executed are returned as they are). As soon
+        as the failure budget is exhausted, no further executors are created - the remaining testcases of the group are
+        marked with `NOT_RUN` in the group itself.
+        """
+        for cur_testcase_executor in self.get_testcase_executors():
+            if not isinstance(cur_testcase_executor, UnresolvedParametrizedTestcaseExecutor) \
+                    or not (cur_testcase_executor.has_runnable_tests() or cur_testcase_executor.has_skipped_tests()
+                            or cur_testcase_executor.has_covered_by_tests()):
+                yield cur_testcase_executor
+                continue
+            if self.executor_tree.is_failure_budget_exhausted(self):
+                cur_testcase_executor.set_result_for_whole_branch(ResultState.NOT_RUN)
+                continue
+            for cur_parametrized_executor in cur_testcase_executor.iter_parametrized_testcase_executors():
+                yield cur_parametrized_executor
+                if self.executor_tree.is_failure_budget_exhausted(self):
+                    cur_testcase_executor.set_result_for_unmaterialized_testcases(ResultState.NOT_RUN)
+                    break
+
+    def _get_concurrency_group_for(self, testcase_executor: TestcaseExecutor) -> Union[Tuple[str, int], None]:
+        """
+        This method returns the concurrency group the given testcase executor belongs to. Consecutive testcases of the
+        same group are executed concurrently.
+
+        :param testcase_executor: the testcase executor the group should be returned for
+        :return: a tuple with the group name and the maximum number of testcases that are allowed to run at the same
+                 time or None if the testcase has to be executed sequentially
+        """
+        executor_tree = self.executor_tree
+        if testcase_executor.is_async() and executor_tree.max_concurrent_async_testcases > 1:
+            return 'async', executor_tree.max_concurrent_async_testcases
+        if testcase_executor.is_parallel_safe() and executor_tree.max_parallel_testcases > 1:
+            return 'parallel-safe', executor_tree.max_parallel_testcases
+        return None
+
+    def _execute_testcase(self, testcase_executor: TestcaseExecutor):
+        """
+        This method executes the given testcase executor - if the failure budget of this branch (or of one of its parent
+        branches) is already exhausted, the testcase is not executed and marked with `NOT_RUN`.
+
+        :param testcase_executor: the testcase executor that should be executed
+        """
+        if self.executor_tree.is_failure_budget_exhausted(self):
+            testcase_executor.set_result_for_whole_branch(ResultState.NOT_RUN)
+        else:
+            testcase_executor.execute()
+
+    def _execute_testcases_in_parallel(self, testcase_executors: List[TestcaseExecutor], max_workers: int):
+        """
+        This method executes the given testcase executors concurrently in a thread pool. The output of every testcase
+        is buffered and printed as one block after the testcase is done.
+
+        .. note::
+            Async testcases block their worker thread while they are executed on the session event loop, so the number
+            of workers limits the number of async testcases that run concurrently on the loop.
+
+        :param testcase_executors: the parallel-safe testcase executors that should be executed
+        :param max_workers: the maximum number of testcases that are executed at the same time
+        """
+        if not testcase_executors:
+            return
+        if len(testcase_executors) == 1:
+            self._execute_testcase(testcase_executors[0])
+            return
+        # start the testcases that took the longest time in earlier runs first
+        testcase_executors = sorted(testcase_executors,
+                                    key=lambda cur_executor: cur_executor.expected_duration_sec or 0, reverse=True)
+
+        with ThreadBufferedOutput() as buffered_output:
+
+            def execute_testcase(testcase_executor: TestcaseExecutor):
+                with buffered_output.capture():
+                    self._execute_testcase(testcase_executor)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+                # `execute()` catches all test and fixture errors itself - `result()` only re-raises unexpected errors
+                for cur_future in [pool.submit(execute_testcase, cur_executor) for cur_executor in testcase_executors]:
+                    cur_future.result()
+
     def _verify_applicability_trough_feature_implementation_matching(self):
         """
         This method validates, that the features in this variation are valid. For this the setup devices must
@@ -335,7 +477,7 @@ class VariationExecutor(BasicExecutableExecutor):
 
     def get_testcase_executors(self) -> List[TestcaseExecutor | UnresolvedParametrizedTestcaseExecutor]:
         """returns all sub testcase executors that belongs to this variation-executor"""
-        return self._testcase_executors.copy()
+        return self._testcase_executors.executors.copy()
 
     def add_testcase_executor(self, testcase_executor: TestcaseExecutor | UnresolvedParametrizedTestcaseExecutor):
         """
@@ -344,9 +486,10 @@ class VariationExecutor(BasicExecutableExecutor):
         if not isinstance(testcase_executor, (TestcaseExecutor, UnresolvedParametrizedTestcaseExecutor)):
             raise TypeError("the given object `testcase_executor` must be of type type `TestcaseExecutor` or "
                             "`UnresolvedParametrizedTestcaseExecutor`")
-        if testcase_executor in self._testcase_executors:
+        if testcase_executor in self._testcase_executors.executors:
             raise ValueError("the given object `testcase_executor` already exists in child list")
-        self._testcase_executors.append(testcase_executor)
+        self._testcase_executors.add(testcase_executor)
+        self.executor_tree.register_executor(testcase_executor)
 
     def determine_feature_replacement_and_vdevice_mappings(self) -> None:
         """
@@ -487,18 +630,14 @@ class VariationExecutor(BasicExecutableExecutor):
 
     def get_executor_for_testcase(self, testcase: callable) -> TestcaseExecutor | None:
         """
-        This method searches for a TestcaseExecutor in the internal list for which the given testcase method is
+        This method searches for a TestcaseExecutor of this variation for which the given testcase method is
         contained in
 
         :param testcase: the testcase class for which the executor should be searched for
 
         :return: returns the associated TestcaseExecutor or None if none could be found for the transferred type
         """
-        for cur_testcase_executor in self._testcase_executors:
-            if cur_testcase_executor.base_testcase_callable == testcase:
-                return cur_testcase_executor
-        # can not find some
-        return None
+        return self._testcase_executors.get_by_key(testcase)
 
     def cleanup_empty_executor_branches(self, consider_discarded=False):
         """
@@ -898,12 +1037,35 @@ class VariationExecutor(BasicExecutableExecutor):
 
                 cur_setup_feature_controller.set_active_method_variation(method_selection=method_var_selection)
 
-    def resolve_and_exchange_unresolved_parametrization(self):
-        """resolves the parametrization if there are any :class:`UnresolvedParametrizedTestcaseExecutor` in the tree"""
+    def resolve_dynamic_parametrization(self):
+        """
+        resolves the dynamic parametrization of all :class:`UnresolvedParametrizedTestcaseExecutor` in the tree (their
+        testcase executors are created while the variation is executed)
+        """
+        for cur_child in self._testcase_executors.executors:
+            if isinstance(cur_child, UnresolvedParametrizedTestcaseExecutor) and cur_child.has_dynamic_parametrization:
+                cur_child.resolve_parametrization()
+
+    def exchange_unresolved_parametrization(
+            self,
+            resolved_executors: Dict[UnresolvedParametrizedTestcaseExecutor, List[ParametrizedTestcaseExecutor]]
+    ):
+        """
+        replaces the given :class:`UnresolvedParametrizedTestcaseExecutor` children with their resolved executors
+
+        :param resolved_executors: a dictionary with the unresolved executors as keys and the list of their resolved
+                                   :class:`ParametrizedTestcaseExecutor` as values (unresolved executors that are not
+                                   contained in this dictionary stay in the tree)
+        """
         replaced_executors = []
-        for cur_child in self._testcase_executors:
-            if isinstance(cur_child, UnresolvedParametrizedTestcaseExecutor):
-                replaced_executors.extend(cur_child.get_resolved_parametrized_testcase_executors())
+        for cur_child in self._testcase_executors.executors:
+            if isinstance(cur_child, UnresolvedParametrizedTestcaseExecutor) and cur_child in resolved_executors:
+                replaced_executors.extend(resolved_executors[cur_child])
             else:
                 replaced_executors.append(cur_child)
-        self._testcase_executors = replaced_executors
+        self._testcase_executors.replace_all(replaced_executors)
+        executor_tree = self.executor_tree
+        for cur_unresolved_executor, cur_resolved_executors in resolved_executors.items():
+            executor_tree.unregister_executor(cur_unresolved_executor)
+            for cur_resolved_executor in cur_resolved_executors:
+                executor_tree.register_executor(cur_resolved_executor)
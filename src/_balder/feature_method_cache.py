@@ -0,0 +1,187 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import inspect
+import weakref
+import functools
+import threading
+import contextvars
+import collections
+from _balder.session_registry import SessionRegistry
+from _balder.fixture_execution_level import FixtureExecutionLevel
+from _balder.utils.functions import get_hashable_key_or_none
+
+#: the statistics of a cached feature method (similar to :func:`functools.lru_cache`)
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'currsize'])
+
+
+class FeatureMethodCache:
+    """
+    This class memoizes the results of a feature method that was decorated with ``@balder.cached(level=...)``. The
+    results are saved per feature instance and per arguments. They are invalidated as soon as the executor leaves a
+    branch of the execution level of the cache.
+
+    The results of caches with the execution level ``testcase`` are saved per running testcase, because parallel-safe
+    testcases and async testcases of one variation can be active at the same time.
+    """
+    #: the testcase executor that is executed within the current context (async testcases run within a copy of this
+    #: context on the session event loop)
+    _running_testcase: contextvars.ContextVar = contextvars.ContextVar('balder_running_testcase', default=None)
+
+    def __init__(self, func: Callable, level: FixtureExecutionLevel):
+        """
+        :param func: the feature method whose results should be memoized
+
+        :param level: the execution level after which the memoized results are invalidated
+        """
+        self.func = func
+        self.level = level
+
+        # the memoized results with the feature instance as first key and the arguments as second key - for the level
+        # TESTCASE there is one dictionary per running testcase (the testcase executor is the key of `_memos`)
+        self._memos: Dict[Union[object, None], weakref.WeakKeyDictionary] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        SessionRegistry.get_active().feature_method_caches.setdefault(level, []).append(self)
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    @staticmethod
+    def get_for(func: Callable) -> Union[FeatureMethodCache, None]:
+        """returns the cache of a function that was returned by :meth:`FeatureMethodCache.wrap` (None otherwise)"""
+        return getattr(func, '__balder_method_cache__', None)
+
+    @staticmethod
+    def _get_key_for(args: Tuple, kwargs: Dict[str, Any]) -> Union[Tuple, None]:
+        """returns the key of the arguments or None if the result can not be cached (because an argument is not
+        hashable)"""
+        return get_hashable_key_or_none((args, tuple(sorted(kwargs.items()))))
+
+    @staticmethod
+    def get_combined_info(caches: List[FeatureMethodCache]) -> CacheInfo:
+        """
+        returns the summed up statistics of all given caches (used for methods with multiple method variations)
+
+        :param caches: the caches of all method variations
+        """
+        all_info = [cur_cache.cache_info() for cur_cache in caches]
+        return CacheInfo(hits=sum(cur_info.hits for cur_info in all_info),
+                         misses=sum(cur_info.misses for cur_info in all_info),
+                         currsize=sum(cur_info.currsize for cur_info in all_info))
+
+    @staticmethod
+    def attach_statistic_methods(wrapper: Callable, caches: List[FeatureMethodCache]) -> None:
+        """
+        adds the methods `cache_info()` and `cache_clear()` to the given wrapper function
+
+        :param wrapper: the function the methods should be added to
+
+        :param caches: all caches the methods should work with
+        """
+        wrapper.cache_info = functools.partial(FeatureMethodCache.get_combined_info, caches)
+
+        def cache_clear():
+            for cur_cache in caches:
+                cur_cache.cache_clear()
+        wrapper.cache_clear = cache_clear
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    @classmethod
+    def set_running_testcase(cls, testcase_executor: Union[object, None]) -> None:
+        """
+        sets the testcase executor that is executed within the current context (the results of the caches with the
+        level TESTCASE are memoized for this testcase)
+
+        :param testcase_executor: the testcase executor that is executed now (None if the testcase is done)
+        """
+        cls._running_testcase.set(testcase_executor)
+
+    @classmethod
+    def invalidate_level(cls, level: FixtureExecutionLevel) -> None:
+        """
+        removes all memoized results of all caches with the given execution level (for the level TESTCASE only the
+        results of the running testcase are removed)
+
+        :param level: the execution level that was left
+        """
+        for cur_cache in SessionRegistry.get_active().feature_method_caches.get(level, []):
+            cur_cache.invalidate()
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _get_memo_key(self) -> Union[object, None]:
+        """returns the key of the memo dictionary that should be used within the current context"""
+        return self._running_testcase.get() if self.level == FixtureExecutionLevel.TESTCASE else None
+
+    def _lookup(self, instance: object, key: Union[Tuple, None]) -> Tuple[bool, Any]:
+        """returns a tuple, where the first element is True if there is a memoized result (the second element)"""
+        with self._lock:
+            memo = self._memos.get(self._get_memo_key())
+            results = memo.get(instance) if memo is not None and key is not None else None
+            if results is not None and key in results:
+                self._hits += 1
+                return True, results[key]
+            self._misses += 1
+            return False, None
+
+    def _store(self, instance: object, key: Union[Tuple, None], value: Any) -> None:
+        """memoizes the result for the given feature instance and arguments (nothing is memoized if the key is None)"""
+        if key is None:
+            return
+        with self._lock:
+            memo = self._memos.setdefault(self._get_memo_key(), weakref.WeakKeyDictionary())
+            memo.setdefault(instance, {})[key] = value
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def wrap(self) -> Callable:
+        """returns the wrapper function that has to be used instead of the feature method"""
+        func = self.func
+        # the wrapper needs an argument with the name `self` (the method-variation multiplexer calls it with `self=..`)
+        cache = self
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def cached_method(self, *args, **kwargs):
+                key = cache._get_key_for(args, kwargs)  # pylint: disable=protected-access
+                found, value = cache._lookup(self, key)  # pylint: disable=protected-access
+                if not found:
+                    value = await func(self, *args, **kwargs)
+                    cache._store(self, key, value)  # pylint: disable=protected-access
+                return value
+        else:
+            @functools.wraps(func)
+            def cached_method(self, *args, **kwargs):
+                key = cache._get_key_for(args, kwargs)  # pylint: disable=protected-access
+                found, value = cache._lookup(self, key)  # pylint: disable=protected-access
+                if not found:
+                    value = func(self, *args, **kwargs)
+                    cache._store(self, key, value)  # pylint: disable=protected-access
+                return value
+
+        cached_method.__balder_method_cache__ = self
+        self.attach_statistic_methods(cached_method, [self])
+        return cached_method
+
+    def invalidate(self) -> None:
+        """removes all memoized results (for the level TESTCASE only the results of the running testcase)"""
+        with self._lock:
+            self._memos.pop(self._get_memo_key(), None)
+
+    def cache_info(self) -> CacheInfo:
+        """returns the statistics of this cache"""
+        with self._lock:
+            currsize = sum(len(cur_results) for cur_memo in self._memos.values() for cur_results in cur_memo.values())
+            return CacheInfo(hits=self._hits, misses=self._misses, currsize=currsize)
+
+    def cache_clear(self) -> None:
+        """removes all memoized results of all testcases and resets the statistics"""
+        with self._lock:
+            self._memos.clear()
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,88 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Union
+
+import pickle
+import inspect
+import hashlib
+
+
+class FixtureCache:
+    """
+    This class describes how the value of a SESSION fixture is cached between multiple test sessions. An instance of
+    it can be given to the decorator ``@balder.fixture(level='session', cache=...)``.
+
+    The cache key is determined by the source code of the fixture and its inputs. If a test session finds a valid
+    entry for this key (it is not older than ``ttl_sec`` and the ``validate`` callback accepts it), the fixture is not
+    executed - neither its construction code nor its teardown code. The cached value is used instead.
+    """
+
+    def __init__(
+            self,
+            ttl_sec: float,
+            validate: Union[Callable[[Any], bool], None] = None,
+            inputs: Union[Callable[..., Any], None] = None
+    ):
+        """
+        :param ttl_sec: the time in seconds an entry is valid after it was created
+
+        :param validate: optional callback that gets the cached value and returns True if it is still valid (for
+                         example because the flashed firmware is still running on the device)
+
+        :param inputs: optional callback that gets the same arguments as the fixture and returns the (picklable) inputs
+                       the cache key should be determined with - if it is not given, the arguments of the fixture are
+                       used
+        """
+        if not isinstance(ttl_sec, (int, float)) or ttl_sec <= 0:
+            raise ValueError('the value of `ttl_sec` has to be a positive number')
+        if validate is not None and not callable(validate):
+            raise TypeError('the value of `validate` has to be a callable')
+        if inputs is not None and not callable(inputs):
+            raise TypeError('the value of `inputs` has to be a callable')
+        self.ttl_sec = ttl_sec
+        self.validate = validate
+        self.inputs = inputs
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    @staticmethod
+    def _get_source_of(fixture: Callable) -> bytes:
+        """returns the source code of the fixture (or its byte code if the source is not available)"""
+        try:
+            return inspect.getsource(fixture).encode('utf-8')
+        except (OSError, TypeError):
+            return fixture.__code__.co_code
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def get_key_for(self, fixture: Callable, kwargs: Dict[str, Any]) -> str:
+        """
+        returns the cache key for the given fixture and its arguments
+
+        :param fixture: the fixture callable
+        :param kwargs: the resolved arguments the fixture is called with
+        """
+        inputs = self.inputs(**kwargs) if self.inputs is not None else sorted(kwargs.items())
+        try:
+            pickled_inputs = pickle.dumps(inputs)
+        except Exception as exc:
+            raise TypeError(f'the inputs of the cached fixture `{fixture.__qualname__}` can not be pickled - use the '
+                            f'argument `inputs` of the `FixtureCache` to provide picklable inputs') from exc
+        key = hashlib.sha256()
+        key.update(f"{fixture.__module__}.{fixture.__qualname__}".encode('utf-8'))
+        key.update(self._get_source_of(fixture))
+        key.update(pickled_inputs)
+        return key.hexdigest()
+
+    def is_valid(self, value: Any) -> bool:
+        """
+        returns True if the given cached value is still valid according to the ``validate`` callback
+
+        :param value: the cached value
+        """
+        return self.validate is None or bool(self.validate(value))
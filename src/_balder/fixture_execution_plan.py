@@ -0,0 +1,53 @@
+from __future__ import annotations
+from typing import Union, Type, Callable, Tuple, TYPE_CHECKING
+import dataclasses
+
+from .utils.typings import MethodLiteralType
+from .fixture_definition_scope import FixtureDefinitionScope
+from .fixture_execution_level import FixtureExecutionLevel
+
+if TYPE_CHECKING:
+    from _balder.fixture_cache import FixtureCache
+    from _balder.scenario import Scenario
+    from _balder.setup import Setup
+
+
+@dataclasses.dataclass(frozen=True)
+class FixturePlanStep:
+    """
+    describes one fixture call within a :class:`FixtureExecutionPlan`
+    """
+    #: the definition scope the fixture belongs to
+    definition_scope: FixtureDefinitionScope
+    #: the namespace where it is defined (None if it is in a balderglob file)
+    namespace: Union[None, Type[Scenario], Type[Setup]]
+    #: the type of the fixture function (defines how the fixture has to be called)
+    function_type: MethodLiteralType
+    #: the fixture callable itself
+    callable: Callable
+    #: the names of all arguments that have to be resolved (without `self`/`cls`)
+    arguments: Tuple[str, ...]
+    #: the namespaces the arguments are searched in (from the most global to the most specific one)
+    argument_namespaces: Tuple[Union[None, Type[Scenario], Type[Setup]], ...]
+    #: the indexes of all steps (of the same definition scope) this fixture references over its arguments
+    dependencies: Tuple[int, ...] = ()
+    #: True if the fixture is only constructed when its value is requested for the first time
+    lazy: bool = False
+    #: the definition how the value of the fixture is cached between multiple test sessions (None if it is not cached)
+    cache: Union[FixtureCache, None] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class FixtureExecutionPlan:
+    """
+    describes all fixtures (in their execution order) that have to be executed, if a branch with a specific execution
+    level, setup and scenario classes is entered
+    """
+    #: the execution level the plan was compiled for
+    execution_level: FixtureExecutionLevel
+    #: all setup classes that are part of the branch
+    setup_types: Tuple[Type[Setup], ...]
+    #: all scenario classes that are part of the branch
+    scenario_types: Tuple[Type[Scenario], ...]
+    #: all fixture calls in the order they have to be executed
+    steps: Tuple[FixturePlanStep, ...]
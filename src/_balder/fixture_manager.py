@@ -1,20 +1,29 @@
 from __future__ import annotations
 
-import itertools
-from typing import List, Tuple, Generator, Dict, Union, Type, Callable, Iterable, TYPE_CHECKING
-
+import sys
 import inspect
+import functools
+import traceback
+import threading
+import contextvars
+import dataclasses
+import concurrent.futures
+from typing import Any, List, Tuple, Generator, AsyncGenerator, Dict, Union, Type, Callable, Iterable, Sequence, \
+    TYPE_CHECKING
+
 from graphlib import TopologicalSorter
 from _balder.executor.testcase_executor import TestcaseExecutor
 from _balder.scenario import Scenario
 from _balder.setup import Setup
 from _balder.fixture_definition_scope import FixtureDefinitionScope
 from _balder.fixture_execution_level import FixtureExecutionLevel
-from _balder.fixture_metadata import FixtureMetadata
+from _balder.fixture_metadata import FixtureMetadata, LazyFixtureMetadata
+from _balder.fixture_execution_plan import FixtureExecutionPlan, FixturePlanStep
 from _balder.executor.basic_executor import BasicExecutor
 from _balder.executor.setup_executor import SetupExecutor
 from _balder.executor.scenario_executor import ScenarioExecutor
 from _balder.executor.variation_executor import VariationExecutor
+from _balder.utils.functions import get_argument_names
 from _balder.exceptions import LostInExecutorTreeException, FixtureReferenceError, UnclearSetupScopedFixtureReference, \
     UnclearUniqueClassReference
 
@@ -31,7 +40,8 @@ class FixtureManager:
     def __init__(
             self,
             fixtures: Dict[FixtureExecutionLevel,
-                           Dict[Union[None, Type[Scenario], Type[Setup]], List[Tuple[MethodLiteralType, Callable]]]]):
+                           Dict[Union[None, Type[Scenario], Type[Setup]], List[Tuple[MethodLiteralType, Callable]]]],
+            fixture_options: Dict[Callable, Dict[str, Any]] = None):
 
         # The first key is the fixture level, the second key is the namespace in which the fixture is defined. As value
         # a list with tuples is returned. The first element is the type of the method/function and the second is the
@@ -39,31 +49,152 @@ class FixtureManager:
         self.fixtures: Dict[FixtureExecutionLevel,
                             Dict[Union[None, Type[Scenario], Type[Setup]], List[Tuple[MethodLiteralType, Callable]]]] \
             = fixtures
+        # contains the options of the fixtures (given to the decorator `@fixture(..)`) with the fixture callable as key
+        self.fixture_options: Dict[Callable, Dict[str, Any]] = {} if fixture_options is None else fixture_options
 
         # contains all active fixtures with their namespace, their func_type, their callable, the generator object and
-        # the result according to the fixture's construction code (will be cleaned after it leaves a level)
-        self.current_tree_fixtures: Dict[FixtureExecutionLevel, List[FixtureMetadata]] = {}
+        # the result according to the fixture's construction code (will be cleaned after it leaves a level) - the
+        # TESTCASE level is not part of this dictionary, because it is managed per thread in `_thread_local_fixtures`
+        self._shared_tree_fixtures: Dict[FixtureExecutionLevel, List[FixtureMetadata]] = {}
+
+        # holds the fixtures of the TESTCASE level for the current thread (parallel-safe testcases of one variation can
+        # be active at the same time)
+        self._thread_local_fixtures = threading.local()
+
+        # contains all active fixtures (without the TESTCASE level) with their namespace and their name as key - the
+        # value is a list with tuples of the execution level and the fixture in the order they were entered (the last
+        # one is the most specific one) - lazy fixtures are part of it, also if they were not constructed yet
+        self._shared_value_index: Dict[Tuple[Union[None, Type[Scenario], Type[Setup]], str],
+                                       List[Tuple[FixtureExecutionLevel,
+                                                  Union[FixtureMetadata, LazyFixtureMetadata]]]] = {}
+        # secures that a lazy fixture is only constructed once, also if multiple threads request it at the same time
+        self._lazy_construction_lock = threading.RLock()
+
+        # contains the compiled execution plans with the execution level, the setup classes and the scenario classes of
+        # the branch as key (a plan is compiled when the first branch with this key is entered)
+        self._compiled_plans: Dict[Tuple[FixtureExecutionLevel, Tuple[Type[Setup], ...], Tuple[Type[Scenario], ...]],
+                                   FixtureExecutionPlan] = {}
 
     # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
 
+    @staticmethod
+    async def _anext(generator: AsyncGenerator) -> Any:
+        """
+        returns the next value of the given async generator (the builtin `anext()` is not available in python 3.9)
+        """
+        return await generator.__anext__()  # pylint: disable=unnecessary-dunder-call
+
     # ---------------------------------- CLASS METHODS ----------------------------------------------------------------
 
     # ---------------------------------- PROPERTIES --------------------------------------------------------------------
 
+    @property
+    def current_tree_fixtures(self) -> Dict[FixtureExecutionLevel, List[FixtureMetadata]]:
+        """
+        returns all active fixtures for every entered execution level - the TESTCASE level is returned for the current
+        thread only
+        """
+        testcase_fixtures = getattr(self._thread_local_fixtures, 'fixtures', None)
+        if testcase_fixtures is None:
+            return self._shared_tree_fixtures
+        return {**self._shared_tree_fixtures, FixtureExecutionLevel.TESTCASE: testcase_fixtures}
+
     @property
     def all_already_run_fixtures(self) -> List[Callable]:
         """
         returns a list of all fixtures that have already been run
         """
         complete_list_in_order = []
+        current_tree_fixtures = self.current_tree_fixtures
         for cur_level in FixtureExecutionLevel:
-            if cur_level in self.current_tree_fixtures.keys():
+            if cur_level in current_tree_fixtures.keys():
                 complete_list_in_order += [
-                    cur_fixture_metadata.callable for cur_fixture_metadata in self.current_tree_fixtures[cur_level]]
+                    cur_fixture_metadata.callable for cur_fixture_metadata in current_tree_fixtures[cur_level]]
         return complete_list_in_order
 
+    @property
+    def registered_lazy_fixtures(self) -> List[Callable]:
+        """
+        returns a list of all lazy fixtures of the entered execution levels that were not constructed yet (they are
+        available for other fixtures, because they are constructed as soon as a fixture requests them)
+        """
+        all_lazy_fixtures = [cur_elem for cur_elems in self._shared_value_index.values() for _, cur_elem in cur_elems]
+        all_lazy_fixtures += list((getattr(self._thread_local_fixtures, 'value_index', None) or {}).values())
+        return [cur_elem.step.callable for cur_elem in all_lazy_fixtures
+                if isinstance(cur_elem, LazyFixtureMetadata) and cur_elem.constructed is None]
+
+    @property
+    def compiled_plans(self) -> List[FixtureExecutionPlan]:
+        """
+        returns all execution plans that were compiled till now
+        """
+        return list(self._compiled_plans.values())
+
     # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
 
+    def _prepare_active_level(self, level: FixtureExecutionLevel) -> None:
+        """
+        marks the given execution level as entered (also if no fixture of this level will be constructed)
+
+        :param level: the execution level that is entered
+        """
+        if level == FixtureExecutionLevel.TESTCASE:
+            if getattr(self._thread_local_fixtures, 'fixtures', None) is None:
+                self._thread_local_fixtures.fixtures = []
+                self._thread_local_fixtures.value_index = {}
+        elif level not in self._shared_tree_fixtures.keys():
+            self._shared_tree_fixtures[level] = []
+
+    def _add_to_value_index(
+            self, level: FixtureExecutionLevel, fixture_metadata: Union[FixtureMetadata, LazyFixtureMetadata]) -> None:
+        """
+        adds an active fixture (or a lazy fixture that was not constructed yet) to the value index
+
+        :param level: the execution level of the fixture
+        :param fixture_metadata: the metadata of the fixture
+        """
+        if isinstance(fixture_metadata, LazyFixtureMetadata):
+            key = (fixture_metadata.step.namespace, fixture_metadata.step.callable.__name__)
+        else:
+            key = (fixture_metadata.namespace, fixture_metadata.callable.__name__)
+        self._prepare_active_level(level)
+        if level == FixtureExecutionLevel.TESTCASE:
+            self._thread_local_fixtures.value_index[key] = fixture_metadata
+        else:
+            self._shared_value_index.setdefault(key, []).append((level, fixture_metadata))
+
+    def _add_active_fixture(self, level: FixtureExecutionLevel, fixture_metadata: FixtureMetadata) -> None:
+        """
+        adds the metadata of an executed fixture to the active fixtures of the given execution level
+
+        :param level: the execution level the fixture was executed for
+        :param fixture_metadata: the metadata of the executed fixture
+        """
+        self._prepare_active_level(level)
+        if level == FixtureExecutionLevel.TESTCASE:
+            self._thread_local_fixtures.fixtures.append(fixture_metadata)
+        else:
+            self._shared_tree_fixtures[level].append(fixture_metadata)
+        self._add_to_value_index(level, fixture_metadata)
+
+    def _remove_active_level(self, level: FixtureExecutionLevel) -> None:
+        """
+        removes all active fixtures of the given execution level
+
+        :param level: the execution level that should be removed
+        """
+        if level == FixtureExecutionLevel.TESTCASE:
+            self._thread_local_fixtures.fixtures = None
+            self._thread_local_fixtures.value_index = None
+        else:
+            for cur_key in list(self._shared_value_index.keys()):
+                remaining = [cur_elem for cur_elem in self._shared_value_index[cur_key] if cur_elem[0] != level]
+                if remaining:
+                    self._shared_value_index[cur_key] = remaining
+                else:
+                    del self._shared_value_index[cur_key]
+            del self._shared_tree_fixtures[level]
+
     def _validate_for_unclear_setup_scoped_fixture_reference(
             self, fixture_callable_namespace: Union[None, Type[Scenario], Type[Setup]],
             fixture_callable: Callable, arguments: List[str], cur_execution_level: FixtureExecutionLevel):
@@ -152,7 +283,7 @@ class FixtureManager:
                 # another one)
                 sorter.add((cur_namespace_type, cur_fixture))
                 # determine all function/method arguments that has to be resolved for this fixture
-                cur_fixture_args = inspect.getfullargspec(cur_fixture).args
+                cur_fixture_args = list(get_argument_names(cur_fixture))
                 if fixture_func_types[cur_fixture] in ["instancemethod", "classmethod"]:
                     # this is a class method (remove `cls`) or an instance method (remove `self`)
                     cur_fixture_args = cur_fixture_args[1:]
@@ -213,6 +344,454 @@ class FixtureManager:
             scenario_type = from_branch.parent_executor.cur_scenario_class.__class__
         return setup_type, scenario_type
 
+    def _get_argument_namespaces(
+            self,
+            from_branch: Union[ExecutorTree, SetupExecutor, ScenarioExecutor, VariationExecutor, TestcaseExecutor],
+            callable_func_namespace: Union[None, Type[Scenario], Type[Setup]]) \
+            -> List[Union[None, Type[Scenario], Type[Setup]]]:
+        """
+        returns all namespaces the arguments of a fixture/testcase are searched in (from the most global to the most
+        specific one)
+
+        :param from_branch: the branch for which the namespaces should be determined
+        :param callable_func_namespace: the namespace of the current fixture or `None` if it is defined in balderglob
+                                        file
+        """
+        all_possible_namespaces = [None]
+        setup_type, scenario_type = self._determine_setup_and_scenario_type(
+            from_branch=from_branch, callable_func_namespace=callable_func_namespace)
+
+        # add to possible namespaces only if the namespace of the current fixture allows this
+        if callable_func_namespace is not None:
+            if (issubclass(callable_func_namespace, Setup) or issubclass(callable_func_namespace, Scenario)) \
+                    and setup_type is not None:
+                all_possible_namespaces.append(setup_type)
+            if issubclass(callable_func_namespace, Scenario) and scenario_type is not None:
+                all_possible_namespaces.append(scenario_type)
+        return all_possible_namespaces
+
+    def _get_fixture_value(
+            self, argument: str, possible_namespaces: Sequence[Union[None, Type[Scenario], Type[Setup]]],
+            callable_func: Callable, max_level: FixtureExecutionLevel = FixtureExecutionLevel.TESTCASE) -> object:
+        """
+        returns the value of the active fixture the given argument references - if there are multiple fixtures with
+        this name, the value of the most specific one is returned (lazy fixtures are constructed now, if they were not
+        requested before)
+
+        :param argument: the name of the argument that should be resolved
+        :param possible_namespaces: the namespaces the fixture is searched in (from the most global to the most
+                                    specific one)
+        :param callable_func: the callable the argument belongs to
+        :param max_level: only fixtures up to this execution level are considered
+        """
+        level_order = FixtureExecutionLevel.get_order()
+        testcase_value_index = getattr(self._thread_local_fixtures, 'value_index', None) or {}
+        if max_level != FixtureExecutionLevel.TESTCASE:
+            testcase_value_index = {}
+        # go to the most specific namespace first, because more specific ones overwrite the more global ones
+        for cur_possible_namespace in reversed(possible_namespaces):
+            key = (cur_possible_namespace, argument)
+            # the TESTCASE level is always the most specific one
+            fixture_metadata = testcase_value_index.get(key)
+            if fixture_metadata is None:
+                fixture_metadata = next(
+                    (cur_elem for cur_level, cur_elem in reversed(self._shared_value_index.get(key, []))
+                     if level_order.index(cur_level) <= level_order.index(max_level)),
+                    None)
+            if fixture_metadata is None:
+                continue
+            if isinstance(fixture_metadata, LazyFixtureMetadata):
+                fixture_metadata = self._construct_lazy_fixture(fixture_metadata)
+            return fixture_metadata.retval
+        raise FixtureReferenceError(
+            f"the argument `{argument}` in fixture `{callable_func.__qualname__}` could not be resolved")
+
+    def _get_dependencies_of(self, level: FixtureExecutionLevel, step: FixturePlanStep) -> List[FixtureMetadata]:
+        """
+        returns all active fixtures of the same execution level and definition scope the given fixture references over
+        its arguments
+
+        :param level: the execution level of the fixture
+        :param step: the plan step of the fixture
+        """
+        return [cur_fixture_metadata for cur_fixture_metadata in self.current_tree_fixtures.get(level, [])
+                if cur_fixture_metadata.definition_scope == step.definition_scope
+                and cur_fixture_metadata.namespace == step.namespace
+                and cur_fixture_metadata.callable.__name__ in step.arguments
+                and cur_fixture_metadata.callable is not step.callable]
+
+    def _construct_lazy_fixture(self, lazy_fixture: LazyFixtureMetadata) -> FixtureMetadata:
+        """
+        executes the construction code of the given lazy fixture (if this was not done before) and adds it to the
+        active fixtures of its execution level
+
+        :param lazy_fixture: the lazy fixture that is requested
+        :return: the metadata of the constructed fixture
+        """
+        with self._lazy_construction_lock:
+            if lazy_fixture.constructed is not None:
+                return lazy_fixture.constructed
+            if lazy_fixture.exception is not None:
+                raise lazy_fixture.exception
+            step = lazy_fixture.step
+            try:
+                # the arguments of the lazy fixture are resolved within its own level (also if a testcase requests it)
+                construct = self._prepare_fixture_call(lazy_fixture.branch, step, max_level=lazy_fixture.level)
+                try:
+                    generator, retvalue = construct()
+                except (StopIteration, StopAsyncIteration) as exc:
+                    raise FixtureReferenceError(
+                        f"the lazy fixture `{step.callable.__qualname__}` does not provide a value") from exc
+            except Exception as exc:
+                lazy_fixture.exception = exc
+                raise
+            fixture_metadata = FixtureMetadata(
+                namespace=step.namespace, function_type=step.function_type, callable=step.callable,
+                generator=generator, retval=retvalue, definition_scope=step.definition_scope,
+                dependencies=self._get_dependencies_of(lazy_fixture.level, step))
+            lazy_fixture.constructed = fixture_metadata
+            # the value index still contains the lazy object (that is now resolved) -> only add it to the level
+            if lazy_fixture.level == FixtureExecutionLevel.TESTCASE:
+                self._thread_local_fixtures.fixtures.append(fixture_metadata)
+            else:
+                self._shared_tree_fixtures[lazy_fixture.level].append(fixture_metadata)
+            return fixture_metadata
+
+    def _get_namespace_types_of_branch(
+            self, branch: Union[ExecutorTree, SetupExecutor, ScenarioExecutor, VariationExecutor, TestcaseExecutor]) \
+            -> Tuple[Tuple[Type[Setup], ...], Tuple[Type[Scenario], ...]]:
+        """
+        returns all setup classes and all scenario classes that are part of the given branch
+
+        :param branch: the branch the classes should be returned for
+        """
+        if isinstance(branch, (ScenarioExecutor, VariationExecutor, TestcaseExecutor)):
+            # these branches always belong to exactly one setup and one scenario
+            setup_type, scenario_type = self._determine_setup_and_scenario_type(
+                from_branch=branch, callable_func_namespace=None)
+            return (setup_type, ), (scenario_type, )
+        setup_types = tuple(
+            cur_setup.__class__
+            for cur_setup in branch.get_all_base_instances_of_this_branch(Setup, only_runnable_elements=True))
+        scenario_types = tuple(
+            cur_scenario.__class__
+            for cur_scenario in branch.get_all_base_instances_of_this_branch(Scenario, only_runnable_elements=True))
+        return setup_types, scenario_types
+
+    def _get_ordered_fixtures(
+            self, execution_level: FixtureExecutionLevel, setup_types: Iterable[Type[Setup]],
+            scenario_types: Iterable[Type[Scenario]]) \
+            -> Dict[FixtureDefinitionScope, List[Tuple[Union[None, Type[Scenario], Type[Setup]], str, object]]]:
+        """
+        This method delivers all fixtures which should be executed for a branch with the given execution level and the
+        given setup and scenario classes (see :meth:`FixtureManager.get_all_fixtures_for_current_level`).
+
+        :param execution_level: the execution level of the branch
+        :param setup_types: all setup classes that are part of the branch
+        :param scenario_types: all scenario classes that are part of the branch
+        :return: a dictionary where the definition object (DEFINITION SCOPE) is the key and the ordered list with the
+                 fixture tuples is the value
+        """
+        all_fixtures = {}
+        # get all relevant fixtures of `balderglob.py` (None is key for balderglob fixtures)
+        glob_fixtures = self.get_fixture_for_class(execution_level, None)
+        all_fixtures[FixtureDefinitionScope.GLOB] = {}
+        all_fixtures[FixtureDefinitionScope.GLOB][None] = glob_fixtures
+        # get all relevant fixtures with definition scope "setup"
+        all_fixtures[FixtureDefinitionScope.SETUP] = {}
+        for cur_setup_type in setup_types:
+            # check if there exists fixtures for the current setup
+            cur_setup_fixtures = self.get_fixture_for_class(execution_level, cur_setup_type)
+            if cur_setup_fixtures:
+                all_fixtures[FixtureDefinitionScope.SETUP][cur_setup_type] = cur_setup_fixtures
+
+        # get all relevant fixtures with definition scope "scenario"
+        all_fixtures[FixtureDefinitionScope.SCENARIO] = {}
+        for cur_scenario_type in scenario_types:
+            cur_scenario_fixtures = self.get_fixture_for_class(execution_level, cur_scenario_type)
+            if cur_scenario_fixtures:
+                all_fixtures[FixtureDefinitionScope.SCENARIO][cur_scenario_type] = cur_scenario_fixtures
+
+        ordered_fixtures = {}
+        # Now the basic order is: [All of ExecutorTree] -> [All of Setup] -> [All of Scenario]
+        #  but the order within these DEFINITION SCOPES has to be determined now!
+        outer_scope_fixtures = self.all_already_run_fixtures + self.registered_lazy_fixtures
+        for cur_definition_scope in FixtureDefinitionScope:
+            ordered_fixtures[cur_definition_scope] = self._sort_fixture_list_of_same_definition_scope(
+                fixture_namespace_dict=all_fixtures[cur_definition_scope], outer_scope_fixtures=outer_scope_fixtures)
+            outer_scope_fixtures = \
+                outer_scope_fixtures + [cur_fixture for _, _, cur_fixture in ordered_fixtures[cur_definition_scope]]
+
+        return ordered_fixtures
+
+    def _compile_execution_plan(
+            self, branch: Union[ExecutorTree, SetupExecutor, ScenarioExecutor, VariationExecutor, TestcaseExecutor],
+            setup_types: Tuple[Type[Setup], ...], scenario_types: Tuple[Type[Scenario], ...]) -> FixtureExecutionPlan:
+        """
+        compiles the execution plan for the given branch
+
+        :param branch: the branch that should be entered
+        :param setup_types: all setup classes that are part of the branch
+        :param scenario_types: all scenario classes that are part of the branch
+        """
+        steps = []
+        ordered_fixtures = self._get_ordered_fixtures(branch.fixture_execution_level, setup_types, scenario_types)
+        for cur_definition_scope in FixtureDefinitionScope:
+            for cur_namespace_type, cur_fixture_func_type, cur_fixture in ordered_fixtures[cur_definition_scope]:
+                if cur_fixture_func_type not in ["function", "staticmethod", "classmethod", "instancemethod"]:
+                    raise ValueError(f"found illegal value for func_type `{cur_fixture_func_type}` for fixture "
+                                     f"`{cur_fixture.__name__}`")
+                arguments = list(get_argument_names(cur_fixture))
+                if cur_fixture_func_type in ["classmethod", "instancemethod"]:
+                    arguments = arguments[1:]
+                self._validate_for_unclear_setup_scoped_fixture_reference(
+                    cur_namespace_type, cur_fixture, arguments, cur_execution_level=branch.fixture_execution_level)
+                steps.append(
+                    FixturePlanStep(
+                        definition_scope=cur_definition_scope,
+                        namespace=cur_namespace_type,
+                        function_type=cur_fixture_func_type,
+                        callable=cur_fixture,
+                        arguments=tuple(arguments),
+                        argument_namespaces=tuple(self._get_argument_namespaces(branch, cur_namespace_type)),
+                        lazy=self.fixture_options.get(cur_fixture, {}).get('lazy', False),
+                        cache=self.fixture_options.get(cur_fixture, {}).get('cache', None)
+                    )
+                )
+        # determine the fixtures every step references within its definition scope (the same edges the sorter uses)
+        for cur_index, cur_step in enumerate(steps):
+            dependencies = tuple(
+                cur_other_index for cur_other_index, cur_other_step in enumerate(steps)
+                if cur_other_index != cur_index and cur_other_step.definition_scope == cur_step.definition_scope
+                and cur_other_step.namespace == cur_step.namespace
+                and cur_other_step.callable.__name__ in cur_step.arguments
+            )
+            steps[cur_index] = dataclasses.replace(cur_step, dependencies=dependencies)
+        return FixtureExecutionPlan(execution_level=branch.fixture_execution_level, setup_types=setup_types,
+                                    scenario_types=scenario_types, steps=tuple(steps))
+
+    def _prepare_fixture_call(
+            self, branch: Union[ExecutorTree, SetupExecutor, ScenarioExecutor, VariationExecutor, TestcaseExecutor],
+            step: FixturePlanStep, max_level: FixtureExecutionLevel = FixtureExecutionLevel.TESTCASE) \
+            -> Callable[[], Tuple[Union[Generator, AsyncGenerator], object]]:
+        """
+        This method resolves all arguments of the fixture of the given plan step and returns a callable, that executes
+        the construction code of the fixture. The returned callable returns the generator object of the fixture (an
+        empty generator if the fixture does not yield) and the value the fixture provides.
+
+        .. note::
+            The arguments are resolved in the calling thread, the returned callable can be executed in any thread.
+
+        :param branch: the branch that is currently entered
+        :param step: the plan step of the fixture
+        :param max_level: only fixtures up to this execution level are considered for the arguments
+        """
+        kwargs = {cur_arg: self._get_fixture_value(cur_arg, step.argument_namespaces, step.callable,
+                                                   max_level=max_level)
+                  for cur_arg in step.arguments}
+        if step.function_type in ["function", "staticmethod"]:
+            # fixture is a function or a staticmethod - no first special attribute
+            args = ()
+        elif step.function_type == "classmethod":
+            args = (step.namespace, )
+        else:
+            self_reference = branch.get_all_base_instances_of_this_branch(
+                with_type=step.namespace, only_runnable_elements=True)
+            if len(self_reference) != 1:
+                raise UnclearUniqueClassReference(
+                    f"can not find exactly one reference of the class "
+                    f"`{step.namespace.__name__}` in current tree branch")
+            args = (self_reference[0], )
+        event_loop = branch.executor_tree.event_loop
+        result_store = branch.executor_tree.fixture_result_store if step.cache is not None else None
+        cache_key = None if result_store is None else step.cache.get_key_for(step.callable, kwargs)
+
+        def empty():
+            yield None
+
+        def construct():
+            if result_store is not None:
+                is_cached, cached_value = result_store.load(cache_key, step.cache)
+                if is_cached:
+                    # valid cached value -> neither the construction nor the teardown code is executed
+                    generator = empty()
+                    next(generator)
+                    return generator, cached_value
+            generator = step.callable(*args, **kwargs)
+            if inspect.isasyncgen(generator):
+                # async generator fixture -> execute construction code on the event loop of the session
+                retvalue = event_loop.run(self._anext(generator))
+            elif isinstance(generator, Generator):
+                retvalue = next(generator)
+            else:
+                retvalue = generator
+                if inspect.isawaitable(retvalue):
+                    # coroutine fixture -> execute it on the event loop of the session
+                    retvalue = event_loop.run(retvalue)
+                generator = empty()
+                next(generator)
+            if result_store is not None:
+                result_store.save(cache_key, retvalue)
+            return generator, retvalue
+        return construct
+
+    def _execute_fixture_teardown(
+            self, branch: Union[ExecutorTree, SetupExecutor, ScenarioExecutor, VariationExecutor, TestcaseExecutor],
+            fixture_metadata: FixtureMetadata) -> None:
+        """
+        executes the teardown code of the given active fixture
+
+        :param branch: the branch that is currently left
+        :param fixture_metadata: the metadata of the fixture
+        """
+        try:
+            if inspect.isasyncgen(fixture_metadata.generator):
+                branch.executor_tree.event_loop.run(self._anext(fixture_metadata.generator))
+            else:
+                next(fixture_metadata.generator)
+        except (StopIteration, StopAsyncIteration):
+            pass
+
+    @staticmethod
+    def _execute_in_dependency_order(
+            pool: concurrent.futures.ThreadPoolExecutor,
+            sorter: TopologicalSorter,
+            start: Callable[[int], Union[Callable[[], Any], None]],
+            handle_done: Callable[[concurrent.futures.Future, int], None],
+            should_stop: Callable[[], bool] = lambda: False) -> None:
+        """
+        This method executes the nodes of the given (already prepared) sorter in the worker threads of the pool. A node
+        is started as soon as all of its predecessors are done.
+
+        :param pool: the pool the nodes are executed in
+        :param sorter: the prepared sorter with the indexes of the nodes
+        :param start: returns the callable that should be executed for a node (None if the node is done without
+                      executing anything in a worker thread)
+        :param handle_done: is called in the calling thread for every node that was executed in a worker thread
+        :param should_stop: returns True if no further nodes should be started (the running ones are still awaited)
+        """
+        running: Dict[concurrent.futures.Future, int] = {}
+        while sorter.is_active() and not should_stop():
+            for cur_index in sorter.get_ready():
+                if should_stop():
+                    break
+                func = start(cur_index)
+                if func is None:
+                    sorter.done(cur_index)
+                    continue
+                # the worker thread uses the context of the calling thread (for example its output buffer)
+                running[pool.submit(contextvars.copy_context().run, func)] = cur_index
+            if not running:
+                continue
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for cur_future in done:
+                cur_index = running.pop(cur_future)
+                handle_done(cur_future, cur_index)
+                sorter.done(cur_index)
+        # no further node should be started - wait for all nodes that are still running
+        for cur_future in concurrent.futures.as_completed(running):
+            handle_done(cur_future, running[cur_future])
+
+    def _enter_concurrently(
+            self, branch: Union[ExecutorTree, SetupExecutor, ScenarioExecutor, VariationExecutor, TestcaseExecutor],
+            plan: FixtureExecutionPlan) -> None:
+        """
+        This method executes the construction code of all fixtures of the given plan concurrently. The definition
+        scopes are still executed one after another, but all fixtures of one definition scope that do not reference
+        each other are executed at the same time in worker threads.
+
+        :param branch: the branch that is currently entered
+        :param plan: the execution plan of the branch
+        """
+        errors: List[Tuple[FixturePlanStep, Exception]] = []
+
+        def start(step_index: int) -> Union[Callable[[], Tuple[Generator, Any]], None]:
+            step = plan.steps[step_index]
+            if step.lazy:
+                # lazy fixtures are only registered - they are constructed when they are requested
+                self._add_to_value_index(
+                    branch.fixture_execution_level,
+                    LazyFixtureMetadata(level=branch.fixture_execution_level, branch=branch, step=step))
+                return None
+            try:
+                return self._prepare_fixture_call(branch, step)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                errors.append((step, exc))
+                return None
+
+        def handle_done_future(future: concurrent.futures.Future, step_index: int):
+            step = plan.steps[step_index]
+            try:
+                generator, retvalue = future.result()
+            except (StopIteration, StopAsyncIteration):
+                return
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                errors.append((step, exc))
+                return
+            fixture_metadata = FixtureMetadata(
+                namespace=step.namespace, function_type=step.function_type, callable=step.callable,
+                generator=generator, retval=retvalue, definition_scope=step.definition_scope,
+                dependencies=self._get_dependencies_of(branch.fixture_execution_level, step))
+            # add the executed fixtures to global reference (in the calling thread)
+            self._add_active_fixture(branch.fixture_execution_level, fixture_metadata)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=branch.executor_tree.max_concurrent_fixtures) as pool:
+            for cur_definition_scope in FixtureDefinitionScope:
+                sorter = TopologicalSorter()
+                for cur_index, cur_step in enumerate(plan.steps):
+                    if cur_step.definition_scope == cur_definition_scope:
+                        sorter.add(cur_index, *cur_step.dependencies)
+                sorter.prepare()
+                self._execute_in_dependency_order(pool, sorter, start, handle_done_future,
+                                                  should_stop=lambda: bool(errors))
+                if errors:
+                    break
+
+        if errors:
+            for cur_step, cur_exc in errors[1:]:
+                print(f"the fixture `{cur_step.callable.__qualname__}` failed too:", file=sys.stderr)
+                traceback.print_exception(type(cur_exc), cur_exc, cur_exc.__traceback__, file=sys.stderr)
+            raise errors[0][1]
+
+    def _leave_concurrently(
+            self, branch: Union[ExecutorTree, SetupExecutor, ScenarioExecutor, VariationExecutor, TestcaseExecutor],
+            fixtures: List[FixtureMetadata]) -> Union[Exception, None]:
+        """
+        This method executes the teardown code of the given active fixtures concurrently. The definition scopes are
+        left in the reverse order. Within a definition scope, a fixture is torn down as soon as all fixtures that
+        reference it were torn down.
+
+        :param branch: the branch that is currently left
+        :param fixtures: the active fixtures of the execution level of the branch
+        :return: the first exception that was raised by a teardown code (or None)
+        """
+        exceptions: List[BaseException] = []
+
+        def handle_done_future(future: concurrent.futures.Future, _: int):
+            if future.exception() is not None:
+                exceptions.append(future.exception())
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=branch.executor_tree.max_concurrent_fixtures) as pool:
+            for cur_definition_scope in reversed(FixtureDefinitionScope):
+                fixtures_of_scope = [cur_fixture for cur_fixture in fixtures
+                                     if cur_fixture.definition_scope == cur_definition_scope]
+                indexes = {id(cur_fixture): cur_index for cur_index, cur_fixture in enumerate(fixtures_of_scope)}
+                sorter = TopologicalSorter()
+                for cur_index, cur_fixture in enumerate(fixtures_of_scope):
+                    sorter.add(cur_index)
+                    # the referenced fixtures have to wait till this fixture was torn down
+                    for cur_dependency in cur_fixture.dependencies:
+                        if id(cur_dependency) in indexes:
+                            sorter.add(indexes[id(cur_dependency)], cur_index)
+                sorter.prepare()
+                self._execute_in_dependency_order(
+                    pool, sorter,
+                    lambda idx, of_scope=fixtures_of_scope: functools.partial(
+                        self._execute_fixture_teardown, branch, of_scope[idx]),
+                    handle_done_future)
+        # only return the first exception
+        return exceptions[0] if exceptions else None
+
     # ---------------------------------- METHODS -----------------------------------------------------------------------
 
     def is_allowed_to_enter(
@@ -233,6 +812,24 @@ class FixtureManager:
         """
         return branch.fixture_execution_level in self.current_tree_fixtures.keys()
 
+    def get_execution_plan(
+            self, branch: Union[ExecutorTree, SetupExecutor, ScenarioExecutor, VariationExecutor, TestcaseExecutor]) \
+            -> FixtureExecutionPlan:
+        """
+        This method returns the execution plan with all fixtures that have to be executed if the given branch is
+        entered. The plan is only compiled for the first branch with the same execution level, setup and scenario
+        classes. All other branches reuse it.
+
+        :param branch: the branch which should be entered
+        """
+        setup_types, scenario_types = self._get_namespace_types_of_branch(branch)
+        key = (branch.fixture_execution_level, setup_types, scenario_types)
+        plan = self._compiled_plans.get(key)
+        if plan is None:
+            plan = self._compile_execution_plan(branch, setup_types, scenario_types)
+            self._compiled_plans[key] = plan
+        return plan
+
     def enter(self, branch: Union[BasicExecutor, ExecutorTree, SetupExecutor, ScenarioExecutor, VariationExecutor,
                                   TestcaseExecutor]):
         """
@@ -248,51 +845,31 @@ class FixtureManager:
             raise LostInExecutorTreeException(
                 "the current branch that should be entered is not allowed, because other branches weren't left yet")
 
-        def empty():
-            yield None
-        # now iterate over all fixtures that should be executed in this enter() call
-        #  -> collect them with all different DEFINITION-SCOPES
-        for cur_definition_scope in FixtureDefinitionScope:
-            cur_fixture_list = self.get_all_fixtures_for_current_level(branch=branch).get(cur_definition_scope)
-            for cur_scope_namespace_type, cur_fixture_func_type, cur_fixture in cur_fixture_list:
-                try:
-                    if cur_fixture_func_type in ["function", "staticmethod"]:
-                        # fixture is a function or a staticmethod - no first special attribute
-                        kwargs = self.get_all_attribute_values(branch, cur_scope_namespace_type, cur_fixture,
-                                                               cur_fixture_func_type)
-                        cur_generator = cur_fixture(**kwargs)
-                    elif cur_fixture_func_type == "classmethod":
-                        kwargs = self.get_all_attribute_values(branch, cur_scope_namespace_type, cur_fixture,
-                                                               cur_fixture_func_type)
-                        cur_generator = cur_fixture(cur_scope_namespace_type, **kwargs)
-                    elif cur_fixture_func_type == "instancemethod":
-                        self_reference = branch.get_all_base_instances_of_this_branch(
-                            with_type=cur_scope_namespace_type, only_runnable_elements=True)
-                        if len(self_reference) != 1:
-                            raise UnclearUniqueClassReference(
-                                f"can not find exactly one reference of the class "
-                                f"`{cur_scope_namespace_type.__name__}` in current tree branch")
-                        kwargs = self.get_all_attribute_values(branch, cur_scope_namespace_type, cur_fixture,
-                                                               cur_fixture_func_type)
-                        cur_generator = cur_fixture(self_reference[0], **kwargs)
-                    else:
-                        raise ValueError(f"found illegal value for func_type `{cur_fixture_func_type}` for fixture "
-                                         f"`{cur_fixture.__name__}`")
-                    if isinstance(cur_generator, Generator):
-                        cur_retvalue = next(cur_generator)
-                    else:
-                        cur_retvalue = cur_generator
-                        cur_generator = empty()
-                        next(cur_generator)
-                    # add the executed fixtures to global reference
-                    if branch.fixture_execution_level not in self.current_tree_fixtures.keys():
-                        self.current_tree_fixtures[branch.fixture_execution_level] = []
-                    self.current_tree_fixtures[branch.fixture_execution_level].append(
-                        FixtureMetadata(namespace=cur_scope_namespace_type, function_type=cur_fixture_func_type,
-                                        callable=cur_fixture, generator=cur_generator, retval=cur_retvalue))
-                except StopIteration:
-                    pass
-                # every other exception that is thrown, will be recognized and rethrown
+        plan = self.get_execution_plan(branch)
+        if branch.executor_tree.max_concurrent_fixtures > 1:
+            self._enter_concurrently(branch, plan)
+            return
+
+        # now iterate over all fixtures that should be executed in this enter() call (the plan contains them already
+        #  ordered for all different DEFINITION-SCOPES)
+        for cur_step in plan.steps:
+            if cur_step.lazy:
+                # lazy fixtures are only registered - they are constructed when they are requested
+                self._add_to_value_index(
+                    branch.fixture_execution_level,
+                    LazyFixtureMetadata(level=branch.fixture_execution_level, branch=branch, step=cur_step))
+                continue
+            try:
+                cur_generator, cur_retvalue = self._prepare_fixture_call(branch, cur_step)()
+                # add the executed fixtures to global reference
+                self._add_active_fixture(
+                    branch.fixture_execution_level,
+                    FixtureMetadata(namespace=cur_step.namespace, function_type=cur_step.function_type,
+                                    callable=cur_step.callable, generator=cur_generator, retval=cur_retvalue,
+                                    definition_scope=cur_step.definition_scope))
+            except (StopIteration, StopAsyncIteration):
+                pass
+            # every other exception that is thrown, will be recognized and rethrown
 
     def leave(self, branch: Union[BasicExecutor, ExecutorTree, SetupExecutor, ScenarioExecutor, VariationExecutor,
                                   TestcaseExecutor]):
@@ -306,21 +883,22 @@ class FixtureManager:
         if branch.fixture_execution_level not in self.current_tree_fixtures.keys():
             raise LostInExecutorTreeException("can not leave the current branch, because it was not entered before")
 
-        current_tree_fixtures_reversed = self.current_tree_fixtures[branch.fixture_execution_level]
-        current_tree_fixtures_reversed.reverse()
-        exception = None
-        for cur_fixture_metadata in current_tree_fixtures_reversed:
-            try:
-                next(cur_fixture_metadata.generator)
-            except StopIteration:
-                pass
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                if not exception:
-                    # only save the first exception
-                    exception = exc
+        if branch.executor_tree.max_concurrent_fixtures > 1:
+            exception = self._leave_concurrently(branch, self.current_tree_fixtures[branch.fixture_execution_level])
+        else:
+            current_tree_fixtures_reversed = self.current_tree_fixtures[branch.fixture_execution_level]
+            current_tree_fixtures_reversed.reverse()
+            exception = None
+            for cur_fixture_metadata in current_tree_fixtures_reversed:
+                try:
+                    self._execute_fixture_teardown(branch, cur_fixture_metadata)
+                except Exception as exc:  # pylint: disable=broad-exception-caught
+                    if not exception:
+                        # only save the first exception
+                        exception = exc
 
         # reset the left location
-        del self.current_tree_fixtures[branch.fixture_execution_level]
+        self._remove_active_level(branch.fixture_execution_level)
 
         if exception:
             raise exception
@@ -350,7 +928,7 @@ class FixtureManager:
         :return: the method returns a dictionary with the attribute name as key and the return value as value
 
         """
-        arguments = inspect.getfullargspec(callable_func).args
+        arguments = list(get_argument_names(callable_func))
         result_dict = {}
 
         if func_type in ["classmethod", "instancemethod"]:
@@ -360,33 +938,13 @@ class FixtureManager:
 
         self._validate_for_unclear_setup_scoped_fixture_reference(
             callable_func_namespace, callable_func, arguments, cur_execution_level=branch.fixture_execution_level)
-        all_possible_namespaces = [None]
-        setup_type, scenario_type = self._determine_setup_and_scenario_type(
+        all_possible_namespaces = self._get_argument_namespaces(
             from_branch=branch, callable_func_namespace=callable_func_namespace)
 
-        # add to possible namespaces only if the namespace of the current fixture allows this
-        if callable_func_namespace is not None:
-            if (issubclass(callable_func_namespace, Setup) or issubclass(callable_func_namespace, Scenario)) \
-                    and setup_type is not None:
-                all_possible_namespaces.append(setup_type)
-            if issubclass(callable_func_namespace, Scenario) and scenario_type is not None:
-                all_possible_namespaces.append(scenario_type)
-
         for cur_arg in arguments:
             if cur_arg in ignore_attributes:
                 continue
-            # go to the most specific fixture, because more specific ones overwrite the more global ones
-            for cur_possible_namespace, cur_level in itertools.product(all_possible_namespaces, FixtureExecutionLevel):
-                if cur_level not in self.current_tree_fixtures.keys():
-                    continue
-                # filter only these fixtures that have the same namespace
-                for cur_fixture_metadata in self.current_tree_fixtures[cur_level]:
-                    if (cur_fixture_metadata.namespace == cur_possible_namespace
-                            and cur_fixture_metadata.callable.__name__ == cur_arg):
-                        result_dict[cur_arg] = cur_fixture_metadata.retval
-            if cur_arg not in result_dict.keys():
-                raise FixtureReferenceError(
-                        f"the argument `{cur_arg}` in fixture `{callable_func.__qualname__}` could not be resolved")
+            result_dict[cur_arg] = self._get_fixture_value(cur_arg, all_possible_namespaces, callable_func)
         return result_dict
 
     def get_fixture_for_class(self, execution_level: FixtureExecutionLevel,
@@ -438,46 +996,5 @@ class FixtureManager:
                  or :class:`Setup`) as first argument, the fixture func_type as second and the fixture callable as third
                  argument (this list is ordered after the call hierarchy)
         """
-        all_fixtures = {}
-        # get all relevant fixtures of `balderglob.py` (None is key for balderglob fixtures)
-        glob_fixtures = self.get_fixture_for_class(branch.fixture_execution_level, None)
-        all_fixtures[FixtureDefinitionScope.GLOB] = {}
-        all_fixtures[FixtureDefinitionScope.GLOB][None] = glob_fixtures
-        # get all relevant fixtures with definition scope "setup"
-        all_fixtures[FixtureDefinitionScope.SETUP] = {}
-        for cur_setup in branch.get_all_base_instances_of_this_branch(Setup, only_runnable_elements=True):
-            # check if there exists fixtures for the current setup
-            cur_setup_fixtures = self.get_fixture_for_class(branch.fixture_execution_level, cur_setup.__class__)
-            if cur_setup_fixtures:
-                all_fixtures[FixtureDefinitionScope.SETUP][cur_setup.__class__] = cur_setup_fixtures
-
-        # get all relevant fixtures with definition scope "scenario"
-        all_fixtures[FixtureDefinitionScope.SCENARIO] = {}
-        for cur_scenario in branch.get_all_base_instances_of_this_branch(Scenario, only_runnable_elements=True):
-            cur_scenario_fixtures = self.get_fixture_for_class(branch.fixture_execution_level, cur_scenario.__class__)
-            if cur_scenario_fixtures:
-                all_fixtures[FixtureDefinitionScope.SCENARIO][cur_scenario.__class__] = cur_scenario_fixtures
-
-        ordered_fixtures = {}
-        # Now the basic order is: [All of ExecutorTree] -> [All of Setup] -> [All of Scenario]
-        #  but the order within these DEFINITION SCOPES has to be determined now!
-        outer_scope_fixtures = self.all_already_run_fixtures
-        ordered_fixtures[FixtureDefinitionScope.GLOB] = self._sort_fixture_list_of_same_definition_scope(
-            fixture_namespace_dict=all_fixtures[FixtureDefinitionScope.GLOB], outer_scope_fixtures=outer_scope_fixtures)
-
-        outer_scope_fixtures = \
-            self.all_already_run_fixtures + \
-            [cur_fixture for _, _, cur_fixture in ordered_fixtures[FixtureDefinitionScope.GLOB]]
-        ordered_fixtures[FixtureDefinitionScope.SETUP] = self._sort_fixture_list_of_same_definition_scope(
-            fixture_namespace_dict=all_fixtures[FixtureDefinitionScope.SETUP],
-            outer_scope_fixtures=outer_scope_fixtures)
-
-        outer_scope_fixtures = \
-            self.all_already_run_fixtures + \
-            [cur_fixture for _, _, cur_fixture in ordered_fixtures[FixtureDefinitionScope.GLOB]] + \
-            [cur_fixture for _, _, cur_fixture in ordered_fixtures[FixtureDefinitionScope.SETUP]]
-        ordered_fixtures[FixtureDefinitionScope.SCENARIO] = self._sort_fixture_list_of_same_definition_scope(
-            fixture_namespace_dict=all_fixtures[FixtureDefinitionScope.SCENARIO],
-            outer_scope_fixtures=outer_scope_fixtures)
-
-        return ordered_fixtures
+        setup_types, scenario_types = self._get_namespace_types_of_branch(branch)
+        return self._get_ordered_fixtures(branch.fixture_execution_level, setup_types, scenario_types)
@@ -1,10 +1,14 @@
 from __future__ import annotations
-from typing import Union, Type, Callable, Generator, TYPE_CHECKING
+from typing import List, Union, Type, Callable, Generator, TYPE_CHECKING
 import dataclasses
 
 from .utils.typings import MethodLiteralType
 
 if TYPE_CHECKING:
+    from _balder.fixture_definition_scope import FixtureDefinitionScope
+    from _balder.fixture_execution_level import FixtureExecutionLevel
+    from _balder.fixture_execution_plan import FixturePlanStep
+    from _balder.executor.basic_executable_executor import BasicExecutableExecutor
     from _balder.scenario import Scenario
     from _balder.setup import Setup
 
@@ -24,3 +28,25 @@ class FixtureMetadata:
     generator: Generator
     #: result according to the fixture's construction code (will be cleaned after it leaves a level)
     retval: object
+    #: the definition scope the fixture belongs to (only set for fixtures that were executed by an execution plan)
+    definition_scope: Union[FixtureDefinitionScope, None] = None
+    #: all active fixtures of the same level and definition scope this fixture references over its arguments
+    dependencies: List[FixtureMetadata] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class LazyFixtureMetadata:
+    """
+    describes a lazy fixture of an entered execution level, that will be constructed the first time its value is
+    requested
+    """
+    #: the execution level the fixture belongs to (it is torn down when this level is left)
+    level: FixtureExecutionLevel
+    #: the branch that was entered with this level
+    branch: BasicExecutableExecutor
+    #: the plan step of the fixture
+    step: FixturePlanStep
+    #: the metadata of the constructed fixture (None as long as the fixture was not requested)
+    constructed: Union[FixtureMetadata, None] = None
+    #: the exception the construction code of the fixture has raised (it is raised again for every further request)
+    exception: Union[Exception, None] = None
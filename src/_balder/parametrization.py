@@ -1,8 +1,10 @@
 from __future__ import annotations
-from typing import Type, Dict, Any, TypeVar, List
+from typing import Type, Dict, Any, TypeVar, List, Tuple, Hashable, Union
 import dataclasses
+from collections.abc import Iterator
 
 from _balder.device import Device
+from _balder.utils.functions import get_hashable_key_or_none
 
 ValueTypeT = TypeVar("ValueTypeT")
 
@@ -15,12 +17,21 @@ class FeatureAccessSelector:
     feature_property_name: str
     parameters: Dict[str, FeatureAccessSelector | Value] = dataclasses.field(default_factory=dict)
 
-    def get_value(self, available_parameters: Dict[str, Any]) -> List[Any]:
-        """accesses the configured method/property"""
+    def get_value(
+            self,
+            available_parameters: Dict[str, Any],
+            value_cache: ParametrizationValueCache | None = None
+    ) -> List[Any]:
+        """
+        accesses the configured method/property
+
+        :param available_parameters: the already resolved parametrization values (used for :class:`Parameter` objects)
+        :param value_cache: optional cache that memoizes the values returned by the feature methods/properties
+        """
         resolved_parameters = {}
         for cur_key, cur_value in self.parameters.items():
             if isinstance(cur_value, FeatureAccessSelector):
-                resolved_parameters[cur_key] = cur_value.get_value(available_parameters)
+                resolved_parameters[cur_key] = cur_value.get_value(available_parameters, value_cache)
             elif isinstance(cur_value, Parameter):
                 resolved_parameters[cur_key] = available_parameters[cur_value.name]
             elif isinstance(cur_value, Value):
@@ -30,10 +41,22 @@ class FeatureAccessSelector:
 
         feature = getattr(self.device, self.device_property_name)
 
+        if value_cache is not None:
+            found, value = value_cache.lookup(feature, self.feature_property_name, resolved_parameters)
+            if found:
+                return value
+
         if isinstance(getattr(feature.__class__, self.feature_property_name), property):
-            return getattr(feature, self.feature_property_name)
+            value = getattr(feature, self.feature_property_name)
+        else:
+            value = getattr(feature, self.feature_property_name)(**resolved_parameters)
 
-        return getattr(feature, self.feature_property_name)(**resolved_parameters)
+        if value_cache is not None:
+            if isinstance(value, Iterator):
+                # an iterator can only be consumed once -> memoize its elements
+                value = list(value)
+            value_cache.store(feature, self.feature_property_name, resolved_parameters, value)
+        return value
 
     def get_parameters(
             self,
@@ -73,3 +96,69 @@ class Value:
     def value(self) -> ValueTypeT:
         """returns the value of the parametrization"""
         return self._value
+
+
+class ParametrizationValueCache:
+    """
+    memoizes the values the feature methods/properties of a dynamic parametrization return - the values are saved per
+    resolved (setup) feature instance, the method/property name and the arguments, so that the feature is only accessed
+    once even if the value is requested in multiple variations or for multiple test methods
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[Hashable, List[Any]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """returns the number of values that were returned from the cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """returns the number of values that were not found in the cache"""
+        return self._misses
+
+    @staticmethod
+    def _get_key_for(feature: object, name: str, arguments: Dict[str, Any]) -> Union[Tuple, None]:
+        """returns the key of the value or None if the value can not be cached (because an argument is not hashable)"""
+        from _balder.controllers.feature_controller import FeatureController  # pylint: disable=import-outside-toplevel
+
+        # the active method variation depends on the variation the feature is currently used in
+        _, _, active_method_variation = FeatureController.get_for(feature.__class__).get_active_method_variation(name)
+        return get_hashable_key_or_none((feature, name, active_method_variation, feature.active_vdevice_device_mapping,
+                                         tuple(sorted(arguments.items()))))
+
+    def lookup(self, feature: object, name: str, arguments: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        returns a tuple, where the first element is True if the value was already memoized (the second element is the
+        value then)
+
+        :param feature: the feature instance the method/property belongs to
+        :param name: the name of the method/property
+        :param arguments: the arguments the method is called with
+        """
+        key = self._get_key_for(feature, name, arguments)
+        if key is not None and key in self._values:
+            self._hits += 1
+            return True, self._values[key]
+        self._misses += 1
+        return False, None
+
+    def store(self, feature: object, name: str, arguments: Dict[str, Any], value: List[Any]) -> None:
+        """
+        memoizes the value of the method/property of the given feature instance
+
+        :param feature: the feature instance the method/property belongs to
+        :param name: the name of the method/property
+        :param arguments: the arguments the method was called with
+        :param value: the returned value
+        """
+        key = self._get_key_for(feature, name, arguments)
+        if key is not None:
+            self._values[key] = value
+
+    def clear(self) -> None:
+        """removes all memoized values"""
+        self._values.clear()
@@ -0,0 +1,198 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterator, List, Literal, Tuple, Union
+
+import csv
+import json
+import mmap
+import array
+import pathlib
+import threading
+
+
+class ParametrizationFile:
+    """
+    This class describes a file (CSV or JSONL) that provides the parametrization values of a test method. Every record
+    of the file is one parametrization element, that provides the values of all :attr:`fields` together.
+
+    The file is never loaded completely. It is memory-mapped and the records are parsed while they are iterated. Only
+    the start offsets of the records are saved (they are determined on first request of :func:`len` or an index), so
+    that a single record can be read again without parsing the whole file.
+    """
+    #: all supported file formats with their file suffixes
+    SUFFIXES = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+    def __init__(
+            self,
+            path: Union[str, pathlib.Path],
+            fields: Union[List[str], None] = None,
+            file_format: Union[Literal['csv', 'jsonl'], None] = None,
+            encoding: str = 'utf-8'
+    ):
+        """
+        :param path: the absolute path of the file
+
+        :param fields: the fields of the records that should be used (all fields of the CSV header or of the first JSON
+                       object if it is not given)
+
+        :param file_format: the format of the file (determined by the file suffix if it is not given)
+
+        :param encoding: the encoding of the file
+        """
+        self._path = pathlib.Path(path)
+        if file_format is None:
+            file_format = self.SUFFIXES.get(self._path.suffix.lower())
+            if file_format is None:
+                raise ValueError(f'can not determine the format of the parametrization file `{self._path}` - use a '
+                                 f'file with one of the suffixes `{"`, `".join(self.SUFFIXES.keys())}` or provide '
+                                 f'the argument `file_format`')
+        if file_format not in ('csv', 'jsonl'):
+            raise ValueError(f'the file format `{file_format}` is not supported - use `csv` or `jsonl`')
+        if not self._path.is_file():
+            raise FileNotFoundError(f'the parametrization file `{self._path}` does not exist')
+        self._file_format = file_format
+        self._encoding = encoding
+
+        # the header of a csv file (None for jsonl files)
+        self._csv_header: Union[List[str], None] = None
+        # the offset of the first record within the file
+        self._first_record_offset = 0
+        # the start offsets of all records (determined on first request)
+        self._record_offsets: Union[array.array, None] = None
+        self._lock = threading.Lock()
+
+        self._read_header()
+        self._fields = tuple(fields) if fields is not None else self._get_default_fields()
+        if len(self._fields) == 0:
+            raise ValueError(f'the parametrization file `{self._path}` does not provide any fields')
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def path(self) -> pathlib.Path:
+        """returns the path of the file"""
+        return self._path
+
+    @property
+    def file_format(self) -> str:
+        """returns the format of the file (`csv` or `jsonl`)"""
+        return self._file_format
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """returns the names of all fields that are provided by every record"""
+        return self._fields
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _open_mmap(self) -> Union[mmap.mmap, None]:
+        """returns the memory map of the file (None if the file is empty, because an empty file can not be mapped)"""
+        with open(self._path, 'rb') as file:
+            if self._path.stat().st_size == 0:
+                return None
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _read_header(self) -> None:
+        """reads the header of a csv file and determines the offset of the first record"""
+        if self._file_format != 'csv':
+            return
+        memory_map = self._open_mmap()
+        if memory_map is None:
+            raise ValueError(f'the csv parametrization file `{self._path}` has no header')
+        with memory_map:
+            header_line = memory_map.readline()
+            self._first_record_offset = memory_map.tell()
+        self._csv_header = next(csv.reader([header_line.decode(self._encoding)]), [])
+
+    def _get_default_fields(self) -> Tuple[str, ...]:
+        """returns all fields of the csv header or of the first json object"""
+        if self._file_format == 'csv':
+            return tuple(self._csv_header)
+        for _, cur_record in self._iter_records_with_offsets():
+            return tuple(cur_record.keys())
+        raise ValueError(f'the jsonl parametrization file `{self._path}` has no records - provide the argument '
+                         f'`fields`')
+
+    def _iter_lines(self, memory_map: mmap.mmap, offsets: List[int]) -> Iterator[str]:
+        """returns the lines of the memory map - the offset after every returned line is appended to `offsets`"""
+        for cur_line in iter(memory_map.readline, b''):
+            offsets.append(memory_map.tell())
+            yield cur_line.decode(self._encoding)
+
+    def _iter_records_with_offsets(self, start_offset: Union[int, None] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """returns all records (beginning at the given offset) as dictionaries together with their start offset"""
+        memory_map = self._open_mmap()
+        if memory_map is None:
+            return
+        with memory_map:
+            memory_map.seek(self._first_record_offset if start_offset is None else start_offset)
+            # the offsets after every line that was read (the last one is the start offset of the next record)
+            line_end_offsets = [memory_map.tell()]
+            lines = self._iter_lines(memory_map, line_end_offsets)
+            if self._file_format == 'csv':
+                # the csv reader requests further lines itself if a quoted value contains line breaks
+                reader = csv.reader(lines)
+                while True:
+                    record_offset = line_end_offsets[-1]
+                    cur_values = next(reader, None)
+                    if cur_values is None:
+                        return
+                    if len(cur_values) == 0:
+                        continue
+                    if len(cur_values) != len(self._csv_header):
+                        raise ValueError(f'the record at line {reader.line_num + 1} of the parametrization file '
+                                         f'`{self._path}` has {len(cur_values)} values, but the header has '
+                                         f'{len(self._csv_header)} fields')
+                    yield record_offset, dict(zip(self._csv_header, cur_values))
+            else:
+                for cur_line_no, cur_line in enumerate(lines, start=1):
+                    record_offset = line_end_offsets[-2]
+                    if not cur_line.strip():
+                        continue
+                    try:
+                        cur_record = json.loads(cur_line)
+                    except json.JSONDecodeError as exc:
+                        raise ValueError(f'the line {cur_line_no} of the parametrization file `{self._path}` is no '
+                                         f'valid json') from exc
+                    if not isinstance(cur_record, dict):
+                        raise ValueError(f'the line {cur_line_no} of the parametrization file `{self._path}` is no '
+                                         f'json object')
+                    yield record_offset, cur_record
+
+    def _get_values_of(self, record: Dict[str, Any]) -> Tuple[Any, ...]:
+        """returns the values of all fields of the given record"""
+        missing_fields = [cur_field for cur_field in self._fields if cur_field not in record]
+        if missing_fields:
+            raise ValueError(f'a record of the parametrization file `{self._path}` does not provide the fields '
+                             f'`{"`, `".join(missing_fields)}`')
+        return tuple(record[cur_field] for cur_field in self._fields)
+
+    def _get_record_offsets(self) -> array.array:
+        """returns the start offsets of all records (they are only determined once)"""
+        with self._lock:
+            if self._record_offsets is None:
+                self._record_offsets = array.array('Q', (cur_offset for cur_offset, _ in
+                                                         self._iter_records_with_offsets()))
+            return self._record_offsets
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        """returns the values of all fields of every record (the file is parsed while it is iterated)"""
+        for _, cur_record in self._iter_records_with_offsets():
+            yield self._get_values_of(cur_record)
+
+    def __len__(self) -> int:
+        return len(self._get_record_offsets())
+
+    def __getitem__(self, idx: int) -> Tuple[Any, ...]:
+        offset = self._get_record_offsets()[idx]
+        for _, cur_record in self._iter_records_with_offsets(start_offset=offset):
+            return self._get_values_of(cur_record)
+        raise IndexError(idx)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self._path)!r}, fields={list(self._fields)!r})"
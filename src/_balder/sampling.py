@@ -0,0 +1,90 @@
+from __future__ import annotations
+from typing import Iterator, List, Union
+
+import math
+import random
+import dataclasses
+
+
+@dataclasses.dataclass(frozen=True)
+class Sampling:
+    """
+    describes the subset of the variations of every scenario and the parametrizations of every test that should be
+    executed (see the session options ``--sample`` and ``--sample-ratio``)
+
+    The elements are selected with a pseudo-random permutation that is determined by the seed and a key (for example
+    the scenario and setup class). The permutation is the same in every run, but the selected window is moved by the
+    ``run`` index - with that, consecutive runs select different elements till all of them were selected once.
+    """
+    #: the maximum number of elements that should be selected (None if the ratio should be used)
+    size: Union[int, None] = None
+    #: the ratio of elements that should be selected (None if the size should be used)
+    ratio: Union[float, None] = None
+    #: the seed the permutations are determined with
+    seed: int = 0
+    #: the index of the run (it rotates the selected window)
+    run: int = 0
+
+    def __post_init__(self):
+        if (self.size is None) == (self.ratio is None):
+            raise ValueError('exactly one of the values `size` and `ratio` has to be given')
+        if self.size is not None and self.size < 1:
+            raise ValueError('the value of `size` has to be 1 or higher')
+        if self.ratio is not None and not 0 < self.ratio <= 1:
+            raise ValueError('the value of `ratio` has to be greater than 0 and not greater than 1')
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def get_sample_size(self, total: int) -> int:
+        """
+        returns the number of elements that should be selected from the given number of elements
+
+        :param total: the number of all elements
+        """
+        if self.size is not None:
+            return min(self.size, total)
+        return min(max(1, math.ceil(self.ratio * total)), total)
+
+    def iter_permuted_indexes(self, key: str, total: int) -> Iterator[int]:
+        """
+        returns all indexes of the given number of elements in a pseudo-random order - the order only depends on the
+        seed and the key, it starts at the window of the current run
+
+        The permutation is an affine mapping ``(a * i + b) % total``, so that no list of all indexes is needed.
+
+        :param key: the key that identifies the elements (the permutation is different for every key)
+        :param total: the number of all elements
+        """
+        if total == 0:
+            return
+        rnd = random.Random(f"{self.seed}:{key}")
+        factor = rnd.randrange(1, total) if total > 1 else 1
+        while math.gcd(factor, total) != 1:
+            factor = rnd.randrange(1, total)
+        offset = rnd.randrange(total)
+        start = (self.run * self.get_sample_size(total)) % total
+        for cur_position in range(total):
+            yield (factor * ((start + cur_position) % total) + offset) % total
+
+    def get_sampled_indexes(self, key: str, total: int) -> List[int]:
+        """
+        returns the sorted indexes of the elements that are selected from the given number of elements
+
+        :param key: the key that identifies the elements (the selection is different for every key)
+        :param total: the number of all elements
+        """
+        sample_size = self.get_sample_size(total)
+        result = []
+        for cur_idx in self.iter_permuted_indexes(key, total):
+            if len(result) == sample_size:
+                break
+            result.append(cur_idx)
+        return sorted(result)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+from typing import Union, List, Tuple, Set, Type, TYPE_CHECKING
+
+import pathlib
+import dataclasses
+
+if TYPE_CHECKING:
+    from _balder.setup import Setup
+    from _balder.scenario import Scenario
+
+
+@dataclasses.dataclass
+class ConcurrencyOptions:
+    """
+    contains the session options that define how many testcases and fixtures are executed at the same time
+    """
+    #: the maximum number of parallel-safe testcases of one variation that are executed at the same time
+    parallel_testcases: Union[int, None] = None
+    #: the maximum number of async testcases of one variation that run concurrently on the session event loop
+    concurrent_async_testcases: Union[int, None] = None
+    #: the maximum number of independent fixtures of one execution level that are executed at the same time
+    concurrent_fixtures: Union[int, None] = None
+
+
+@dataclasses.dataclass
+class SamplingOptions:
+    """
+    contains the session options that select a subset of the variations and the parametrized testcases
+    """
+    #: the strength of the n-wise covering array all parametrized tests are reduced to (None if not reduced)
+    parametrize_nwise: Union[int, None] = None
+    #: the seed the n-wise covering arrays of the parametrized tests are determined with
+    parametrize_seed: Union[int, None] = None
+    #: the seed of the session (used for the sampling and as default for the n-wise covering arrays)
+    seed: Union[int, None] = None
+    #: the number of variations and parametrized testcases that should be sampled (None if not sampled by number)
+    sample_size: Union[int, None] = None
+    #: the ratio of variations and parametrized testcases that should be sampled (None if not sampled by ratio)
+    sample_ratio: Union[float, None] = None
+    #: the index of the sampled run (None if the index of the last sampled run should be incremented)
+    sample_run: Union[int, None] = None
+    #: True if only a small set of variations, that covers the same devices, features and connections, is executed
+    minimal_variations: bool = False
+    #: True if only the first applicable variation of every scenario (with every setup) is determined and executed
+    first_variation_only: bool = False
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def is_sampled(self) -> bool:
+        """returns True if only a sample (selected by number or ratio) should be executed"""
+        return self.sample_size is not None or self.sample_ratio is not None
+
+
+@dataclasses.dataclass
+class FailureLimitOptions:
+    """
+    contains the session options that stop the execution after a number of failures
+    """
+    #: the maximum number of failures of the whole session (None if there is no limit)
+    max_failures: Union[int, None] = None
+    #: the maximum number of failures of every setup branch (None if there is no limit)
+    max_failures_per_setup: Union[int, None] = None
+    #: the maximum number of failures of every variation branch (None if there is no limit)
+    max_failures_per_variation: Union[int, None] = None
+
+
+@dataclasses.dataclass
+class ExecutionPlanOptions:
+    """
+    contains the session options that optimize, save or load the execution plan
+    """
+    #: specifies that the execution order should be optimized with the durations that were recorded in earlier runs
+    optimize_execution_order: Union[bool, None] = None
+    #: the file the resolved execution plan should be saved in (None if it should not be saved)
+    save_plan: Union[pathlib.Path, None] = None
+    #: the file the execution plan should be loaded from instead of resolving the tree (None if it is resolved)
+    load_plan: Union[pathlib.Path, None] = None
+
+
+@dataclasses.dataclass
+class DistributionOptions:
+    """
+    contains the session options of the distributed execution with a coordinator and workers
+    """
+    #: the address (host and port) of the coordinator - the coordinator listens on it, the workers connect to it
+    coordinator_address: Union[Tuple[str, int], None] = None
+    #: the number of workers the coordinator waits for
+    expected_workers: Union[int, None] = None
+
+
+@dataclasses.dataclass
+class SessionOptions:
+    """
+    contains all settings of a :class:`BalderSession`, that can be modified by command line arguments (see
+    :meth:`BalderSession.parse_args`) - the settings of the different features are grouped in own option objects
+    """
+    #: specifies that the tests should only be collected but not be resolved and executed
+    collect_only: Union[bool, None] = None
+    #: specifies that the tests should only be collected and resolved but not executed
+    resolve_only: Union[bool, None] = None
+    #: specifies that all discarded variations should be printed (with information why they were discarded)
+    show_discarded: Union[bool, None] = None
+    #: contains a number of :class:`Setup` class strings that should only be considered for the execution
+    only_with_setup: Union[List[str], None] = None
+    #: contains a number of :class:`Scenario` class strings that should only be considered for the execution
+    only_with_scenario: Union[List[str], None] = None
+    #: the setup and scenario classes of which every resolved setup/scenario pair has to contain at least one
+    #: (None if all pairs are resolved - the watch mode only resolves the pairs that are affected by a change)
+    only_pairs_with: Union[Set[Type[Union[Setup, Scenario]]], None] = None
+    #: if this is true, the test run should include duplicated tests that are declared as covered_by another test
+    #: method
+    force_covered_by_duplicates: Union[bool, None] = None
+    #: the options that define how many testcases and fixtures are executed at the same time
+    concurrency: ConcurrencyOptions = dataclasses.field(default_factory=ConcurrencyOptions)
+    #: the options that select a subset of the variations and the parametrized testcases
+    sampling: SamplingOptions = dataclasses.field(default_factory=SamplingOptions)
+    #: the options that stop the execution after a number of failures
+    failure_limits: FailureLimitOptions = dataclasses.field(default_factory=FailureLimitOptions)
+    #: the options that optimize, save or load the execution plan
+    plan: ExecutionPlanOptions = dataclasses.field(default_factory=ExecutionPlanOptions)
+    #: the options of the distributed execution with a coordinator and workers
+    distribution: DistributionOptions = dataclasses.field(default_factory=DistributionOptions)
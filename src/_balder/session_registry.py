@@ -0,0 +1,221 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple, Type, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from _balder.device import Device
+    from _balder.feature import Feature
+    from _balder.scenario import Scenario
+    from _balder.setup import Setup
+    from _balder.vdevice import VDevice
+    from _balder.connection import Connection
+    from _balder.feature_method_cache import FeatureMethodCache
+    from _balder.fixture_execution_level import FixtureExecutionLevel
+    from _balder.parametrization import FeatureAccessSelector
+    from _balder.controllers import Controller, DeviceController, FeatureController, ScenarioController, \
+        SetupController, VDeviceController
+
+
+class SessionRegistry:
+    """
+    This class holds all registries balder fills while an environment is imported and collected: the controllers of
+    all balder classes, everything the decorators register before the collector checks it and everything the
+    collector determines for the test methods.
+
+    Exactly one registry is active at a time. Every :class:`BalderSession` creates its own registry (with the content
+    of the base registry, that holds everything that was registered outside a session) and activates it. After
+    :meth:`BalderSession.reset` the base registry is active again, so that a new session can be executed in the same
+    process without the data of the old one.
+
+    .. note::
+        The active registry is global for the whole process, so only one session can be active at a time. A new
+        :class:`BalderSession` resets the previous session automatically, before it activates its own registry.
+    """
+    #: the registry that is active if no session is active
+    _base: SessionRegistry = None
+    #: the registry that is currently active
+    _active: SessionRegistry = None
+
+    #: the names of all attributes that contain data the collector has determined for the test methods
+    COLLECTED_DATA_NAMES = ('parametrization', 'parallel_safe_test_methods', 'dynamic_parametrization_order',
+                            'nwise_parametrization')
+    #: the names of all attributes that are dictionaries with lists or dictionaries (that contain the entries) as values
+    NESTED_NAMES = ('controllers', 'raw_fixtures', 'feature_method_caches')
+    #: the keys of the :attr:`SessionRegistry.controllers` dictionary
+    CONTROLLER_KINDS = ('device', 'feature', 'scenario', 'setup', 'vdevice')
+
+    def __init__(self):
+        #: the controllers of all balder classes - the key is the kind of the classes (one of
+        #: :attr:`SessionRegistry.CONTROLLER_KINDS`), the value contains the controllers of all classes of this kind
+        self.controllers: Dict[str, Dict[type, Controller]] = {}
+
+        #: all raw fixtures (not resolved yet) with their execution level as key (see `@balder.fixture`)
+        self.raw_fixtures: Dict[str, List[Callable]] = {}
+        #: the options of all raw fixtures (the fixture callable is the key)
+        self.raw_fixture_options: Dict[Callable, Dict[str, Any]] = {}
+        #: all methods that were decorated with `@balder.for_vdevice` (not checked yet)
+        self.possible_method_variations: Dict[Callable, List[Tuple[Union[Type[VDevice], str], Connection]]] = {}
+        #: all test methods that were decorated with `@balder.parametrize..` (not checked yet)
+        self.possible_parametrization: Dict[Callable, Dict[str, Union[Iterable[Any], FeatureAccessSelector]]] = {}
+        #: all test methods that were decorated with `@balder.parallel_safe` (not checked yet)
+        self.possible_parallel_safe_tests: List[Callable] = []
+        #: all test methods that were decorated with `@balder.parametrize_nwise` (not checked yet)
+        self.possible_nwise_parametrization: Dict[Callable, Tuple[int, Union[int, None]]] = {}
+
+        #: the checked parametrization of all test methods
+        self.parametrization: Dict[Callable, Dict[str, Union[Iterable[Any], FeatureAccessSelector]]] = {}
+        #: all checked test methods that can be executed in parallel
+        self.parallel_safe_test_methods: List[Callable] = []
+        #: the order the dynamic parametrization attributes of a test method have to be resolved in
+        self.dynamic_parametrization_order: Dict[Callable, Tuple[str, ...]] = {}
+        #: the checked strength and seed of all test methods that were decorated with `@balder.parametrize_nwise`
+        self.nwise_parametrization: Dict[Callable, Tuple[int, Union[int, None]]] = {}
+
+        #: all caches of feature methods that were decorated with `@balder.cached` with their execution level as key
+        self.feature_method_caches: Dict[FixtureExecutionLevel, List[FeatureMethodCache]] = {}
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    @staticmethod
+    def _get_module_name_of(element: Any) -> Union[str, None]:
+        """returns the name of the module the given class, function or method cache was defined in"""
+        element = getattr(element, 'func', element)
+        return getattr(element, '__module__', None)
+
+    @staticmethod
+    def _merge_entries(own_entries: Union[list, dict], other_entries: Union[list, dict],
+                       is_relevant: Callable[[Any], bool]) -> None:
+        """adds all relevant entries of the other list/dictionary, that are not part of the own one yet"""
+        if isinstance(own_entries, list):
+            own_entries.extend(cur_elem for cur_elem in other_entries
+                               if cur_elem not in own_entries and is_relevant(cur_elem))
+            return
+        for cur_key, cur_value in other_entries.items():
+            if cur_key not in own_entries and is_relevant(cur_key):
+                own_entries[cur_key] = cur_value.copy() if isinstance(cur_value, (dict, list)) else cur_value
+
+    @staticmethod
+    def _remove_entries(entries: Union[list, dict], is_relevant: Callable[[Any], bool]) -> None:
+        """removes all entries of the list/dictionary that are not relevant"""
+        if isinstance(entries, list):
+            entries[:] = [cur_elem for cur_elem in entries if is_relevant(cur_elem)]
+            return
+        for cur_key in [cur_key for cur_key in entries.keys() if not is_relevant(cur_key)]:
+            del entries[cur_key]
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    @classmethod
+    def get_active(cls) -> SessionRegistry:
+        """returns the registry that is currently active"""
+        return cls._active
+
+    @classmethod
+    def get_base(cls) -> SessionRegistry:
+        """returns the registry that is active if no session is active"""
+        return cls._base
+
+    @classmethod
+    def create_from_base(cls) -> SessionRegistry:
+        """returns a new registry that contains everything the base registry contains"""
+        new_registry = cls()
+        new_registry.merge(cls._base)
+        return new_registry
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def is_active(self) -> bool:
+        """returns True if this registry is currently active"""
+        return SessionRegistry._active is self
+
+    @property
+    def device_controllers(self) -> Dict[Type[Device], DeviceController]:
+        """returns the controllers of all device classes"""
+        return self.controllers.setdefault('device', {})
+
+    @property
+    def feature_controllers(self) -> Dict[Type[Feature], FeatureController]:
+        """returns the controllers of all feature classes"""
+        return self.controllers.setdefault('feature', {})
+
+    @property
+    def scenario_controllers(self) -> Dict[Type[Scenario], ScenarioController]:
+        """returns the controllers of all scenario classes"""
+        return self.controllers.setdefault('scenario', {})
+
+    @property
+    def setup_controllers(self) -> Dict[Type[Setup], SetupController]:
+        """returns the controllers of all setup classes"""
+        return self.controllers.setdefault('setup', {})
+
+    @property
+    def vdevice_controllers(self) -> Dict[Type[VDevice], VDeviceController]:
+        """returns the controllers of all vdevice classes"""
+        return self.controllers.setdefault('vdevice', {})
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def activate(self) -> None:
+        """
+        activates this registry - all following registrations are saved in it
+
+        :raises RuntimeError: if the registry of another session is still active (the base registry can always be
+                              activated) - a :class:`BalderSession` resets the previous session before, so this only
+                              happens if the registry is activated directly
+        """
+        active = SessionRegistry._active
+        if self is not SessionRegistry._base and active is not SessionRegistry._base and active is not self:
+            raise RuntimeError('the registry of another session is still active - only one session can be active at a '
+                               'time, reset the other session before a new one is created')
+        SessionRegistry._active = self
+
+    def merge(self, other: SessionRegistry, modules: Union[Set[str], None] = None,
+              with_collected_data: bool = True) -> None:
+        """
+        adds the content of the other registry to this registry (existing entries are not overwritten)
+
+        :param other: the registry whose content should be added
+        :param modules: the names of the modules whose entries should be added (all entries if None)
+        :param with_collected_data: False if the data the collector has determined for the test methods should not be
+                                    added (only the controllers and the elements the decorators have registered)
+        """
+        def is_relevant(element):
+            return modules is None or self._get_module_name_of(element) in modules
+
+        for cur_name in self.__dict__.keys():
+            if not with_collected_data and cur_name in self.COLLECTED_DATA_NAMES:
+                continue
+            own_value = getattr(self, cur_name)
+            other_value = getattr(other, cur_name)
+            if cur_name in self.NESTED_NAMES:
+                for cur_key, cur_entries in other_value.items():
+                    self._merge_entries(own_value.setdefault(cur_key, type(cur_entries)()), cur_entries, is_relevant)
+            else:
+                self._merge_entries(own_value, other_value, is_relevant)
+
+    def remove_all_except(self, modules: Set[str]) -> None:
+        """
+        removes all entries of this registry that do not belong to one of the given modules
+
+        :param modules: the names of the modules whose entries should be kept
+        """
+        def is_relevant(element):
+            return self._get_module_name_of(element) in modules
+
+        for cur_name, cur_value in self.__dict__.items():
+            if cur_name in self.NESTED_NAMES:
+                for cur_entries in cur_value.values():
+                    self._remove_entries(cur_entries, is_relevant)
+            else:
+                self._remove_entries(cur_value, is_relevant)
+
+    def clear(self) -> None:
+        """removes all entries of this registry"""
+        for cur_value in self.__dict__.values():
+            cur_value.clear()
+
+
+SessionRegistry._base = SessionRegistry()  # pylint: disable=protected-access
+SessionRegistry._active = SessionRegistry._base  # pylint: disable=protected-access
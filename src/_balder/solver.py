@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List, Dict, Tuple, Type, Union, Callable, TYPE_CHECKING
+from typing import List, Dict, Iterable, Iterator, Set, Tuple, Type, Union, Callable, Hashable, TYPE_CHECKING
 
 import itertools
 from _balder.fixture_manager import FixtureManager
@@ -8,10 +8,12 @@ from _balder.executor.setup_executor import SetupExecutor
 from _balder.executor.scenario_executor import ScenarioExecutor
 from _balder.executor.testcase_executor import TestcaseExecutor
 from _balder.executor.variation_executor import VariationExecutor
-from _balder.executor.parametrized_testcase_executor import ParametrizedTestcaseExecutor
 from _balder.executor.unresolved_parametrized_testcase_executor import UnresolvedParametrizedTestcaseExecutor
 from _balder.previous_executor_mark import PreviousExecutorMark
-from _balder.controllers import ScenarioController, SetupController
+from _balder.sampling import Sampling
+from _balder.controllers import DeviceController, ScenarioController, SetupController
+from _balder.exceptions import ExecutionPlanError
+from _balder.utils.functions import get_class_id
 
 if TYPE_CHECKING:
     from _balder.setup import Setup
@@ -19,6 +21,7 @@ if TYPE_CHECKING:
     from _balder.scenario import Scenario
     from _balder.connection import Connection
     from _balder.plugin_manager import PluginManager
+    from _balder.execution_plan import ExecutionPlan
 
 
 class Solver:
@@ -28,7 +31,8 @@ class Solver:
     """
 
     def __init__(self, setups: List[Type[Setup]], scenarios: List[Type[Scenario]], connections: List[Type[Connection]],
-                 fixture_manager: Union[FixtureManager, None]):
+                 fixture_manager: Union[FixtureManager, None],
+                 only_pairs_with: Union[Set[Type[Union[Setup, Scenario]]], None] = None):
         #: contains all available setup classes
         self._all_existing_setups = setups
         #: contains all available scenario classes
@@ -40,6 +44,13 @@ class Solver:
         #: methods
         self._mapping: List[Tuple[Type[Setup], Type[Scenario], Dict[Type[Device], Type[Device]]]] = []
         self._resolving_was_executed = False
+        #: True if only the first applicable device mapping of every setup/scenario pair should be determined
+        self._first_variation_only = False
+        #: the setup and scenario classes of which every resolved setup/scenario pair has to contain at least one
+        #: (None if all pairs are resolved)
+        self._only_pairs_with = only_pairs_with
+        #: the plan the mappings were loaded from (None if they were resolved) - only its test methods are added
+        self._execution_plan: Union[ExecutionPlan, None] = None
 
         self._fixture_manager = fixture_manager
 
@@ -56,10 +67,12 @@ class Solver:
         # now determine all covered_by items
         all_scenarios = executor_tree.get_all_scenario_executors()
         all_testcases = executor_tree.get_all_testcase_executors()
-        all_available_testcase_functions = [
-            cur_testcase_executor.base_testcase_callable for cur_testcase_executor in all_testcases]
-        all_available_scenario_classes = [
-            cur_scenario_executor.base_scenario_class for cur_scenario_executor in all_scenarios]
+        # the first executor of every scenario class and test method
+        first_executor_by_item = {}
+        for cur_scenario_executor in all_scenarios:
+            first_executor_by_item.setdefault(cur_scenario_executor.base_scenario_class, cur_scenario_executor)
+        for cur_testcase_executor in all_testcases:
+            first_executor_by_item.setdefault(cur_testcase_executor.base_testcase_callable, cur_testcase_executor)
 
         covered_by_mapping_of_interest = {}
         for cur_scenario in all_scenarios:
@@ -74,15 +87,9 @@ class Solver:
 
         # now go throw all covered_by items and check if the destination is contained in the tree -> set prev_mark
         for cur_elem, covered_from_items in covered_by_mapping_of_interest.items():
-            all_matched_covered_from_executors = []
-            for cur_covered_from_item in covered_from_items:
-                if cur_covered_from_item in all_available_scenario_classes:
-                    all_matched_covered_from_executors.append(
-                        all_scenarios[all_available_scenario_classes.index(cur_covered_from_item)])
-
-                elif cur_covered_from_item in all_available_testcase_functions:
-                    all_matched_covered_from_executors.append(
-                        all_testcases[all_available_testcase_functions.index(cur_covered_from_item)])
+            all_matched_covered_from_executors = [first_executor_by_item[cur_covered_from_item]
+                                                  for cur_covered_from_item in covered_from_items
+                                                  if cur_covered_from_item in first_executor_by_item]
             if len(all_matched_covered_from_executors) > 0:
                 cur_elem.prev_mark = PreviousExecutorMark.COVERED_BY
                 cur_elem.covered_by_executors = all_matched_covered_from_executors
@@ -104,7 +111,7 @@ class Solver:
         """
         This method searches for all possible hits for the internal lists `_all_existing_setups` and
         `_all_existing_scenarios`. It returns all combinations of :meth:`Setup`'s and :meth:`Scenario`'s that could
-        exist.
+        exist (if `_only_pairs_with` is given, only the pairs that contain at least one of its classes).
 
         :return: a list with tuple pairs that defines all possible pairs of :meth:`Setup` classes and :meth:`Scenario`
                  classes
@@ -112,9 +119,138 @@ class Solver:
         matching_list = []
         for cur_setup in self._all_existing_setups:
             for cur_scenario in self._all_existing_scenarios:
+                if self._only_pairs_with is not None and cur_setup not in self._only_pairs_with \
+                        and cur_scenario not in self._only_pairs_with:
+                    continue
                 matching_list.append((cur_setup, cur_scenario))
         return matching_list
 
+    @staticmethod
+    def _provides_features_of(setup_device: Type[Device], scenario_device: Type[Device]) -> bool:
+        """
+        This method returns True if the setup device has an instance of every feature type the scenario device uses
+        (the method does not check the vDevice mappings, it is only a cheap preselection)
+        """
+        setup_features = DeviceController.get_for(setup_device).get_all_instantiated_feature_objects().values()
+        scenario_features = DeviceController.get_for(scenario_device).get_all_instantiated_feature_objects().values()
+        for cur_scenario_feature in scenario_features:
+            if not any(isinstance(cur_setup_feature, cur_scenario_feature.__class__)
+                       for cur_setup_feature in setup_features):
+                return False
+        return True
+
+    def _iter_device_mappings_for(
+            self,
+            setup: Type[Setup],
+            scenario: Type[Scenario]
+    ) -> Iterator[Dict[Type[Device], Type[Device]]]:
+        """
+        This method returns all device mappings between the given scenario and setup lazily - it returns the same
+        mappings as :meth:`Solver.get_initial_mapping`, but in an order, in which the first mappings are likely to be
+        applicable:
+
+        * the scenario devices with the most features and connections are mapped first
+        * setup devices that provide all feature types of the scenario device are tried first
+        * setup devices that are directly connected to the setup devices of all already mapped scenario neighbours are
+          tried before the other ones
+
+        :param setup: the setup class
+        :param scenario: the scenario class
+
+        :return: a generator that returns the device mappings (the keys are in the order of the scenario devices)
+        """
+        setup_devices = SetupController.get_for(setup).get_all_abs_inner_device_classes()
+        scenario_devices = ScenarioController.get_for(scenario).get_all_abs_inner_device_classes()
+        if len(scenario_devices) > len(setup_devices):
+            return
+
+        def get_neighbours(connections: List[Connection]) -> Dict[Type[Device], Set[Type[Device]]]:
+            neighbours = {}
+            for cur_cnn in connections:
+                neighbours.setdefault(cur_cnn.from_device, set()).add(cur_cnn.to_device)
+                neighbours.setdefault(cur_cnn.to_device, set()).add(cur_cnn.from_device)
+            return neighbours
+        scenario_neighbours = get_neighbours(ScenarioController.get_for(scenario).get_all_abs_connections())
+        setup_neighbours = get_neighbours(SetupController.get_for(setup).get_all_abs_connections())
+
+        search_order = sorted(
+            scenario_devices,
+            key=lambda dev: -(len(DeviceController.get_for(dev).get_all_instantiated_feature_objects())
+                              + len(scenario_neighbours.get(dev, set()))))
+        preferred_setup_devices = {
+            cur_scenario_device: sorted(
+                setup_devices, key=lambda dev, scenario_dev=cur_scenario_device: not self._provides_features_of(
+                    dev, scenario_dev))
+            for cur_scenario_device in scenario_devices
+        }
+
+        def search(mapping: Dict[Type[Device], Type[Device]]) -> Iterator[Dict[Type[Device], Type[Device]]]:
+            if len(mapping) == len(search_order):
+                yield {cur_scenario_device: mapping[cur_scenario_device] for cur_scenario_device in scenario_devices}
+                return
+            cur_scenario_device = search_order[len(mapping)]
+            mapped_neighbours = [mapping[cur_neighbour]
+                                 for cur_neighbour in scenario_neighbours.get(cur_scenario_device, set())
+                                 if cur_neighbour in mapping]
+            used_setup_devices = set(mapping.values())
+            candidates = sorted(
+                [cur_setup_device for cur_setup_device in preferred_setup_devices[cur_scenario_device]
+                 if cur_setup_device not in used_setup_devices],
+                key=lambda dev: not all(cur_neighbour in setup_neighbours.get(dev, set())
+                                        for cur_neighbour in mapped_neighbours))
+            for cur_setup_device in candidates:
+                mapping[cur_scenario_device] = cur_setup_device
+                yield from search(mapping)
+                del mapping[cur_scenario_device]
+
+        yield from search({})
+
+    def _get_scenario_executor_for(
+            self,
+            executor_tree: ExecutorTree,
+            setup: Type[Setup],
+            scenario: Type[Scenario]
+    ) -> ScenarioExecutor:
+        """
+        This method returns the scenario executor for the given setup and scenario - the setup and scenario executors
+        are created if they do not exist yet
+        """
+        setup_executor = executor_tree.get_executor_for_setup(setup=setup)
+        if setup_executor is None:
+            # setup is not available -> create new SetupExecutor
+            setup_executor = SetupExecutor(setup, parent=executor_tree)
+            executor_tree.add_setup_executor(setup_executor)
+
+        scenario_executor = setup_executor.get_executor_for_scenario(scenario=scenario)
+        if scenario_executor is None:
+            # scenario is not available -> create new ScenarioExecutor
+            scenario_executor = ScenarioExecutor(scenario, parent=setup_executor)
+            setup_executor.add_scenario_executor(scenario_executor)
+        return scenario_executor
+
+    def _get_first_variation_executors_for(
+            self,
+            scenario_executor: ScenarioExecutor,
+            device_mappings: Iterator[Dict[Type[Device], Type[Device]]]
+    ) -> List[VariationExecutor]:
+        """
+        This method verifies the given device mappings till the first applicable variation is found. All remaining
+        device mappings are never determined.
+
+        :param scenario_executor: the scenario executor the variations belong to
+        :param device_mappings: the device mappings in the order they should be verified
+
+        :return: all verified variation executors (only the last one can be applicable)
+        """
+        variation_executors = []
+        for cur_device_mapping in device_mappings:
+            variation_executor = VariationExecutor(device_mapping=cur_device_mapping, parent=scenario_executor)
+            variation_executor.verify_applicability()
+            variation_executors.append(variation_executor)
+            if variation_executor.can_be_applied():
+                break
+        return variation_executors
+
     # ---------------------------------- METHODS -----------------------------------------------------------------------
 
     def get_initial_mapping(self) -> List[Tuple[Type[Setup], Type[Scenario], Dict[Type[Device], Type[Device]]]]:
@@ -142,25 +278,70 @@ class Solver:
                     mapping.append((cur_setup, cur_scenario, device_mapping))
         return mapping
 
-    def resolve(self, plugin_manager: PluginManager) -> None:  # pylint: disable=unused-argument
+    # pylint: disable-next=unused-argument
+    def resolve(self, plugin_manager: PluginManager, first_variation_only: bool = False) -> None:
         """
         This method carries out the entire resolve process and saves the end result in the object property
         `self._mapping`.
+
+        :param plugin_manager: the related plugin manager object
+        :param first_variation_only: True if only the first applicable device mapping of every setup/scenario pair
+                                     should be determined - the mappings are not determined here, but lazily while
+                                     the executor tree is built (`self._mapping` only contains the found mappings then)
         """
         # reset mapping list
         self._mapping = []
+        self._first_variation_only = first_variation_only
+        if first_variation_only:
+            self._resolving_was_executed = True
+            return
         initial_mapping = self.get_initial_mapping()
         self._mapping = initial_mapping
         self._resolving_was_executed = True
 
-    def get_static_parametrized_testcase_executor_for(
+    def resolve_from_plan(self, execution_plan: ExecutionPlan, with_discarded: bool = False) -> None:
+        """
+        This method loads the mappings from the given execution plan instead of resolving them. The device mappings
+        of the plan are used as they are - only the variations are verified again, while the executor tree is built.
+
+        :param execution_plan: the execution plan the mappings should be loaded from
+        :param with_discarded: True if the discarded variations of the plan should be loaded too
+        """
+        setups = {get_class_id(cur_setup): cur_setup for cur_setup in self._all_existing_setups}
+        scenarios = {get_class_id(cur_scenario): cur_scenario for cur_scenario in self._all_existing_scenarios}
+        self._mapping = []
+        self._first_variation_only = False
+        for cur_variation in execution_plan.variations:
+            if not cur_variation['applicable'] and not with_discarded:
+                continue
+            if cur_variation['setup'] not in setups or cur_variation['scenario'] not in scenarios:
+                raise ExecutionPlanError(f"can not find the setup or scenario of the planned variation "
+                                         f"`{cur_variation['id']}` - resolve the plan again")
+            cur_setup = setups[cur_variation['setup']]
+            cur_scenario = scenarios[cur_variation['scenario']]
+            setup_devices = {get_class_id(cur_device): cur_device
+                             for cur_device in SetupController.get_for(cur_setup).get_all_abs_inner_device_classes()}
+            scenario_devices = {
+                get_class_id(cur_device): cur_device
+                for cur_device in ScenarioController.get_for(cur_scenario).get_all_abs_inner_device_classes()}
+            try:
+                device_mapping = {scenario_devices[cur_scenario_device]: setup_devices[cur_setup_device]
+                                  for cur_scenario_device, cur_setup_device in cur_variation['device_mapping'].items()}
+            except KeyError as exc:
+                raise ExecutionPlanError(f"can not find the device {exc} of the planned variation "
+                                         f"`{cur_variation['id']}` - resolve the plan again") from exc
+            self._mapping.append((cur_setup, cur_scenario, device_mapping))
+        self._execution_plan = execution_plan
+        self._resolving_was_executed = True
+
+    def get_parametrized_testcase_executor_for(
             self,
             variation_executor: VariationExecutor,
             testcase: Callable
-    ) -> List[UnresolvedParametrizedTestcaseExecutor | ParametrizedTestcaseExecutor]:
+    ) -> UnresolvedParametrizedTestcaseExecutor:
         """
-        returns a list of all testcase executors, with already resolved static parametrization -
-        :class:`UnresolvedParametrizedTest` will be returned for unresolved dynamic parametrization
+        returns the group executor for all parametrized testcases of the given test method within the variation - the
+        single :class:`ParametrizedTestcaseExecutor` objects are created while the variation is executed
 
         :param variation_executor: the current variation executor
         :param testcase: the current testcase
@@ -171,67 +352,208 @@ class Solver:
             raise ValueError(f'can not determine parametrization for test `{testcase.__qualname__}` because no '
                              f'parametrization exist')
         static_parametrization = scenario_controller.get_parametrization_for(testcase, static=True, dynamic=False)
-        executor_typ = UnresolvedParametrizedTestcaseExecutor \
-            if scenario_controller.get_parametrization_for(testcase, static=False, dynamic=True) \
-            else ParametrizedTestcaseExecutor
+        return UnresolvedParametrizedTestcaseExecutor(testcase, variation_executor, static_parametrization)
 
-        if not static_parametrization:
-            return [executor_typ(testcase, parent=variation_executor)]
+    def _get_sampled_variation_executors_for(
+            self,
+            scenario_executor: ScenarioExecutor,
+            device_mappings: List[Dict[Type[Device], Type[Device]]],
+            sampling: Sampling
+    ) -> List[VariationExecutor]:
+        """
+        This method selects the variations of the given device mappings that should be executed according the
+        sampling. The device mappings are verified in the pseudo-random order of the sampling till enough applicable
+        variations were found - all remaining device mappings are never verified.
 
-        # generate product
-        result = []
-        for cur_product in itertools.product(*static_parametrization.values()):
-            cur_product_parametrization = dict(zip(static_parametrization.keys(), cur_product))
-            result.append(executor_typ(testcase, variation_executor, cur_product_parametrization))
-        return result
+        :param scenario_executor: the scenario executor the variations belong to
+        :param device_mappings: all device mappings of the scenario with the setup of the scenario executor
+        :param sampling: the sampling that defines the selected variations
 
-    # pylint: disable-next=unused-argument
-    def get_executor_tree(self, plugin_manager: PluginManager, add_discarded=False) -> ExecutorTree:
+        :return: the selected variation executors in the order of the device mappings
+        """
+        key = f"{scenario_executor.parent_executor.base_setup_class.__class__.__qualname__}::" \
+              f"{scenario_executor.base_scenario_class.__class__.__qualname__}"
+        sample_size = sampling.get_sample_size(len(device_mappings))
+        selected = {}
+        for cur_idx in sampling.iter_permuted_indexes(key, len(device_mappings)):
+            if len(selected) == sample_size:
+                break
+            variation_executor = VariationExecutor(device_mapping=device_mappings[cur_idx], parent=scenario_executor)
+            variation_executor.verify_applicability()
+            if variation_executor.can_be_applied():
+                selected[cur_idx] = variation_executor
+        return [selected[cur_idx] for cur_idx in sorted(selected.keys())]
+
+    @staticmethod
+    def _get_coverage_facts_of(variation_executor: VariationExecutor) -> Set[Tuple[Hashable, ...]]:
+        """
+        This method returns all facts the given (applicable) variation covers. These facts are:
+
+        * ``('device', scenario device, base classes of the mapped setup device)`` - setup devices that have the same
+          base classes are the same kind of device
+        * ``('feature', scenario device, attribute name, setup feature class)`` for every feature of the scenario device
+        * ``('connection', from device, to device, tree string of the routed connection)`` for every valid routing of
+          every scenario connection
+
+        :param variation_executor: the variation executor, the facts should be returned for
+
+        :return: a set with all facts of the variation
+        """
+        facts = set()
+        for cur_scenario_device, cur_setup_device in variation_executor.base_device_mapping.items():
+            facts.add(('device', cur_scenario_device, cur_setup_device.__bases__))
+            for cur_mapping in variation_executor.feature_replacement[cur_scenario_device].mappings:
+                if cur_mapping.scenario_feature is not None:
+                    facts.add(('feature', cur_scenario_device, cur_mapping.attr_name,
+                               cur_mapping.setup_feature.__class__))
+        for cur_scenario_cnn, cur_routings in variation_executor.routings.items():
+            for cur_routing in cur_routings:
+                facts.add(('connection', cur_scenario_cnn.from_device, cur_scenario_cnn.to_device,
+                           cur_routing.get_virtual_connection().get_tree_str()))
+        return facts
+
+    def _get_minimal_variation_executors_for(
+            self,
+            scenario_executor: ScenarioExecutor,
+            device_mappings: List[Dict[Type[Device], Type[Device]]],
+    ) -> List[VariationExecutor]:
+        """
+        This method selects a small set of applicable variations, that covers the same facts (see
+        :meth:`Solver._get_coverage_facts_of`) as all applicable variations together. The variations are selected with
+        a greedy set cover: the variation that covers the most uncovered facts is selected till every fact is covered
+        (ties are resolved by the order of the device mappings).
+
+        :param scenario_executor: the scenario executor the variations belong to
+        :param device_mappings: all device mappings of the scenario with the setup of the scenario executor
+
+        :return: the not applicable variation executors and the selected ones in the order of the device mappings
+        """
+        all_variation_executors = []
+        facts_of_applicable_variations: Dict[int, Set[Tuple[Hashable, ...]]] = {}
+        for cur_idx, cur_device_mapping in enumerate(device_mappings):
+            variation_executor = VariationExecutor(device_mapping=cur_device_mapping, parent=scenario_executor)
+            variation_executor.verify_applicability()
+            all_variation_executors.append(variation_executor)
+            if variation_executor.can_be_applied():
+                facts_of_applicable_variations[cur_idx] = self._get_coverage_facts_of(variation_executor)
+
+        uncovered = set().union(*facts_of_applicable_variations.values())
+        selected_indexes = set()
+        while uncovered:
+            best_idx = max(facts_of_applicable_variations.keys(),
+                           key=lambda idx: len(facts_of_applicable_variations[idx] & uncovered))
+            selected_indexes.add(best_idx)
+            uncovered -= facts_of_applicable_variations[best_idx]
+        return [cur_variation_executor for cur_idx, cur_variation_executor in enumerate(all_variation_executors)
+                if cur_idx in selected_indexes or cur_idx not in facts_of_applicable_variations]
+
+    def _get_variation_executors_for(
+            self,
+            scenario_executor: ScenarioExecutor,
+            device_mappings: Iterable[Dict[Type[Device], Type[Device]]],
+            sampling: Union[Sampling, None],
+            minimal_variations: bool
+    ) -> List[VariationExecutor]:
+        """
+        This method creates and verifies the variation executors of the given device mappings, that should be added
+        to the scenario executor (see :meth:`Solver.get_executor_tree` for the parameters)
+
+        :param scenario_executor: the scenario executor the variations belong to
+        :param device_mappings: all device mappings of the scenario with the setup of the scenario executor
+
+        :return: the variation executors in the order they should be added
+        """
+        if self._first_variation_only:
+            variation_executors = self._get_first_variation_executors_for(scenario_executor, device_mappings)
+            self._mapping.extend(
+                (scenario_executor.parent_executor.base_setup_class.__class__,
+                 scenario_executor.base_scenario_class.__class__, cur_variation_executor.base_device_mapping)
+                for cur_variation_executor in variation_executors if cur_variation_executor.can_be_applied())
+            return variation_executors
+        if sampling is not None:
+            return self._get_sampled_variation_executors_for(scenario_executor, device_mappings, sampling)
+        if minimal_variations:
+            return self._get_minimal_variation_executors_for(scenario_executor, device_mappings)
+        variation_executors = []
+        for cur_device_mapping in device_mappings:
+            variation_executor = VariationExecutor(device_mapping=cur_device_mapping, parent=scenario_executor)
+            variation_executor.verify_applicability()
+            variation_executors.append(variation_executor)
+        return variation_executors
+
+    def _add_testcase_executors_to(self, variation_executor: VariationExecutor):
+        """
+        This method adds the testcase executors for all test methods of the scenario to the given variation executor
+
+        :param variation_executor: the variation executor the testcase executors should be added to
+        """
+        scenario_controller = variation_executor.parent_executor.base_scenario_controller
+        planned_names = None
+        if self._execution_plan is not None:
+            planned_names = self._execution_plan.get_testcase_names_of(variation_executor.executor_id)
+        for cur_testcase in scenario_controller.get_all_test_methods():
+            if planned_names is not None and cur_testcase.__name__ not in planned_names:
+                continue
+            # we have a parametrization for this test case
+            if scenario_controller.get_parametrization_for(cur_testcase):
+                variation_executor.add_testcase_executor(
+                    self.get_parametrized_testcase_executor_for(variation_executor, cur_testcase))
+            else:
+                testcase_executor = TestcaseExecutor(cur_testcase, parent=variation_executor)
+                variation_executor.add_testcase_executor(testcase_executor)
+
+    def get_executor_tree(
+            self,
+            plugin_manager: PluginManager,  # pylint: disable=unused-argument
+            add_discarded=False,
+            sampling: Union[Sampling, None] = None,
+            minimal_variations: bool = False
+    ) -> ExecutorTree:
         """
         This method builds the ExecutorTree from the resolved data and returns it
 
         :param plugin_manager: the related plugin manager object
         :param add_discarded: True in case discarded elements should be added to the tree, otherwise False
+        :param sampling: the sampling that selects the executed variations and parametrizations (None if all of them
+                         should be executed) - the variations are selected while the tree is built, so that no
+                         executors are created for variations that are not selected
+        :param minimal_variations: True if only a small set of variations should be added for every scenario, that
+                                   covers every scenario device with every kind of setup device, every feature
+                                   implementation and every routed connection type at least once
 
         :return: the executor tree is built on the basis of the mapping data
         """
 
         executor_tree = ExecutorTree(self._fixture_manager)
-
-        # create all setup executor
-
-        for cur_setup, cur_scenario, cur_device_mapping in self._mapping:
-            setup_executor = executor_tree.get_executor_for_setup(setup=cur_setup)
-            if setup_executor is None:
-                # setup is not available -> create new SetupExecutor
-                setup_executor = SetupExecutor(cur_setup, parent=executor_tree)
-                executor_tree.add_setup_executor(setup_executor)
-
-            scenario_executor = setup_executor.get_executor_for_scenario(scenario=cur_scenario)
-            if scenario_executor is None:
-                # scenario is not available -> create new ScenarioExecutor
-                scenario_executor = ScenarioExecutor(cur_scenario, parent=setup_executor)
-                setup_executor.add_scenario_executor(scenario_executor)
-
-            variation_executor = scenario_executor.get_executor_for_device_mapping(device_mapping=cur_device_mapping)
-            if variation_executor is None:
-                # variation is not available -> create new VariationExecutor
-                variation_executor = VariationExecutor(device_mapping=cur_device_mapping, parent=scenario_executor)
-                variation_executor.verify_applicability()
-
-                scenario_executor.add_variation_executor(variation_executor)
-
-                for cur_testcase in scenario_executor.base_scenario_controller.get_all_test_methods():
-                    # we have a parametrization for this test case
-                    if scenario_executor.base_scenario_controller.get_parametrization_for(cur_testcase):
-                        testcase_executors = self.get_static_parametrized_testcase_executor_for(
-                            variation_executor, cur_testcase
-                        )
-                        for cur_testcase_executor in testcase_executors:
-                            variation_executor.add_testcase_executor(cur_testcase_executor)
-                    else:
-                        testcase_executor = TestcaseExecutor(cur_testcase, parent=variation_executor)
-                        variation_executor.add_testcase_executor(testcase_executor)
+        executor_tree.sampling = sampling
+
+        if self._first_variation_only and (sampling is not None or minimal_variations):
+            raise ValueError('the sampling and the minimal variations can not be used if the solver only resolves the '
+                             'first variation')
+
+        # create all setup and scenario executor
+        device_mappings_per_scenario_executor: \
+            Dict[ScenarioExecutor, Iterable[Dict[Type[Device], Type[Device]]]] = {}
+        if self._first_variation_only:
+            # the device mappings are determined lazily, so that only the mappings till the first applicable one are
+            # created (`self._mapping` only contains the found mappings)
+            self._mapping = []
+            for cur_setup, cur_scenario in self._get_all_unfiltered_mappings():
+                scenario_executor = self._get_scenario_executor_for(executor_tree, cur_setup, cur_scenario)
+                device_mappings_per_scenario_executor[scenario_executor] = \
+                    self._iter_device_mappings_for(cur_setup, cur_scenario)
+        else:
+            for cur_setup, cur_scenario, cur_device_mapping in self._mapping:
+                scenario_executor = self._get_scenario_executor_for(executor_tree, cur_setup, cur_scenario)
+                device_mappings_per_scenario_executor.setdefault(scenario_executor, []).append(cur_device_mapping)
+
+        # create all variation executor
+        for cur_scenario_executor, cur_device_mappings in device_mappings_per_scenario_executor.items():
+            variation_executors = self._get_variation_executors_for(
+                cur_scenario_executor, cur_device_mappings, sampling, minimal_variations)
+            for cur_variation_executor in variation_executors:
+                cur_scenario_executor.add_variation_executor(cur_variation_executor)
+                self._add_testcase_executors_to(cur_variation_executor)
 
         # now filter all elements that have no child elements
         #   -> these are items that have no valid matching, because no variation can be applied for it (there are no
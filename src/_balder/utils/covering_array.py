@@ -0,0 +1,161 @@
+from __future__ import annotations
+from typing import Any, Dict, List, Set, Tuple, Union
+
+import random
+import itertools
+from collections import OrderedDict
+
+#: the number of candidate rows that are generated for every row of the covering array (the best one is used)
+CANDIDATES_PER_ROW = 30
+
+
+def _get_all_tuples_of(indexes: Tuple[int, ...], strength: int) -> Set[Tuple[Tuple[int, int], ...]]:
+    """
+    returns all t-tuples that are covered by one row - a t-tuple consists of `strength` pairs of the parameter position
+    and the index of the value
+
+    :param indexes: the index of the value for every parameter position
+    :param strength: the number of parameters every t-tuple consists of
+    """
+    return set(itertools.combinations(enumerate(indexes), strength))
+
+
+def _count_new_tuples(
+        partial_row: Dict[int, int],
+        position: int,
+        value_idx: int,
+        strength: int,
+        uncovered: Set[Tuple[Tuple[int, int], ...]]
+) -> int:
+    """
+    returns the number of uncovered t-tuples, that would be covered if the parameter at `position` of the partial row
+    gets the value with the index `value_idx` (only t-tuples that consist of already fixed parameters are considered)
+    """
+    fixed_positions = sorted(partial_row.keys())
+    count = 0
+    for cur_other_positions in itertools.combinations(fixed_positions, strength - 1):
+        cur_tuple = tuple(sorted([(cur_pos, partial_row[cur_pos]) for cur_pos in cur_other_positions]
+                                 + [(position, value_idx)]))
+        if cur_tuple in uncovered:
+            count += 1
+    return count
+
+
+def _get_candidate_row(
+        rnd: random.Random,
+        partial_row: Dict[int, int],
+        values: List[List[Any]],
+        strength: int,
+        uncovered: Set[Tuple[Tuple[int, int], ...]]
+) -> Tuple[int, ...]:
+    """
+    returns a candidate row (the value index of every parameter) that is completed from the given partial row - the
+    remaining parameters are fixed in a random order, every one with the value that covers the most uncovered t-tuples
+    """
+    remaining_positions = [cur_pos for cur_pos in range(len(values)) if cur_pos not in partial_row]
+    rnd.shuffle(remaining_positions)
+    for cur_pos in remaining_positions:
+        value_indexes = list(range(len(values[cur_pos])))
+        rnd.shuffle(value_indexes)
+        partial_row[cur_pos] = max(
+            value_indexes,
+            key=lambda idx, row=partial_row, pos=cur_pos: _count_new_tuples(row, pos, idx, strength, uncovered))
+    return tuple(partial_row[cur_pos] for cur_pos in range(len(values)))
+
+
+def get_covering_array(
+        parameters: OrderedDict[str, List[Any]],
+        strength: int,
+        seed: Union[int, None] = None
+) -> List[OrderedDict[str, Any]]:
+    """
+    This function returns a covering array of the given parameters. Every combination of values of any `strength`
+    parameters is part of at least one returned row. The rows are determined with a greedy algorithm (similar to AETG)
+    that generates a number of candidate rows and adds the one that covers the most combinations that are not covered
+    yet. The returned rows are the same for the same parameters, strength and seed.
+
+    If the strength is equal or greater than the number of parameters, the full cartesian product is returned.
+
+    :param parameters: the values of every parameter (the parameter name as key)
+    :param strength: the number of parameters every combination should consist of (2 for pairwise)
+    :param seed: the seed of the random number generator that orders the candidates
+    """
+    if strength < 1:
+        raise ValueError('the strength of a covering array has to be 1 or higher')
+    names = list(parameters.keys())
+    values = [list(cur_values) for cur_values in parameters.values()]
+    if any(len(cur_values) == 0 for cur_values in values):
+        return []
+    if strength >= len(names):
+        return [OrderedDict(zip(names, cur_product)) for cur_product in itertools.product(*values)]
+
+    rnd = random.Random(seed)
+    uncovered = set()
+    for cur_positions in itertools.combinations(range(len(names)), strength):
+        for cur_value_indexes in itertools.product(*[range(len(values[cur_pos])) for cur_pos in cur_positions]):
+            uncovered.add(tuple(zip(cur_positions, cur_value_indexes)))
+
+    rows: List[Tuple[int, ...]] = []
+    while uncovered:
+        # sort before choosing to be independent of the (hash based) order of the set
+        sorted_uncovered = sorted(uncovered)
+        best_row = None
+        best_covered = set()
+        for _ in range(CANDIDATES_PER_ROW):
+            # every candidate starts with one uncovered t-tuple, so that every candidate covers something new
+            candidate = _get_candidate_row(rnd, dict(rnd.choice(sorted_uncovered)), values, strength, uncovered)
+            covered = _get_all_tuples_of(candidate, strength) & uncovered
+            if len(covered) > len(best_covered):
+                best_row, best_covered = candidate, covered
+        rows.append(best_row)
+        uncovered -= best_covered
+
+    return [OrderedDict((names[cur_pos], values[cur_pos][cur_idx]) for cur_pos, cur_idx in enumerate(cur_row))
+            for cur_row in rows]
+
+
+def select_covering_rows(
+        rows: List[OrderedDict[str, Any]],
+        strength: int,
+        seed: Union[int, None] = None
+) -> List[OrderedDict[str, Any]]:
+    """
+    This function selects a subset of the given rows, so that every combination of values of any `strength` parameters
+    that exists in the given rows, is still part of at least one selected row. It is used if not all combinations of
+    the values are valid (for example for dynamic parametrization, where the values of one parameter depend on
+    another one). The rows are selected with a greedy set cover, the selected rows keep their original order.
+
+    :param rows: all possible rows (they need to have the same keys)
+    :param strength: the number of parameters every combination should consist of (2 for pairwise)
+    :param seed: the seed of the random number generator that breaks ties
+    """
+    if strength < 1:
+        raise ValueError('the strength of a covering array has to be 1 or higher')
+    if len(rows) == 0 or strength >= len(rows[0]):
+        return list(rows)
+
+    # the values are indexed by equality (they do not need to be hashable)
+    known_values: Dict[str, List[Any]] = {cur_name: [] for cur_name in rows[0].keys()}
+
+    def get_index_of(name: str, value: Any) -> int:
+        for cur_idx, cur_known_value in enumerate(known_values[name]):
+            if cur_known_value == value:
+                return cur_idx
+        known_values[name].append(value)
+        return len(known_values[name]) - 1
+
+    tuples_of_rows = [
+        _get_all_tuples_of(tuple(get_index_of(cur_name, cur_value) for cur_name, cur_value in cur_row.items()),
+                           strength)
+        for cur_row in rows
+    ]
+    uncovered = set().union(*tuples_of_rows)
+
+    candidate_order = list(range(len(rows)))
+    random.Random(seed).shuffle(candidate_order)
+    selected_indexes = []
+    while uncovered:
+        best_idx = max(candidate_order, key=lambda idx: len(tuples_of_rows[idx] & uncovered))
+        selected_indexes.append(best_idx)
+        uncovered -= tuples_of_rows[best_idx]
+    return [rows[cur_idx] for cur_idx in sorted(selected_indexes)]
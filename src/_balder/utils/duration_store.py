@@ -0,0 +1,110 @@
+from __future__ import annotations
+from typing import Dict, Union, TYPE_CHECKING
+
+import json
+import pathlib
+from _balder.executor.testcase_executor import TestcaseExecutor
+
+if TYPE_CHECKING:
+    from _balder.executor.executor_tree import ExecutorTree
+    from _balder.executor.basic_executable_executor import BasicExecutableExecutor
+
+
+class DurationStore:
+    """
+    This class holds the durations of branches and testcases that were recorded in earlier runs. The durations are
+    saved in the file `durations.json` within the balder cache directory (`.balder_cache` in the working directory).
+
+    For every branch the store holds the time its fixtures took (``fixture``) and the time the whole branch took
+    (``total``).
+    """
+    #: the name of the directory (within the working directory) balder saves its cache files in
+    CACHE_DIR_NAME = '.balder_cache'
+    #: the name of the file the durations are saved in
+    FILE_NAME = 'durations.json'
+
+    def __init__(self, working_dir: Union[str, pathlib.Path]):
+        self._filepath = pathlib.Path(working_dir) / self.CACHE_DIR_NAME / self.FILE_NAME
+        self._durations: Dict[str, Dict[str, float]] = {}
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    @staticmethod
+    def get_key_for(executor: BasicExecutableExecutor) -> str:
+        """
+        returns the key the durations of the given executor are saved with - it is its executor id, that is the same
+        in every run
+
+        :param executor: a setup, scenario, variation or testcase executor
+        """
+        if executor.executor_id is None:
+            raise TypeError(f"can not determine a duration key for executor of type `{executor.__class__.__name__}`")
+        return executor.executor_id
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def filepath(self) -> pathlib.Path:
+        """returns the path to the file the durations are saved in"""
+        return self._filepath
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _record(self, executor: BasicExecutableExecutor, total_sec: Union[float, None],
+                fixture_sec: Union[float, None]):
+        """saves the given durations for the executor (if they were measured)"""
+        if total_sec is None:
+            return
+        self._durations[self.get_key_for(executor)] = {'total': total_sec, 'fixture': fixture_sec or 0}
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def load(self) -> None:
+        """loads the durations of earlier runs - does nothing if there are no recorded durations"""
+        if not self._filepath.is_file():
+            return
+        try:
+            with open(self._filepath, 'r', encoding='utf-8') as file:
+                self._durations = json.load(file)
+        except (OSError, ValueError):
+            # a broken cache file is ignored - it will be overwritten by the next run
+            self._durations = {}
+
+    def save(self) -> None:
+        """saves all durations into the cache file"""
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._filepath, 'w', encoding='utf-8') as file:
+            json.dump(self._durations, file, indent=1, sort_keys=True)
+
+    def get_total_duration(self, executor: BasicExecutableExecutor) -> Union[float, None]:
+        """returns the recorded duration of the whole branch/testcase or None if there is no recorded duration"""
+        durations = self._durations.get(self.get_key_for(executor))
+        return None if durations is None else durations['total']
+
+    def get_fixture_duration(self, executor: BasicExecutableExecutor) -> Union[float, None]:
+        """returns the recorded duration of the fixtures of the branch or None if there is no recorded duration"""
+        durations = self._durations.get(self.get_key_for(executor))
+        return None if durations is None else durations['fixture']
+
+    def record(self, executor_tree: ExecutorTree) -> None:
+        """
+        updates the store with the durations of all branches and testcases that were executed in the given tree
+
+        :param executor_tree: the executed executor tree
+        """
+        for cur_setup_executor in executor_tree.get_setup_executors():
+            self._record(cur_setup_executor, cur_setup_executor.execution_time_sec,
+                         cur_setup_executor.fixture_execution_time_sec)
+            for cur_scenario_executor in cur_setup_executor.get_scenario_executors():
+                self._record(cur_scenario_executor, cur_scenario_executor.execution_time_sec,
+                             cur_scenario_executor.fixture_execution_time_sec)
+                for cur_variation_executor in cur_scenario_executor.get_variation_executors():
+                    self._record(cur_variation_executor, cur_variation_executor.execution_time_sec,
+                                 cur_variation_executor.fixture_execution_time_sec)
+                    for cur_testcase_executor in cur_variation_executor.get_testcase_executors():
+                        if isinstance(cur_testcase_executor, TestcaseExecutor) \
+                                and cur_testcase_executor.execution_time_sec is not None:
+                            self._record(cur_testcase_executor, cur_testcase_executor.test_execution_time_sec,
+                                         cur_testcase_executor.fixture_execution_time_sec)
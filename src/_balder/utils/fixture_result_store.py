@@ -0,0 +1,80 @@
+from __future__ import annotations
+from typing import Any, Tuple, Union, TYPE_CHECKING
+
+import time
+import pickle
+import pathlib
+from _balder.utils.duration_store import DurationStore
+
+if TYPE_CHECKING:
+    from _balder.fixture_cache import FixtureCache
+
+
+class FixtureResultStore:
+    """
+    This class saves the values of cached SESSION fixtures (see :class:`FixtureCache`) between multiple test sessions.
+    Every value is saved in its own file within the directory `fixtures` of the balder cache directory
+    (`.balder_cache` in the working directory).
+    """
+    #: the name of the directory (within the balder cache directory) the fixture values are saved in
+    DIR_NAME = 'fixtures'
+
+    def __init__(self, working_dir: Union[str, pathlib.Path]):
+        self._directory = pathlib.Path(working_dir) / DurationStore.CACHE_DIR_NAME / self.DIR_NAME
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def directory(self) -> pathlib.Path:
+        """returns the path to the directory the fixture values are saved in"""
+        return self._directory
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _get_filepath_for(self, key: str) -> pathlib.Path:
+        """returns the path of the file the value with the given key is saved in"""
+        return self._directory / f"{key}.pickle"
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def load(self, key: str, cache: FixtureCache) -> Tuple[bool, Any]:
+        """
+        returns a tuple, where the first element is True if there is a valid entry for the key (the second element is
+        the cached value then)
+
+        :param key: the cache key of the fixture
+        :param cache: the cache definition of the fixture
+        """
+        filepath = self._get_filepath_for(key)
+        if not filepath.is_file():
+            return False, None
+        try:
+            with open(filepath, 'rb') as file:
+                entry = pickle.load(file)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # a broken cache file is ignored - it will be overwritten by the next construction of the fixture
+            return False, None
+        if time.time() - entry['created'] > cache.ttl_sec:
+            return False, None
+        if not cache.is_valid(entry['value']):
+            return False, None
+        return True, entry['value']
+
+    def save(self, key: str, value: Any) -> None:
+        """
+        saves the value of a fixture with the given key
+
+        :param key: the cache key of the fixture
+        :param value: the value the fixture has provided
+        """
+        try:
+            content = pickle.dumps({'created': time.time(), 'value': value})
+        except Exception as exc:
+            raise TypeError(f'the value `{value!r}` of a cached fixture can not be pickled') from exc
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with open(self._get_filepath_for(key), 'wb') as file:
+            file.write(content)
@@ -1,7 +1,9 @@
 from __future__ import annotations
-from typing import List, Type, Union, TYPE_CHECKING
+from typing import Callable, Dict, List, Tuple, Type, Union, TYPE_CHECKING
 
+import os
 import inspect
+import functools
 from _balder.scenario import Scenario
 from _balder.exceptions import InheritanceError
 
@@ -33,6 +35,11 @@ def get_scenario_inheritance_list_of(scenario: Type[Scenario]) -> List[Type[Scen
     return [scenario] + get_scenario_inheritance_list_of(base_class_of_interest)
 
 
+def get_class_id(cls: type) -> str:
+    """returns the identifier of the given class, that is the same in every process (its qualified name)"""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
 def get_class_that_defines_method(meth):
     """credits to https://stackoverflow.com/a/25959545"""
     if inspect.ismethod(meth):
@@ -69,10 +76,20 @@ def cnn_type_check_and_convert(elem: Union[Connection, Type[Connection], BaseCon
                     f'`{elem}`')
 
 
+@functools.lru_cache(maxsize=None)
+def get_argument_names(func: Callable) -> Tuple[str, ...]:
+    """
+    This helper function returns the names of all positional arguments of the given callable (the same as
+    `inspect.getfullargspec(func).args`). The result is cached for every callable.
+    """
+    return tuple(inspect.getfullargspec(func).args)
+
+
+@functools.lru_cache(maxsize=None)
 def get_method_type(func_class, func) -> MethodLiteralType:
     """
     This helper function returns the type of the method (`staticmethod`, `classmethod` or `instancemethod`). It never
-    returns `function` because this type does not have a class.
+    returns `function` because this type does not have a class. The result is cached for every class and function.
     """
     expected_class_qualname = func.__qualname__.rpartition('.')[0]
 
@@ -101,3 +118,33 @@ def get_method_type(func_class, func) -> MethodLiteralType:
         raise KeyError(f'the provided function `{func.__qualname__}` does not match with the provided class '
                        f'`{func_class.__qualname__}`')
     return meth_type
+
+
+def get_hashable_key_or_none(key: Tuple) -> Union[Tuple, None]:
+    """
+    This helper function returns the given cache key if it is hashable, otherwise it returns None (the value can not be
+    cached then, because one of its arguments is not hashable).
+    """
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_py_file_snapshot(directory: Union[str, os.PathLike]) -> Dict[str, int]:
+    """
+    This helper function returns the modification times (in nanoseconds) of all python files within the given directory
+    and its subdirectories. The paths of the files are the keys.
+    """
+    snapshot = {}
+    for root, _, files in os.walk(str(directory)):
+        for file in files:
+            if file.endswith(".py"):
+                cur_path = os.path.join(root, file)
+                try:
+                    snapshot[cur_path] = os.stat(cur_path).st_mtime_ns
+                except OSError:
+                    # the file was removed in the meantime
+                    continue
+    return snapshot
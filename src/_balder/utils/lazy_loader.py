@@ -0,0 +1,37 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List
+
+import sys
+import importlib
+
+
+def make_lazy_getattr(module_name: str, lazy_objects: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    returns a module level ``__getattr__`` function, that imports the requested object on first access - the object is
+    saved in the module globals afterwards, so that the function is not called again for it
+
+    :param module_name: the name of the module the function is used in
+
+    :param lazy_objects: the name of every lazy object as key and the name of the module it is defined in as value
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in lazy_objects:
+            raise AttributeError(f"module `{module_name}` has no attribute `{name}`")
+        value = getattr(importlib.import_module(lazy_objects[name]), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+    return __getattr__
+
+
+def make_lazy_dir(module_name: str, public_names: Iterable[str]) -> Callable[[], List[str]]:
+    """
+    returns a module level ``__dir__`` function, that returns the already loaded globals and the not yet imported
+    public objects of the module
+
+    :param module_name: the name of the module the function is used in
+
+    :param public_names: the names of all public objects of the module
+    """
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name]).keys()) | set(public_names))
+    return __dir__
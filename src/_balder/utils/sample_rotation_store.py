@@ -0,0 +1,56 @@
+from __future__ import annotations
+from typing import Union
+
+import json
+import pathlib
+from _balder.utils.duration_store import DurationStore
+
+
+class SampleRotationStore:
+    """
+    This class holds the index of the next sampled run (see :class:`Sampling`). The index is saved in the file
+    `sampling.json` within the balder cache directory (`.balder_cache` in the working directory), so that every run
+    with ``--sample`` or ``--sample-ratio`` selects another window of the elements.
+    """
+    #: the name of the file the index is saved in
+    FILE_NAME = 'sampling.json'
+
+    def __init__(self, working_dir: Union[str, pathlib.Path]):
+        self._filepath = pathlib.Path(working_dir) / DurationStore.CACHE_DIR_NAME / self.FILE_NAME
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def filepath(self) -> pathlib.Path:
+        """returns the path to the file the index is saved in"""
+        return self._filepath
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def get_next_run(self) -> int:
+        """returns the index of the next run (0 if there is no valid file)"""
+        if not self._filepath.is_file():
+            return 0
+        try:
+            with open(self._filepath, 'r', encoding='utf-8') as file:
+                run = json.load(file).get('next_run', 0)
+        except (OSError, ValueError, AttributeError):
+            # a broken file is ignored - it will be overwritten with the next run
+            return 0
+        return run if isinstance(run, int) and run >= 0 else 0
+
+    def save_next_run(self, run: int) -> None:
+        """
+        saves the index of the next run
+
+        :param run: the index the next run should use
+        """
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._filepath, 'w', encoding='utf-8') as file:
+            json.dump({'next_run': run}, file)
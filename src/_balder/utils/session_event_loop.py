@@ -0,0 +1,94 @@
+from __future__ import annotations
+from typing import Any, Awaitable, Union
+
+import asyncio
+import threading
+import contextvars
+import concurrent.futures
+
+
+class SessionEventLoop:
+    """
+    This class manages the single asyncio event loop of a test session. The loop runs in its own background thread,
+    so that awaitables can be executed from every thread (also from the worker threads of parallel running testcases)
+    and all of them share the same loop. The loop (and its thread) will be created on the first usage.
+    """
+
+    def __init__(self):
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+        self._thread: Union[threading.Thread, None] = None
+        self._start_lock = threading.Lock()
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    @staticmethod
+    async def _await(awaitable: Awaitable) -> Any:
+        """helper coroutine that awaits any awaitable (`create_task()` only accepts coroutines)"""
+        return await awaitable
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        """returns True if the event loop was already started and not closed yet"""
+        return self._loop is not None
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _start(self) -> None:
+        """starts the event loop in a new daemon thread"""
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=loop.run_forever, name="balder-event-loop", daemon=True)
+            self._thread.start()
+            self._loop = loop
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def run(self, awaitable: Awaitable) -> Any:
+        """
+        This method executes the given awaitable on the session event loop, blocks until it is done and returns its
+        result (or raises its exception). The awaitable is executed within a copy of the context of the calling thread.
+
+        :param awaitable: the awaitable (for example a coroutine) that should be executed
+        """
+        self._start()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError('can not block the session event loop by waiting for an awaitable inside the loop - '
+                               'use `await` instead')
+
+        result_future = concurrent.futures.Future()
+
+        def transfer_result(task: asyncio.Task):
+            if task.cancelled():
+                result_future.cancel()
+            elif task.exception() is not None:
+                result_future.set_exception(task.exception())
+            else:
+                result_future.set_result(task.result())
+
+        def create_task():
+            # the task copies the current context - this callback is executed within the context of the caller
+            task = self._loop.create_task(self._await(awaitable))
+            task.add_done_callback(transfer_result)
+
+        self._loop.call_soon_threadsafe(create_task, context=contextvars.copy_context())
+        return result_future.result()
+
+    def close(self) -> None:
+        """
+        finalizes all open async generators, stops the event loop and waits for its thread - does nothing if the loop
+        was never started
+        """
+        if self._loop is None:
+            return
+        self.run(self._loop.shutdown_asyncgens())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
@@ -0,0 +1,107 @@
+from __future__ import annotations
+from typing import TextIO, Union
+
+import io
+import sys
+import threading
+import contextlib
+import contextvars
+
+
+class ThreadBufferedStream(io.TextIOBase):
+    """
+    Text stream that wraps another stream (like `sys.stdout`). Every thread that is currently capturing (see
+    :meth:`ThreadBufferedOutput.capture`) writes into its own buffer, all other threads write directly into the wrapped
+    stream.
+
+    .. note::
+        The buffer is held in a context variable, so that coroutines that are executed on the session event loop on
+        behalf of a capturing thread write into the buffer of this thread too.
+    """
+
+    def __init__(self, wrapped: TextIO, buffer_var: contextvars.ContextVar):
+        super().__init__()
+        #: the original stream the buffered content is written to
+        self.wrapped = wrapped
+        self._buffer_var = buffer_var
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def encoding(self):
+        """returns the encoding of the wrapped stream"""
+        return getattr(self.wrapped, 'encoding', None)
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _get_buffer(self) -> Union[io.StringIO, None]:
+        """returns the buffer of the current thread or None if the current thread does not capture its output"""
+        return self._buffer_var.get()
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        buffer = self._get_buffer()
+        if buffer is None:
+            return self.wrapped.write(s)
+        return buffer.write(s)
+
+    def flush(self) -> None:
+        if self._get_buffer() is None:
+            self.wrapped.flush()
+
+
+class ThreadBufferedOutput:
+    """
+    Context manager that replaces `sys.stdout` and `sys.stderr` with :class:`ThreadBufferedStream` objects. This allows
+    threads to capture their whole output and to write it as one block after they are done. With that the output of
+    parallel running elements does not interleave.
+    """
+
+    def __init__(self):
+        self._stdout_buffer: contextvars.ContextVar[Union[io.StringIO, None]] = \
+            contextvars.ContextVar('balder_stdout_buffer', default=None)
+        self._stderr_buffer: contextvars.ContextVar[Union[io.StringIO, None]] = \
+            contextvars.ContextVar('balder_stderr_buffer', default=None)
+        self._write_lock = threading.Lock()
+        self._stdout: Union[ThreadBufferedStream, None] = None
+        self._stderr: Union[ThreadBufferedStream, None] = None
+
+    def __enter__(self) -> ThreadBufferedOutput:
+        self._stdout = ThreadBufferedStream(sys.stdout, self._stdout_buffer)
+        self._stderr = ThreadBufferedStream(sys.stderr, self._stderr_buffer)
+        sys.stdout = self._stdout
+        sys.stderr = self._stderr
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        sys.stdout = self._stdout.wrapped
+        sys.stderr = self._stderr.wrapped
+
+    @contextlib.contextmanager
+    def capture(self):
+        """
+        buffers everything the current thread writes to `sys.stdout` and `sys.stderr` and writes it to the original
+        streams (as one block) when the context is left
+        """
+        stdout_token = self._stdout_buffer.set(io.StringIO())
+        stderr_token = self._stderr_buffer.set(io.StringIO())
+        try:
+            yield
+        finally:
+            stdout_content = self._stdout_buffer.get().getvalue()
+            stderr_content = self._stderr_buffer.get().getvalue()
+            self._stdout_buffer.reset(stdout_token)
+            self._stderr_buffer.reset(stderr_token)
+            with self._write_lock:
+                self._stdout.wrapped.write(stdout_content)
+                self._stdout.wrapped.flush()
+                self._stderr.wrapped.write(stderr_content)
+                self._stderr.wrapped.flush()
@@ -0,0 +1,185 @@
+from __future__ import annotations
+from typing import Dict, List, Set, Type, Union
+
+import sys
+import time
+import types
+import inspect
+import pathlib
+import traceback
+from _balder.setup import Setup
+from _balder.scenario import Scenario
+from _balder.balder_session import BalderSession
+from _balder.utils.functions import get_py_file_snapshot
+
+
+class Watcher:
+    """
+    The watcher executes a balder session and polls the python files of the working directory afterwards. As soon as
+    a file was changed, it executes the setup/scenario pairs that are affected by the change again.
+
+    The watcher only imports the changed modules and the modules that depend on them (over their module globals)
+    again. All other modules stay imported and their controllers are used again. Only the setup/scenario pairs that
+    contain at least one setup or scenario class of a module that was imported again are resolved and executed. If
+    the ``balderglob.py`` file or a connection module was changed, everything is imported and executed again.
+    """
+
+    def __init__(self, cmd_args: List[str], working_dir: Union[str, pathlib.Path], interval: float = 0.5):
+        """
+        :param cmd_args: the command line arguments every session is executed with
+
+        :param working_dir: the working directory of the environment
+
+        :param interval: the time in seconds between two polls of the python files
+        """
+        self._cmd_args = cmd_args
+        self._working_dir = pathlib.Path(working_dir).absolute()
+        self._interval = interval
+
+        #: the modification times of all python files after the last session was started
+        self._snapshot: Dict[str, int] = {}
+        #: the last executed session (None if no session was executed yet)
+        self._session: Union[BalderSession, None] = None
+        #: True if the last session failed before it was executed completely (everything is imported again then)
+        self._last_session_failed = False
+
+    # ---------------------------------- STATIC METHODS ----------------------------------------------------------------
+
+    @staticmethod
+    def _get_referenced_module_name_of(value: object) -> Union[str, None]:
+        """
+        returns the name of the module the given global value of a module belongs to (None if it is no module, class
+        or function)
+        """
+        if inspect.ismodule(value):
+            return value.__name__
+        if inspect.isclass(value) or inspect.isfunction(value):
+            return value.__module__
+        return None
+
+    @staticmethod
+    def _influences_whole_environment(path: pathlib.Path) -> bool:
+        """
+        returns True if changes of the given file influence the whole environment (the ``balderglob.py`` file and the
+        connection modules, that can change the global connection tree)
+        """
+        return path.name in ('balderglob.py', 'connections.py') or 'connections' in path.parent.name
+
+    # ---------------------------------- CLASS METHODS -----------------------------------------------------------------
+
+    # ---------------------------------- PROPERTIES --------------------------------------------------------------------
+
+    @property
+    def session(self) -> Union[BalderSession, None]:
+        """returns the last executed session (None if no session was executed yet)"""
+        return self._session
+
+    # ---------------------------------- PROTECTED METHODS -------------------------------------------------------------
+
+    def _get_working_dir_modules(self) -> Dict[str, types.ModuleType]:
+        """returns all imported modules of the working directory with their name as key"""
+        module_prefix = f"{self._working_dir.stem}."
+        return {cur_name: cur_module for cur_name, cur_module in sys.modules.copy().items()
+                if cur_name == self._working_dir.stem or cur_name.startswith(module_prefix)}
+
+    def _get_dependent_modules(self, modules: Dict[str, types.ModuleType]) -> Dict[str, Set[str]]:
+        """
+        returns the names of all modules that reference another module over their module globals (the name of the
+        referenced module is the key)
+
+        :param modules: all modules of the working directory with their name as key
+        """
+        dependents = {cur_name: set() for cur_name in modules.keys()}
+        for cur_name, cur_module in modules.items():
+            for cur_value in vars(cur_module).values():
+                referenced_module_name = self._get_referenced_module_name_of(cur_value)
+                if referenced_module_name in dependents.keys() and referenced_module_name != cur_name:
+                    dependents[referenced_module_name].add(cur_name)
+        return dependents
+
+    def _get_changed_files(self) -> List[pathlib.Path]:
+        """returns all python files that were added, changed or removed since the last poll"""
+        new_snapshot = get_py_file_snapshot(self._working_dir)
+        changed_files = [pathlib.Path(cur_path) for cur_path in set(self._snapshot.keys()) | set(new_snapshot.keys())
+                         if self._snapshot.get(cur_path) != new_snapshot.get(cur_path)]
+        self._snapshot = new_snapshot
+        return changed_files
+
+    # ---------------------------------- METHODS -----------------------------------------------------------------------
+
+    def get_affected_modules(self, changed_files: List[pathlib.Path]) -> Union[Set[str], None]:
+        """
+        This method determines the names of all modules that have to be imported again, because of the given changed
+        files. These are the modules of the changed files and all modules that reference them (directly or indirectly).
+
+        :param changed_files: all python files that were added, changed or removed
+        :return: the names of all affected modules or None if the whole environment has to be imported again
+        """
+        if any(self._influences_whole_environment(cur_path) for cur_path in changed_files):
+            return None
+        modules = self._get_working_dir_modules()
+        modules_by_path = {pathlib.Path(cur_module.__file__).absolute(): cur_name
+                           for cur_name, cur_module in modules.items() if getattr(cur_module, '__file__', None)}
+        dependents = self._get_dependent_modules(modules)
+
+        # new files are not imported yet - the collector imports them
+        affected = {modules_by_path[cur_path.absolute()] for cur_path in changed_files
+                    if cur_path.absolute() in modules_by_path.keys()}
+        unchecked = list(affected)
+        while unchecked:
+            for cur_dependent in dependents[unchecked.pop()]:
+                if cur_dependent not in affected:
+                    affected.add(cur_dependent)
+                    unchecked.append(cur_dependent)
+        return affected
+
+    def run_session(self, changed_files: Union[List[pathlib.Path], None] = None) -> BalderSession:
+        """
+        This method executes a new session. If changed files are given, only the affected modules are imported again
+        and only the affected setup/scenario pairs are executed.
+
+        :param changed_files: all python files that were changed since the last session (None if everything should be
+                              executed)
+        :return: the executed session
+        """
+        affected_modules = None
+        if changed_files is not None and self._session is not None and not self._last_session_failed:
+            affected_modules = self.get_affected_modules(changed_files)
+        if self._session is not None:
+            self._session.reset(modules=affected_modules)
+        kept_modules = set(self._get_working_dir_modules().keys())
+
+        self._last_session_failed = True
+        self._session = BalderSession(cmd_args=self._cmd_args, working_dir=self._working_dir)
+        self._session.collect()
+        if affected_modules is not None:
+            new_modules = set(self._get_working_dir_modules().keys()) - kept_modules
+            affected_classes: Set[Type[Union[Setup, Scenario]]] = {
+                cur_cls for cur_cls in [*self._session.all_collected_setups, *self._session.all_collected_scenarios]
+                if any(cur_base.__module__ in new_modules for cur_base in cur_cls.__mro__)
+            }
+            self._session.options.only_pairs_with = affected_classes
+            print(f"balder watch: {len(changed_files)} file(s) changed - execute the setup/scenario pairs of "
+                  f"{len(affected_classes)} affected setup(s)/scenario(s) again")
+        self._session.run()
+        self._last_session_failed = False
+        return self._session
+
+    def run(self) -> None:
+        """
+        This method executes the first session and waits for changes afterwards. It never returns - stop it with
+        `CTRL+C`.
+        """
+        changed_files = None
+        self._snapshot = get_py_file_snapshot(self._working_dir)
+        while True:
+            try:
+                self.run_session(changed_files)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # the environment is broken - wait for the next change
+                traceback.print_exception(*sys.exc_info())
+            print(f"balder watch: waiting for changes in `{self._working_dir}` (press CTRL+C to stop)", flush=True)
+            changed_files = []
+            while not changed_files:
+                time.sleep(self._interval)
+                changed_files = self._get_changed_files()
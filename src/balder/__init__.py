@@ -1,20 +1,60 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from _balder.utils.lazy_loader import make_lazy_getattr, make_lazy_dir
 from _balder import __version__, __version_tuple__
-from _balder.setup import Setup
-from _balder.device import Device
-from _balder.vdevice import VDevice
-from _balder.feature import Feature
-from _balder.scenario import Scenario
-from _balder.connection import Connection
-from _balder.balder_plugin import BalderPlugin
-from _balder.balder_settings import BalderSettings
-from _balder.unmapped_vdevice import UnmappedVDevice
-from _balder.decorator_fixture import fixture
-from _balder.decorator_connect import connect
-from _balder.decorator_covered_by import covered_by
-from _balder.decorator_for_vdevice import for_vdevice
-from _balder.decorator_insert_into_tree import insert_into_tree
-from _balder.decorator_parametrize import parametrize
-from _balder.decorator_parametrize_by_feature import parametrize_by_feature
+
+if TYPE_CHECKING:
+    from _balder.setup import Setup
+    from _balder.device import Device
+    from _balder.vdevice import VDevice
+    from _balder.feature import Feature
+    from _balder.scenario import Scenario
+    from _balder.connection import Connection
+    from _balder.balder_plugin import BalderPlugin
+    from _balder.balder_settings import BalderSettings
+    from _balder.unmapped_vdevice import UnmappedVDevice
+    from _balder.fixture_cache import FixtureCache
+    from _balder.fixture_execution_level import FixtureExecutionLevel
+    from _balder.decorator_fixture import fixture
+    from _balder.decorator_cached import cached
+    from _balder.decorator_connect import connect
+    from _balder.decorator_covered_by import covered_by
+    from _balder.decorator_for_vdevice import for_vdevice
+    from _balder.decorator_insert_into_tree import insert_into_tree
+    from _balder.decorator_parametrize import parametrize
+    from _balder.decorator_parametrize_by_feature import parametrize_by_feature
+    from _balder.decorator_parametrize_nwise import parametrize_nwise
+    from _balder.decorator_parametrize_from_file import parametrize_from_file
+    from _balder.decorator_parallel_safe import parallel_safe
+
+
+# all public objects are imported on first access (see `__getattr__`), so that `import balder` stays fast - the key is
+# the name of the object and the value is the module it is defined in
+_LAZY_OBJECTS = {
+    'Setup': '_balder.setup',
+    'Device': '_balder.device',
+    'VDevice': '_balder.vdevice',
+    'Feature': '_balder.feature',
+    'Scenario': '_balder.scenario',
+    'Connection': '_balder.connection',
+    'BalderPlugin': '_balder.balder_plugin',
+    'BalderSettings': '_balder.balder_settings',
+    'UnmappedVDevice': '_balder.unmapped_vdevice',
+    'FixtureCache': '_balder.fixture_cache',
+    'FixtureExecutionLevel': '_balder.fixture_execution_level',
+    'fixture': '_balder.decorator_fixture',
+    'cached': '_balder.decorator_cached',
+    'connect': '_balder.decorator_connect',
+    'covered_by': '_balder.decorator_covered_by',
+    'for_vdevice': '_balder.decorator_for_vdevice',
+    'insert_into_tree': '_balder.decorator_insert_into_tree',
+    'parametrize': '_balder.decorator_parametrize',
+    'parametrize_by_feature': '_balder.decorator_parametrize_by_feature',
+    'parametrize_nwise': '_balder.decorator_parametrize_nwise',
+    'parametrize_from_file': '_balder.decorator_parametrize_from_file',
+    'parallel_safe': '_balder.decorator_parallel_safe',
+}
 
 
 __all__ = [
@@ -26,6 +66,8 @@ __all__ = [
 
     'fixture',
 
+    'cached',
+
     'for_vdevice',
 
     'insert_into_tree',
@@ -36,6 +78,12 @@ __all__ = [
 
     'parametrize_by_feature',
 
+    'parametrize_nwise',
+
+    'parametrize_from_file',
+
+    'parallel_safe',
+
     'Setup',
 
     'Device',
@@ -52,5 +100,13 @@ __all__ = [
 
     'BalderSettings',
 
-    'UnmappedVDevice'
+    'UnmappedVDevice',
+
+    'FixtureCache',
+
+    'FixtureExecutionLevel'
 ]
+
+
+__getattr__ = make_lazy_getattr(__name__, _LAZY_OBJECTS)
+__dir__ = make_lazy_dir(__name__, __all__)
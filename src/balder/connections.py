@@ -1,19 +1,60 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
 
-from _balder.objects.connections.osi_1_physical import BluetoothConnection, CanBusConnection, CoaxialCableConnection, \
-    DslConnection, RS232Connection, RS422Connection, RS485Connection, IsdnConnection, I2CConnection, I2SConnection, \
-    OneWireConnection, OpticalFiberConnection, SpiConnection, TwistedPairCableConnection, UsbConnection, WifiConnection
-from _balder.objects.connections.osi_2_datalink import EthernetConnection, WirelessLanConnection, LLDPConnection, \
-    ProfibusConnection
-from _balder.objects.connections.osi_3_network import IpSecConnection, IPv4Connection, IPv6Connection, \
-    ICMPv4Connection, ICMPv6Connection, IPConnection, ICMPConnection
-from _balder.objects.connections.osi_4_transport import TcpIPv4Connection, UdpIPv4Connection, TcpIPv6Connection, \
-    UdpIPv6Connection, TcpConnection, UdpConnection
-from _balder.objects.connections.osi_5_session import PptpConnection
-from _balder.objects.connections.osi_6_presentation import TelnetConnection
-from _balder.objects.connections.osi_7_application import HttpConnection, ImapConnection, LdapConnection, \
-    NtpConnection, RpcConnection, SmtpConnection, SntpConnection, SshConnection, DnsConnection
-from _balder.objects.connections.power_connections import PowerConnection, ACPowerConnection, DCPowerConnection
+from _balder.utils.lazy_loader import make_lazy_getattr, make_lazy_dir
+
+if TYPE_CHECKING:
+    from _balder.objects.connections.osi_1_physical import BluetoothConnection, CanBusConnection, \
+        CoaxialCableConnection, DslConnection, RS232Connection, RS422Connection, RS485Connection, IsdnConnection, \
+        I2CConnection, I2SConnection, OneWireConnection, OpticalFiberConnection, SpiConnection, \
+        TwistedPairCableConnection, UsbConnection, WifiConnection
+    from _balder.objects.connections.osi_2_datalink import EthernetConnection, WirelessLanConnection, LLDPConnection, \
+        ProfibusConnection
+    from _balder.objects.connections.osi_3_network import IpSecConnection, IPv4Connection, IPv6Connection, \
+        ICMPv4Connection, ICMPv6Connection, IPConnection, ICMPConnection
+    from _balder.objects.connections.osi_4_transport import TcpIPv4Connection, UdpIPv4Connection, TcpIPv6Connection, \
+        UdpIPv6Connection, TcpConnection, UdpConnection
+    from _balder.objects.connections.osi_5_session import PptpConnection
+    from _balder.objects.connections.osi_6_presentation import TelnetConnection
+    from _balder.objects.connections.osi_7_application import HttpConnection, ImapConnection, LdapConnection, \
+        NtpConnection, RpcConnection, SmtpConnection, SntpConnection, SshConnection, DnsConnection
+    from _balder.objects.connections.power_connections import PowerConnection, ACPowerConnection, DCPowerConnection
+
+# the connection modules are imported on first access of one of their connections (see `__getattr__`) - the global
+# connection tree of the built-in connections is only extended by the modules that are really used
+_LAZY_MODULES = {
+    '_balder.objects.connections.osi_1_physical': [
+        'BluetoothConnection', 'CanBusConnection', 'CoaxialCableConnection', 'DslConnection', 'RS232Connection',
+        'RS422Connection', 'RS485Connection', 'IsdnConnection', 'I2CConnection', 'I2SConnection', 'OneWireConnection',
+        'OpticalFiberConnection', 'SpiConnection', 'TwistedPairCableConnection', 'UsbConnection', 'WifiConnection',
+    ],
+    '_balder.objects.connections.osi_2_datalink': [
+        'EthernetConnection', 'WirelessLanConnection', 'LLDPConnection', 'ProfibusConnection',
+    ],
+    '_balder.objects.connections.osi_3_network': [
+        'IpSecConnection', 'IPv4Connection', 'IPv6Connection', 'ICMPv4Connection', 'ICMPv6Connection', 'IPConnection',
+        'ICMPConnection',
+    ],
+    '_balder.objects.connections.osi_4_transport': [
+        'TcpIPv4Connection', 'UdpIPv4Connection', 'TcpIPv6Connection', 'UdpIPv6Connection', 'TcpConnection',
+        'UdpConnection',
+    ],
+    '_balder.objects.connections.osi_5_session': [
+        'PptpConnection',
+    ],
+    '_balder.objects.connections.osi_6_presentation': [
+        'TelnetConnection',
+    ],
+    '_balder.objects.connections.osi_7_application': [
+        'HttpConnection', 'ImapConnection', 'LdapConnection', 'NtpConnection', 'RpcConnection', 'SmtpConnection',
+        'SntpConnection', 'SshConnection', 'DnsConnection',
+    ],
+    '_balder.objects.connections.power_connections': [
+        'PowerConnection', 'ACPowerConnection', 'DCPowerConnection',
+    ],
+}
+#: the module every connection is defined in (the name of the connection is the key)
+_LAZY_OBJECTS = {cur_name: cur_module for cur_module, cur_names in _LAZY_MODULES.items() for cur_name in cur_names}
 
 __all__ = [
     # OSI: Physical Layer
@@ -45,3 +86,7 @@ __all__ = [
     # General Power Connection
     "PowerConnection", "ACPowerConnection", "DCPowerConnection",
 ]
+
+
+__getattr__ = make_lazy_getattr(__name__, _LAZY_OBJECTS)
+__dir__ = make_lazy_dir(__name__, __all__)
@@ -1,8 +1,10 @@
 from _balder.parametrization import FeatureAccessSelector, Parameter, Value
+from _balder.parametrization_file import ParametrizationFile
 
 
 __all__ = [
     'FeatureAccessSelector',
     'Parameter',
-    'Value'
+    'Value',
+    'ParametrizationFile'
 ]
@@ -0,0 +1,66 @@
+import os
+import re
+import sys
+import json
+import subprocess
+import pytest
+
+
+def get_imported_modules_after(statement: str) -> set:
+    """executes the statement in a new interpreter and returns the names of all modules that are imported afterwards"""
+    result = subprocess.run(
+        [sys.executable, '-c', f"import sys, json; {statement}; print(json.dumps(list(sys.modules.keys())))"],
+        capture_output=True, text=True, check=True)
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def get_cumulative_import_time_of(module_name: str) -> int:
+    """returns the cumulative import time of the module in microseconds (the fastest of three imports)"""
+    import_times = []
+    for _ in range(3):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module_name}"],
+                                capture_output=True, text=True, check=True)
+        match = re.search(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(module_name)}$", result.stderr, re.MULTILINE)
+        import_times.append(int(match.group(1)))
+    return min(import_times)
+
+
+class Test0ImportTime:
+    """
+    This testcase checks that `import balder` only imports the modules that are really needed. All objects of the
+    namespaces `balder` and `balder.connections` are imported on their first access. If the environment variable
+    `BALDER_CHECK_IMPORT_TIME` is set, the import of `balder` has to stay within the import time budget too (the import
+    time depends on the machine, so this check is not executed by default).
+    """
+    #: the maximum cumulative import time of `balder` in microseconds
+    IMPORT_TIME_BUDGET = 50_000
+
+    def test_import_balder_is_lazy(self):
+        modules = get_imported_modules_after("import balder")
+        assert '_balder.collector' not in modules
+        assert '_balder.balder_session' not in modules
+        assert 'argparse' not in modules
+        assert not any(cur_name.startswith('_balder.executor') for cur_name in modules)
+        assert not any(cur_name.startswith('_balder.objects.connections') for cur_name in modules)
+
+    def test_access_of_object_imports_it(self):
+        modules = get_imported_modules_after("import balder; assert balder.Setup.__name__ == 'Setup'")
+        assert '_balder.setup' in modules
+        assert '_balder.collector' not in modules
+
+    def test_access_of_connection_imports_only_its_layers(self):
+        modules = get_imported_modules_after("from balder.connections import TcpConnection")
+        assert '_balder.objects.connections.osi_4_transport' in modules
+        assert '_balder.objects.connections.osi_3_network' in modules
+        assert '_balder.objects.connections.osi_7_application' not in modules
+        assert '_balder.objects.connections.power_connections' not in modules
+
+    def test_daemon_client_is_lazy(self):
+        modules = get_imported_modules_after("import _balder.console.balder, _balder.daemon.client")
+        assert '_balder.balder_session' not in modules
+        assert '_balder.collector' not in modules
+
+    @pytest.mark.skipif(not os.environ.get('BALDER_CHECK_IMPORT_TIME'),
+                        reason="the import time is only checked if `BALDER_CHECK_IMPORT_TIME` is set")
+    def test_import_time_budget(self):
+        assert get_cumulative_import_time_of('balder') < self.IMPORT_TIME_BUDGET
@@ -0,0 +1,6 @@
+import os
+
+#: the value the test prints (the testcase changes it while the daemon is running)
+VALUE = 1
+#: the process that has imported this module
+IMPORT_PID = os.getpid()
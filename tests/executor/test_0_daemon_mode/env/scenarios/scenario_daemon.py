@@ -0,0 +1,12 @@
+import balder
+from ..lib import value
+
+
+class ScenarioDaemon(balder.Scenario):
+    """scenario with one device that prints the value of the lib module"""
+
+    class Device(balder.Device):
+        pass
+
+    def test_print_value(self):
+        print(f"value {value.VALUE} imported by {value.IMPORT_PID};")
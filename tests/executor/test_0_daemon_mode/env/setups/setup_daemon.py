@@ -0,0 +1,8 @@
+import balder
+
+
+class SetupDaemon(balder.Setup):
+    """setup with one device"""
+
+    class Device1(balder.Device):
+        pass
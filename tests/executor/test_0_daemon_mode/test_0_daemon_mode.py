@@ -0,0 +1,93 @@
+import os
+import re
+import sys
+import time
+import socket
+import shutil
+import pathlib
+import tempfile
+import subprocess
+import pytest
+
+#: the python code that executes the console script (the command line arguments follow it)
+CONSOLE_CODE = 'from _balder.console.balder import console_balder; console_balder()'
+
+
+class Test0DaemonMode:
+    """
+    This testcase starts a balder daemon for the environment and executes it multiple times with ``--use-daemon``. The
+    test checks that the environment is only imported once as long as no file is changed, that a changed file is
+    imported again for the next run, that the command line arguments of every run are used and that the daemon can be
+    stopped again.
+    """
+
+    @staticmethod
+    def run_balder(working_dir: pathlib.Path, socket_path: pathlib.Path, *args: str) -> subprocess.CompletedProcess:
+        """executes balder within a new process with the given arguments"""
+        return subprocess.run(
+            [sys.executable, '-c', CONSOLE_CODE, '--working-dir', str(working_dir), '--daemon-socket', str(socket_path),
+             *args],
+            capture_output=True, text=True, timeout=60, cwd=str(working_dir), check=False)
+
+    @staticmethod
+    def get_printed_values(stdout: str):
+        """returns the value and the process id the test has printed"""
+        return [(int(value), int(pid)) for value, pid in re.findall(r"value (\d+) imported by (\d+);", stdout)]
+
+    @pytest.mark.skipif(not hasattr(os, 'fork') or not hasattr(socket, 'AF_UNIX'),
+                        reason="the daemon mode is only available on POSIX systems")
+    def test(self, balder_working_dir):
+        value_file = balder_working_dir / 'lib' / 'value.py'
+        original_value_file_content = value_file.read_text(encoding='utf-8')
+        socket_dir = pathlib.Path(tempfile.mkdtemp())
+        socket_path = socket_dir / 'daemon.sock'
+
+        daemon = subprocess.Popen(
+            [sys.executable, '-c', CONSOLE_CODE, '--daemon', '--working-dir', str(balder_working_dir),
+             '--daemon-socket', str(socket_path)],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, cwd=str(balder_working_dir))
+        try:
+            start_time = time.perf_counter()
+            while not socket_path.exists():
+                assert daemon.poll() is None, f"daemon terminates unexpectedly: {daemon.stdout.read()}"
+                assert time.perf_counter() - start_time < 30, "daemon does not start"
+                time.sleep(0.05)
+
+            first_run = self.run_balder(balder_working_dir, socket_path, '--use-daemon')
+            assert first_run.returncode == 0, first_run.stderr
+            assert "TOTAL SUCCESS: 1" in first_run.stdout
+            [(first_value, first_pid)] = self.get_printed_values(first_run.stdout)
+            assert first_value == 1
+
+            # no file was changed -> the environment is not imported again
+            second_run = self.run_balder(balder_working_dir, socket_path, '--use-daemon')
+            assert second_run.returncode == 0, second_run.stderr
+            assert self.get_printed_values(second_run.stdout) == [(1, first_pid)]
+
+            # the arguments of the run are used
+            collect_only_run = self.run_balder(balder_working_dir, socket_path, '--use-daemon', '--collect-only')
+            assert collect_only_run.returncode == 0, collect_only_run.stderr
+            assert "Collect 1 Setups and 1 Scenarios" in collect_only_run.stdout
+            assert self.get_printed_values(collect_only_run.stdout) == []
+
+            # change a file -> the environment is imported again
+            value_file.write_text(original_value_file_content.replace('VALUE = 1', 'VALUE = 2'), encoding='utf-8')
+            later_time = time.time() + 10
+            os.utime(value_file, (later_time, later_time))
+            third_run = self.run_balder(balder_working_dir, socket_path, '--use-daemon')
+            assert third_run.returncode == 0, third_run.stderr
+            [(third_value, third_pid)] = self.get_printed_values(third_run.stdout)
+            assert third_value == 2
+            assert third_pid != first_pid
+
+            stop_run = self.run_balder(balder_working_dir, socket_path, '--stop-daemon')
+            assert stop_run.returncode == 0, stop_run.stderr
+            assert daemon.wait(timeout=30) == 0
+            assert not socket_path.exists()
+        finally:
+            value_file.write_text(original_value_file_content, encoding='utf-8')
+            if daemon.poll() is None:
+                daemon.kill()
+                daemon.wait()
+            daemon.stdout.close()
+            shutil.rmtree(socket_dir, ignore_errors=True)
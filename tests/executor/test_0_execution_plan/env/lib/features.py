@@ -0,0 +1,13 @@
+import balder
+
+
+class ServiceFeature(balder.Feature):
+    """feature of the server"""
+
+    def get_name(self) -> str:
+        raise NotImplementedError()
+
+
+class ApiFeature(balder.Feature):
+    """feature of the client"""
+    pass
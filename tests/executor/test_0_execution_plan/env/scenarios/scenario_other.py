@@ -0,0 +1,14 @@
+import balder
+from ..lib.features import ServiceFeature
+
+print("scenario other imported;")
+
+
+class ScenarioOther(balder.Scenario):
+    """scenario with a single server"""
+
+    class Server(balder.Device):
+        service = ServiceFeature()
+
+    def test_other(self):
+        print("other;")
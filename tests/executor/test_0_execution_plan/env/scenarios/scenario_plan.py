@@ -0,0 +1,20 @@
+import balder
+from ..lib.features import ServiceFeature, ApiFeature
+
+
+class ScenarioPlan(balder.Scenario):
+    """scenario with a server that is connected to a client"""
+
+    class Server(balder.Device):
+        service = ServiceFeature()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Client(balder.Device):
+        api = ApiFeature()
+
+    def test_service(self):
+        print(f"{self.Server.service.get_name()};")
+
+    @balder.parametrize('value', [1, 2])
+    def test_value(self, value):
+        print(f"value {value};")
@@ -0,0 +1,18 @@
+import balder
+from ..lib.features import ApiFeature
+
+
+class ClientIdFeature(balder.Feature):
+    """feature that is not implemented by any setup device"""
+    pass
+
+
+class ScenarioUnmatched(balder.Scenario):
+    """scenario with a client that needs a feature, no setup device has"""
+
+    class Client(balder.Device):
+        api = ApiFeature()
+        client_id = ClientIdFeature()
+
+    def test_unmatched(self):
+        print("unmatched;")
@@ -0,0 +1,26 @@
+import balder
+from ..lib.features import ServiceFeature, ApiFeature
+
+
+class SetupService(ServiceFeature):
+    def get_name(self) -> str:
+        return "setup service"
+
+
+class SetupPlan(balder.Setup):
+    """setup with a server that is connected to two clients and another device without features"""
+
+    class Server(balder.Device):
+        service = SetupService()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Client1(balder.Device):
+        api = ApiFeature()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Client2(balder.Device):
+        api = ApiFeature()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Other(balder.Device):
+        pass
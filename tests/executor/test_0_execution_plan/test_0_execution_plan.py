@@ -0,0 +1,84 @@
+import re
+import sys
+import json
+import pathlib
+import tempfile
+import subprocess
+
+#: the python code that executes the console script (the command line arguments follow it)
+CONSOLE_CODE = 'from _balder.console.balder import console_balder; console_balder()'
+#: the python code that executes the console script, but fails as soon as the solver determines the device mappings
+CONSOLE_CODE_WITHOUT_SOLVING = 'from _balder.solver import Solver; Solver.get_initial_mapping = None; ' + CONSOLE_CODE
+
+
+class Test0ExecutionPlan:
+    """
+    This testcase saves the execution plan of an environment once for one scenario and once for both scenarios of the
+    environment. It checks that the plan contains the planned variations with their testcases and discard reasons, that
+    `balder plan-diff` shows the added variation and that the first plan can be executed without resolving it again
+    and without importing the scenario that is not part of the plan. It also saves the plan of a scenario without any
+    applicable variation and checks that the plan contains its discarded variations, while the run does not show them.
+    """
+
+    @staticmethod
+    def run_balder(code: str, *args: str) -> subprocess.CompletedProcess:
+        """executes balder within a new process with the given arguments"""
+        return subprocess.run([sys.executable, '-c', code, *args], capture_output=True, text=True, timeout=60,
+                              check=False)
+
+    def test(self, balder_working_dir):
+        plan_dir = pathlib.Path(tempfile.mkdtemp())
+        one_scenario_plan = plan_dir / 'one_scenario.json'
+        all_scenarios_plan = plan_dir / 'all_scenarios.json'
+
+        result = self.run_balder(CONSOLE_CODE, '--working-dir', str(balder_working_dir), '--resolve-only',
+                                 '--save-plan', str(one_scenario_plan),
+                                 '--only-with-scenario', 'scenarios/scenario_plan.py')
+        assert result.returncode == 0, result.stderr
+        result = self.run_balder(CONSOLE_CODE, '--working-dir', str(balder_working_dir), '--resolve-only',
+                                 '--save-plan', str(all_scenarios_plan))
+        assert result.returncode == 0, result.stderr
+
+        plan_data = json.loads(one_scenario_plan.read_text(encoding='utf-8'))
+        assert plan_data['files'] == ['scenarios/scenario_plan.py', 'setups/setup_plan.py']
+        # every permutation of the four setup devices for the two scenario devices - only the two clients are valid
+        assert len(plan_data['variations']) == 12
+        applicable_variations = [cur_variation for cur_variation in plan_data['variations']
+                                 if cur_variation['applicable']]
+        assert sorted(cur_variation['device_mapping']['env.scenarios.scenario_plan.ScenarioPlan.Client']
+                      for cur_variation in applicable_variations) == \
+               ['env.setups.setup_plan.SetupPlan.Client1', 'env.setups.setup_plan.SetupPlan.Client2']
+        assert all(cur_variation['discard_reason'] for cur_variation in plan_data['variations']
+                   if not cur_variation['applicable'])
+        testcases = applicable_variations[0]['testcases']
+        assert [cur_testcase['name'] for cur_testcase in testcases] == ['test_service', 'test_value']
+        assert testcases[1]['parametrization'] == {'static': {'value': ['1', '2']}, 'dynamic': []}
+
+        result = self.run_balder(CONSOLE_CODE, 'plan-diff', str(one_scenario_plan), str(all_scenarios_plan))
+        assert result.returncode == 0, result.stderr
+        assert "1 variation(s) added, 0 variation(s) removed, 0 variation(s) with changed testcases" in result.stdout
+        assert "+ env.setups.setup_plan.SetupPlan::env.scenarios.scenario_other.ScenarioOther" in result.stdout
+
+        # the solver would fail, if it determines the device mappings
+        result = self.run_balder(CONSOLE_CODE_WITHOUT_SOLVING, '--working-dir', str(balder_working_dir),
+                                 '--load-plan', str(one_scenario_plan))
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "load 2 valid variations from the execution plan" in result.stdout
+        assert "scenario other imported;" not in result.stdout
+        assert len(re.findall(r"setup service;", result.stdout)) == 2
+        assert sorted(re.findall(r"value (\d);", result.stdout)) == ['1', '1', '2', '2']
+
+        result = self.run_balder(CONSOLE_CODE, '--working-dir', str(balder_working_dir), '--load-plan',
+                                 str(one_scenario_plan), '--sample', '1')
+        assert result.returncode == 2
+        assert "argument --load-plan: not allowed with argument --sample" in result.stderr
+
+        unmatched_plan = plan_dir / 'unmatched.json'
+        result = self.run_balder(CONSOLE_CODE, '--working-dir', str(balder_working_dir), '--resolve-only',
+                                 '--save-plan', str(unmatched_plan),
+                                 '--only-with-scenario', 'scenarios/scenario_unmatched.py')
+        assert result.returncode == 0, result.stderr
+        assert "ScenarioUnmatched" not in result.stdout
+        plan_data = json.loads(unmatched_plan.read_text(encoding='utf-8'))
+        assert len(plan_data['variations']) == 4
+        assert not any(cur_variation['applicable'] for cur_variation in plan_data['variations'])
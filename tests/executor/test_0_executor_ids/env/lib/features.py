@@ -0,0 +1,11 @@
+import balder
+
+
+class ServiceFeature(balder.Feature):
+    """feature of the server"""
+    pass
+
+
+class ApiFeature(balder.Feature):
+    """feature of the client"""
+    pass
@@ -0,0 +1,17 @@
+import balder
+from ..lib.features import ServiceFeature, ApiFeature
+
+
+class SetupIds(balder.Setup):
+    """setup with a server that is connected to two clients"""
+
+    class Server(balder.Device):
+        service = ServiceFeature()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Client1(balder.Device):
+        api = ApiFeature()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Client2(balder.Device):
+        api = ApiFeature()
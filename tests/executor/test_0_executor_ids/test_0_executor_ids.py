@@ -0,0 +1,69 @@
+import io
+import pathlib
+import contextlib
+from multiprocessing import Process, Queue
+from _balder.balder_session import BalderSession
+
+
+def run_session_and_get_ids(working_dir: pathlib.Path, queue: Queue):
+    """executes a session and puts the executor ids of the whole tree (before and after the execution) in the queue"""
+    session = BalderSession(cmd_args=[], working_dir=working_dir)
+    results = {}
+
+    def get_ids():
+        executors = [*session.executor_tree.get_setup_executors(), *session.executor_tree.get_all_scenario_executors(),
+                     *session.executor_tree.get_all_variation_executors(),
+                     *session.executor_tree.get_all_testcase_executors()]
+        return {
+            'ids': [(cur_executor.__class__.__name__, cur_executor.executor_id) for cur_executor in executors],
+            'indexed': all(session.executor_tree.get_executor_by_id(cur_executor.executor_id) is cur_executor
+                           for cur_executor in executors),
+        }
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.collect()
+        session.solve()
+        session.create_executor_tree()
+        results['before'] = get_ids()
+        session.executor_tree.execute()
+        results['after'] = get_ids()
+    results['unknown'] = session.executor_tree.get_executor_by_id('unknown')
+    queue.put(results)
+
+
+class Test0ExecutorIds:
+    """
+    This testcase resolves the same environment in two different processes. It checks that every executor of the tree
+    has a unique id, that the ids are the same in both processes and that the tree returns every executor for its id
+    (also the parametrized testcase executors that replace their unresolved group while the tree is executed).
+    """
+
+    def test(self, balder_working_dir):
+        process_results = []
+        for _ in range(2):
+            queue = Queue()
+            proc = Process(target=run_session_and_get_ids, args=(balder_working_dir, queue))
+            proc.start()
+            proc.join(timeout=120)
+            assert proc.exitcode == 0
+            process_results.append(queue.get())
+
+        first_result, second_result = process_results
+        assert first_result == second_result
+        assert first_result['unknown'] is None
+        for cur_state in ('before', 'after'):
+            assert first_result[cur_state]['indexed']
+            all_ids = [cur_id for _, cur_id in first_result[cur_state]['ids']]
+            assert len(all_ids) == len(set(all_ids))
+
+        variation_id = "env.setups.setup_ids.SetupIds::env.scenarios.scenario_ids.ScenarioIds" \
+                       "[ScenarioIds.Client=SetupIds.Client1,ScenarioIds.Server=SetupIds.Server]"
+        assert ('SetupExecutor', 'env.setups.setup_ids.SetupIds') in first_result['before']['ids']
+        assert ('VariationExecutor', variation_id) in first_result['before']['ids']
+        assert ('UnresolvedParametrizedTestcaseExecutor', f"{variation_id}::ScenarioIds.test_value") \
+               in first_result['before']['ids']
+        # two variations with two testcases before the execution and with three testcases after it
+        assert len(first_result['before']['ids']) == 1 + 1 + 2 + 4
+        assert len(first_result['after']['ids']) == 1 + 1 + 2 + 6
+        assert ('ParametrizedTestcaseExecutor', f"{variation_id}::ScenarioIds.test_value[2]") \
+               in first_result['after']['ids']
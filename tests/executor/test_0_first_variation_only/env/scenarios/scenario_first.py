@@ -0,0 +1,20 @@
+import balder
+from ..lib.features import ServiceFeature, ApiFeature, MonitorFeature
+
+
+class ScenarioFirst(balder.Scenario):
+    """scenario with a server that is connected to a client and an observer"""
+
+    class Server(balder.Device):
+        service = ServiceFeature()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Client(balder.Device):
+        api = ApiFeature()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Observer(balder.Device):
+        monitor = MonitorFeature()
+
+    def test_service(self):
+        print(f"{self.Server.service.get_name()};")
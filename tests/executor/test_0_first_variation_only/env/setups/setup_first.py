@@ -0,0 +1,35 @@
+import balder
+from ..lib.features import ServiceFeature, ApiFeature, MonitorFeature
+
+
+class SetupService(ServiceFeature):
+    def get_name(self) -> str:
+        return "setup service"
+
+
+class SetupFirst(balder.Setup):
+    """
+    setup with six devices - the devices without features are the first ones in the order of the setup devices, so that
+    the first device mappings in this order are not applicable
+    """
+
+    class ADecoy1(balder.Device):
+        pass
+
+    @balder.connect(ADecoy1, over_connection=balder.Connection)
+    class ADecoy2(balder.Device):
+        pass
+
+    class ADecoy3(balder.Device):
+        pass
+
+    class Server(balder.Device):
+        service = SetupService()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Client(balder.Device):
+        api = ApiFeature()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Observer(balder.Device):
+        monitor = MonitorFeature()
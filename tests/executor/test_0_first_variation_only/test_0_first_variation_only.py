@@ -0,0 +1,38 @@
+import re
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0FirstVariationOnly(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with the command line argument ``--first-variation-only``. The scenario has
+    three devices, the setup has six devices, but the devices without features are the first ones of the setup. The
+    test checks that the solver verifies only one device mapping (the applicable one) and that only this variation is
+    executed.
+    """
+
+    @property
+    def cmd_args(self):
+        return ['--first-variation-only', '--show-discarded']
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        assert "resolve them to 1 valid variations (0 discarded)" in stdout
+        assert len(re.findall(r"setup service;", stdout)) == 1
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        # no other device mapping was verified (not applicable ones would be part of the tree as discarded variations)
+        all_variations = session.executor_tree.get_all_variation_executors(return_discarded=True)
+        assert len(all_variations) == 1
+        assert {scenario_device.__name__: setup_device.__name__
+                for scenario_device, setup_device in all_variations[0].base_device_mapping.items()} == \
+               {'Server': 'Server', 'Client': 'Client', 'Observer': 'Observer'}
+        assert len(session.all_resolved_mappings) == 1
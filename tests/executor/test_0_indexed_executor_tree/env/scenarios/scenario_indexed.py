@@ -0,0 +1,20 @@
+import balder
+from ..lib.features import ServiceFeature, ApiFeature
+
+
+class ScenarioIndexed(balder.Scenario):
+    """scenario with a server that is connected to a client"""
+
+    class Server(balder.Device):
+        service = ServiceFeature()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Client(balder.Device):
+        api = ApiFeature()
+
+    def test_plain(self):
+        pass
+
+    @balder.parametrize('value', [1, 2])
+    def test_value(self, value):
+        pass
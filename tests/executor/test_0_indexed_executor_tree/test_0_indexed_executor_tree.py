@@ -0,0 +1,76 @@
+import io
+import pathlib
+import contextlib
+from multiprocessing import Process, Queue
+from _balder.balder_session import BalderSession
+from _balder.previous_executor_mark import PreviousExecutorMark
+
+
+def run_session_and_check_tree(working_dir: pathlib.Path, queue: Queue):
+    """resolves the executor tree and puts the results of different lookups and views of it in the queue"""
+    session = BalderSession(cmd_args=[], working_dir=working_dir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.collect()
+        session.solve()
+        session.create_executor_tree()
+    tree = session.executor_tree
+    setup_executor = tree.get_setup_executors()[0]
+    scenario_executor = setup_executor.get_scenario_executors()[0]
+    first_variation, second_variation = scenario_executor.get_variation_executors()
+    test_plain = scenario_executor.base_scenario_class.__class__.test_plain
+    reversed_mapping = dict(reversed(second_variation.base_device_mapping.items()))
+
+    results = {
+        'setup_lookup': tree.get_executor_for_setup(setup_executor.base_setup_class.__class__) is setup_executor,
+        'scenario_lookup':
+            setup_executor.get_executor_for_scenario(scenario_executor.base_scenario_class.__class__)
+            is scenario_executor,
+        'mapping_lookup':
+            scenario_executor.get_executor_for_device_mapping(reversed_mapping) is second_variation,
+        'testcase_lookup':
+            first_variation.get_executor_for_testcase(test_plain) is first_variation.all_child_executors[0],
+        'unknown_lookup': tree.get_executor_for_setup(BalderSession),
+        'iter_equals_get': list(tree.iter_all_variation_executors()) == tree.get_all_variation_executors()
+                           and list(tree.iter_all_testcase_executors()) == tree.get_all_testcase_executors(),
+    }
+    # the views are copies of the cached lists
+    tree.get_all_variation_executors().clear()
+    results['views_are_copies'] = tree.get_all_variation_executors() == [first_variation, second_variation]
+
+    # the views change with the tree
+    scenario_executor.reorder_child_executors(scenario_executor.get_variation_executors(return_discarded=True)[::-1])
+    results['reordered'] = tree.get_all_variation_executors() == [second_variation, first_variation]
+    second_variation.prev_mark = PreviousExecutorMark.DISCARDED
+    results['discarded'] = (tree.get_all_variation_executors() == [first_variation],
+                            len(tree.get_all_testcase_executors()))
+    first_variation.prev_mark = PreviousExecutorMark.DISCARDED
+    results['all_discarded'] = (tree.get_setup_executors(), tree.get_all_scenario_executors(),
+                                tree.get_all_testcase_executors())
+    queue.put(results)
+
+
+class Test0IndexedExecutorTree:
+    """
+    This testcase resolves an environment with one setup and one scenario that results in two variations. It checks
+    that the executors can be looked up over their setup class, scenario class, device mapping and test method and
+    that the flattened views of the tree are updated as soon as the variations are reordered or discarded.
+    """
+
+    def test(self, balder_working_dir):
+        queue = Queue()
+        proc = Process(target=run_session_and_check_tree, args=(balder_working_dir, queue))
+        proc.start()
+        proc.join(timeout=120)
+        assert proc.exitcode == 0
+
+        results = queue.get()
+        assert results['setup_lookup']
+        assert results['scenario_lookup']
+        assert results['mapping_lookup']
+        assert results['testcase_lookup']
+        assert results['unknown_lookup'] is None
+        assert results['iter_equals_get']
+        assert results['views_are_copies']
+        assert results['reordered']
+        assert results['discarded'] == (True, 2)
+        assert results['all_discarded'] == ([], [], [])
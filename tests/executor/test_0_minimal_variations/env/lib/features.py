@@ -0,0 +1,13 @@
+import balder
+
+
+class ApiFeature(balder.Feature):
+    """scenario feature of the client"""
+
+    def get_version(self) -> int:
+        raise NotImplementedError()
+
+
+class ServiceFeature(balder.Feature):
+    """scenario feature of the server"""
+    pass
@@ -0,0 +1,16 @@
+import balder
+from ..lib.features import ApiFeature, ServiceFeature
+
+
+class ScenarioMinimal(balder.Scenario):
+    """scenario with a client that is connected to a server"""
+
+    class Server(balder.Device):
+        service = ServiceFeature()
+
+    @balder.connect(Server, over_connection=balder.Connection)
+    class Client(balder.Device):
+        api = ApiFeature()
+
+    def test_version(self):
+        print(f"version {self.Client.api.get_version()};")
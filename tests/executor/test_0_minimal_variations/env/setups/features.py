@@ -0,0 +1,15 @@
+from ..lib.features import ApiFeature, ServiceFeature
+
+
+class SetupApiV1(ApiFeature):
+    def get_version(self) -> int:
+        return 1
+
+
+class SetupApiV2(ApiFeature):
+    def get_version(self) -> int:
+        return 2
+
+
+class SetupService(ServiceFeature):
+    pass
@@ -0,0 +1,40 @@
+import balder
+from ..lib.connections import AConnection, BConnection
+from .features import SetupApiV1, SetupApiV2, SetupService
+
+
+class ClientDevice(balder.Device):
+    """base class of all clients"""
+    pass
+
+
+class ServerDevice(balder.Device):
+    """base class of all servers"""
+    pass
+
+
+class SetupMinimal(balder.Setup):
+    """
+    setup with three clients and two servers - the scenario results in five applicable variations, but two of them are
+    enough to cover every feature implementation and connection type
+    """
+
+    class Server1(ServerDevice):
+        service = SetupService()
+
+    class Server2(ServerDevice):
+        service = SetupService()
+
+    @balder.connect(Server1, over_connection=AConnection)
+    @balder.connect(Server2, over_connection=AConnection)
+    class Client1(ClientDevice):
+        api = SetupApiV1()
+
+    @balder.connect(Server1, over_connection=AConnection)
+    @balder.connect(Server2, over_connection=AConnection)
+    class Client2(ClientDevice):
+        api = SetupApiV1()
+
+    @balder.connect(Server2, over_connection=BConnection)
+    class Client3(ClientDevice):
+        api = SetupApiV2()
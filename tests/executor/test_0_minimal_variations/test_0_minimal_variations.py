@@ -0,0 +1,48 @@
+import re
+from _balder.solver import Solver
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0MinimalVariations(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with five applicable variations with the command line argument
+    ``--minimal-variations``. The clients of the setup have two different feature implementations and are connected over
+    two different connection types. The test checks that only two variations are executed and that these two variations
+    cover the same facts as all applicable variations together.
+    """
+
+    @property
+    def cmd_args(self):
+        return ['--minimal-variations']
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        assert "resolve them to 2 valid variations" in stdout
+        assert sorted(re.findall(r"version (\d+);", stdout)) == ['1', '2']
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        assert session.options.sampling.minimal_variations
+
+        selected_variations = session.executor_tree.get_all_variation_executors()
+        assert len(selected_variations) == 2
+        selected_clients = sorted(cur_variation.base_device_mapping[cur_variation.cur_scenario_class.Client].__name__
+                                  for cur_variation in selected_variations)
+        assert selected_clients[0] in ('Client1', 'Client2')
+        assert selected_clients[1] == 'Client3'
+
+        # the selected variations cover the same facts as all applicable variations
+        all_variations = session.solver.get_executor_tree(session.plugin_manager).get_all_variation_executors()
+        assert len(all_variations) == 5
+        all_facts = set().union(*[Solver._get_coverage_facts_of(cur_variation) for cur_variation in all_variations])
+        selected_facts = set().union(*[Solver._get_coverage_facts_of(cur_variation)
+                                       for cur_variation in selected_variations])
+        assert selected_facts == all_facts
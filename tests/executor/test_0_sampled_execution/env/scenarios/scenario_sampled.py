@@ -0,0 +1,18 @@
+import balder
+
+
+class ScenarioSampled(balder.Scenario):
+    """scenario with two devices that results in twelve variations with the setup"""
+
+    class Sender(balder.Device):
+        pass
+
+    class Receiver(balder.Device):
+        pass
+
+    @balder.parametrize('number', list(range(20)))
+    def test_parametrized(self, number):
+        print(f"parametrized {number};")
+
+    def test_not_parametrized(self):
+        print("not parametrized;")
@@ -0,0 +1,17 @@
+import balder
+
+
+class SetupSampled(balder.Setup):
+    """setup with four devices"""
+
+    class Device1(balder.Device):
+        pass
+
+    class Device2(balder.Device):
+        pass
+
+    class Device3(balder.Device):
+        pass
+
+    class Device4(balder.Device):
+        pass
@@ -0,0 +1,60 @@
+import re
+import json
+import shutil
+from _balder.sampling import Sampling
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from _balder.utils.duration_store import DurationStore
+from _balder.utils.sample_rotation_store import SampleRotationStore
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0SampledExecution(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with twelve variations and a test with twenty parametrized testcases with the
+    command line argument ``--sample 2``. Before the session starts, the test writes the index of the next sampled run
+    into the balder cache. The test checks that only two variations with two parametrized testcases each are part of
+    the tree, that the index of the run was incremented and that the samples of consecutive runs cover all elements.
+    """
+
+    @property
+    def cmd_args(self):
+        return ['--sample', '2', '--seed', '7']
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def test(self, balder_working_dir):
+        cache_dir = balder_working_dir / DurationStore.CACHE_DIR_NAME
+        cache_dir.mkdir(exist_ok=True)
+        with open(cache_dir / SampleRotationStore.FILE_NAME, 'w', encoding='utf-8') as file:
+            json.dump({'next_run': 3}, file)
+        try:
+            super().test(balder_working_dir)
+            assert SampleRotationStore(balder_working_dir).get_next_run() == 4
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        assert "sample them with seed 7 (sample run 3)" in stdout
+        assert len(re.findall(r"VARIATION ", stdout)) == 2
+        assert len(re.findall(r"parametrized (\d+);", stdout)) == 4
+        assert len(re.findall(r"not parametrized;", stdout)) == 2
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        assert session.sampling == Sampling(size=2, seed=7, run=3)
+        assert len(session.executor_tree.get_all_variation_executors()) == 2
+        # all not selected variations were never created
+        assert len(session.executor_tree.get_all_variation_executors(return_discarded=True)) == 2
+
+        # the same seed and run always selects the same elements, consecutive runs select all elements
+        assert session.sampling.get_sampled_indexes('key', 20) == session.sampling.get_sampled_indexes('key', 20)
+        all_selected = set()
+        for cur_run in range(10):
+            all_selected.update(Sampling(size=2, seed=7, run=cur_run).get_sampled_indexes('key', 20))
+        assert all_selected == set(range(20))
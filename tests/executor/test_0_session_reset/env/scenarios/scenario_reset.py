@@ -0,0 +1,23 @@
+import balder
+
+
+class ValueFeature(balder.Feature):
+    """feature that returns the given value"""
+
+    def get(self, value):
+        return value
+
+
+class ScenarioReset(balder.Scenario):
+    """scenario with one device and a parametrized test that uses a fixture"""
+
+    class Device(balder.Device):
+        value = ValueFeature()
+
+    @balder.fixture('scenario')
+    def offset(self):
+        yield 10
+
+    @balder.parametrize('value', [1, 2])
+    def test_value(self, offset, value):
+        assert self.Device.value.get(value) + offset == value + 10
@@ -0,0 +1,9 @@
+import balder
+from ..scenarios.scenario_reset import ValueFeature
+
+
+class SetupReset(balder.Setup):
+    """setup with one device that provides the value feature"""
+
+    class Device1(balder.Device):
+        value = ValueFeature()
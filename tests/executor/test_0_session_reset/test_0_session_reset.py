@@ -0,0 +1,66 @@
+import io
+import pathlib
+import contextlib
+from multiprocessing import Process, Queue
+from _balder.balder_session import BalderSession
+from _balder.session_registry import SessionRegistry
+
+
+def run_sessions_and_reset(working_dir: pathlib.Path, queue: Queue):
+    """
+    executes two sessions one after another in this process and puts the results of them in the queue - the first
+    session is reset automatically when the second one is created, the second one is reset explicitly
+    """
+    results = []
+    previous_session = None
+    for _ in range(2):
+        session = BalderSession(cmd_args=[], working_dir=working_dir)
+        if previous_session is not None:
+            results[-1]['registry_cleared'] = not any(previous_session.registry.__dict__.values())
+            # the previous session was already reset - resetting it again must not deactivate the new session
+            previous_session.reset()
+            results[-1]['is_next_session_active'] = session.registry.is_active
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            session.run()
+        results.append({
+            'stdout': stdout.getvalue(),
+            'scenario_controllers': [cur_cls.__qualname__ for cur_cls in session.registry.scenario_controllers],
+            'parametrization': len(session.registry.parametrization),
+            'raw_fixtures': sum(len(cur_list) for cur_list in session.registry.raw_fixtures.values()),
+        })
+        previous_session = session
+    previous_session.reset()
+    results[-1]['registry_cleared'] = not any(previous_session.registry.__dict__.values())
+    results[-1]['is_base_active'] = SessionRegistry.get_base().is_active
+    results[-1]['base_scenario_controllers'] = len(SessionRegistry.get_base().scenario_controllers)
+    queue.put(results)
+
+
+class Test0SessionReset:
+    """
+    This testcase executes two balder sessions for the same environment one after another within the same process.
+    The first session is reset automatically when the second session is created. The test checks that both sessions
+    collect and execute the environment completely and that the registries of the first session are not used by the
+    second one. It also checks that resetting the first session again does not affect the second one and that the
+    base registry is active again after the second session was reset.
+    """
+
+    def test(self, balder_working_dir):
+        queue = Queue()
+        proc = Process(target=run_sessions_and_reset, args=(balder_working_dir, queue))
+        proc.start()
+        proc.join(timeout=120)
+        assert proc.exitcode == 0
+
+        first_result, second_result = queue.get()
+        for cur_result in (first_result, second_result):
+            assert "Collect 1 Setups and 1 Scenarios" in cur_result['stdout']
+            assert "TOTAL NOT_RUN: 0 | TOTAL FAILURE: 0 | TOTAL ERROR: 0 | TOTAL SUCCESS: 2" in cur_result['stdout']
+            assert cur_result['scenario_controllers'] == ['ScenarioReset']
+            assert cur_result['parametrization'] == 1
+            assert cur_result['raw_fixtures'] == 1
+            assert cur_result['registry_cleared']
+        assert first_result['is_next_session_active']
+        assert second_result['is_base_active']
+        assert second_result['base_scenario_controllers'] == 0
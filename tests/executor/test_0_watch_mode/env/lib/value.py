@@ -0,0 +1,2 @@
+#: the value the scenario b prints (the testcase changes it)
+VALUE = 1
@@ -0,0 +1,11 @@
+import balder
+
+
+class ScenarioA(balder.Scenario):
+    """scenario with one device that prints its value"""
+
+    class Device(balder.Device):
+        pass
+
+    def test_print_value(self):
+        print("scenario a prints value 1;")
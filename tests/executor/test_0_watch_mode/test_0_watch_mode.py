@@ -0,0 +1,81 @@
+import io
+import os
+import re
+import sys
+import time
+import pathlib
+import contextlib
+from multiprocessing import Process, Queue
+from _balder.watcher import Watcher
+
+
+def rewrite_file(path: pathlib.Path, old: str, new: str):
+    """replaces the given text in the file and moves its modification time into the future"""
+    path.write_text(path.read_text(encoding='utf-8').replace(old, new), encoding='utf-8')
+    later_time = time.time() + 10
+    os.utime(path, (later_time, later_time))
+
+
+def run_watcher(working_dir: pathlib.Path, queue: Queue):
+    """executes the watcher for different changes and puts the printed values and the kept modules in the queue"""
+    watcher = Watcher([], working_dir)
+    setup_module_name = f"{working_dir.stem}.setups.setup_watch"
+    results = []
+    # the setup module of the first session (the reference keeps it alive, so that it can be compared by identity)
+    first_setup_module = []
+
+    def run_and_remember(changed_files):
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            watcher.run_session(changed_files)
+        if not first_setup_module:
+            first_setup_module.append(sys.modules[setup_module_name])
+        results.append({
+            'values': sorted(re.findall(r"scenario (\w) prints value (\d+);", stdout.getvalue())),
+            'is_first_setup_module': sys.modules[setup_module_name] is first_setup_module[0],
+        })
+
+    # the first session executes everything
+    run_and_remember(None)
+    # change the scenario a -> only the pair with the scenario a is executed again
+    rewrite_file(working_dir / 'scenarios' / 'scenario_a.py', 'value 1;', 'value 2;')
+    run_and_remember([working_dir / 'scenarios' / 'scenario_a.py'])
+    # change the module the scenario b imports -> only the pair with the scenario b is executed again
+    rewrite_file(working_dir / 'lib' / 'value.py', 'VALUE = 1', 'VALUE = 3')
+    run_and_remember([working_dir / 'lib' / 'value.py'])
+    # change the setup -> all pairs are executed again
+    rewrite_file(working_dir / 'setups' / 'setup_watch.py', 'with one device', 'with exactly one device')
+    run_and_remember([working_dir / 'setups' / 'setup_watch.py'])
+    queue.put(results)
+
+
+class Test0WatchMode:
+    """
+    This testcase executes the watcher for an environment with one setup and two scenarios. It changes different files
+    of the environment one after another and checks that only the setup/scenario pairs that are affected by the change
+    are executed again (with the changed code) and that the modules that are not affected are not imported again.
+    """
+
+    def test(self, balder_working_dir):
+        changed_files = [balder_working_dir / 'scenarios' / 'scenario_a.py', balder_working_dir / 'lib' / 'value.py',
+                         balder_working_dir / 'setups' / 'setup_watch.py']
+        original_contents = {cur_file: cur_file.read_text(encoding='utf-8') for cur_file in changed_files}
+        try:
+            queue = Queue()
+            proc = Process(target=run_watcher, args=(balder_working_dir, queue))
+            proc.start()
+            proc.join(timeout=120)
+            assert proc.exitcode == 0
+
+            first, scenario_a_changed, value_changed, setup_changed = queue.get()
+        finally:
+            for cur_file, cur_content in original_contents.items():
+                cur_file.write_text(cur_content, encoding='utf-8')
+
+        assert first['values'] == [('a', '1'), ('b', '1')]
+        assert scenario_a_changed['values'] == [('a', '2')]
+        assert scenario_a_changed['is_first_setup_module']
+        assert value_changed['values'] == [('b', '3')]
+        assert value_changed['is_first_setup_module']
+        assert setup_changed['values'] == [('a', '2'), ('b', '3')]
+        assert not setup_changed['is_first_setup_module']
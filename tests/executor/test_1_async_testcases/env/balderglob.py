@@ -0,0 +1,17 @@
+from typing import Union
+
+import asyncio
+import balder
+from multiprocessing import Queue
+
+
+class RuntimeObserver:
+    """This is a helper object, that will be used from this test environment to observe the execution order"""
+    queue: Union[Queue, None] = None
+
+
+@balder.fixture(level="session")
+async def session_event_loop():
+    # async generator fixture that provides the event loop of the session
+    yield asyncio.get_running_loop()
+    await asyncio.sleep(0)
@@ -0,0 +1,9 @@
+import asyncio
+import balder
+
+
+class ValueFeature(balder.Feature):
+    """feature with an awaitable method"""
+
+    async def get_value(self) -> int:
+        raise NotImplementedError()
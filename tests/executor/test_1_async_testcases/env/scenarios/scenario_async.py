@@ -0,0 +1,42 @@
+import asyncio
+import balder
+from ..lib.features import ValueFeature
+
+
+class ScenarioAsync(balder.Scenario):
+    """scenario with three async tests that wait for each other and one sync test"""
+
+    started_tests = set()
+
+    class ScenarioDevice(balder.Device):
+        value = ValueFeature()
+
+    @balder.fixture(level="testcase")
+    async def testcase_loop(self):
+        await asyncio.sleep(0)
+        return asyncio.get_running_loop()
+
+    async def _check_concurrent(self, name, session_event_loop, testcase_loop):
+        assert asyncio.get_running_loop() is session_event_loop, "test does not run on the session event loop"
+        assert testcase_loop is session_event_loop, "fixture does not run on the session event loop"
+        assert await self.ScenarioDevice.value.get_value() == 42
+        print(f"running {name}")
+        self.started_tests.add(name)
+        # wait till all async tests are active - this is only possible if they are executed concurrently
+        for _ in range(1000):
+            if len(self.started_tests) == 3:
+                break
+            await asyncio.sleep(0.01)
+        assert len(self.started_tests) == 3, "async tests are not executed concurrently"
+
+    async def test_async_1(self, session_event_loop, testcase_loop):
+        await self._check_concurrent('test_async_1', session_event_loop, testcase_loop)
+
+    async def test_async_2(self, session_event_loop, testcase_loop):
+        await self._check_concurrent('test_async_2', session_event_loop, testcase_loop)
+
+    async def test_async_3(self, session_event_loop, testcase_loop):
+        await self._check_concurrent('test_async_3', session_event_loop, testcase_loop)
+
+    def test_sync(self, testcase_loop):
+        assert testcase_loop.is_running()
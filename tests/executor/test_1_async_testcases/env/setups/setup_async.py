@@ -0,0 +1,17 @@
+import asyncio
+import balder
+from ..lib.features import ValueFeature
+
+
+class SetupValueFeature(ValueFeature):
+
+    async def get_value(self) -> int:
+        await asyncio.sleep(0)
+        return 42
+
+
+class SetupAsync(balder.Setup):
+    """simple setup for the async execution test"""
+
+    class SetupDevice(balder.Device):
+        value = SetupValueFeature()
@@ -0,0 +1,39 @@
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test1AsyncTestcases(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with async tests, async fixtures and an awaitable feature method with the
+    command line argument ``--concurrent-async-testcases 3``. The async tests wait till all of them are active, so they
+    can only succeed if they run concurrently on the session event loop.
+    """
+
+    @property
+    def cmd_args(self):
+        return ['--concurrent-async-testcases', '3']
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        lines = stdout.splitlines()
+        for cur_test_name in ['test_async_1', 'test_async_2', 'test_async_3']:
+            line_idx = lines.index(f"      TEST ScenarioAsync.{cur_test_name} running {cur_test_name}")
+            # the output of one test has to be printed as one block
+            assert lines[line_idx + 1] == "[.]", f"output of test `{cur_test_name}` is not printed as one block"
+        assert "      TEST ScenarioAsync.test_sync [.]" in lines
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        all_testcase_executors = session.executor_tree.get_all_testcase_executors()
+        assert len(all_testcase_executors) == 4
+        for cur_testcase_executor in all_testcase_executors:
+            assert cur_testcase_executor.executor_result == ResultState.SUCCESS, \
+                f"testcase `{cur_testcase_executor.full_test_name_str}` does not terminates with SUCCESS"
+        assert not session.executor_tree.event_loop.is_running, "event loop was not closed"
@@ -0,0 +1,8 @@
+from typing import Union
+
+from multiprocessing import Queue
+
+
+class RuntimeObserver:
+    """This is a helper object, that will be used from this test environment to observe the execution order"""
+    queue: Union[Queue, None] = None
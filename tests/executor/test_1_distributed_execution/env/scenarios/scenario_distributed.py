@@ -0,0 +1,30 @@
+import balder
+
+
+class ValueFeature(balder.Feature):
+
+    def get_value(self):
+        raise NotImplementedError
+
+
+class ScenarioDistributed(balder.Scenario):
+    """scenario that is executed by the workers on both setups"""
+    IGNORE = ['test_ignored_parametrized']
+
+    class ScenarioDevice(balder.Device):
+        value = ValueFeature()
+
+    @balder.parametrize_by_feature('value', (ScenarioDevice, 'value', 'get_value'))
+    def test_dynamic_parametrized(self, value):
+        assert value in ('A1', 'A2', 'B1')
+
+    @balder.parametrize('number', [1, 2])
+    def test_static_parametrized(self, number):
+        assert isinstance(number, int)
+
+    @balder.parametrize('number', range(100))
+    def test_ignored_parametrized(self, number):
+        pass
+
+    def test_value(self):
+        print(f"executed with value {self.ScenarioDevice.value.get_value()}")
@@ -0,0 +1,15 @@
+import balder
+from ..scenarios.scenario_distributed import ValueFeature
+
+
+class SetupValueFeatureA(ValueFeature):
+
+    def get_value(self):
+        return ['A1', 'A2']
+
+
+class SetupA(balder.Setup):
+    """setup that is only served by the first worker"""
+
+    class SetupDevice(balder.Device):
+        value = SetupValueFeatureA()
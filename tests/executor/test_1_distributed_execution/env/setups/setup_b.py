@@ -0,0 +1,18 @@
+import balder
+from ..scenarios.scenario_distributed import ValueFeature
+
+
+class SetupValueFeatureB(ValueFeature):
+
+    def get_value(self):
+        return ['B1']
+
+
+class SetupB(balder.Setup):
+    """setup that is only served by the second worker"""
+
+    class SetupDevice1(balder.Device):
+        value = SetupValueFeatureB()
+
+    class SetupDevice2(balder.Device):
+        value = SetupValueFeatureB()
@@ -0,0 +1,90 @@
+import socket
+from multiprocessing import Process
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from _balder.executor.unresolved_parametrized_testcase_executor import UnresolvedParametrizedTestcaseExecutor
+from _balder.console.balder import _console_balder_debug
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test1DistributedExecution(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with two setups as coordinator on localhost. Two workers are connected to it,
+    the first one only serves the ``SetupA`` and the second one only serves the ``SetupB``. The testcase checks that
+    all variations are executed by the worker that serves their setup and that the results (also the results of the
+    dynamically parametrized tests) are sent back to the coordinator. The coordinator has to look up the values of the
+    statically parametrized tests in its own tree, so that their types are kept. The executors of the ignored
+    parametrized test are never created - neither by the workers nor by the coordinator.
+    """
+
+    #: the port the coordinator listens on (will be determined in the test)
+    port = None
+
+    @property
+    def cmd_args(self):
+        return ['--coordinator', f'127.0.0.1:{self.port}', '--expected-workers', '2']
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def test(self, balder_working_dir):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            self.port = sock.getsockname()[1]
+
+        workers = [
+            Process(target=_console_balder_debug,
+                    kwargs={'cmd_args': ['worker', '--coordinator', f'127.0.0.1:{self.port}',
+                                         '--only-with-setup', f'setups/{cur_setup_file}'],
+                            'working_dir': balder_working_dir})
+            for cur_setup_file in ['setup_a.py', 'setup_b.py']
+        ]
+        for cur_worker in workers:
+            cur_worker.start()
+        try:
+            super().test(balder_working_dir)
+        finally:
+            for cur_worker in workers:
+                cur_worker.join(timeout=30)
+        for cur_worker in workers:
+            assert cur_worker.exitcode == 0, f"worker terminates with unexpected exit code `{cur_worker.exitcode}`"
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        lines = stdout.splitlines()
+        worker_names = set()
+        for cur_line in lines:
+            if cur_line.startswith("    VARIATION "):
+                worker_names.add(cur_line.split("(executed by worker ")[1])
+        assert len(worker_names) == 2, "the variations were not executed by two different workers"
+        assert lines[-1] == "TOTAL NOT_RUN: 300 | TOTAL FAILURE: 0 | TOTAL ERROR: 0 | TOTAL SUCCESS: 13 | " \
+                            "TOTAL SKIP: 0 | TOTAL COVERED_BY: 0"
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        all_variation_executors = session.executor_tree.get_all_variation_executors()
+        assert len(all_variation_executors) == 3
+        all_testcase_executors = session.executor_tree.get_all_testcase_executors()
+        ignored_groups = [cur_executor for cur_executor in all_testcase_executors
+                          if isinstance(cur_executor, UnresolvedParametrizedTestcaseExecutor)]
+        assert len(ignored_groups) == 3
+        for cur_group in ignored_groups:
+            assert cur_group.materialized_executors == []
+            assert cur_group.testsummary().not_run == 100
+            all_testcase_executors.remove(cur_group)
+        # SetupA: 2 dynamic parametrized tests + 2 static parametrized tests + 1 normal test, SetupB: 2 variations
+        # with 1 + 2 + 1 tests
+        assert len(all_testcase_executors) == 13
+        assert sorted(cur_executor.full_test_name_str for cur_executor in all_testcase_executors
+                      if cur_executor.base_testcase_callable.__name__ == 'test_dynamic_parametrized') == [
+            'ScenarioDistributed.test_dynamic_parametrized[A1]', 'ScenarioDistributed.test_dynamic_parametrized[A2]',
+            'ScenarioDistributed.test_dynamic_parametrized[B1]', 'ScenarioDistributed.test_dynamic_parametrized[B1]']
+        static_values = [cur_executor.parametrization['number'] for cur_executor in all_testcase_executors
+                         if cur_executor.base_testcase_callable.__name__ == 'test_static_parametrized']
+        assert sorted(static_values) == [1, 1, 1, 2, 2, 2]
+        for cur_testcase_executor in all_testcase_executors:
+            assert cur_testcase_executor.executor_result == ResultState.SUCCESS, \
+                f"testcase `{cur_testcase_executor.full_test_name_str}` does not terminates with SUCCESS"
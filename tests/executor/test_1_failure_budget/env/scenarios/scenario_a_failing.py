@@ -0,0 +1,23 @@
+import balder
+
+
+class ScenarioAFailing(balder.Scenario):
+    """scenario with a failing test that is executed before a passing one and a parametrized one"""
+
+    class ScenarioDevice(balder.Device):
+        pass
+
+    @balder.fixture(level="variation")
+    def variation_fixture(self):
+        yield
+        print("teardown of variation fixture")
+
+    def test_1_failing(self):
+        assert False, "this test fails"
+
+    def test_2_passing(self):
+        pass
+
+    @balder.parametrize('number', range(1000))
+    def test_3_parametrized(self, number):
+        pass
@@ -0,0 +1,15 @@
+import balder
+
+
+class ScenarioBPassing(balder.Scenario):
+    """scenario that is not executed anymore, because the failure budget of the session is exhausted"""
+
+    class ScenarioDevice(balder.Device):
+        pass
+
+    def test_passing(self):
+        pass
+
+    @balder.parametrize('number', range(1000))
+    def test_parametrized(self, number):
+        pass
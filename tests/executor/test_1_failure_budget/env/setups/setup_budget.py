@@ -0,0 +1,11 @@
+import balder
+
+
+class SetupBudget(balder.Setup):
+    """setup with two devices - every scenario has two variations"""
+
+    class SetupDevice1(balder.Device):
+        pass
+
+    class SetupDevice2(balder.Device):
+        pass
@@ -0,0 +1,56 @@
+from _balder.exit_code import ExitCode
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from _balder.executor.unresolved_parametrized_testcase_executor import UnresolvedParametrizedTestcaseExecutor
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test1FailureBudget(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with two scenarios with the command line arguments ``--maxfail 2`` and
+    ``--maxfail-per-variation 1``. Every variation of the first scenario has a failing test that is executed before a
+    passing one. The passing test is never executed, because the failure budget of its variation is exhausted. After
+    the second variation failed, the failure budget of the session is exhausted too - so the second scenario is not
+    executed anymore. The teardown code of the fixtures has to be executed anyway. The executors of the parametrized
+    tests are never created, because none of them is executed - their result is only stored in their group.
+    """
+
+    @property
+    def cmd_args(self):
+        return ['--maxfail', '2', '--maxfail-per-variation', '1']
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    @property
+    def expected_exit_code(self) -> int:
+        return ExitCode.TESTS_FAILED.value
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        lines = stdout.splitlines()
+        assert lines.count("teardown of variation fixture") == 2
+        assert "STOPPED THE EXECUTION AFTER 2 FAILURES" in lines
+        assert lines[-1] == "TOTAL NOT_RUN: 4004 | TOTAL FAILURE: 2 | TOTAL ERROR: 0 | TOTAL SUCCESS: 0 | " \
+                            "TOTAL SKIP: 0 | TOTAL COVERED_BY: 0"
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.FAILURE, \
+            "test session does not terminates with FAILURE"
+        all_testcase_executors = session.executor_tree.get_all_testcase_executors()
+        # the parametrized tests are still represented by their groups, because their executors were never created
+        assert len([cur_testcase_executor for cur_testcase_executor in all_testcase_executors
+                    if isinstance(cur_testcase_executor, UnresolvedParametrizedTestcaseExecutor)]) == 4
+        for cur_testcase_executor in all_testcase_executors:
+            expected_result = ResultState.FAILURE \
+                if cur_testcase_executor.base_testcase_callable.__name__ == 'test_1_failing' else ResultState.NOT_RUN
+            assert cur_testcase_executor.executor_result == expected_result, \
+                f"testcase `{cur_testcase_executor.full_test_name_str}` does not terminates with {expected_result.name}"
+            if isinstance(cur_testcase_executor, UnresolvedParametrizedTestcaseExecutor):
+                assert cur_testcase_executor.materialized_executors == [], \
+                    "the executors of the parametrized tests were created although they are not executed"
+        for cur_variation_executor in session.executor_tree.get_all_variation_executors():
+            if cur_variation_executor.cur_scenario_class.__class__.__name__ == 'ScenarioAFailing':
+                assert cur_variation_executor.teardown_result.result == ResultState.SUCCESS
@@ -0,0 +1,14 @@
+import balder
+
+
+class ScenarioOrder(balder.Scenario):
+    """simple scenario that is executed for every setup device"""
+
+    class ScenarioDevice(balder.Device):
+        pass
+
+    def test_1(self):
+        pass
+
+    def test_2(self):
+        pass
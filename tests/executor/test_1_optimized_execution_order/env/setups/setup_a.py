@@ -0,0 +1,8 @@
+import balder
+
+
+class SetupA(balder.Setup):
+    """setup that took less time in the earlier run"""
+
+    class SetupDevice(balder.Device):
+        pass
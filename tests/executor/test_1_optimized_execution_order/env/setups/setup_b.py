@@ -0,0 +1,11 @@
+import balder
+
+
+class SetupB(balder.Setup):
+    """setup that took more time in the earlier run - its second device has the more expensive fixtures"""
+
+    class SetupDevice1(balder.Device):
+        pass
+
+    class SetupDevice2(balder.Device):
+        pass
@@ -0,0 +1,68 @@
+import json
+import shutil
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from _balder.utils.duration_store import DurationStore
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test1OptimizedExecutionOrder(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with two setups with the command line argument
+    ``--optimize-execution-order``. Before the session starts, the test writes durations of an earlier run, where the
+    ``SetupB`` took longer than the ``SetupA`` and the variation with ``SetupB.SetupDevice2`` has more expensive fixtures
+    than the variation with ``SetupB.SetupDevice1``. The test checks that the branches are executed in this order and
+    that the durations of this run are recorded afterwards.
+    """
+
+    SETUP_A_KEY = "env.setups.setup_a.SetupA"
+    SETUP_B_KEY = "env.setups.setup_b.SetupB"
+    SCENARIO_B_KEY = f"{SETUP_B_KEY}::env.scenarios.scenario_order.ScenarioOrder"
+
+    @property
+    def cmd_args(self):
+        return ['--optimize-execution-order']
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def test(self, balder_working_dir):
+        cache_dir = balder_working_dir / DurationStore.CACHE_DIR_NAME
+        cache_dir.mkdir(exist_ok=True)
+        durations = {
+            self.SETUP_A_KEY: {'fixture': 0.1, 'total': 1.0},
+            self.SETUP_B_KEY: {'fixture': 0.1, 'total': 10.0},
+            f"{self.SCENARIO_B_KEY}[ScenarioOrder.ScenarioDevice=SetupB.SetupDevice1]": {'fixture': 1.0, 'total': 2.0},
+            f"{self.SCENARIO_B_KEY}[ScenarioOrder.ScenarioDevice=SetupB.SetupDevice2]": {'fixture': 5.0, 'total': 6.0},
+        }
+        with open(cache_dir / DurationStore.FILE_NAME, 'w', encoding='utf-8') as file:
+            json.dump(durations, file)
+        try:
+            super().test(balder_working_dir)
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        lines = [cur_line for cur_line in stdout.splitlines()
+                 if cur_line.startswith("SETUP ") or cur_line.startswith("    VARIATION ")]
+        assert lines == [
+            "SETUP SetupB",
+            "    VARIATION ScenarioOrder.ScenarioDevice:SetupB.SetupDevice2",
+            "    VARIATION ScenarioOrder.ScenarioDevice:SetupB.SetupDevice1",
+            "SETUP SetupA",
+            "    VARIATION ScenarioOrder.ScenarioDevice:SetupA.SetupDevice",
+        ], "the branches were not executed in the expected order"
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        with open(session.duration_store.filepath, 'r', encoding='utf-8') as file:
+            recorded_durations = json.load(file)
+        for cur_testcase_executor in session.executor_tree.get_all_testcase_executors():
+            assert DurationStore.get_key_for(cur_testcase_executor) in recorded_durations, \
+                f"duration of testcase `{cur_testcase_executor.full_test_name_str}` was not recorded"
+        # the durations of the earlier run were overwritten
+        assert recorded_durations[Test1OptimizedExecutionOrder.SETUP_B_KEY]['total'] < 10.0
@@ -0,0 +1,39 @@
+import threading
+import balder
+
+
+class ScenarioParallel(balder.Scenario):
+    """scenario with three parallel-safe tests that wait for each other and one sequential test"""
+
+    # all parallel-safe tests have to reach this barrier - it breaks if they are not executed at the same time
+    barrier = threading.Barrier(3, timeout=10)
+    active_tests = []
+
+    class ScenarioDevice(balder.Device):
+        pass
+
+    @balder.fixture(level="testcase")
+    def testcase_thread_ident(self):
+        self.active_tests.append(threading.get_ident())
+        yield threading.get_ident()
+        self.active_tests.remove(threading.get_ident())
+
+    def _check_parallel(self, testcase_thread_ident):
+        assert testcase_thread_ident == threading.get_ident(), "fixture value of another thread was provided"
+        print(f"running in thread {threading.get_ident()}")
+        self.barrier.wait()
+
+    @balder.parallel_safe
+    def test_parallel_1(self, testcase_thread_ident):
+        self._check_parallel(testcase_thread_ident)
+
+    @balder.parallel_safe
+    def test_parallel_2(self, testcase_thread_ident):
+        self._check_parallel(testcase_thread_ident)
+
+    @balder.parallel_safe
+    def test_parallel_3(self, testcase_thread_ident):
+        self._check_parallel(testcase_thread_ident)
+
+    def test_sequential(self, testcase_thread_ident):
+        assert self.active_tests == [testcase_thread_ident], "another test is active at the same time"
@@ -0,0 +1,8 @@
+import balder
+
+
+class SetupParallel(balder.Setup):
+    """simple setup for the parallel execution test"""
+
+    class SetupDevice(balder.Device):
+        pass
@@ -0,0 +1,39 @@
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test1ParallelSafeTestcases(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with three parallel-safe tests and one normal test with the command line
+    argument ``--parallel-testcases 3``. The parallel-safe tests wait for each other over a barrier, so they can only
+    succeed if they are executed at the same time. The normal test checks that no other test is active while it runs.
+    """
+
+    @property
+    def cmd_args(self):
+        return ['--parallel-testcases', '3']
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        lines = stdout.splitlines()
+        for cur_test_name in ['test_parallel_1', 'test_parallel_2', 'test_parallel_3']:
+            line_idx = [idx for idx, line in enumerate(lines)
+                        if line.startswith(f"      TEST ScenarioParallel.{cur_test_name} running in thread")][0]
+            # the output of one test has to be printed as one block
+            assert lines[line_idx + 1] == "[.]", f"output of test `{cur_test_name}` is not printed as one block"
+        assert "      TEST ScenarioParallel.test_sequential [.]" in lines
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        all_testcase_executors = session.executor_tree.get_all_testcase_executors()
+        assert len(all_testcase_executors) == 4
+        for cur_testcase_executor in all_testcase_executors:
+            assert cur_testcase_executor.executor_result == ResultState.SUCCESS, \
+                f"testcase `{cur_testcase_executor.full_test_name_str}` does not terminates with SUCCESS"
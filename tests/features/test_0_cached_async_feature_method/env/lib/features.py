@@ -0,0 +1,8 @@
+import balder
+
+
+class SessionFeature(balder.Feature):
+    """feature that opens a new session on the device for every call"""
+
+    async def open_session(self) -> int:
+        raise NotImplementedError()
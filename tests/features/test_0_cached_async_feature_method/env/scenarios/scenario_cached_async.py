@@ -0,0 +1,32 @@
+import asyncio
+import balder
+from ..lib.features import SessionFeature
+
+
+class ScenarioCachedAsync(balder.Scenario):
+    """scenario with three async tests that run concurrently and use the cached session of their own testcase"""
+
+    started_tests = set()
+
+    class Dut(balder.Device):
+        session = SessionFeature()
+
+    async def _check_session(self, name):
+        session = await self.Dut.session.open_session()
+        self.started_tests.add(name)
+        # wait till all async tests are active - the other tests must not get the session of this test
+        for _ in range(1000):
+            if len(self.started_tests) == 3:
+                break
+            await asyncio.sleep(0.01)
+        assert await self.Dut.session.open_session() == session
+        print(f"session of {name}: {session}")
+
+    async def test_async_1(self):
+        await self._check_session('test_async_1')
+
+    async def test_async_2(self):
+        await self._check_session('test_async_2')
+
+    async def test_async_3(self):
+        await self._check_session('test_async_3')
@@ -0,0 +1,27 @@
+import asyncio
+import balder
+from ..lib.features import SessionFeature
+
+
+class SetupSessionFeature(SessionFeature):
+    """setup feature with a cached async method"""
+
+    opened_sessions = 0
+
+    @balder.cached(level='testcase')
+    async def open_session(self) -> int:
+        await asyncio.sleep(0)
+        SetupSessionFeature.opened_sessions += 1
+        return SetupSessionFeature.opened_sessions
+
+
+class SetupCachedAsync(balder.Setup):
+    """simple setup for the cached async feature method test"""
+
+    class Dut(balder.Device):
+        session = SetupSessionFeature()
+
+    @balder.fixture(level="setup")
+    def print_statistics(self):
+        yield
+        print(f"session statistics: {SetupSessionFeature.open_session.cache_info()}")
@@ -0,0 +1,33 @@
+import re
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0CachedAsyncFeatureMethod(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with a cached async feature method of the level ``testcase`` with the
+    command line argument ``--concurrent-async-testcases 3``. The three async tests run concurrently on the session
+    event loop, but every test has to get its own memoized result. The results have to be invalidated after every
+    testcase, so no memoized result is left after the session.
+    """
+
+    @property
+    def cmd_args(self):
+        return ['--concurrent-async-testcases', '3']
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        sessions = re.findall(r"session of test_async_\d: (\d+)", stdout)
+        assert sorted(sessions) == ['1', '2', '3'], f"the testcases share their cached results: {sessions}"
+        assert "session statistics: CacheInfo(hits=3, misses=3, currsize=0)" in stdout
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        assert len(session.executor_tree.get_all_testcase_executors()) == 3
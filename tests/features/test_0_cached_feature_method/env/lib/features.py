@@ -0,0 +1,19 @@
+import balder
+
+
+class PeerFeature(balder.Feature):
+    """feature of the device the version is requested from"""
+
+
+@balder.for_vdevice("Peer", with_connections=balder.Connection())
+class VersionFeature(balder.Feature):
+    """scenario feature that requests the version and the interfaces of another device"""
+
+    class Peer(balder.VDevice):
+        peer = PeerFeature()
+
+    def get_version(self) -> str:
+        raise NotImplementedError()
+
+    def get_interfaces(self, prefix) -> tuple:
+        raise NotImplementedError()
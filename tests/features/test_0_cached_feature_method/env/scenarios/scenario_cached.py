@@ -0,0 +1,27 @@
+import balder
+from ..lib.features import PeerFeature, VersionFeature
+
+
+class ScenarioCached(balder.Scenario):
+    """scenario that requests the version and the interfaces multiple times"""
+
+    class Dut(balder.Device):
+        version = VersionFeature(Peer="PeerDevice")
+
+    @balder.connect(Dut, over_connection=balder.Connection())
+    class PeerDevice(balder.Device):
+        peer = PeerFeature()
+
+    def test_1(self):
+        assert self.Dut.version.get_version() == "1.2.3"
+        assert self.Dut.version.get_version() == "1.2.3"
+        assert self.Dut.version.get_interfaces("eth") == ("eth0", "eth1")
+        assert self.Dut.version.get_interfaces("eth") == ("eth0", "eth1")
+
+    def test_2(self):
+        assert self.Dut.version.get_version() == "1.2.3"
+        assert self.Dut.version.get_interfaces("eth") == ("eth0", "eth1")
+        assert self.Dut.version.get_interfaces(prefix="eth") == ("eth0", "eth1")
+        # a list is not hashable -> the method is called without the cache
+        assert self.Dut.version.get_interfaces(["eth"]) == ("['eth']0", "['eth']1")
+        assert self.Dut.version.get_interfaces(["eth"]) == ("['eth']0", "['eth']1")
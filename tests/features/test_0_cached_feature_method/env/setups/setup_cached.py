@@ -0,0 +1,49 @@
+import balder
+import balder.connections as cnn
+from ..lib.features import PeerFeature, VersionFeature
+
+
+@balder.for_vdevice("Peer", with_connections=cnn.EthernetConnection | cnn.CanBusConnection)
+class SetupVersionFeature(VersionFeature):
+    """setup feature with cached method variations"""
+
+    class Peer(VersionFeature.Peer):
+        pass
+
+    @balder.for_vdevice("Peer", with_connections=cnn.EthernetConnection)
+    @balder.cached(level='variation')
+    def get_version(self) -> str:
+        print("query version over ethernet")
+        return "1.2.3"
+
+    @balder.for_vdevice("Peer", with_connections=cnn.CanBusConnection)
+    @balder.cached(level=balder.FixtureExecutionLevel.VARIATION)
+    def get_version(self) -> str:
+        print("query version over can")
+        return "1.2.3"
+
+    @balder.cached(level='testcase')
+    def get_interfaces(self, prefix) -> tuple:
+        print(f"query interfaces with prefix {prefix}")
+        return f"{prefix}0", f"{prefix}1"
+
+
+class SetupCached(balder.Setup):
+    """setup with two peer devices - the scenario has one variation for every peer"""
+
+    class Dut(balder.Device):
+        version = SetupVersionFeature()
+
+    @balder.connect(Dut, over_connection=cnn.EthernetConnection)
+    class PeerEthernet(balder.Device):
+        peer = PeerFeature()
+
+    @balder.connect(Dut, over_connection=cnn.CanBusConnection)
+    class PeerCan(balder.Device):
+        peer = PeerFeature()
+
+    @balder.fixture(level="setup")
+    def print_statistics(self):
+        yield
+        print(f"version statistics: {SetupVersionFeature.get_version.cache_info()}")
+        print(f"interfaces statistics: {SetupVersionFeature.get_interfaces.cache_info()}")
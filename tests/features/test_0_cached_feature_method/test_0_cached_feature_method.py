@@ -0,0 +1,36 @@
+import re
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0CachedFeatureMethod(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with cached feature methods. The method ``get_version`` has two method
+    variations (one for every peer device) that are cached for the whole variation, so every variation queries the
+    version only once. The method ``get_interfaces`` is cached per testcase, so it is queried once for every testcase
+    and for every different argument call (calls with unhashable arguments are not cached). The statistics are
+    printed after all variations were executed.
+    """
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        messages = re.findall(r"query version over \w+|query interfaces with prefix eth", stdout)
+        assert sorted(messages) == sorted(["query version over ethernet", "query version over can"]
+                                          + ["query interfaces with prefix eth"] * 6), \
+            f"unexpected feature calls: {messages}"
+        assert "version statistics: CacheInfo(hits=4, misses=2, currsize=0)" in stdout
+        # the calls with a list argument are not cached
+        assert stdout.count("query interfaces with prefix ['eth']") == 4
+        # the keyword call `get_interfaces(prefix="eth")` uses another cache entry than `get_interfaces("eth")`
+        assert "interfaces statistics: CacheInfo(hits=2, misses=10, currsize=0)" in stdout
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        assert len(session.executor_tree.get_all_testcase_executors()) == 4
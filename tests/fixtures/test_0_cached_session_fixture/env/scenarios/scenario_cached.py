@@ -0,0 +1,11 @@
+import balder
+
+
+class ScenarioCached(balder.Scenario):
+    """scenario that uses the value of the cached setup fixture"""
+
+    class ScenarioDevice(balder.Device):
+        pass
+
+    def test_firmware(self, flash_firmware):
+        assert flash_firmware == "firmware-1.0"
@@ -0,0 +1,18 @@
+import balder
+
+
+def firmware_is_still_valid(value):
+    return value == "firmware-1.0"
+
+
+class SetupCached(balder.Setup):
+    """setup with an expensive session fixture, whose value is cached between the sessions"""
+
+    class SetupDevice(balder.Device):
+        pass
+
+    @balder.fixture(level="session", cache=balder.FixtureCache(ttl_sec=3600, validate=firmware_is_still_valid))
+    def flash_firmware(self, firmware_version):
+        print("flash firmware")
+        yield f"firmware-{firmware_version}"
+        print("teardown of flashed firmware")
@@ -0,0 +1,45 @@
+import shutil
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from _balder.utils.duration_store import DurationStore
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0CachedSessionFixture(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with a cached SESSION fixture twice. The first session has to execute the
+    fixture and saves its value in the balder cache directory. The second session has to use the cached value without
+    executing the construction or the teardown code of the fixture.
+    """
+
+    # the number of the session that is currently executed
+    cur_run = 0
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def test(self, balder_working_dir):
+        cache_dir = balder_working_dir / DurationStore.CACHE_DIR_NAME
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        try:
+            for cur_run in (1, 2):
+                self.cur_run = cur_run
+                super().test(balder_working_dir)
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        lines = stdout.splitlines()
+        if self.cur_run == 1:
+            assert "flash firmware" in lines, "the first session has not executed the cached fixture"
+            assert "teardown of flashed firmware" in lines
+        else:
+            assert "flash firmware" not in lines, "the second session has not used the cached value"
+            assert "teardown of flashed firmware" not in lines
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
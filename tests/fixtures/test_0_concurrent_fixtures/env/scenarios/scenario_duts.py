@@ -0,0 +1,11 @@
+import balder
+
+
+class ScenarioDuts(balder.Scenario):
+    """scenario that uses the values of the concurrently constructed setup fixtures"""
+
+    class ScenarioDevice(balder.Device):
+        pass
+
+    def test_consoles(self, open_consoles):
+        assert open_consoles == ["dut1", "dut2"]
@@ -0,0 +1,37 @@
+import threading
+import balder
+
+# the construction (and the teardown) of the three DUTs only finishes if all of them are executed at the same time
+POWER_UP_BARRIER = threading.Barrier(3, timeout=10)
+POWER_DOWN_BARRIER = threading.Barrier(3, timeout=10)
+
+
+class SetupDuts(balder.Setup):
+    """setup with three DUTs that are powered up by independent fixtures"""
+
+    class SetupDevice(balder.Device):
+        pass
+
+    @balder.fixture(level="setup")
+    def power_up_dut_1(self):
+        POWER_UP_BARRIER.wait()
+        yield "dut1"
+        POWER_DOWN_BARRIER.wait()
+
+    @balder.fixture(level="setup")
+    def power_up_dut_2(self):
+        POWER_UP_BARRIER.wait()
+        yield "dut2"
+        POWER_DOWN_BARRIER.wait()
+
+    @balder.fixture(level="setup")
+    def power_up_dut_3(self):
+        POWER_UP_BARRIER.wait()
+        yield "dut3"
+        POWER_DOWN_BARRIER.wait()
+
+    @balder.fixture(level="setup")
+    def open_consoles(self, power_up_dut_1, power_up_dut_2):
+        print(f"open consoles of {power_up_dut_1} and {power_up_dut_2}")
+        yield [power_up_dut_1, power_up_dut_2]
+        print("close consoles")
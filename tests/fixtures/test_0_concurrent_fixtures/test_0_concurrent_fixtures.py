@@ -0,0 +1,35 @@
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0ConcurrentFixtures(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with the command line argument ``--concurrent-fixtures 4``. The setup has
+    three independent fixtures that only finish their construction and their teardown code if all of them are executed
+    at the same time. Another fixture references two of them, so it has to be executed after them and has to be torn
+    down before them. The test checks that the session terminates successfully and that the referencing fixture gets
+    the values of the referenced ones.
+    """
+
+    @property
+    def cmd_args(self):
+        return ['--concurrent-fixtures', '4']
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        lines = stdout.splitlines()
+        assert "open consoles of dut1 and dut2" in lines
+        assert "close consoles" in lines
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        for cur_setup_executor in session.executor_tree.get_setup_executors():
+            assert cur_setup_executor.construct_result.result == ResultState.SUCCESS
+            assert cur_setup_executor.teardown_result.result == ResultState.SUCCESS
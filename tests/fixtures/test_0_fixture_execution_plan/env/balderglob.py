@@ -0,0 +1,14 @@
+from typing import Union
+
+from multiprocessing import Queue
+import balder
+
+
+class RuntimeObserver:
+    """This is a helper object, that will be used from this test environment to observe the execution order"""
+    queue: Union[Queue, None] = None
+
+
+@balder.fixture(level="testcase")
+def glob_testcase_fixture():
+    return "glob"
@@ -0,0 +1,25 @@
+import balder
+
+
+class ScenarioPlan(balder.Scenario):
+    """scenario with multiple testcases that use fixtures of different execution levels"""
+
+    class ScenarioDevice(balder.Device):
+        pass
+
+    @balder.fixture(level="variation")
+    def variation_fixture(self):
+        return object()
+
+    @balder.fixture(level="testcase")
+    def testcase_fixture(self, variation_fixture, glob_testcase_fixture):
+        return variation_fixture, glob_testcase_fixture
+
+    def test_1(self, variation_fixture, testcase_fixture):
+        assert testcase_fixture == (variation_fixture, "glob")
+
+    def test_2(self, variation_fixture, testcase_fixture):
+        assert testcase_fixture == (variation_fixture, "glob")
+
+    def test_3(self, variation_fixture, testcase_fixture):
+        assert testcase_fixture == (variation_fixture, "glob")
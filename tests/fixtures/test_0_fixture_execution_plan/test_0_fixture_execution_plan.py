@@ -0,0 +1,34 @@
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from _balder.fixture_execution_level import FixtureExecutionLevel
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0FixtureExecutionPlan(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with one scenario that has two variations with three testcases each. The
+    testcases use fixtures of different execution levels and definition scopes. The test checks that the values of the
+    fixtures are forwarded correctly and that the fixture execution plans are only compiled once for every execution
+    level, setup class and scenario class - all variations and all testcases reuse them.
+    """
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        assert len(session.executor_tree.get_all_testcase_executors()) == 6
+
+        compiled_plans = session.executor_tree.fixture_manager.compiled_plans
+        for cur_level in FixtureExecutionLevel:
+            plans_of_level = [cur_plan for cur_plan in compiled_plans if cur_plan.execution_level == cur_level]
+            assert len(plans_of_level) == 1, f"expected exactly one compiled plan for level {cur_level.name}"
+
+        testcase_plan = [cur_plan for cur_plan in compiled_plans
+                         if cur_plan.execution_level == FixtureExecutionLevel.TESTCASE][0]
+        assert [cur_step.callable.__name__ for cur_step in testcase_plan.steps] == \
+               ["glob_testcase_fixture", "testcase_fixture"]
+        assert testcase_plan.steps[1].arguments == ("variation_fixture", "glob_testcase_fixture")
@@ -0,0 +1,23 @@
+from typing import Union
+
+from multiprocessing import Queue
+import balder
+
+
+class RuntimeObserver:
+    """This is a helper object, that will be used from this test environment to observe the execution order"""
+    queue: Union[Queue, None] = None
+
+
+@balder.fixture(level="session", lazy=True)
+def trace_collection():
+    print("start trace collection")
+    yield
+    print("stop trace collection")
+
+
+@balder.fixture(level="session", lazy=True)
+def log_directory():
+    print("create log directory")
+    yield "logs"
+    print("remove log directory")
@@ -0,0 +1,37 @@
+import balder
+
+
+class ScenarioLazy(balder.Scenario):
+    """scenario with a lazy fixture that is only requested by one of its testcases"""
+
+    class ScenarioDevice(balder.Device):
+        pass
+
+    @balder.fixture(level="variation")
+    def interface(self):
+        print("open interface")
+        yield "eth0"
+        print("close interface")
+
+    @balder.fixture(level="variation")
+    def interface_log(self, interface, log_directory):
+        print(f"open log of {interface} in {log_directory}")
+        yield
+        print("close log")
+
+    @balder.fixture(level="variation", lazy=True)
+    def packet_capture(self, interface):
+        print(f"start capture on {interface}")
+        yield f"capture of {interface}"
+        print("stop capture")
+
+    def test_1_without_capture(self):
+        print("execute test_1_without_capture")
+
+    def test_2_with_capture(self, packet_capture):
+        print("execute test_2_with_capture")
+        assert packet_capture == "capture of eth0"
+
+    def test_3_with_capture(self, packet_capture):
+        print("execute test_3_with_capture")
+        assert packet_capture == "capture of eth0"
@@ -0,0 +1,11 @@
+import balder
+
+
+class SetupLazy(balder.Setup):
+    """setup with two devices - the scenario has two variations"""
+
+    class SetupDevice1(balder.Device):
+        pass
+
+    class SetupDevice2(balder.Device):
+        pass
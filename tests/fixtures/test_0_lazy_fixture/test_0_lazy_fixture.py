@@ -0,0 +1,46 @@
+import re
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0LazyFixture(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with lazy fixtures. The variation fixture ``packet_capture`` is only
+    requested by the second and the third testcase, so it has to be constructed right before the second testcase once
+    for every variation and has to be torn down with its variation (before the fixture it references). The session
+    fixture ``trace_collection`` is never requested, so it is never executed. The lazy session fixture
+    ``log_directory`` is requested by the variation fixture ``interface_log``, so it has to be constructed once within
+    the first variation and has to be torn down at the end of the session.
+    """
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        messages = re.findall(r"(open interface|close interface|start capture on eth0|stop capture|execute test_\w+|"
+                              r"start trace collection|create log directory|remove log directory|open log|"
+                              r"close log)", stdout)
+        expected_variation_messages = [
+            "open interface",
+            "open log",
+            "execute test_1_without_capture",
+            "start capture on eth0",
+            "execute test_2_with_capture",
+            "execute test_3_with_capture",
+            "stop capture",
+            "close log",
+            "close interface",
+        ]
+        expected_messages = expected_variation_messages * 2
+        expected_messages.insert(1, "create log directory")
+        expected_messages.append("remove log directory")
+        assert messages == expected_messages, f"unexpected fixture order: {messages}"
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        assert len(session.executor_tree.get_all_testcase_executors()) == 6
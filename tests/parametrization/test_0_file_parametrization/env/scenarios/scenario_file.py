@@ -0,0 +1,19 @@
+import balder
+
+
+class ScenarioFile(balder.Scenario):
+    """scenario with tests that are parametrized by the records of files"""
+
+    class ScenarioDevice(balder.Device):
+        pass
+
+    @balder.parametrize('mode', ['a', 'b'])
+    @balder.parametrize_from_file('vectors.jsonl', fields=['data', 'expected'])
+    def test_jsonl(self, mode, data, expected):
+        assert int(data, 16) == expected
+        print(f"jsonl {mode}-{data}-{expected};")
+
+    @balder.parametrize_from_file('vectors.csv')
+    def test_csv(self, text, length):
+        assert len(text) == int(length)
+        print(f"csv {text!r};")
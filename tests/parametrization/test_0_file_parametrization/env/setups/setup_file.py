@@ -0,0 +1,8 @@
+import balder
+
+
+class SetupFile(balder.Setup):
+    """setup with one device"""
+
+    class SetupDevice(balder.Device):
+        pass
@@ -0,0 +1,37 @@
+import re
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from _balder.parametrization_file import ParametrizationFile
+from _balder.controllers.scenario_controller import ScenarioController
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0FileParametrization(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with tests that are parametrized by the records of a JSONL and a CSV file.
+    All fields of one record are provided together, the JSONL test is also combined with a static parametrization.
+    """
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        assert "group test_jsonl with 6 testcases" in stdout
+        assert "group test_csv with 3 testcases" in stdout
+        assert re.findall(r"jsonl ([\w-]+);", stdout) == \
+            ['a-00-0', 'a-01-1', 'a-ff-255', 'b-00-0', 'b-01-1', 'b-ff-255']
+        assert re.findall(r"csv ('[^']*');", stdout) == ["'abc'", "'with,comma'", "'two\\nlines'"]
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        assert session.executor_tree.testsummary().success == 9
+        scenario_class = session.executor_tree.get_all_scenario_executors()[0].base_scenario_class.__class__
+        test_jsonl = getattr(scenario_class, 'test_jsonl')
+        parametrization = ScenarioController.get_for(scenario_class).get_parametrization_for(test_jsonl)
+        # the values of the file are never held by the scenario controller
+        assert isinstance(parametrization['data'], ParametrizationFile)
+        assert parametrization['data'] is parametrization['expected']
@@ -0,0 +1,23 @@
+from typing import Union
+
+from multiprocessing import Queue
+import balder
+from _balder.executor.unresolved_parametrized_testcase_executor import UnresolvedParametrizedTestcaseExecutor
+
+
+class RuntimeObserver:
+    """This is a helper object, that will be used from this test environment to observe the execution order"""
+    queue: Union[Queue, None] = None
+
+
+class PrintTreePlugin(balder.BalderPlugin):
+    """prints the testcase executors of the tree before it is executed"""
+
+    def filter_executor_tree(self, executor_tree):
+        for cur_executor in executor_tree.get_all_testcase_executors():
+            if isinstance(cur_executor, UnresolvedParametrizedTestcaseExecutor):
+                print(f"group {cur_executor.base_testcase_callable.__name__} with "
+                      f"{cur_executor.get_testcase_count()} testcases and "
+                      f"{len(cur_executor.materialized_executors)} executors")
+            else:
+                print(f"testcase {cur_executor.base_testcase_callable.__name__}")
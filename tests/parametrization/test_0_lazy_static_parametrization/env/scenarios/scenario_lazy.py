@@ -0,0 +1,19 @@
+import gc
+import balder
+from _balder.executor.parametrized_testcase_executor import ParametrizedTestcaseExecutor
+
+
+class ScenarioLazy(balder.Scenario):
+    """scenario with a statically parametrized test"""
+
+    class ScenarioDevice(balder.Device):
+        pass
+
+    @balder.parametrize('number', [1, 2, 3])
+    @balder.parametrize('letter', ['x', 'y'])
+    def test_parametrized(self, number, letter):
+        created = len([cur_obj for cur_obj in gc.get_objects() if isinstance(cur_obj, ParametrizedTestcaseExecutor)])
+        print(f"execute {number}-{letter} with {created} created executors")
+
+    def test_not_parametrized(self):
+        print("execute not parametrized")
@@ -0,0 +1,38 @@
+import re
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from _balder.executor.parametrized_testcase_executor import ParametrizedTestcaseExecutor
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0LazyStaticParametrization(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with a statically parametrized test. Before the execution, the tree only
+    contains one group executor for it, that already knows the number of its testcases. The executors of the single
+    parametrized testcases are created one after another while the variation is executed and replace the group after
+    they were all created.
+    """
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        assert "group test_parametrized with 6 testcases and 0 executors" in stdout
+        assert "testcase test_not_parametrized" in stdout
+        messages = re.findall(r"execute (\d-\w) with (\d+) created executors", stdout)
+        assert messages == [('1-x', '1'), ('1-y', '2'), ('2-x', '3'), ('2-y', '4'), ('3-x', '5'), ('3-y', '6')], \
+            f"unexpected executions: {messages}"
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        all_testcase_executors = session.executor_tree.get_all_testcase_executors()
+        assert len(all_testcase_executors) == 7
+        parametrized_executors = [cur_executor for cur_executor in all_testcase_executors
+                                  if isinstance(cur_executor, ParametrizedTestcaseExecutor)]
+        assert len(parametrized_executors) == 6
+        assert len(set(cur_executor.unresolved_group_obj for cur_executor in parametrized_executors)) == 1
+        assert session.executor_tree.testsummary().success == 7
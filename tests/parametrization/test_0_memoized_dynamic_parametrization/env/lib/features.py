@@ -0,0 +1,13 @@
+from typing import List
+import balder
+
+
+class SerialFeature(balder.Feature):
+    """feature that provides the baud rates the device supports"""
+
+    def get_baudrates(self, parity: str) -> List[int]:
+        raise NotImplementedError
+
+
+class PeerFeature(balder.Feature):
+    """feature of a peer device"""
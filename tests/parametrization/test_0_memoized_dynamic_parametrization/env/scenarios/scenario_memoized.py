@@ -0,0 +1,23 @@
+import balder
+from balder.parametrization import Value
+from ..lib.features import SerialFeature, PeerFeature
+
+
+class ScenarioMemoized(balder.Scenario):
+    """scenario with two test methods that are parametrized by the same feature method"""
+
+    class SerialDevice(balder.Device):
+        serial = SerialFeature()
+
+    class PeerDevice(balder.Device):
+        peer = PeerFeature()
+
+    @balder.parametrize_by_feature('baudrate', (SerialDevice, 'serial', 'get_baudrates'),
+                                   parameter={'parity': Value('even')})
+    def test_send(self, baudrate):
+        print(f"send with {baudrate};")
+
+    @balder.parametrize_by_feature('baudrate', (SerialDevice, 'serial', 'get_baudrates'),
+                                   parameter={'parity': Value('even')})
+    def test_receive(self, baudrate):
+        print(f"receive with {baudrate};")
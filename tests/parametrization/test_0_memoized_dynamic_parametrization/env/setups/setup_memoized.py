@@ -0,0 +1,23 @@
+import balder
+from ..lib.features import SerialFeature, PeerFeature
+
+
+class SetupSerialFeature(SerialFeature):
+
+    def get_baudrates(self, parity: str):
+        print(f"query baudrates for {parity};")
+        # the values are returned as generator, that can only be consumed once
+        yield from [9600, 115200]
+
+
+class SetupMemoized(balder.Setup):
+    """setup with one serial device and two peer devices (results in two variations with the same serial device)"""
+
+    class SetupSerial(balder.Device):
+        serial = SetupSerialFeature()
+
+    class SetupPeer1(balder.Device):
+        peer = PeerFeature()
+
+    class SetupPeer2(balder.Device):
+        peer = PeerFeature()
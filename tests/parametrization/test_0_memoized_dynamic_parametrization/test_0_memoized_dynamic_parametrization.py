@@ -0,0 +1,31 @@
+import re
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0MemoizedDynamicParametrization(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with two test methods that are dynamically parametrized by the same feature
+    method. The scenario is resolved to two variations that use the same setup device for the parametrizing feature.
+    The feature method is only called once, all other requests use the memoized value.
+    """
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        assert re.findall(r"query baudrates for (\w+);", stdout) == ['even']
+        assert len(re.findall(r"send with (\d+);", stdout)) == 4
+        assert len(re.findall(r"receive with (\d+);", stdout)) == 4
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"
+        assert session.executor_tree.testsummary().success == 8
+        value_cache = session.executor_tree.get_setup_executors()[0].parametrization_value_cache
+        assert value_cache.misses == 1
+        assert value_cache.hits == 3
@@ -0,0 +1,9 @@
+from typing import List
+import balder
+
+
+class ChannelFeature(balder.Feature):
+    """feature that provides the channels that are supported for a mode"""
+
+    def get_channels(self, mode: str) -> List[int]:
+        raise NotImplementedError
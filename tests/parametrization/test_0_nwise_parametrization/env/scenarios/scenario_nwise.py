@@ -0,0 +1,32 @@
+import balder
+from balder.parametrization import Parameter
+from ..lib.features import ChannelFeature
+
+
+class ScenarioNwise(balder.Scenario):
+    """scenario with parametrized tests that are reduced to n-wise covering arrays"""
+
+    class ScenarioDevice(balder.Device):
+        channels = ChannelFeature()
+
+    @balder.parametrize('p1', [1, 2, 3])
+    @balder.parametrize('p2', [1, 2, 3])
+    @balder.parametrize('p3', [1, 2, 3])
+    @balder.parametrize('p4', [1, 2, 3])
+    def test_static(self, p1, p2, p3, p4):
+        print(f"static {p1}-{p2}-{p3}-{p4};")
+
+    @balder.parametrize_nwise(strength=2, seed=1)
+    @balder.parametrize('mode', ['a', 'b', 'c'])
+    @balder.parametrize('speed', [1, 2, 3])
+    @balder.parametrize_by_feature('channel', (ScenarioDevice, 'channels', 'get_channels'),
+                                   parameter={'mode': Parameter('mode')})
+    def test_dynamic(self, mode, speed, channel):
+        print(f"dynamic {mode}-{speed}-{channel};")
+
+    @balder.parametrize_nwise(strength=3)
+    @balder.parametrize('p1', [1, 2])
+    @balder.parametrize('p2', [1, 2])
+    @balder.parametrize('p3', [1, 2])
+    def test_full_strength(self, p1, p2, p3):
+        print(f"full {p1}-{p2}-{p3};")
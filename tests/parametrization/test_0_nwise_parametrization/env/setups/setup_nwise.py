@@ -0,0 +1,15 @@
+import balder
+from ..lib.features import ChannelFeature
+
+
+class SetupChannelFeature(ChannelFeature):
+
+    def get_channels(self, mode: str):
+        return [1, 2] if mode == 'c' else [1, 2, 3]
+
+
+class SetupNwise(balder.Setup):
+    """setup with one device"""
+
+    class SetupDevice(balder.Device):
+        channels = SetupChannelFeature()
@@ -0,0 +1,56 @@
+import re
+import itertools
+from _balder.testresult import ResultState
+from _balder.balder_session import BalderSession
+from tests.test_utilities.base_0_envtester_class import Base0EnvtesterClass
+
+
+class Test0NwiseParametrization(Base0EnvtesterClass):
+    """
+    This testcase executes an environment with parametrized tests that are reduced to n-wise covering arrays. The
+    static test is reduced by the session option `--parametrize-nwise`, the others by `@balder.parametrize_nwise`. The
+    test with dynamic parametrization only has valid combinations (mode `c` does not support channel 3). The test
+    checks that all pairs of values are covered with less testcases than the full cartesian product.
+    """
+
+    @property
+    def cmd_args(self):
+        return ['--parametrize-nwise', '2', '--parametrize-seed', '5']
+
+    @property
+    def expected_data(self) -> tuple:
+        return tuple()
+
+    @staticmethod
+    def _assert_all_pairs_covered(rows, all_rows):
+        expected_pairs = set()
+        for cur_row in all_rows:
+            expected_pairs.update(itertools.combinations(enumerate(cur_row), 2))
+        covered_pairs = set()
+        for cur_row in rows:
+            covered_pairs.update(itertools.combinations(enumerate(cur_row), 2))
+        assert covered_pairs == expected_pairs, f"missing pairs: {expected_pairs - covered_pairs}"
+
+    def validate_printed_output(self, stdout: str) -> bool:
+        static_rows = [tuple(cur_row.split('-')) for cur_row in re.findall(r"static ([\d-]+);", stdout)]
+        assert len(set(static_rows)) == len(static_rows)
+        assert len(static_rows) < 3 ** 4, f"static test was not reduced: {len(static_rows)} testcases"
+        self._assert_all_pairs_covered(static_rows, itertools.product('123', repeat=4))
+        assert f"group test_static with {len(static_rows)} testcases" in stdout
+
+        dynamic_rows = [tuple(cur_row.split('-')) for cur_row in re.findall(r"dynamic ([\w-]+);", stdout)]
+        all_dynamic_rows = [(mode, speed, channel) for mode, speed, channel in itertools.product('abc', '123', '123')
+                            if not (mode == 'c' and channel == '3')]
+        assert set(dynamic_rows).issubset(all_dynamic_rows), f"unexpected rows: {dynamic_rows}"
+        assert len(dynamic_rows) < len(all_dynamic_rows), f"dynamic test was not reduced: {dynamic_rows}"
+        self._assert_all_pairs_covered(dynamic_rows, all_dynamic_rows)
+        assert "group test_dynamic with None testcases" in stdout
+
+        full_rows = re.findall(r"full ([\d-]+);", stdout)
+        assert sorted(full_rows) == sorted('-'.join(cur) for cur in itertools.product('12', repeat=3))
+        return True
+
+    @staticmethod
+    def validate_finished_session(session: BalderSession):
+        assert session.executor_tree.executor_result == ResultState.SUCCESS, \
+            "test session does not terminates with SUCCESS"